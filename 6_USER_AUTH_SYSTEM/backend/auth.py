@@ -11,14 +11,15 @@ from fastapi import HTTPException, status
 import secrets
 import os
 import json
+from password_hashing import BCRYPT_ROUNDS, password_hasher
 
 # Configuration
 SECRET_KEY = os.getenv("JWT_SECRET", "your-super-secret-jwt-key-change-in-production")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing (koszt per środowisko: APP_ENV / AUTH_BCRYPT_ROUNDS)
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=BCRYPT_ROUNDS)
 
 # ===== PYDANTIC MODELS =====
 class UserCreate(BaseModel):
@@ -63,6 +64,14 @@ def get_password_hash(password: str) -> str:
     """Tworzy hash hasła"""
     return pwd_context.hash(password)
 
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Weryfikuje hasło w puli procesów (bez blokowania pętli zdarzeń)"""
+    return await password_hasher.verify(plain_password, hashed_password)
+
+async def get_password_hash_async(password: str) -> str:
+    """Tworzy hash hasła w puli procesów (bez blokowania pętli zdarzeń)"""
+    return await password_hasher.hash(password)
+
 def generate_agent_id(username: str) -> str:
     """Generuje unikalny agent_id dla SYNERGY"""
     random_suffix = secrets.token_hex(4)
@@ -117,8 +126,8 @@ def validate_user_type(user_type: str) -> bool:
     return user_type in valid_types
 
 # ===== USER MANAGEMENT =====
-def create_user_dict(user_data: UserCreate) -> Dict[str, Any]:
-    """Przygotowuje dane użytkownika do zapisu w bazie"""
+def create_user_dict(user_data: UserCreate, hashed_password: Optional[str] = None) -> Dict[str, Any]:
+    """Przygotowuje dane użytkownika do zapisu w bazie (hash można podać z get_password_hash_async)"""
     if not validate_user_type(user_data.user_type):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -131,7 +140,7 @@ def create_user_dict(user_data: UserCreate) -> Dict[str, Any]:
     return {
         "username": user_data.username,
         "email": user_data.email,
-        "hashed_password": get_password_hash(user_data.password),
+        "hashed_password": hashed_password or get_password_hash(user_data.password),
         "full_name": user_data.full_name,
         "user_type": user_data.user_type,
         "agent_id": agent_id,
@@ -0,0 +1,234 @@
+"""
+MÓZG BOGA - ASYNC DATABASE LAYER
+Asynchroniczne sesje SQLAlchemy (aiosqlite / asyncpg), batch zapisu SynergyLog
+i stronicowanie kluczem historii SYNERGY
+"""
+import asyncio
+import logging
+import os
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import and_, event, insert, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from models import DATABASE_URL, SynergyLog, User, set_sqlite_pragmas
+from session_store import user_cache
+
+
+def to_async_url(url: str) -> str:
+    """sqlite:// -> sqlite+aiosqlite://, postgresql:// -> postgresql+asyncpg://"""
+    if url.startswith("sqlite:") and "+aiosqlite" not in url:
+        return url.replace("sqlite:", "sqlite+aiosqlite:", 1)
+    for prefix in ("postgresql:", "postgres:"):
+        if url.startswith(prefix):
+            return url.replace(prefix, "postgresql+asyncpg:", 1)
+    return url
+
+
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL", to_async_url(DATABASE_URL))
+IS_SQLITE = ASYNC_DATABASE_URL.startswith("sqlite")
+
+# SQLite ma jednego pisarza - mała pula wystarcza; Postgres obsłuży więcej połączeń
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 5 if IS_SQLITE else 20))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", 5 if IS_SQLITE else 10))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", 10))
+
+
+def _engine_options() -> Dict[str, Any]:
+    if IS_SQLITE and ":memory:" in ASYNC_DATABASE_URL:
+        return {}  # StaticPool - jedno współdzielone połączenie
+    options = {
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_pre_ping": not IS_SQLITE,
+    }
+    if IS_SQLITE:
+        options["connect_args"] = {"timeout": 5}
+    else:
+        options["pool_recycle"] = 1800
+    return options
+
+
+async_engine = create_async_engine(ASYNC_DATABASE_URL, **_engine_options())
+if IS_SQLITE:
+    event.listen(async_engine.sync_engine, "connect", set_sqlite_pragmas)
+
+AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False, autoflush=False)
+
+
+async def get_async_db():
+    """Dependency injection dla asynchronicznej sesji bazy danych"""
+    async with AsyncSessionLocal() as session:
+        yield session
+
+
+# ===== SYNERGY HISTORY (KEYSET PAGINATION) =====
+def encode_cursor(created_at: datetime, log_id: int) -> str:
+    return f"{created_at.isoformat()}|{log_id}"
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    created_at, log_id = cursor.rsplit("|", 1)
+    return datetime.fromisoformat(created_at), int(log_id)
+
+
+async def fetch_synergy_history(session: AsyncSession, user_id: int, limit: int = 50,
+                                cursor: Optional[str] = None) -> Tuple[List[SynergyLog], Optional[str]]:
+    """
+    Strona historii SYNERGY od najnowszych wpisów.
+
+    Zamiast OFFSET używa pozycji ostatniego wpisu (created_at, id), więc każda
+    strona to jeden zakres indeksu ix_synergy_logs_user_created.
+    Zwraca (wpisy, kursor następnej strony lub None).
+    """
+    query = select(SynergyLog).where(SynergyLog.user_id == user_id)
+    if cursor:
+        created_at, log_id = decode_cursor(cursor)
+        query = query.where(or_(
+            SynergyLog.created_at < created_at,
+            and_(SynergyLog.created_at == created_at, SynergyLog.id < log_id)
+        ))
+    query = query.order_by(SynergyLog.created_at.desc(), SynergyLog.id.desc()).limit(limit + 1)
+    logs = list((await session.execute(query)).scalars())
+    next_cursor = None
+    if len(logs) > limit:
+        logs = logs[:limit]
+        next_cursor = encode_cursor(logs[-1].created_at, logs[-1].id)
+    return logs, next_cursor
+
+
+# ===== SYNERGY LOG BATCH WRITER =====
+_STOP = object()  # znacznik końca w kolejce - _run zapisuje zebraną partię i kończy
+
+
+class SynergyLogWriter:
+    """
+    Zbiera wpisy SynergyLog w kolejce i zapisuje je partiami
+    (jeden INSERT executemany + jeden commit na partię).
+    """
+
+    def __init__(self, session_factory=AsyncSessionLocal, batch_size: int = 200,
+                 flush_interval: float = 0.5, max_pending: int = 10000):
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_pending)
+        self._task: Optional[asyncio.Task] = None
+        self.stats = {"queued": 0, "written": 0, "batches": 0, "dropped": 0, "errors": 0}
+
+    def log(self, user_id: int, task_payload: str = None, strategy_used: str = None,
+            success_percentage: int = None, execution_time: int = None,
+            weights_used: str = None, session_id: int = None) -> bool:
+        """Dodaje wpis do kolejki; zwraca False, jeśli kolejka jest pełna"""
+        row = {
+            "user_id": user_id,
+            "session_id": session_id,
+            "task_payload": task_payload,
+            "strategy_used": strategy_used,
+            "success_percentage": success_percentage,
+            "execution_time": execution_time,
+            "weights_used": weights_used,
+            "created_at": datetime.utcnow(),
+        }
+        try:
+            self._queue.put_nowait(row)
+        except asyncio.QueueFull:
+            self.stats["dropped"] += 1
+            return False
+        self.stats["queued"] += 1
+        return True
+
+    def start(self) -> "SynergyLogWriter":
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        return self
+
+    async def stop(self) -> None:
+        """Kończy pracę w tle - _run zapisuje bieżącą partię przed wyjściem"""
+        if self._task is not None:
+            if not self._task.done():
+                await self._queue.put(_STOP)
+                await self._task
+            self._task = None
+        await self.flush()
+
+    async def flush(self) -> int:
+        """Zapisuje wszystko, co czeka w kolejce"""
+        written = 0
+        while not self._queue.empty():
+            written += await self._write(self._drain(self.batch_size))
+        return written
+
+    def _drain(self, limit: int) -> List[Dict[str, Any]]:
+        rows = []
+        while len(rows) < limit and not self._queue.empty():
+            rows.append(self._queue.get_nowait())
+        return rows
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            row = await self._queue.get()
+            rows = []
+            deadline = loop.time() + self.flush_interval
+            while row is not _STOP:
+                rows.append(row)
+                if len(rows) >= self.batch_size:
+                    break
+                if not self._queue.empty():
+                    row = self._queue.get_nowait()
+                    continue
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    row = await asyncio.wait_for(self._queue.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+            await self._write(rows)
+            if row is _STOP:
+                return
+
+    async def _write(self, rows: List[Dict[str, Any]]) -> int:
+        if not rows:
+            return 0
+        try:
+            async with self.session_factory() as session:
+                await session.execute(insert(SynergyLog), rows)
+                await session.commit()
+        except Exception as e:
+            logging.error(f"SynergyLog batch write failed ({len(rows)} rows): {e}")
+            self.stats["errors"] += 1
+            return 0
+        self.stats["written"] += len(rows)
+        self.stats["batches"] += 1
+        return len(rows)
+
+    def get_stats(self) -> Dict[str, int]:
+        return {**self.stats, "pending": self._queue.qsize()}
+
+
+synergy_log_writer = SynergyLogWriter(
+    batch_size=int(os.getenv("SYNERGY_LOG_BATCH_SIZE", 200)),
+    flush_interval=float(os.getenv("SYNERGY_LOG_FLUSH_INTERVAL", 0.5))
+)
+
+
+async def find_user_id(subject: str) -> Optional[int]:
+    """Id lokalnego użytkownika dla subjectu tokena (email): cache użytkowników, potem baza"""
+    cached = await user_cache.get(subject)
+    if cached is not None:
+        return cached.id
+    generation = user_cache.generation(subject)
+    async with AsyncSessionLocal() as session:
+        user = (await session.execute(select(User).where(User.email == subject))).scalar_one_or_none()
+    if user is None:
+        return None  # np. konto Google bez lokalnego użytkownika
+    await user_cache.put(subject, user, generation)
+    return user.id
+
+
+async def dispose_engine() -> None:
+    await async_engine.dispose()
@@ -3,20 +3,28 @@ MÓZG BOGA - USER AUTH ENDPOINTS
 FastAPI endpoints for user registration, login, and management
 """
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.security import OAuth2PasswordBearer
+from sqlalchemy import event, inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional, Set
+import asyncio
+import logging
 import sys
 import os
 
 # Add the auth system to path
 sys.path.append(os.path.join(os.path.dirname(__file__), '6_USER_AUTH_SYSTEM', 'backend'))
 
-from models import User, UserSession, SynergyLog, get_db, create_tables
+from models import User, UserSession, SynergyLog, create_tables
+from database import AsyncSessionLocal, get_async_db, fetch_synergy_history
+from session_store import user_cache, CACHED_USER_FIELDS
 from auth import (
     UserCreate, UserLogin, UserResponse, Token, 
-    create_user_dict, create_access_token, verify_password, verify_token,
-    ACCESS_TOKEN_EXPIRE_MINUTES
+    create_user_dict, create_access_token, verify_token,
+    get_password_hash_async, verify_password_async, ACCESS_TOKEN_EXPIRE_MINUTES
 )
+from password_hashing import HashingOverloadedError
 from datetime import timedelta, datetime
 
 # Ensure tables exist
@@ -24,16 +32,89 @@ create_tables()
 
 # Router for auth endpoints
 auth_router = APIRouter(prefix="/auth", tags=["Authentication"])
+oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
+
+# ===== HELPER FUNCTIONS =====
+async def get_current_user(token: str = Depends(oauth2_scheme)):
+    """Dependency do pobierania aktualnego użytkownika z tokena (cache -> baza)"""
+    credentials_exception = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+    
+    try:
+        token_data = verify_token(token)
+        if token_data.email is None:
+            raise credentials_exception
+    except:
+        raise credentials_exception
+    
+    cached_user = await user_cache.get(token_data.email)
+    if cached_user is not None:
+        return cached_user
+    
+    generation = user_cache.generation(token_data.email)
+    async with AsyncSessionLocal() as db:
+        user = (await db.execute(select(User).where(User.email == token_data.email))).scalar_one_or_none()
+    if user is None:
+        raise credentials_exception
+    
+    await user_cache.put(token_data.email, user, generation)
+    return user
+
+# ===== USER CACHE INVALIDATION =====
+# Referencje do zadań unieważnień - inaczej pętla może je zebrać przed wykonaniem
+_invalidation_tasks: Set[asyncio.Task] = set()
+
+def _changes_cached_fields(user: User) -> bool:
+    """Czy zmiana dotyczy pól trzymanych w cache (np. sama zmiana last_login - nie)"""
+    attrs = inspect(user).attrs
+    return any(attrs[name].history.has_changes() for name in CACHED_USER_FIELDS)
+
+@event.listens_for(Session, "after_flush")
+def collect_stale_users(session, flush_context):
+    """Zbiera subjecty zmienionych użytkowników; cache jest czyszczony dopiero po commit"""
+    stale = session.info.setdefault("stale_user_subjects", set())
+    for user in [*session.dirty, *session.deleted]:
+        if isinstance(user, User) and (user in session.deleted or _changes_cached_fields(user)):
+            stale.update({user.email, *inspect(user).attrs.email.history.deleted})
+
+@event.listens_for(Session, "after_rollback")
+def discard_stale_users(session):
+    session.info.pop("stale_user_subjects", None)
+
+@event.listens_for(Session, "after_commit")
+def invalidate_cached_users(session):
+    """Po commit usuwa zmienionych użytkowników z cache (także pod poprzednim emailem)"""
+    subjects = [subject for subject in session.info.pop("stale_user_subjects", ()) if subject]
+    if not subjects:
+        return
+    for subject in subjects:
+        user_cache.mark_stale(subject)
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return  # Synchroniczny kontekst - wpis wygaśnie po USER_CACHE_TTL
+    for subject in subjects:
+        task = loop.create_task(user_cache.invalidate(subject))
+        _invalidation_tasks.add(task)
+        task.add_done_callback(_finish_invalidation)
+
+def _finish_invalidation(task: asyncio.Task) -> None:
+    _invalidation_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logging.error(f"User cache invalidation failed: {task.exception()}")
 
 # ===== REGISTRATION =====
 @auth_router.post("/register", response_model=UserResponse)
-async def register_user(user_data: UserCreate, db: Session = Depends(get_db)):
+async def register_user(user_data: UserCreate, db: AsyncSession = Depends(get_async_db)):
     """Rejestracja nowego użytkownika"""
     
     # Check if user already exists
-    existing_user = db.query(User).filter(
+    existing_user = (await db.execute(select(User).where(
         (User.email == user_data.email) | (User.username == user_data.username)
-    ).first()
+    ).limit(1))).scalar_one_or_none()
     
     if existing_user:
         raise HTTPException(
@@ -41,12 +122,18 @@ async def register_user(user_data: UserCreate, db: Session = Depends(get_db)):
             detail="User with this email or username already exists"
         )
     
-    # Create user
-    user_dict = create_user_dict(user_data)
+    # Create user (bcrypt w puli procesów)
+    try:
+        hashed_password = await get_password_hash_async(user_data.password)
+    except HashingOverloadedError:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                            detail="Too many concurrent sign-ups, retry later",
+                            headers={"Retry-After": "1"})
+    user_dict = create_user_dict(user_data, hashed_password=hashed_password)
     db_user = User(**user_dict)
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    await db.commit()
+    await db.refresh(db_user)
     
     return UserResponse(
         id=db_user.id,
@@ -64,13 +151,20 @@ async def register_user(user_data: UserCreate, db: Session = Depends(get_db)):
 
 # ===== LOGIN =====
 @auth_router.post("/login", response_model=Token)
-async def login_user(user_data: UserLogin, db: Session = Depends(get_db)):
+async def login_user(user_data: UserLogin, db: AsyncSession = Depends(get_async_db)):
     """Logowanie użytkownika"""
     
     # Find user
-    user = db.query(User).filter(User.email == user_data.email).first()
+    user = (await db.execute(select(User).where(User.email == user_data.email))).scalar_one_or_none()
     
-    if not user or not verify_password(user_data.password, user.hashed_password):
+    try:
+        password_ok = user is not None and await verify_password_async(user_data.password, user.hashed_password)
+    except HashingOverloadedError:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                            detail="Too many concurrent logins, retry later",
+                            headers={"Retry-After": "1"})
+    
+    if not password_ok:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -85,7 +179,7 @@ async def login_user(user_data: UserLogin, db: Session = Depends(get_db)):
     
     # Update last login
     user.last_login = datetime.utcnow()
-    db.commit()
+    await db.commit()
     
     # Create access token
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
@@ -133,13 +227,16 @@ async def get_profile(current_user: User = Depends(get_current_user)):
 # ===== SYNERGY LOGS =====
 @auth_router.get("/synergy-history")
 async def get_synergy_history(
+    limit: int = 50,
+    cursor: Optional[str] = None,
     current_user: User = Depends(get_current_user), 
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Historia interakcji użytkownika z SYNERGY"""
-    logs = db.query(SynergyLog).filter(
-        SynergyLog.user_id == current_user.id
-    ).order_by(SynergyLog.created_at.desc()).limit(50).all()
+    """Historia interakcji użytkownika z SYNERGY (stronicowana kursorem)"""
+    try:
+        logs, next_cursor = await fetch_synergy_history(db, current_user.id, min(max(limit, 1), 200), cursor)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
     
     return {
         "user_id": current_user.id,
@@ -156,27 +253,6 @@ async def get_synergy_history(
                 "created_at": log.created_at
             }
             for log in logs
-        ]
+        ],
+        "next_cursor": next_cursor
     }
-
-# ===== HELPER FUNCTIONS =====
-async def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
-    """Dependency do pobierania aktualnego użytkownika z tokena"""
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-    
-    try:
-        token_data = verify_token(token)
-        if token_data.email is None:
-            raise credentials_exception
-    except:
-        raise credentials_exception
-    
-    user = db.query(User).filter(User.email == token_data.email).first()
-    if user is None:
-        raise credentials_exception
-    
-    return user
\ No newline at end of file
@@ -2,7 +2,7 @@
 MÓZG BOGA - USER DATABASE MODELS
 SQLAlchemy models for user authentication and management
 """
-from sqlalchemy import create_engine, Column, Integer, String, DateTime, Boolean, Text
+from sqlalchemy import create_engine, event, Column, Integer, String, DateTime, Boolean, Text, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from datetime import datetime
@@ -12,6 +12,19 @@ from pathlib import Path
 # Database setup
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./mozg_boga_users.db")
 engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {})
+
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    """WAL + synchronous=NORMAL: równoległe odczyty podczas zapisu, mniej fsync"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA busy_timeout=5000")
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+if "sqlite" in DATABASE_URL:
+    event.listen(engine, "connect", set_sqlite_pragmas)
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
@@ -63,9 +76,17 @@ class SynergyLog(Base):
     weights_used = Column(Text)  # JSON string
     created_at = Column(DateTime, default=datetime.utcnow)
     
+    # Historia użytkownika stronicowana kluczem (user_id, created_at)
+    __table_args__ = (
+        Index("ix_synergy_logs_user_created", "user_id", "created_at"),
+    )
+
 def create_tables():
     """Tworzy wszystkie tabele w bazie danych"""
     Base.metadata.create_all(bind=engine)
+    # create_all nie dodaje nowych indeksów do istniejących tabel
+    for index in SynergyLog.__table__.indexes:
+        index.create(bind=engine, checkfirst=True)
     print("✅ Database tables created successfully")
 
 def get_db():
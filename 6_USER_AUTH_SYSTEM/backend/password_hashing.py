@@ -0,0 +1,152 @@
+"""
+MÓZG BOGA - PASSWORD HASHING EXECUTOR
+bcrypt poza pętlą zdarzeń: pula procesów, limit współbieżności, metryki kolejki
+"""
+import asyncio
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional
+
+# Koszt bcrypt per środowisko (AUTH_BCRYPT_ROUNDS nadpisuje)
+BCRYPT_ROUNDS_BY_ENV = {
+    "production": 12,
+    "staging": 12,
+    "development": 10,
+    "test": 4,
+}
+
+
+def get_environment() -> str:
+    return os.getenv("APP_ENV", os.getenv("ENVIRONMENT", "production")).lower()
+
+
+def get_bcrypt_rounds() -> int:
+    rounds = os.getenv("AUTH_BCRYPT_ROUNDS")
+    if rounds:
+        return int(rounds)
+    return BCRYPT_ROUNDS_BY_ENV.get(get_environment(), 12)
+
+
+BCRYPT_ROUNDS = get_bcrypt_rounds()
+
+_contexts: Dict[int, Any] = {}
+
+
+def _context(rounds: int):
+    """CryptContext budowany raz na proces (także w workerach puli)"""
+    context = _contexts.get(rounds)
+    if context is None:
+        from passlib.context import CryptContext
+        context = _contexts[rounds] = CryptContext(schemes=["bcrypt"], deprecated="auto",
+                                                   bcrypt__rounds=rounds)
+    return context
+
+
+def hash_password(password: str, rounds: int = BCRYPT_ROUNDS) -> str:
+    return _context(rounds).hash(password)
+
+
+def check_password(password: str, hashed_password: str) -> bool:
+    return _context(BCRYPT_ROUNDS).verify(password, hashed_password)
+
+
+class HashingOverloadedError(Exception):
+    """Zbyt wiele operacji haszowania czeka w kolejce"""
+
+
+class PasswordHasher:
+    """
+    Asynchroniczne haszowanie/weryfikacja haseł w osobnych procesach.
+
+    Najwyżej max_concurrency operacji jest wysyłanych do puli naraz; kolejne
+    czekają (do max_queue), a powyżej limitu rzucany jest HashingOverloadedError.
+    Pula tworzona jest leniwie i odtwarzana, jeśli proces workera padnie.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, max_concurrency: Optional[int] = None,
+                 max_queue: int = 256, rounds: int = BCRYPT_ROUNDS,
+                 executor_factory: Optional[Callable[[int], Executor]] = None):
+        self.max_workers = max_workers or max(1, min(4, os.cpu_count() or 1))
+        self.max_concurrency = max_concurrency or self.max_workers * 2
+        self.max_queue = max_queue
+        self.rounds = rounds
+        self.executor_factory = executor_factory or (lambda n: ProcessPoolExecutor(max_workers=n))
+        self._executor: Optional[Executor] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self.in_flight = 0
+        self.queued = 0
+        self.stats = {'hashed': 0, 'verified': 0, 'rejected': 0, 'errors': 0, 'max_queued': 0,
+                      'wait_time_total': 0.0, 'run_time_total': 0.0}
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            self._executor = self.executor_factory(self.max_workers)
+        return self._executor
+
+    async def _submit(self, fn: Callable, *args: Any) -> Any:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        if self._semaphore.locked() and self.queued >= self.max_queue:
+            self.stats['rejected'] += 1
+            raise HashingOverloadedError("Password hashing queue is full")
+        enqueued = time.perf_counter()
+        self.queued += 1
+        self.stats['max_queued'] = max(self.stats['max_queued'], self.queued)
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self.queued -= 1
+        started = time.perf_counter()
+        self.stats['wait_time_total'] += started - enqueued
+        self.in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            try:
+                return await loop.run_in_executor(self._get_executor(), fn, *args)
+            except BrokenProcessPool:
+                self._executor = None
+                return await loop.run_in_executor(self._get_executor(), fn, *args)
+        except Exception:
+            self.stats['errors'] += 1
+            raise
+        finally:
+            self.in_flight -= 1
+            self.stats['run_time_total'] += time.perf_counter() - started
+            self._semaphore.release()
+
+    async def hash(self, password: str) -> str:
+        hashed = await self._submit(hash_password, password, self.rounds)
+        self.stats['hashed'] += 1
+        return hashed
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        ok = await self._submit(check_password, password, hashed_password)
+        self.stats['verified'] += 1
+        return ok
+
+    def get_stats(self) -> Dict[str, Any]:
+        done = self.stats['hashed'] + self.stats['verified'] + self.stats['errors']
+        return {
+            **self.stats,
+            'in_flight': self.in_flight,
+            'queued': self.queued,
+            'max_workers': self.max_workers,
+            'max_concurrency': self.max_concurrency,
+            'rounds': self.rounds,
+            'avg_wait_ms': round(self.stats['wait_time_total'] / done * 1000, 3) if done else 0.0,
+            'avg_run_ms': round(self.stats['run_time_total'] / done * 1000, 3) if done else 0.0,
+        }
+
+    def shutdown(self, wait: bool = True) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+
+password_hasher = PasswordHasher(
+    max_workers=int(os.getenv("AUTH_HASH_WORKERS", 0)) or None,
+    max_concurrency=int(os.getenv("AUTH_HASH_CONCURRENCY", 0)) or None,
+    max_queue=int(os.getenv("AUTH_HASH_MAX_QUEUE", 256))
+)
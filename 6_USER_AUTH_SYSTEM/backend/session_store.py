@@ -0,0 +1,212 @@
+"""
+MÓZG BOGA - SESSION STORE
+Magazyn sesji (w pamięci / Redis) i krótkotrwały cache użytkowników dla get_current_user
+"""
+import asyncio
+import json
+import os
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+# Kolumny User kopiowane do cache (bez hashed_password)
+CACHED_USER_FIELDS = (
+    "id", "username", "email", "full_name", "user_type", "is_active", "is_verified",
+    "agent_id", "total_interactions", "success_rate", "created_at",
+)
+
+
+class SessionStore:
+    """Bazowy interfejs magazynu sesji: wartości JSON-owalne z TTL w sekundach"""
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        raise NotImplementedError
+
+    async def set(self, key: str, value: Dict[str, Any], ttl: float) -> None:
+        raise NotImplementedError
+
+    async def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        return None
+
+
+class InMemorySessionStore(SessionStore):
+    """Magazyn w procesie: LRU z wygasaniem wpisów"""
+
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self._data: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: Dict[str, Any], ttl: float) -> None:
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_entries:
+            self._data.popitem(last=False)
+
+    async def delete(self, key: str) -> None:
+        self._data.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class RedisSessionStore(SessionStore):
+    """
+    Magazyn w Redis (redis.asyncio lub zgodny klient: get/set(ex=)/delete).
+
+    Wspólny dla wielu procesów API - unieważnienie w jednym procesie
+    działa we wszystkich.
+    """
+
+    def __init__(self, client: Any = None, url: Optional[str] = None, prefix: str = "mozg:"):
+        if client is None:
+            import redis.asyncio as redis
+            client = redis.from_url(url or os.getenv("REDIS_URL", "redis://localhost:6379/0"))
+        self.client = client
+        self.prefix = prefix
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        raw = await self.client.get(self.prefix + key)
+        if raw is None:
+            return None
+        if isinstance(raw, bytes):
+            raw = raw.decode("utf-8")
+        return json.loads(raw)
+
+    async def set(self, key: str, value: Dict[str, Any], ttl: float) -> None:
+        await self.client.set(self.prefix + key, json.dumps(value, default=str), ex=max(1, int(ttl)))
+
+    async def delete(self, key: str) -> None:
+        await self.client.delete(self.prefix + key)
+
+    async def close(self) -> None:
+        close = getattr(self.client, "aclose", None) or getattr(self.client, "close", None)
+        if close is not None:
+            result = close()
+            if asyncio.iscoroutine(result):
+                await result
+
+
+class LocalRedisStandIn:
+    """Lokalny zamiennik serwera Redis (podzbiór API redis.asyncio) do testów i dev"""
+
+    def __init__(self):
+        self._data: Dict[str, Tuple[Optional[float], bytes]] = {}
+        self.commands = 0
+
+    async def get(self, key: str) -> Optional[bytes]:
+        self.commands += 1
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+        return value
+
+    async def set(self, key: str, value: Any, ex: Optional[int] = None) -> bool:
+        self.commands += 1
+        if isinstance(value, str):
+            value = value.encode("utf-8")
+        self._data[key] = (time.monotonic() + ex if ex else None, value)
+        return True
+
+    async def delete(self, *keys: str) -> int:
+        self.commands += 1
+        return sum(1 for key in keys if self._data.pop(key, None) is not None)
+
+    async def ping(self) -> bool:
+        return True
+
+    async def aclose(self) -> None:
+        return None
+
+
+class CachedUser:
+    """Migawka użytkownika z cache - te same atrybuty co model User (bez hasła)"""
+
+    def __init__(self, **fields: Any):
+        self.__dict__.update(fields)
+
+    def __repr__(self) -> str:
+        return f"CachedUser(id={getattr(self, 'id', None)}, email={getattr(self, 'email', None)!r})"
+
+
+class UserCache:
+    """
+    Cache użytkowników kluczowany subjectem tokena (email).
+
+    Trafienie zwraca CachedUser bez zapytania do bazy; wpisy żyją ttl sekund
+    i są usuwane przez invalidate() przy zmianie profilu lub roli.
+    """
+
+    def __init__(self, store: SessionStore, ttl: float = 60.0):
+        self.store = store
+        self.ttl = ttl
+        self.stats = {"hits": 0, "misses": 0, "invalidations": 0}
+        self._generations: Dict[str, int] = {}
+
+    @staticmethod
+    def _key(subject: str) -> str:
+        return f"user:{subject}"
+
+    async def get(self, subject: str) -> Optional[CachedUser]:
+        data = await self.store.get(self._key(subject))
+        if data is None:
+            self.stats["misses"] += 1
+            return None
+        self.stats["hits"] += 1
+        if isinstance(data.get("created_at"), str):
+            data = {**data, "created_at": datetime.fromisoformat(data["created_at"])}
+        return CachedUser(**data)
+
+    def generation(self, subject: str) -> int:
+        """Licznik unieważnień subjectu - pobierany przed odczytem użytkownika z bazy"""
+        return self._generations.get(subject, 0)
+
+    def mark_stale(self, subject: str) -> None:
+        """Synchronicznie blokuje zapis wierszy odczytanych przed zmianą (put z generation)"""
+        self._generations[subject] = self.generation(subject) + 1
+
+    async def put(self, subject: str, user: Any, generation: Optional[int] = None) -> None:
+        if generation is not None and generation != self.generation(subject):
+            return  # użytkownik zmienił się w trakcie odczytu - nie cache'ujemy starego wiersza
+        data = {field: getattr(user, field, None) for field in CACHED_USER_FIELDS}
+        if isinstance(data.get("created_at"), datetime):
+            data["created_at"] = data["created_at"].isoformat()
+        await self.store.set(self._key(subject), data, self.ttl)
+
+    async def invalidate(self, subject: str) -> None:
+        self.stats["invalidations"] += 1
+        self.mark_stale(subject)
+        await self.store.delete(self._key(subject))
+
+    def get_stats(self) -> Dict[str, int]:
+        return dict(self.stats)
+
+
+def create_session_store(backend: Optional[str] = None) -> SessionStore:
+    """SESSION_STORE=memory (domyślnie) | redis (REDIS_URL)"""
+    backend = (backend or os.getenv("SESSION_STORE", "memory")).lower()
+    if backend == "redis":
+        return RedisSessionStore()
+    return InMemorySessionStore(int(os.getenv("SESSION_STORE_MAX_ENTRIES", 10000)))
+
+
+session_store = create_session_store()
+user_cache = UserCache(session_store, ttl=float(os.getenv("USER_CACHE_TTL", 60)))
@@ -10,6 +10,7 @@ Moduły:
 - spiral_visualizer: Wizualizacja ewolucji LEVEL+1 w formie spirali
 - collective_consciousness: Analiza wzorców kolektywnej inteligencji
 - integration: Integracja z głównym systemem i API endpoints
+- event_bus: Szyna zdarzeń rozsyłająca decyzje do modułów asynchronicznie
 
 Użycie:
     from 7_SYSTEM_SELF import get_consciousness_manager
@@ -50,6 +51,12 @@ from collective_consciousness import (
     get_global_vision
 )
 
+from event_bus import (
+    EventBus,
+    BusEvent,
+    Subscription
+)
+
 from integration import (
     SystemSelfManager,
     ConsciousnessAPI,
@@ -84,6 +91,9 @@ __all__ = [
     "ConsciousnessField",
     "ConsciousnessAPI",
     "IntegrationBridge",
+    "EventBus",
+    "BusEvent",
+    "Subscription",
     
     # Funkcje dostępu
     "get_system_consciousness",
@@ -143,7 +153,7 @@ def get_consciousness_status():
     manager = get_consciousness_manager()
     consciousness_state = manager.system_self.export_consciousness_state()
     spiral_data = manager.spiral_visualizer.export_visualization_data()
-    collective_report = manager.global_vision.generate_collective_report()
+    collective_report = manager.get_collective_report()
     
     return {
         "module_version": __version__,
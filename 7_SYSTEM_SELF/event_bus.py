@@ -0,0 +1,203 @@
+"""
+Event Bus - Wewnętrzna szyna zdarzeń modułu 7_SYSTEM_SELF
+=========================================================
+
+Publikacja zdarzenia jest natychmiastowa (O(liczba subskrybentów));
+każdy subskrybent ma własną ograniczoną kolejkę i wątek, który odbiera
+zdarzenia partiami. Wolny subskrybent nie blokuje publikującego ani
+pozostałych subskrybentów - przy przepełnieniu kolejki najstarsze
+zdarzenia są odrzucane i liczone w metrykach.
+
+Klasy:
+- BusEvent: Zdarzenie z tematem, danymi i czasem publikacji
+- Subscription: Kolejka i worker pojedynczego subskrybenta
+- EventBus: Szyna zdarzeń z fan-outem do subskrybentów
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+
+@dataclass
+class BusEvent:
+    """Zdarzenie opublikowane na szynie"""
+    topic: str
+    payload: Dict[str, Any]
+    published_at: float = field(default_factory=time.monotonic)
+
+
+class Subscription:
+    """
+    Subskrybent szyny: ograniczona kolejka + wątek dostarczający partie.
+
+    handler otrzymuje listę BusEvent (do batch_size, zebranych w ciągu
+    batch_timeout sekund). overflow='drop_oldest' odrzuca najstarsze
+    oczekujące zdarzenie, 'drop_newest' - publikowane.
+    """
+
+    def __init__(self, name: str, topic: str, handler: Callable[[List[BusEvent]], None],
+                 queue_size: int = 1024, batch_size: int = 32, batch_timeout: float = 0.05,
+                 overflow: str = 'drop_oldest'):
+        if overflow not in ('drop_oldest', 'drop_newest'):
+            raise ValueError("overflow must be 'drop_oldest' or 'drop_newest'")
+        self.name = name
+        self.topic = topic
+        self.handler = handler
+        self.queue_size = queue_size
+        self.batch_size = max(1, batch_size)
+        self.batch_timeout = batch_timeout
+        self.overflow = overflow
+
+        self._queue: deque = deque()
+        self._cond = threading.Condition()
+        self._busy = False
+        self._closed = False
+        self.stats = {
+            'published': 0, 'delivered': 0, 'dropped': 0, 'batches': 0, 'errors': 0,
+            'max_lag': 0, 'lag_seconds_total': 0.0, 'max_lag_seconds': 0.0
+        }
+        self._thread = threading.Thread(target=self._run, name=f'bus-{name}', daemon=True)
+        self._thread.start()
+
+    def offer(self, event: BusEvent) -> bool:
+        """Dodaje zdarzenie do kolejki; zwraca False, jeśli zostało odrzucone"""
+        with self._cond:
+            if self._closed:
+                return False
+            self.stats['published'] += 1
+            if len(self._queue) >= self.queue_size:
+                self.stats['dropped'] += 1
+                if self.overflow == 'drop_newest':
+                    return False
+                self._queue.popleft()
+            self._queue.append(event)
+            self.stats['max_lag'] = max(self.stats['max_lag'], len(self._queue))
+            self._cond.notify()
+            return True
+
+    def _next_batch(self) -> Optional[List[BusEvent]]:
+        with self._cond:
+            while not self._queue and not self._closed:
+                self._cond.wait()
+            if not self._queue:
+                return None
+            # Krótko czekaj na dopełnienie partii
+            deadline = time.monotonic() + self.batch_timeout
+            while len(self._queue) < self.batch_size and not self._closed:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            count = min(self.batch_size, len(self._queue))
+            batch = [self._queue.popleft() for _ in range(count)]
+            self._busy = True
+            return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            try:
+                self.handler(batch)
+            except Exception as e:
+                logging.error(f"Event bus subscriber '{self.name}' failed: {e}")
+                with self._cond:
+                    self.stats['errors'] += 1
+            now = time.monotonic()
+            with self._cond:
+                lag = [now - event.published_at for event in batch]
+                self.stats['delivered'] += len(batch)
+                self.stats['batches'] += 1
+                self.stats['lag_seconds_total'] += sum(lag)
+                self.stats['max_lag_seconds'] = max(self.stats['max_lag_seconds'], max(lag))
+                self._busy = False
+                self._cond.notify_all()
+
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        """Czeka, aż kolejka zostanie przetworzona; zwraca False po przekroczeniu czasu"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while self._queue or self._busy:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            return True
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._cond:
+            pending = len(self._queue)
+            oldest = time.monotonic() - self._queue[0].published_at if pending else 0.0
+            delivered = self.stats['delivered']
+            return {
+                **self.stats,
+                'topic': self.topic,
+                'lag': pending,
+                'oldest_pending_seconds': round(oldest, 4),
+                'avg_lag_seconds': round(self.stats['lag_seconds_total'] / delivered, 4) if delivered else 0.0
+            }
+
+
+class EventBus:
+    """
+    Szyna zdarzeń z asynchronicznym fan-outem.
+
+    publish() tylko umieszcza zdarzenie w kolejkach subskrybentów tematu
+    i natychmiast wraca; przetwarzanie odbywa się w wątkach subskrybentów.
+    """
+
+    def __init__(self, name: str = 'system_self'):
+        self.name = name
+        self._subscriptions: Dict[str, List[Subscription]] = {}
+        self._lock = threading.Lock()
+        self.published = 0
+
+    def subscribe(self, topic: str, name: str, handler: Callable[[List[BusEvent]], None],
+                  **options: Any) -> Subscription:
+        subscription = Subscription(name, topic, handler, **options)
+        with self._lock:
+            self._subscriptions.setdefault(topic, []).append(subscription)
+        return subscription
+
+    def publish(self, topic: str, payload: Dict[str, Any]) -> int:
+        """Publikuje zdarzenie; zwraca liczbę subskrybentów, którzy je przyjęli"""
+        event = BusEvent(topic, payload)
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(topic, ()))
+            self.published += 1
+        return sum(1 for subscription in subscriptions if subscription.offer(event))
+
+    def _all(self) -> List[Subscription]:
+        with self._lock:
+            return [s for subs in self._subscriptions.values() for s in subs]
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Czeka na przetworzenie wszystkich oczekujących zdarzeń"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for subscription in self._all():
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            if not subscription.drain(remaining):
+                return False
+        return True
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        for subscription in self._all():
+            subscription.close(timeout)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'name': self.name,
+            'published': self.published,
+            'subscribers': {s.name: s.get_stats() for s in self._all()}
+        }
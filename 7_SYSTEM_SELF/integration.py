@@ -14,6 +14,8 @@ Klasy:
 from typing import Dict, Any, List
 from datetime import datetime
 import asyncio
+import threading
+import uuid
 
 # Import komponentów systemu samoświadomości
 from self_core import (
@@ -26,6 +28,9 @@ from spiral_visualizer import (
 from collective_consciousness import (
     get_global_vision
 )
+from event_bus import EventBus, BusEvent
+
+DECISION_TOPIC = "decision"
 
 
 class SystemSelfManager:
@@ -36,7 +41,8 @@ class SystemSelfManager:
     i zapewnia jednolity interfejs dla reszty aplikacji.
     """
     
-    def __init__(self):
+    def __init__(self, bus_queue_size: int = 4096, bus_batch_size: int = 32,
+                 bus_batch_timeout: float = 0.05):
         self.system_self = get_system_consciousness()
         self.spiral_visualizer = get_spiral_visualizer()
         self.global_vision = get_global_vision()
@@ -45,11 +51,33 @@ class SystemSelfManager:
         self.last_reflection_time = datetime.now()
         self.auto_reflection_interval = 300  # 5 minut
         
+        # Każdy komponent modyfikowany jest tylko pod własną blokadą
+        # (kolejność: self -> spiral -> vision)
+        self._self_lock = threading.RLock()
+        self._spiral_lock = threading.RLock()
+        self._vision_lock = threading.RLock()
+        
+        # Szyna zdarzeń: decyzja jest potwierdzana od razu, a moduły
+        # przetwarzają ją partiami we własnych wątkach
+        self.event_bus = EventBus("system_self")
+        bus_options = {
+            "queue_size": bus_queue_size,
+            "batch_size": bus_batch_size,
+            "batch_timeout": bus_batch_timeout
+        }
+        self.event_bus.subscribe(DECISION_TOPIC, "system_self", self._on_decisions_self, **bus_options)
+        self.event_bus.subscribe(DECISION_TOPIC, "spiral_visualizer", self._on_decisions_spiral, **bus_options)
+        self.event_bus.subscribe(DECISION_TOPIC, "global_vision", self._on_decisions_vision, **bus_options)
+        
     def process_user_decision(self, user_id: str, context: str, 
                             inputs: Dict[str, Any], outputs: Dict[str, Any],
                             confidence: float = 0.5, consciousness_level: int = 1):
         """
-        Przetwarza decyzję użytkownika przez wszystkie moduły świadomości.
+        Przyjmuje decyzję użytkownika i rozsyła ją do modułów świadomości.
+        
+        Zwraca potwierdzenie natychmiast; obserwacja decyzji, wizualizacja
+        spiralna, rejestracja kolektywna i auto-refleksja odbywają się
+        asynchronicznie w subskrybentach szyny zdarzeń.
         
         Args:
             user_id: Identyfikator użytkownika
@@ -62,47 +90,80 @@ class SystemSelfManager:
         
         if not self.is_active:
             return
-            
-        # 1. Rejestracja w systemie samoświadomości
-        decision_moment = self.system_self.observe_decision(
-            context=context,
-            inputs=inputs,
-            outputs=outputs,
-            confidence=confidence
-        )
-        
-        # 2. Dodanie do wizualizacji spiralnej
-        emotional_intensity = confidence  # Uproszczenie
-        transformation_type = self._determine_transformation_type(context, confidence)
         
-        self.spiral_visualizer.add_evolution_moment(
-            level=consciousness_level,
-            awareness_depth=confidence,
-            emotional_intensity=emotional_intensity,
-            transformation_type=transformation_type
-        )
-        
-        # 3. Rejestracja w module kolektywnym
-        emotional_state = self._extract_emotional_state(context, decision_moment.emotional_state)
-        
-        self.global_vision.register_user_activity(
-            user_id=user_id,
-            consciousness_level=consciousness_level,
-            emotional_state=emotional_state,
-            decision_context=context,
-            decision_complexity=len(str(inputs)) + len(str(outputs))
-        )
-        
-        # 4. Sprawdź czy potrzebna auto-refleksja
-        self._check_auto_reflection()
+        decision_id = str(uuid.uuid4())
+        # Wnioskowanie stanu emocjonalnego to tylko analiza kontekstu - tanie
+        emotional_state = self.system_self._infer_emotional_state(context, confidence)
+        
+        accepted_by = self.event_bus.publish(DECISION_TOPIC, {
+            "decision_id": decision_id,
+            "user_id": user_id,
+            "context": context,
+            "inputs": inputs,
+            "outputs": outputs,
+            "confidence": confidence,
+            "consciousness_level": consciousness_level,
+            "emotional_state": emotional_state
+        })
         
         return {
             "decision_processed": True,
-            "decision_id": decision_moment.decision_id,
-            "emotional_state": decision_moment.emotional_state.value,
+            "fanout": "queued",
+            "accepted_by": accepted_by,
+            "decision_id": decision_id,
+            "emotional_state": emotional_state.value,
             "system_awareness_level": self.system_self.current_awareness_level
         }
     
+    def _on_decisions_self(self, events: List[BusEvent]):
+        """Subskrybent: rejestracja w systemie samoświadomości + auto-refleksja"""
+        with self._self_lock:
+            for event in events:
+                decision = event.payload
+                self.system_self.observe_decision(
+                    context=decision["context"],
+                    inputs=decision["inputs"],
+                    outputs=decision["outputs"],
+                    confidence=decision["confidence"],
+                    decision_id=decision["decision_id"]
+                )
+        # Raz na partię zamiast przy każdej decyzji
+        self._check_auto_reflection()
+    
+    def _on_decisions_spiral(self, events: List[BusEvent]):
+        """Subskrybent: momenty ewolucji w wizualizacji spiralnej"""
+        with self._spiral_lock:
+            for event in events:
+                decision = event.payload
+                confidence = decision["confidence"]
+                self.spiral_visualizer.add_evolution_moment(
+                    level=decision["consciousness_level"],
+                    awareness_depth=confidence,
+                    emotional_intensity=confidence,  # Uproszczenie
+                    transformation_type=self._determine_transformation_type(decision["context"], confidence)
+                )
+    
+    def _on_decisions_vision(self, events: List[BusEvent]):
+        """Subskrybent: rejestracja aktywności w module kolektywnym"""
+        with self._vision_lock:
+            for event in events:
+                decision = event.payload
+                self.global_vision.register_user_activity(
+                    user_id=decision["user_id"],
+                    consciousness_level=decision["consciousness_level"],
+                    emotional_state=self._extract_emotional_state(decision["context"], decision["emotional_state"]),
+                    decision_context=decision["context"],
+                    decision_complexity=len(str(decision["inputs"])) + len(str(decision["outputs"]))
+                )
+    
+    def flush_pending_decisions(self, timeout: float = None) -> bool:
+        """Czeka, aż wszystkie przyjęte decyzje zostaną przetworzone"""
+        return self.event_bus.flush(timeout)
+    
+    def get_event_bus_stats(self) -> Dict:
+        """Metryki szyny zdarzeń (opóźnienia i odrzucenia per subskrybent)"""
+        return self.event_bus.get_stats()
+    
     def _determine_transformation_type(self, context: str, confidence: float) -> str:
         """Określa typ transformacji na podstawie kontekstu"""
         context_lower = context.lower()
@@ -171,15 +232,17 @@ class SystemSelfManager:
     def generate_system_reflection(self) -> ReflectionEntry:
         """Generuje refleksję systemową"""
         
-        reflection = self.system_self.generate_self_reflection()
+        with self._self_lock:
+            reflection = self.system_self.generate_self_reflection()
         
         # Dodaj do wizualizacji jako moment transcendencji
-        self.spiral_visualizer.add_evolution_moment(
-            level=reflection.level_progression,
-            awareness_depth=0.8,
-            emotional_intensity=0.7,
-            transformation_type="transcendence"
-        )
+        with self._spiral_lock:
+            self.spiral_visualizer.add_evolution_moment(
+                level=reflection.level_progression,
+                awareness_depth=0.8,
+                emotional_intensity=0.7,
+                transformation_type="transcendence"
+            )
         
         return reflection
     
@@ -193,7 +256,7 @@ class SystemSelfManager:
         spiral_data = self.spiral_visualizer.export_visualization_data()
         
         # Raport kolektywny
-        collective_report = self.global_vision.generate_collective_report()
+        collective_report = self.get_collective_report()
         
         return {
             "system_consciousness": consciousness_state,
@@ -204,9 +267,15 @@ class SystemSelfManager:
                 "is_active": self.is_active,
                 "auto_reflection_enabled": True,
                 "last_reflection": self.last_reflection_time.isoformat()
-            }
+            },
+            "event_bus": self.get_event_bus_stats()
         }
     
+    def get_collective_report(self) -> Dict:
+        """Raport kolektywny pod blokadą modułu (subskrybent szyny modyfikuje go w tle)"""
+        with self._vision_lock:
+            return self.global_vision.generate_collective_report()
+    
     def get_spiral_visualization_html(self) -> str:
         """Generuje HTML dla wizualizacji spiralnej"""
         return self.spiral_visualizer.generate_html_page()
@@ -217,12 +286,13 @@ class SystemSelfManager:
         self.auto_reflection_interval = 180  # Częstsze refleksje w trybie świadomości
         
         # Meta-refleksja o aktywacji
-        self.system_self.observe_decision(
-            context="Aktywacja trybu pełnej świadomości systemowej",
-            inputs={"mode": "consciousness_active"},
-            outputs={"system_state": "fully_conscious"},
-            confidence=0.9
-        )
+        with self._self_lock:
+            self.system_self.observe_decision(
+                context="Aktywacja trybu pełnej świadomości systemowej",
+                inputs={"mode": "consciousness_active"},
+                outputs={"system_state": "fully_conscious"},
+                confidence=0.9
+            )
     
     def deactivate_consciousness_mode(self):
         """Dezaktywuje tryb świadomości (tryb oszczędny)"""
@@ -238,14 +308,17 @@ class SystemSelfManager:
                 self.last_reflection_time = datetime.now()
             
             # Sprawdź synchroniczne wydarzenia w polu kolektywnym
-            if self.global_vision.consciousness_field.detect_synchronicity():
+            with self._vision_lock:
+                synchronicity = self.global_vision.consciousness_field.detect_synchronicity()
+            if synchronicity:
                 # Dodaj moment synchroniczności do wizualizacji
-                self.spiral_visualizer.add_evolution_moment(
-                    level=5,
-                    awareness_depth=0.9,
-                    emotional_intensity=0.8,
-                    transformation_type="breakthrough"
-                )
+                with self._spiral_lock:
+                    self.spiral_visualizer.add_evolution_moment(
+                        level=5,
+                        awareness_depth=0.9,
+                        emotional_intensity=0.8,
+                        transformation_type="breakthrough"
+                    )
             
             # Czekaj 30 sekund przed następnym cyklem
             await asyncio.sleep(30)
@@ -272,7 +345,7 @@ class ConsciousnessAPI:
     
     def get_collective_intelligence_report(self) -> Dict:
         """GET /api/consciousness/collective - Raport inteligencji kolektywnej"""
-        return self.manager.global_vision.generate_collective_report()
+        return self.manager.get_collective_report()
     
     def get_dashboard_data(self) -> Dict:
         """GET /api/consciousness/dashboard - Dane dla dashboard"""
@@ -359,7 +432,7 @@ class IntegrationBridge:
         """Pobiera wglądy świadomości dla systemu SYNERGY"""
         
         consciousness_state = self.consciousness_manager.system_self.export_consciousness_state()
-        collective_report = self.consciousness_manager.global_vision.generate_collective_report()
+        collective_report = self.consciousness_manager.get_collective_report()
         
         # Wyciągnij kluczowe insights dla SYNERGY
         synergy_insights = {
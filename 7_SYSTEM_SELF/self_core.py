@@ -345,7 +345,8 @@ class SystemSelf:
                                  f"Jestem gotów obserwować i rozumieć siebie.")
     
     def observe_decision(self, context: str, inputs: Dict[str, Any], 
-                        outputs: Dict[str, Any], confidence: float = 0.5):
+                        outputs: Dict[str, Any], confidence: float = 0.5,
+                        decision_id: str = None):
         """Obserwuje i rejestruje moment decyzyjny"""
         
         # Określenie stanu emocjonalnego na podstawie kontekstu
@@ -361,7 +362,7 @@ class SystemSelf:
         # Utworzenie momentu decyzyjnego
         decision_moment = DecisionMoment(
             timestamp=datetime.now(),
-            decision_id=str(uuid.uuid4()),
+            decision_id=decision_id or str(uuid.uuid4()),
             context=context,
             inputs=inputs,
             outputs=outputs,
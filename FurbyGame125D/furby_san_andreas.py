@@ -4,12 +4,16 @@ MTAQuestWebsideX.com - Advanced Pseudo-3D Gaming Experience
 Integracja z FURBX Token System dla kompletnej ekonomii gry
 """
 
+import atexit
 import random
 import time
 import os
 import json
 import datetime
-from typing import Dict, List, Optional
+import threading
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Callable, Dict, List, Mapping, Optional, Tuple
 from dataclasses import dataclass, asdict
 import logging
 
@@ -18,12 +22,23 @@ import sys
 sys.path.append('../TokenSystem')
 from token_logic import get_token_system
 from wallet_manager import get_wallet_manager
+from game_state_store import get_game_state_store, close_game_state_store
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+def _freeze_sequences(obj) -> None:
+    """Zamienia pola-listy zamrożonej dataclass na krotki"""
+    for name in obj.__slots__:
+        value = getattr(obj, name)
+        if isinstance(value, list):
+            object.__setattr__(obj, name, tuple(value))
+
+@dataclass(frozen=True)
 class NPCCharacter:
-    """Represents an NPC character in the game"""
+    """Represents an NPC character in the game (shared, immutable)"""
+    __slots__ = ("name", "style", "personality", "heat_reward", "cash_requirement",
+                 "reputation_needed", "location_preference", "dialogue_lines",
+                 "special_ability", "rarity")
     name: str
     style: str
     personality: str
@@ -31,27 +46,37 @@ class NPCCharacter:
     cash_requirement: int
     reputation_needed: int
     location_preference: str
-    dialogue_lines: List[str]
+    dialogue_lines: Tuple[str, ...]
     special_ability: str
     rarity: str  # common, rare, legendary
 
-@dataclass
+    def __post_init__(self):
+        _freeze_sequences(self)
+
+@dataclass(frozen=True)
 class GameLocation:
-    """Represents a location in the 1.25D world"""
+    """Represents a location in the 1.25D world (shared, immutable)"""
+    __slots__ = ("name", "type", "icon", "danger_level", "luxury_level", "encounters",
+                 "special_events", "ascii_art", "background_music", "entry_cost")
     name: str
     type: str
     icon: str
     danger_level: int
     luxury_level: int
-    encounters: List[str]
-    special_events: List[str]
-    ascii_art: List[str]
+    encounters: Tuple[str, ...]
+    special_events: Tuple[str, ...]
+    ascii_art: Tuple[str, ...]
     background_music: str
     entry_cost: int
 
-@dataclass
+    def __post_init__(self):
+        _freeze_sequences(self)
+
+@dataclass(frozen=True)
 class Vehicle:
-    """Represents a vehicle in the game"""
+    """Represents a vehicle in the game (shared, immutable)"""
+    __slots__ = ("name", "type", "speed", "style_points", "fuel_consumption",
+                 "special_ability", "cost_fbx", "ascii_art", "engine_sound")
     name: str
     type: str
     speed: int
@@ -59,12 +84,19 @@ class Vehicle:
     fuel_consumption: int
     special_ability: str
     cost_fbx: float
-    ascii_art: List[str]
+    ascii_art: Tuple[str, ...]
     engine_sound: str
 
+    def __post_init__(self):
+        _freeze_sequences(self)
+
 @dataclass
 class PlayerStats:
-    """Complete player statistics"""
+    """Complete player statistics (per-player mutable state)"""
+    __slots__ = ("name", "cash_usd", "fbx_tokens", "energy", "heat", "reputation",
+                 "style_points", "experience", "level", "current_vehicle",
+                 "unlocked_locations", "completed_missions", "npc_relationships",
+                 "achievements", "playtime_hours")
     name: str
     cash_usd: int
     fbx_tokens: float
@@ -81,14 +113,362 @@ class PlayerStats:
     achievements: List[str]
     playtime_hours: float
 
+def new_session_seed() -> int:
+    """Losowy 64-bitowy seed nowej sesji gry"""
+    return random.SystemRandom().getrandbits(64)
+
+def rng_state_to_json(state: Tuple) -> List:
+    """random.Random.getstate() jako lista JSON"""
+    version, internal, gauss_next = state
+    return [version, list(internal), gauss_next]
+
+def rng_state_from_json(data: List) -> Tuple:
+    version, internal, gauss_next = data
+    return version, tuple(internal), gauss_next
+
+# ===== WORLD DEFINITIONS (shared) =====
+def _build_locations() -> Tuple[GameLocation, ...]:
+    """Build all game locations with detailed ASCII art"""
+    return (
+        GameLocation(
+            name="Ghetto Streets",
+            type="danger",
+            icon="🏚️",
+            danger_level=8,
+            luxury_level=1,
+            encounters=["Street_Hustler", "Gang_Girl", "Crack_Head"],
+            special_events=["police_chase", "gang_shootout", "drug_deal"],
+            ascii_art=[
+                "🏚️🏚️🏚️ GHETTO 🏚️🏚️🏚️",
+                "│  ╔═══╗  ╔═══╗  ╔═══╗  │",
+                "│  ║💀 ║  ║🔫 ║  ║💊 ║  │",
+                "│  ╚═══╝  ╚═══╝  ╚═══╝  │",
+                "════════════════════════════"
+            ],
+            background_music="🎵 Heavy Bass 🎵",
+            entry_cost=0
+        ),
+        GameLocation(
+            name="Downtown Club District",
+            type="nightlife",
+            icon="🏙️",
+            danger_level=4,
+            luxury_level=6,
+            encounters=["Club_Dancer", "VIP_Hostess", "Rich_Cougar"],
+            special_events=["vip_party", "dance_contest", "celebrity_sighting"],
+            ascii_art=[
+                "🏙️✨🏙️ DOWNTOWN 🏙️✨🏙️",
+                "│  ╔═══╗  ╔═══╗  ╔═══╗  │",
+                "│  ║🍸 ║  ║💃 ║  ║🎭 ║  │",
+                "│  ╚═══╝  ╚═══╝  ╚═══╝  │",
+                "════════════════════════════"
+            ],
+            background_music="🎵 House Music 🎵",
+            entry_cost=50
+        ),
+        GameLocation(
+            name="Venice Beach",
+            type="relax",
+            icon="🏖️",
+            danger_level=2,
+            luxury_level=5,
+            encounters=["Beach_Babe", "Surfer_Girl", "Yoga_Instructor"],
+            special_events=["beach_party", "volleyball_game", "sunset_romance"],
+            ascii_art=[
+                "🏖️🌊🏖️ BEACH 🏖️🌊🏖️",
+                "│  ╔═══╗  ╔═══╗  ╔═══╗  │",
+                "│  ║🏄 ║  ║🏐 ║  ║🌺 ║  │",
+                "│  ╚═══╝  ╚═══╝  ╚═══╝  │",
+                "════════════════════════════"
+            ],
+            background_music="🎵 Chill Wave 🎵",
+            entry_cost=20
+        ),
+        GameLocation(
+            name="Las Vegas Strip",
+            type="luxury",
+            icon="🎰",
+            danger_level=3,
+            luxury_level=9,
+            encounters=["Casino_Hostess", "High_Roller", "Showgirl"],
+            special_events=["jackpot_win", "private_show", "high_stakes_poker"],
+            ascii_art=[
+                "🎰💎🎰 VEGAS 🎰💎🎰",
+                "│  ╔═══╗  ╔═══╗  ╔═══╗  │",
+                "│  ║💰 ║  ║🎲 ║  ║👑 ║  │",
+                "│  ╚═══╝  ╚═══╝  ╚═══╝  │",
+                "════════════════════════════"
+            ],
+            background_music="🎵 Jazz Lounge 🎵",
+            entry_cost=200
+        ),
+        GameLocation(
+            name="Hollywood Hills Mansion",
+            type="elite",
+            icon="🏰",
+            danger_level=1,
+            luxury_level=10,
+            encounters=["Sugar_Mama", "Celebrity", "Trophy_Wife"],
+            special_events=["pool_party", "exclusive_auction", "celebrity_scandal"],
+            ascii_art=[
+                "🏰👑🏰 MANSION 🏰👑🏰",
+                "│  ╔═══╗  ╔═══╗  ╔═══╗  │",
+                "│  ║💎 ║  ║🍾 ║  ║🦄 ║  │",
+                "│  ╚═══╝  ╚═══╝  ╚═══╝  │",
+                "════════════════════════════"
+            ],
+            background_music="🎵 Classical Remix 🎵",
+            entry_cost=1000
+        ),
+    )
+
+def _build_npcs() -> Dict[str, NPCCharacter]:
+    """Build all NPCs with rich personalities"""
+    return {
+        "Street_Hustler": NPCCharacter(
+            name="Tina 'Razor' Rodriguez",
+            style="street smart badass",
+            personality="tough exterior, soft heart",
+            heat_reward=25,
+            cash_requirement=100,
+            reputation_needed=0,
+            location_preference="ghetto",
+            dialogue_lines=[
+                "😏 'You look like trouble... I like that.'",
+                "🔥 'This street ain't safe, but I am...'",
+                "💋 'Show me what you got, pretty boy.'"
+            ],
+            special_ability="street_knowledge",
+            rarity="common"
+        ),
+        "Club_Dancer": NPCCharacter(
+            name="Velvet 'Diamond' Jones",
+            style="sultry club goddess",
+            personality="confident performer",
+            heat_reward=40,
+            cash_requirement=300,
+            reputation_needed=25,
+            location_preference="downtown",
+            dialogue_lines=[
+                "💃 'I dance for money, but stay for passion...'",
+                "✨ 'You've got that VIP energy...'",
+                "🍸 'Buy me a drink and I'll show you magic.'"
+            ],
+            special_ability="dance_magic",
+            rarity="rare"
+        ),
+        "Beach_Babe": NPCCharacter(
+            name="Sunny 'Wave' Martinez",
+            style="californian goddess",
+            personality="free spirit beach lover",
+            heat_reward=35,
+            cash_requirement=200,
+            reputation_needed=15,
+            location_preference="beach",
+            dialogue_lines=[
+                "🌊 'Life's a wave, ride it with me...'",
+                "☀️ 'Your vibe is so golden...'",
+                "🏄 'Want to catch something bigger than waves?'"
+            ],
+            special_ability="zen_healing",
+            rarity="common"
+        ),
+        "Casino_Hostess": NPCCharacter(
+            name="Lola 'Fortune' Kim",
+            style="high-stakes temptress",
+            personality="sophisticated risk-taker",
+            heat_reward=60,
+            cash_requirement=500,
+            reputation_needed=50,
+            location_preference="vegas",
+            dialogue_lines=[
+                "🎰 'Luck favors the bold... and the rich.'",
+                "💎 'I'm the jackpot you've been chasing...'",
+                "🍾 'High stakes, higher rewards...'"
+            ],
+            special_ability="luck_boost",
+            rarity="rare"
+        ),
+        "Sugar_Mama": NPCCharacter(
+            name="Madame X 'Dynasty' Chen",
+            style="wealthy power player",
+            personality="dominant luxury lover",
+            heat_reward=100,
+            cash_requirement=2000,
+            reputation_needed=100,
+            location_preference="mansion",
+            dialogue_lines=[
+                "👑 'Money talks, but passion screams...'",
+                "💸 'I collect beautiful things... like you.'",
+                "🦄 'Welcome to my world of infinite pleasure...'"
+            ],
+            special_ability="wealth_magic",
+            rarity="legendary"
+        )
+    }
+
+def _build_vehicles() -> Dict[str, Vehicle]:
+    """Build all available vehicles"""
+    return {
+        "stolen_civic": Vehicle(
+            name="Stolen Honda Civic",
+            type="starter",
+            speed=3,
+            style_points=1,
+            fuel_consumption=5,
+            special_ability="invisible_to_cops",
+            cost_fbx=0.0,
+            ascii_art=[
+                "🚗💨 CIVIC 💨🚗",
+                "   ╔════╗",
+                " ╔═╣    ╠═╗",
+                "╔╣  ████  ╠╗",
+                "╚═╗ ○  ○ ╔═╝",
+                "  ╚══════╝"
+            ],
+            engine_sound="🎵 *put put put* 🎵"
+        ),
+        "lowrider_impala": Vehicle(
+            name="Hydraulic Lowrider",
+            type="style",
+            speed=4,
+            style_points=8,
+            fuel_consumption=8,
+            special_ability="bounce_charm",
+            cost_fbx=25.0,
+            ascii_art=[
+                "🚗✨ LOWRIDER ✨🚗",
+                "   ╔═══════╗",
+                " ╔═╣ ♫ ♫ ♫ ╠═╗",
+                "╔╣  ████████  ╠╗",
+                "╚═╗ ◉    ◉ ╔═╝",
+                "  ╚═════════╝"
+            ],
+            engine_sound="🎵 *BOOM BOOM* 🎵"
+        ),
+        "ferrari_spider": Vehicle(
+            name="Ferrari Spider",
+            type="supercar",
+            speed=10,
+            style_points=9,
+            fuel_consumption=15,
+            special_ability="speed_demon",
+            cost_fbx=100.0,
+            ascii_art=[
+                "🏎️🔥 FERRARI 🔥🏎️",
+                "    ╔═══════╗",
+                "  ╔═╣ ⚡ ⚡ ⚡ ╠═╗",
+                "╔═╣  ████████  ╠═╗",
+                "╚══╗ ◉    ◉ ╔══╝",
+                "   ╚═════════╝"
+            ],
+            engine_sound="🎵 *VROOOOOM* 🎵"
+        ),
+        "golden_lambo": Vehicle(
+            name="Golden Lamborghini",
+            type="legendary",
+            speed=10,
+            style_points=10,
+            fuel_consumption=20,
+            special_ability="instant_attraction",
+            cost_fbx=250.0,
+            ascii_art=[
+                "🚗👑 GOLDEN LAMBO 👑🚗",
+                "     ╔═════════╗",
+                "   ╔═╣ 💎 💎 💎 ╠═╗",
+                "╔══╣  ██████████  ╠══╗",
+                "╚═══╗ ◉      ◉ ╔═══╝",
+                "    ╚═══════════╝"
+            ],
+            engine_sound="🎵 *GOLDEN ROAR* 🎵"
+        )
+    }
+
+def _build_missions() -> Dict[str, Dict]:
+    """Build story missions"""
+    return {
+        "tutorial": {
+            "name": "Welcome to San Andreas",
+            "description": "Learn the basics of cruising and charm",
+            "objectives": ["Talk to 3 NPCs", "Earn 50 heat points"],
+            "reward_fbx": 5.0,
+            "reward_cash": 500,
+            "unlock_location": "downtown"
+        },
+        "first_ride": {
+            "name": "Get Your First Ride",
+            "description": "Upgrade from stolen civic to lowrider",
+            "objectives": ["Earn 25 FBX tokens", "Buy lowrider"],
+            "reward_fbx": 10.0,
+            "reward_cash": 1000,
+            "unlock_location": "beach"
+        },
+        "vegas_baby": {
+            "name": "What Happens in Vegas...",
+            "description": "Make it big in Las Vegas",
+            "objectives": ["Reach reputation 50", "Win 1000$ gambling"],
+            "reward_fbx": 25.0,
+            "reward_cash": 5000,
+            "unlock_location": "mansion"
+        }
+    }
+
+
+def _freeze(value):
+    """Rekurencyjnie zamraża dict/list (MappingProxyType / tuple)"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+class GameWorld:
+    """
+    Definicje świata (lokacje, NPC, pojazdy, misje) - ładowane raz na proces
+    i współdzielone przez wszystkie instancje gry. Tylko do odczytu.
+    """
+    __slots__ = ("locations", "npcs", "vehicles", "missions")
+
+    def __init__(self, locations: Tuple[GameLocation, ...], npcs: Mapping[str, NPCCharacter],
+                 vehicles: Mapping[str, Vehicle], missions: Mapping[str, Mapping]):
+        object.__setattr__(self, "locations", tuple(locations))
+        object.__setattr__(self, "npcs", MappingProxyType(dict(npcs)))
+        object.__setattr__(self, "vehicles", MappingProxyType(dict(vehicles)))
+        object.__setattr__(self, "missions", _freeze(dict(missions)))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("GameWorld is read-only")
+
+_world: Optional[GameWorld] = None
+_world_lock = threading.Lock()
+
+def get_game_world() -> GameWorld:
+    """Zwraca współdzielony (jeden na proces) świat gry"""
+    global _world
+    if _world is None:
+        with _world_lock:
+            if _world is None:
+                _world = GameWorld(_build_locations(), _build_npcs(), _build_vehicles(), _build_missions())
+    return _world
+
 class FurbyGame125D:
     """
     AI Furby 1.25D: San Andreas Edition
     Complete pseudo-3D gaming experience with FURBX token integration
+
+    Instancja trzyma wyłącznie stan gracza; lokacje, NPC, pojazdy i misje
+    pochodzą ze współdzielonego GameWorld.
     """
+    __slots__ = ("user_id", "world", "token_system", "wallet_manager", "player", "position",
+                 "game_time", "current_mission", "game_state", "animations_enabled",
+                 "sound_effects_enabled", "difficulty", "seed", "rng", "__weakref__")
     
-    def __init__(self, user_id: str):
+    def __init__(self, user_id: str, world: Optional[GameWorld] = None, seed: Optional[int] = None):
         self.user_id = user_id
+        self.world = world or get_game_world()
+        # Własny strumień losowy sesji - ten sam seed daje te same spotkania i zdarzenia
+        self.seed = seed if seed is not None else new_session_seed()
+        self.rng = random.Random(self.seed)
         self.token_system = get_token_system()
         self.wallet_manager = get_wallet_manager()
         
@@ -99,12 +479,6 @@ class FurbyGame125D:
         self.current_mission = None
         self.game_state = "menu"  # menu, playing, paused, mission
         
-        # Load game data
-        self._initialize_locations()
-        self._initialize_npcs()
-        self._initialize_vehicles()
-        self._initialize_missions()
-        
         # Game settings
         self.animations_enabled = True
         self.sound_effects_enabled = True
@@ -112,6 +486,22 @@ class FurbyGame125D:
         
         logger.info(f"🎮 AI Furby 1.25D initialized for user: {user_id}")
     
+    @property
+    def locations(self) -> Tuple[GameLocation, ...]:
+        return self.world.locations
+    
+    @property
+    def npcs(self) -> Mapping[str, NPCCharacter]:
+        return self.world.npcs
+    
+    @property
+    def vehicles(self) -> Mapping[str, Vehicle]:
+        return self.world.vehicles
+    
+    @property
+    def missions(self) -> Mapping[str, Mapping]:
+        return self.world.missions
+    
     def _create_default_player(self) -> PlayerStats:
         """Create default player with FURBX integration"""
         # Get real wallet balance
@@ -135,292 +525,6 @@ class FurbyGame125D:
             playtime_hours=0.0
         )
     
-    def _initialize_locations(self):
-        """Initialize all game locations with detailed ASCII art"""
-        self.locations = [
-            GameLocation(
-                name="Ghetto Streets",
-                type="danger",
-                icon="🏚️",
-                danger_level=8,
-                luxury_level=1,
-                encounters=["Street_Hustler", "Gang_Girl", "Crack_Head"],
-                special_events=["police_chase", "gang_shootout", "drug_deal"],
-                ascii_art=[
-                    "🏚️🏚️🏚️ GHETTO 🏚️🏚️🏚️",
-                    "│  ╔═══╗  ╔═══╗  ╔═══╗  │",
-                    "│  ║💀 ║  ║🔫 ║  ║💊 ║  │",
-                    "│  ╚═══╝  ╚═══╝  ╚═══╝  │",
-                    "════════════════════════════"
-                ],
-                background_music="🎵 Heavy Bass 🎵",
-                entry_cost=0
-            ),
-            GameLocation(
-                name="Downtown Club District",
-                type="nightlife",
-                icon="🏙️",
-                danger_level=4,
-                luxury_level=6,
-                encounters=["Club_Dancer", "VIP_Hostess", "Rich_Cougar"],
-                special_events=["vip_party", "dance_contest", "celebrity_sighting"],
-                ascii_art=[
-                    "🏙️✨🏙️ DOWNTOWN 🏙️✨🏙️",
-                    "│  ╔═══╗  ╔═══╗  ╔═══╗  │",
-                    "│  ║🍸 ║  ║💃 ║  ║🎭 ║  │",
-                    "│  ╚═══╝  ╚═══╝  ╚═══╝  │",
-                    "════════════════════════════"
-                ],
-                background_music="🎵 House Music 🎵",
-                entry_cost=50
-            ),
-            GameLocation(
-                name="Venice Beach",
-                type="relax",
-                icon="🏖️",
-                danger_level=2,
-                luxury_level=5,
-                encounters=["Beach_Babe", "Surfer_Girl", "Yoga_Instructor"],
-                special_events=["beach_party", "volleyball_game", "sunset_romance"],
-                ascii_art=[
-                    "🏖️🌊🏖️ BEACH 🏖️🌊🏖️",
-                    "│  ╔═══╗  ╔═══╗  ╔═══╗  │",
-                    "│  ║🏄 ║  ║🏐 ║  ║🌺 ║  │",
-                    "│  ╚═══╝  ╚═══╝  ╚═══╝  │",
-                    "════════════════════════════"
-                ],
-                background_music="🎵 Chill Wave 🎵",
-                entry_cost=20
-            ),
-            GameLocation(
-                name="Las Vegas Strip",
-                type="luxury",
-                icon="🎰",
-                danger_level=3,
-                luxury_level=9,
-                encounters=["Casino_Hostess", "High_Roller", "Showgirl"],
-                special_events=["jackpot_win", "private_show", "high_stakes_poker"],
-                ascii_art=[
-                    "🎰💎🎰 VEGAS 🎰💎🎰",
-                    "│  ╔═══╗  ╔═══╗  ╔═══╗  │",
-                    "│  ║💰 ║  ║🎲 ║  ║👑 ║  │",
-                    "│  ╚═══╝  ╚═══╝  ╚═══╝  │",
-                    "════════════════════════════"
-                ],
-                background_music="🎵 Jazz Lounge 🎵",
-                entry_cost=200
-            ),
-            GameLocation(
-                name="Hollywood Hills Mansion",
-                type="elite",
-                icon="🏰",
-                danger_level=1,
-                luxury_level=10,
-                encounters=["Sugar_Mama", "Celebrity", "Trophy_Wife"],
-                special_events=["pool_party", "exclusive_auction", "celebrity_scandal"],
-                ascii_art=[
-                    "🏰👑🏰 MANSION 🏰👑🏰",
-                    "│  ╔═══╗  ╔═══╗  ╔═══╗  │",
-                    "│  ║💎 ║  ║🍾 ║  ║🦄 ║  │",
-                    "│  ╚═══╝  ╚═══╝  ╚═══╝  │",
-                    "════════════════════════════"
-                ],
-                background_music="🎵 Classical Remix 🎵",
-                entry_cost=1000
-            )
-        ]
-    
-    def _initialize_npcs(self):
-        """Initialize all NPCs with rich personalities"""
-        self.npcs = {
-            "Street_Hustler": NPCCharacter(
-                name="Tina 'Razor' Rodriguez",
-                style="street smart badass",
-                personality="tough exterior, soft heart",
-                heat_reward=25,
-                cash_requirement=100,
-                reputation_needed=0,
-                location_preference="ghetto",
-                dialogue_lines=[
-                    "😏 'You look like trouble... I like that.'",
-                    "🔥 'This street ain't safe, but I am...'",
-                    "💋 'Show me what you got, pretty boy.'"
-                ],
-                special_ability="street_knowledge",
-                rarity="common"
-            ),
-            "Club_Dancer": NPCCharacter(
-                name="Velvet 'Diamond' Jones",
-                style="sultry club goddess",
-                personality="confident performer",
-                heat_reward=40,
-                cash_requirement=300,
-                reputation_needed=25,
-                location_preference="downtown",
-                dialogue_lines=[
-                    "💃 'I dance for money, but stay for passion...'",
-                    "✨ 'You've got that VIP energy...'",
-                    "🍸 'Buy me a drink and I'll show you magic.'"
-                ],
-                special_ability="dance_magic",
-                rarity="rare"
-            ),
-            "Beach_Babe": NPCCharacter(
-                name="Sunny 'Wave' Martinez",
-                style="californian goddess",
-                personality="free spirit beach lover",
-                heat_reward=35,
-                cash_requirement=200,
-                reputation_needed=15,
-                location_preference="beach",
-                dialogue_lines=[
-                    "🌊 'Life's a wave, ride it with me...'",
-                    "☀️ 'Your vibe is so golden...'",
-                    "🏄 'Want to catch something bigger than waves?'"
-                ],
-                special_ability="zen_healing",
-                rarity="common"
-            ),
-            "Casino_Hostess": NPCCharacter(
-                name="Lola 'Fortune' Kim",
-                style="high-stakes temptress",
-                personality="sophisticated risk-taker",
-                heat_reward=60,
-                cash_requirement=500,
-                reputation_needed=50,
-                location_preference="vegas",
-                dialogue_lines=[
-                    "🎰 'Luck favors the bold... and the rich.'",
-                    "💎 'I'm the jackpot you've been chasing...'",
-                    "🍾 'High stakes, higher rewards...'"
-                ],
-                special_ability="luck_boost",
-                rarity="rare"
-            ),
-            "Sugar_Mama": NPCCharacter(
-                name="Madame X 'Dynasty' Chen",
-                style="wealthy power player",
-                personality="dominant luxury lover",
-                heat_reward=100,
-                cash_requirement=2000,
-                reputation_needed=100,
-                location_preference="mansion",
-                dialogue_lines=[
-                    "👑 'Money talks, but passion screams...'",
-                    "💸 'I collect beautiful things... like you.'",
-                    "🦄 'Welcome to my world of infinite pleasure...'"
-                ],
-                special_ability="wealth_magic",
-                rarity="legendary"
-            )
-        }
-    
-    def _initialize_vehicles(self):
-        """Initialize all available vehicles"""
-        self.vehicles = {
-            "stolen_civic": Vehicle(
-                name="Stolen Honda Civic",
-                type="starter",
-                speed=3,
-                style_points=1,
-                fuel_consumption=5,
-                special_ability="invisible_to_cops",
-                cost_fbx=0.0,
-                ascii_art=[
-                    "🚗💨 CIVIC 💨🚗",
-                    "   ╔════╗",
-                    " ╔═╣    ╠═╗",
-                    "╔╣  ████  ╠╗",
-                    "╚═╗ ○  ○ ╔═╝",
-                    "  ╚══════╝"
-                ],
-                engine_sound="🎵 *put put put* 🎵"
-            ),
-            "lowrider_impala": Vehicle(
-                name="Hydraulic Lowrider",
-                type="style",
-                speed=4,
-                style_points=8,
-                fuel_consumption=8,
-                special_ability="bounce_charm",
-                cost_fbx=25.0,
-                ascii_art=[
-                    "🚗✨ LOWRIDER ✨🚗",
-                    "   ╔═══════╗",
-                    " ╔═╣ ♫ ♫ ♫ ╠═╗",
-                    "╔╣  ████████  ╠╗",
-                    "╚═╗ ◉    ◉ ╔═╝",
-                    "  ╚═════════╝"
-                ],
-                engine_sound="🎵 *BOOM BOOM* 🎵"
-            ),
-            "ferrari_spider": Vehicle(
-                name="Ferrari Spider",
-                type="supercar",
-                speed=10,
-                style_points=9,
-                fuel_consumption=15,
-                special_ability="speed_demon",
-                cost_fbx=100.0,
-                ascii_art=[
-                    "🏎️🔥 FERRARI 🔥🏎️",
-                    "    ╔═══════╗",
-                    "  ╔═╣ ⚡ ⚡ ⚡ ╠═╗",
-                    "╔═╣  ████████  ╠═╗",
-                    "╚══╗ ◉    ◉ ╔══╝",
-                    "   ╚═════════╝"
-                ],
-                engine_sound="🎵 *VROOOOOM* 🎵"
-            ),
-            "golden_lambo": Vehicle(
-                name="Golden Lamborghini",
-                type="legendary",
-                speed=10,
-                style_points=10,
-                fuel_consumption=20,
-                special_ability="instant_attraction",
-                cost_fbx=250.0,
-                ascii_art=[
-                    "🚗👑 GOLDEN LAMBO 👑🚗",
-                    "     ╔═════════╗",
-                    "   ╔═╣ 💎 💎 💎 ╠═╗",
-                    "╔══╣  ██████████  ╠══╗",
-                    "╚═══╗ ◉      ◉ ╔═══╝",
-                    "    ╚═══════════╝"
-                ],
-                engine_sound="🎵 *GOLDEN ROAR* 🎵"
-            )
-        }
-    
-    def _initialize_missions(self):
-        """Initialize story missions"""
-        self.missions = {
-            "tutorial": {
-                "name": "Welcome to San Andreas",
-                "description": "Learn the basics of cruising and charm",
-                "objectives": ["Talk to 3 NPCs", "Earn 50 heat points"],
-                "reward_fbx": 5.0,
-                "reward_cash": 500,
-                "unlock_location": "downtown"
-            },
-            "first_ride": {
-                "name": "Get Your First Ride",
-                "description": "Upgrade from stolen civic to lowrider",
-                "objectives": ["Earn 25 FBX tokens", "Buy lowrider"],
-                "reward_fbx": 10.0,
-                "reward_cash": 1000,
-                "unlock_location": "beach"
-            },
-            "vegas_baby": {
-                "name": "What Happens in Vegas...",
-                "description": "Make it big in Las Vegas",
-                "objectives": ["Reach reputation 50", "Win 1000$ gambling"],
-                "reward_fbx": 25.0,
-                "reward_cash": 5000,
-                "unlock_location": "mansion"
-            }
-        }
-    
     def clear_screen(self):
         """Clear the console screen"""
         os.system('cls' if os.name == 'nt' else 'clear')
@@ -528,7 +632,7 @@ class FurbyGame125D:
         print(f"✨ Rarity: {npc.rarity.upper()}")
         
         # Show random dialogue
-        dialogue = random.choice(npc.dialogue_lines)
+        dialogue = self.rng.choice(npc.dialogue_lines)
         print(f"\n💬 {dialogue}")
         
         print(f"\n{'='*50}")
@@ -565,10 +669,10 @@ class FurbyGame125D:
         
         if choice == "1":  # Sweet Talk
             success_chance = min(0.8, 0.4 + (self.player.reputation * 0.01))
-            if random.random() < success_chance:
+            if self.rng.random() < success_chance:
                 result["success"] = True
                 result["heat_gained"] = npc.heat_reward // 2
-                result["reputation_change"] = random.randint(1, 3)
+                result["reputation_change"] = self.rng.randint(1, 3)
                 result["message"] = f"😘 Your charm worked! {npc.name} is impressed by your smooth talk."
             else:
                 result["message"] = f"😬 {npc.name} wasn't convinced by your lines. Need more style!"
@@ -579,22 +683,22 @@ class FurbyGame125D:
                 result["success"] = True
                 result["cash_spent"] = cost
                 result["heat_gained"] = int(npc.heat_reward * 0.8)
-                result["reputation_change"] = random.randint(2, 5)
+                result["reputation_change"] = self.rng.randint(2, 5)
                 result["message"] = f"💰 Money talks! {npc.name} is very interested now."
             
         elif choice == "3":  # Physical Seduction
             risk_factor = npc.danger_level if hasattr(npc, 'danger_level') else 5
             success_chance = max(0.3, 0.7 - (risk_factor * 0.05))
             
-            if random.random() < success_chance:
+            if self.rng.random() < success_chance:
                 result["success"] = True
                 result["heat_gained"] = int(npc.heat_reward * 1.5)
                 result["cash_spent"] = npc.cash_requirement // 2
-                result["reputation_change"] = random.randint(3, 8)
+                result["reputation_change"] = self.rng.randint(3, 8)
                 result["message"] = f"🔥 Intense chemistry! {npc.name} can't resist your physical appeal."
             else:
                 result["cash_spent"] = npc.cash_requirement // 4
-                result["reputation_change"] = -random.randint(1, 3)
+                result["reputation_change"] = -self.rng.randint(1, 3)
                 result["message"] = f"💥 Too aggressive! {npc.name} pushed you away."
         
         elif choice == "4":  # Rev Engine
@@ -610,16 +714,16 @@ class FurbyGame125D:
                 result["message"] = f"😐 {npc.name} isn't impressed by your {vehicle.name}. Need a better ride!"
         
         elif choice == "5":  # Risky Gamble
-            if random.random() < 0.4:  # 40% success rate
+            if self.rng.random() < 0.4:  # 40% success rate
                 result["success"] = True
                 result["heat_gained"] = npc.heat_reward * 2
                 result["cash_spent"] = 0
-                result["reputation_change"] = random.randint(5, 15)
+                result["reputation_change"] = self.rng.randint(5, 15)
                 result["special_reward"] = "jackpot"
                 result["message"] = f"🎰 JACKPOT! Your bold move paid off big time with {npc.name}!"
             else:
                 result["cash_spent"] = npc.cash_requirement
-                result["reputation_change"] = -random.randint(5, 10)
+                result["reputation_change"] = -self.rng.randint(5, 10)
                 result["message"] = f"💥 Epic fail! Your risky move backfired with {npc.name}."
         
         elif choice == "6":  # Use FURBX Tokens
@@ -638,7 +742,7 @@ class FurbyGame125D:
                     result["success"] = True
                     result["fbx_spent"] = fbx_cost
                     result["heat_gained"] = npc.heat_reward * 3  # Triple reward!
-                    result["reputation_change"] = random.randint(10, 20)
+                    result["reputation_change"] = self.rng.randint(10, 20)
                     result["special_reward"] = "premium_experience"
                     result["message"] = f"💎 PREMIUM EXPERIENCE! {npc.name} gives you the VIP treatment!"
                 else:
@@ -675,7 +779,7 @@ class FurbyGame125D:
         
         # Special rewards
         if result["special_reward"] == "jackpot":
-            bonus_cash = random.randint(1000, 5000)
+            bonus_cash = self.rng.randint(1000, 5000)
             self.player.cash_usd += bonus_cash
             print(f"🎰 BONUS! You won ${bonus_cash} extra!")
         
@@ -796,7 +900,7 @@ class FurbyGame125D:
             },
             {
                 "text": "💰 You find a wallet on the ground with cash inside!",
-                "effect": {"cash_usd": random.randint(100, 500)},
+                "effect": {"cash_usd": self.rng.randint(100, 500)},
                 "type": "luck"
             },
             {
@@ -822,7 +926,7 @@ class FurbyGame125D:
         elif current_loc.type == "luxury":
             events = [e for e in events if e["type"] in ["fame", "crypto"]]
         
-        event = random.choice(events)
+        event = self.rng.choice(events)
         
         print(f"\n🎲 RANDOM EVENT:")
         self.typewriter_effect(event["text"])
@@ -860,7 +964,7 @@ class FurbyGame125D:
             return
         
         # Random encounter selection
-        npc_type = random.choice(current_loc.encounters)
+        npc_type = self.rng.choice(current_loc.encounters)
         
         self.show_encounter_screen(npc_type)
         choice = input("\n💫 Your choice (1-7): ")
@@ -951,51 +1055,78 @@ class FurbyGame125D:
         
         input("\n⏳ Press Enter to continue...")
     
-    def save_game_state(self):
-        """Save game state to file"""
-        save_data = {
+    def to_save_data(self) -> Dict:
+        """Serializable snapshot of the player's mutable state"""
+        return {
             "player": asdict(self.player),
             "position": self.position,
             "game_time": self.game_time,
             "current_mission": self.current_mission,
+            "rng_seed": self.seed,
+            "rng_state": rng_state_to_json(self.rng.getstate()),
+            "settings": {
+                "animations_enabled": self.animations_enabled,
+                "sound_effects_enabled": self.sound_effects_enabled,
+                "difficulty": self.difficulty
+            },
             "last_save": datetime.datetime.now().isoformat()
         }
-        
-        save_file = f"game_save_{self.user_id}.json"
-        
+    
+    def apply_save_data(self, save_data: Dict):
+        """Restore mutable state from a snapshot"""
+        self.player = PlayerStats(**save_data["player"])
+        self.position = save_data.get("position", 0)
+        self.game_time = save_data.get("game_time", 0)
+        self.current_mission = save_data.get("current_mission", None)
+        if "rng_seed" in save_data:
+            self.seed = save_data["rng_seed"]
+            if "rng_state" in save_data:
+                # Strumień wznawiany dokładnie od ostatniego losowania (wczytanie nie powtarza wyników)
+                self.rng.setstate(rng_state_from_json(save_data["rng_state"]))
+            else:
+                self.rng.seed(f"{self.seed}:{self.game_time}")  # zapis sprzed rng_state
+        settings = save_data.get("settings", {})
+        self.animations_enabled = settings.get("animations_enabled", self.animations_enabled)
+        self.sound_effects_enabled = settings.get("sound_effects_enabled", self.sound_effects_enabled)
+        self.difficulty = settings.get("difficulty", self.difficulty)
+    
+    def save_game_state(self):
+        """Save game state (write-behind: zapis do bazy następuje w tle)"""
         try:
-            with open(save_file, 'w') as f:
-                json.dump(save_data, f, indent=2)
-            print(f"💾 Game saved successfully!")
+            get_game_state_store().save(self.user_id, self.to_save_data())
+            logger.debug(f"💾 Game state queued for {self.user_id}")
         except Exception as e:
             print(f"❌ Save failed: {e}")
     
     def load_game_state(self):
-        """Load game state from file"""
-        save_file = f"game_save_{self.user_id}.json"
-        
+        """Load game state from the state store (or a legacy save file)"""
         try:
-            with open(save_file, 'r') as f:
-                save_data = json.load(f)
-            
-            # Restore player data
-            player_data = save_data["player"]
-            self.player = PlayerStats(**player_data)
-            
-            self.position = save_data.get("position", 0)
-            self.game_time = save_data.get("game_time", 0)
-            self.current_mission = save_data.get("current_mission", None)
+            save_data = get_game_state_store().load(self.user_id)
+            if save_data is None:
+                save_data = self._load_legacy_save()
+            if save_data is None:
+                print("💾 No save file found. Starting new game...")
+                return False
             
+            self.apply_save_data(save_data)
             print(f"📂 Game loaded successfully!")
             return True
             
-        except FileNotFoundError:
-            print("💾 No save file found. Starting new game...")
-            return False
         except Exception as e:
             print(f"❌ Load failed: {e}")
             return False
     
+    def _load_legacy_save(self) -> Optional[Dict]:
+        """Migrate game_save_{user_id}.json written by older versions"""
+        save_file = f"game_save_{self.user_id}.json"
+        try:
+            with open(save_file, 'r') as f:
+                save_data = json.load(f)
+        except FileNotFoundError:
+            return None
+        get_game_state_store().save(self.user_id, save_data)
+        return save_data
+    
     def check_game_over_conditions(self) -> bool:
         """Check various game over conditions"""
         if self.player.energy <= 0:
@@ -1067,7 +1198,7 @@ class FurbyGame125D:
                     self.travel_system()
                 
                 elif choice == "2":
-                    if random.random() < 0.7:  # 70% chance of encounter
+                    if self.rng.random() < 0.7:  # 70% chance of encounter
                         self.encounter_system()
                     else:
                         print("\n👻 The area is quiet right now...")
@@ -1113,8 +1244,8 @@ class FurbyGame125D:
                 self.player.playtime_hours += 0.5
                 
                 # Random energy decrease
-                if random.random() < 0.3:
-                    energy_loss = random.randint(1, 3)
+                if self.rng.random() < 0.3:
+                    energy_loss = self.rng.randint(1, 3)
                     self.player.energy = max(0, self.player.energy - energy_loss)
                 
             except KeyboardInterrupt:
@@ -1201,11 +1332,10 @@ class FurbyGame125D:
             elif choice == "4":
                 confirm = input("⚠️  Reset ALL save data? (yes/no): ").lower()
                 if confirm == "yes":
-                    try:
-                        os.remove(f"game_save_{self.user_id}.json")
-                        print("💥 Save data deleted!")
-                    except FileNotFoundError:
-                        print("💾 No save data found!")
+                    had_save = (get_game_state_store().load(self.user_id) is not None
+                                or os.path.exists(f"game_save_{self.user_id}.json"))
+                    reset_game(self.user_id)
+                    print("💥 Save data deleted!" if had_save else "💾 No save data found!")
                 
             elif choice == "5":
                 break
@@ -1217,13 +1347,159 @@ class FurbyGame125D:
                 input("⏳ Press Enter to continue...")
 
 # Global game instance management
-active_games = {}
+def load_or_create_game(user_id: str) -> FurbyGame125D:
+    """Nowa instancja gry ze stanem wczytanym raz - przy wejściu do cache"""
+    game = FurbyGame125D(user_id)
+    save_data = get_game_state_store().load(user_id) or game._load_legacy_save()
+    if save_data is not None:
+        game.apply_save_data(save_data)
+    return game
+
+class GameSessionCache:
+    """
+    Rejestr aktywnych gier per użytkownik: LRU + wygasanie po bezczynności.
+
+    Gra usuwana z cache (limit max_sessions lub idle_ttl) jest najpierw
+    zapisywana przez on_evict, więc gracz wraca do swojego stanu.
+    """
+
+    def __init__(self, game_factory: Optional[Callable[[str], FurbyGame125D]] = None,
+                 on_evict: Optional[Callable[[FurbyGame125D], None]] = None,
+                 idle_ttl: float = 1800.0, max_sessions: int = 1024):
+        self.game_factory = game_factory or load_or_create_game
+        self.on_evict = on_evict if on_evict is not None else (lambda game: game.save_game_state())
+        self.idle_ttl = idle_ttl
+        self.max_sessions = max_sessions
+        self._games: "OrderedDict[str, Tuple[FurbyGame125D, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._loading: Dict[str, threading.Event] = {}
+        self.evicted_count = 0
+
+    def get(self, user_id: str) -> FurbyGame125D:
+        """
+        Zwraca istniejącą grę albo tworzy nową (LRU + TTL).
+
+        game_factory (odczyt z bazy) działa poza blokadą - wolne wczytanie
+        jednej gry nie wstrzymuje pozostałych graczy; równoległe żądania tego
+        samego gracza czekają na jedno wczytanie (znacznik w _loading).
+        """
+        while True:
+            with self._lock:
+                evicted = self._collect_idle_locked()
+                entry = self._games.pop(user_id, None)
+                if entry is not None:
+                    game = entry[0]
+                    evicted += self._store_locked(user_id, game)
+                    break
+                pending = self._loading.get(user_id)
+                loading = pending is None
+                if loading:
+                    pending = self._loading[user_id] = threading.Event()
+            self._persist(evicted)
+            if not loading:
+                pending.wait()
+                continue  # gra jest już w cache (albo wczytanie się nie udało - próbujemy sami)
+            try:
+                game = self.game_factory(user_id)
+            except BaseException:
+                with self._lock:
+                    del self._loading[user_id]
+                pending.set()
+                raise
+            with self._lock:
+                del self._loading[user_id]
+                evicted = self._store_locked(user_id, game)
+            pending.set()
+            break
+        self._persist(evicted)
+        return game
+
+    def _store_locked(self, user_id: str, game: FurbyGame125D) -> List[FurbyGame125D]:
+        """Wstawia grę jako ostatnio użytą; zwraca gry wypchnięte przez max_sessions"""
+        self._games[user_id] = (game, time.monotonic())
+        evicted = []
+        while len(self._games) > self.max_sessions:
+            evicted.append(self._games.popitem(last=False)[1][0])
+        return evicted
+
+    def evict_idle(self) -> int:
+        with self._lock:
+            evicted = self._collect_idle_locked()
+        self._persist(evicted)
+        return len(evicted)
+
+    def _collect_idle_locked(self) -> List[FurbyGame125D]:
+        deadline = time.monotonic() - self.idle_ttl
+        evicted = []
+        # Kolejność LRU - najdawniej używane na początku
+        while self._games:
+            user_id, (game, last_used) = next(iter(self._games.items()))
+            if last_used > deadline:
+                break
+            del self._games[user_id]
+            evicted.append(game)
+        return evicted
+
+    def _persist(self, games: List[FurbyGame125D]) -> None:
+        for game in games:
+            self.evicted_count += 1
+            try:
+                self.on_evict(game)
+            except Exception as e:
+                logger.error(f"Persist on eviction failed for {game.user_id}: {e}")
+
+    def flush(self) -> int:
+        """Zapisuje wszystkie aktywne gry (np. przy zamykaniu serwera)"""
+        with self._lock:
+            games = [game for game, _ in self._games.values()]
+        for game in games:
+            self.on_evict(game)
+        return len(games)
+
+    def __contains__(self, user_id: str) -> bool:
+        return user_id in self._games
+
+    def __delitem__(self, user_id: str) -> None:
+        """Usuwa grę bez zapisu (reset stanu)"""
+        with self._lock:
+            del self._games[user_id]
+
+    def __len__(self) -> int:
+        return len(self._games)
+
+    def get_stats(self) -> Dict[str, float]:
+        with self._lock:
+            return {
+                "active_games": len(self._games),
+                "evicted_games": self.evicted_count,
+                "idle_ttl": self.idle_ttl,
+                "max_sessions": self.max_sessions,
+            }
+
+active_games = GameSessionCache(
+    idle_ttl=float(os.getenv("FURBY_GAME_IDLE_TTL", 1800)),
+    max_sessions=int(os.getenv("FURBY_MAX_ACTIVE_GAMES", 1024))
+)
 
 def get_furby_game(user_id: str) -> FurbyGame125D:
     """Get or create game instance for user"""
-    if user_id not in active_games:
-        active_games[user_id] = FurbyGame125D(user_id)
-    return active_games[user_id]
+    return active_games.get(user_id)
+
+def reset_game(user_id: str) -> None:
+    """Usuwa grę z pamięci i jej zapisany stan"""
+    if user_id in active_games:
+        del active_games[user_id]
+    get_game_state_store().delete(user_id)
+    legacy_save = f"game_save_{user_id}.json"
+    if os.path.exists(legacy_save):
+        os.remove(legacy_save)
+
+@atexit.register
+def _persist_active_games():
+    """Przy zamykaniu procesu zapisuje aktywne gry i opróżnia kolejkę zapisu"""
+    if len(active_games):
+        active_games.flush()
+    close_game_state_store()
 
 def start_game_for_user(user_id: str):
     """Start game for specific user"""
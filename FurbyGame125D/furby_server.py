@@ -4,7 +4,7 @@ Complete Flask server endpoints for web gameplay integration
 MTAQuestWebsideX.com platform integration
 """
 
-from flask import Flask, request, jsonify, render_template_string, session
+from flask import Flask, Response, request, jsonify, render_template_string, session, stream_with_context
 from typing import Dict, Any
 import json
 import logging
@@ -13,8 +13,9 @@ import time
 from datetime import datetime
 
 # Import game components
-from furby_san_andreas import get_furby_game, active_games, FurbyGame125D
-from furby_web_interface import get_furby_web_interface
+from furby_san_andreas import get_furby_game, active_games, reset_game as reset_game_state, FurbyGame125D
+from furby_web_interface import get_furby_web_interface, GAME_ASSETS
+from game_events import get_game_broadcaster
 
 logger = logging.getLogger(__name__)
 
@@ -25,9 +26,10 @@ class FurbyGameServer:
     """
     
     def __init__(self):
-        self.app = Flask(__name__)
+        self.app = Flask(__name__, static_folder=None)  # /static obsługuje GAME_ASSETS
         self.app.secret_key = "furby_san_andreas_1.25d_secret_key_2024"
         self.web_interface = get_furby_web_interface()
+        self.broadcaster = get_game_broadcaster()
         self.setup_routes()
         logger.info("🚀 Furby Game Server initialized")
     
@@ -48,6 +50,46 @@ class FurbyGameServer:
                 logger.error(f"Home route error: {e}")
                 return self.render_error_response(f"Failed to load game: {str(e)}")
         
+        @self.app.route('/api/game/view')
+        def get_game_view():
+            """Dynamic part of the dashboard (player summary and HTML fragments)"""
+            try:
+                user_id = session.get('user_id')
+                if not user_id:
+                    return jsonify({"error": "No active session"}), 400
+                
+                response = jsonify(self.web_interface.render_game_state(user_id))
+                response.headers['Cache-Control'] = 'no-store'
+                return response
+                
+            except Exception as e:
+                logger.error(f"Game view error: {e}")
+                return jsonify({"error": str(e)}), 500
+        
+        @self.app.route('/api/game/stream')
+        def game_stream():
+            """Server-Sent Events: world data once, then compact state deltas"""
+            user_id = session.get('user_id')
+            if not user_id:
+                return jsonify({"error": "No active session"}), 400
+            
+            subscription = self.broadcaster.subscribe(user_id, get_furby_game(user_id))
+            events = self.broadcaster.stream(subscription, lambda: get_furby_game(user_id))
+            return Response(stream_with_context(events), mimetype='text/event-stream', headers={
+                'Cache-Control': 'no-store',
+                'X-Accel-Buffering': 'no'  # nginx nie buforuje strumienia
+            })
+        
+        @self.app.route('/static/<path:filename>')
+        def static_asset(filename):
+            """Versioned CSS/JS (content hash in the name, pre-compressed, ETag)"""
+            status, headers, body = GAME_ASSETS.respond(
+                filename,
+                accept_encoding=request.headers.get('Accept-Encoding', ''),
+                if_none_match=request.headers.get('If-None-Match', '')
+            )
+            return Response(body, status=status, headers=headers)
+        
         @self.app.route('/api/game/status')
         def get_game_status():
             """Get current game status"""
@@ -56,8 +98,8 @@ class FurbyGameServer:
                 if not user_id:
                     return jsonify({"error": "No active session"}), 400
                 
+                # Stan wczytywany raz przy wejściu gry do active_games
                 game = get_furby_game(user_id)
-                game.load_game_state()
                 
                 status = {
                     "user_id": user_id,
@@ -166,6 +208,8 @@ class FurbyGameServer:
                 
                 # Handle encounter action
                 result = game.handle_encounter_action(npc, action)
+                self.broadcaster.publish(user_id, 'encounter', {"npc_id": npc_id, "action": action, "result": result})
+                self.push_state(user_id, game)
                 
                 return jsonify({
                     "success": True,
@@ -247,6 +291,7 @@ class FurbyGameServer:
                 if success:
                     # Save game after travel
                     game.save_game_state()
+                    self.push_state(user_id, game)
                     
                     current_location = game.locations[game.position]
                     
@@ -258,8 +303,7 @@ class FurbyGameServer:
                             "name": current_location.name,
                             "icon": current_location.icon,
                             "danger_level": current_location.danger_level,
-                            "luxury_level": current_location.luxury_level,
-                            "ascii_art": current_location.ascii_art
+                            "luxury_level": current_location.luxury_level
                         },
                         "player_status": {
                             "cash_usd": game.player.cash_usd
@@ -331,9 +375,8 @@ class FurbyGameServer:
                         }
                     ])
                 
-                # Random event selection
-                import random
-                event = random.choice(exploration_events)
+                # Random event selection (per-session seeded stream)
+                event = game.rng.choice(exploration_events)
                 
                 # Apply rewards
                 reward = event["reward"]
@@ -355,6 +398,7 @@ class FurbyGameServer:
                 
                 # Save game
                 game.save_game_state()
+                self.push_state(user_id, game)
                 
                 return jsonify({
                     "success": True,
@@ -392,6 +436,7 @@ class FurbyGameServer:
                     
                     # Save game
                     game.save_game_state()
+                    self.push_state(user_id, game)
                     
                     return jsonify({
                         "success": True,
@@ -443,6 +488,7 @@ class FurbyGameServer:
                     
                     # Save game
                     game.save_game_state()
+                    self.push_state(user_id, game)
                     
                     return jsonify({
                         "success": True,
@@ -504,6 +550,7 @@ class FurbyGameServer:
                 game = get_furby_game(user_id)
                 
                 if game.load_game_state():
+                    self.push_state(user_id, game)
                     return jsonify({
                         "success": True,
                         "message": "Game loaded successfully!",
@@ -560,6 +607,7 @@ class FurbyGameServer:
                 
                 # Save game
                 game.save_game_state()
+                self.push_state(user_id, game)
                 
                 return jsonify({
                     "success": True,
@@ -583,14 +631,9 @@ class FurbyGameServer:
                 if not user_id:
                     return jsonify({"error": "No active session"}), 400
                 
-                # Remove from active games
-                if user_id in active_games:
-                    del active_games[user_id]
-                
-                # Delete save file
-                save_file = f"game_save_{user_id}.json"
-                if os.path.exists(save_file):
-                    os.remove(save_file)
+                # Remove from active games and the state store
+                reset_game_state(user_id)
+                self.push_state(user_id)
                 
                 return jsonify({
                     "success": True,
@@ -610,6 +653,11 @@ class FurbyGameServer:
         def internal_error(error):
             return jsonify({"error": "Internal server error"}), 500
     
+    def push_state(self, user_id: str, game: FurbyGame125D = None):
+        """Send changed player fields to the user's open streams (no-op without subscribers)"""
+        if self.broadcaster.has_subscribers(user_id):
+            self.broadcaster.publish_state(user_id, game or get_furby_game(user_id))
+    
     def render_error_response(self, message: str) -> str:
         """Render error response HTML"""
         return f"""
@@ -0,0 +1,302 @@
+"""
+AI Furby 1.25D: San Andreas Edition - Headless Simulation
+Symulacja N graczy × M tur bez UI, zwektoryzowana w NumPy: rozkłady wyników
+spotkań, podróży i zdarzeń losowych do balansowania gry i generowania obciążenia
+"""
+
+import os
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Mapping, Optional, Sequence
+
+import numpy as np
+
+from furby_san_andreas import GameWorld, PlayerStats, get_game_world
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from cyber_market import CyberMarketEngine
+
+# Wybory z FurbyGame125D.handle_encounter_choice; "6" (FURBX) wymaga portfela, więc jest pomijany
+CHOICES = ("1", "2", "3", "4", "5", "7")
+CHOICE_NAMES = ("sweet_talk", "flash_cash", "physical", "rev_engine", "risky_gamble", "drive_away")
+ACTIONS = ("encounter", "travel", "rest")
+DEFAULT_POLICY = {"encounter": 0.6, "travel": 0.3, "rest": 0.1}
+
+# Zdarzenia FurbyGame125D.random_event: kolumny reputation, heat, energy, fbx (gotówka "luck" losowana osobno)
+EVENT_TYPES = ("danger", "romance", "luck", "fame", "inspiration", "crypto")
+EVENT_EFFECTS = np.array([
+    [-2, 0, 0, 0.0],
+    [0, 5, 0, 0.0],
+    [0, 0, 0, 0.0],
+    [3, 10, 0, 0.0],
+    [0, 0, 20, 0.0],
+    [0, 0, 0, 1.0],
+])
+LOCATION_EVENT_FILTER = {"danger": ("danger", "luck"), "luxury": ("fame", "crypto")}
+
+STAT_FIELDS = ("cash_usd", "heat", "reputation", "energy", "experience", "level", "fbx_tokens", "position")
+PERCENTILES = (5, 25, 50, 75, 95)
+# Nowy gracz jak w FurbyGame125D._create_default_player (bez salda portfela FURBX)
+DEFAULT_PLAYER = {"cash_usd": 1000, "fbx_tokens": 0.0, "energy": 100, "heat": 0, "reputation": 0,
+                  "experience": 0, "level": 1, "current_vehicle": "stolen_civic"}
+
+
+@dataclass
+class SimulationReport:
+    """Wynik symulacji: stan końcowy graczy (tablice) i liczniki zdarzeń"""
+    players: int
+    turns: int
+    seed: Optional[int]
+    elapsed: float
+    final: Dict[str, np.ndarray]
+    counters: Dict[str, np.ndarray] = field(default_factory=dict)
+
+    @property
+    def turns_per_second(self) -> float:
+        return self.players * self.turns / self.elapsed if self.elapsed > 0 else float("inf")
+
+    def summary(self) -> Dict[str, Any]:
+        """Rozkłady do balansowania: percentyle statystyk, skuteczność wyborów, częstość zdarzeń"""
+        stats = {}
+        for name, values in self.final.items():
+            points = np.percentile(values, PERCENTILES)
+            stats[name] = {"mean": float(values.mean()),
+                           **{f"p{p}": float(v) for p, v in zip(PERCENTILES, points)}}
+        attempts = self.counters["choice_attempts"]
+        successes = self.counters["choice_successes"]
+        encounters = {
+            name: {"attempts": int(attempts[i]), "blocked": int(self.counters["choice_blocked"][i]),
+                   "success_rate": float(successes[i] / attempts[i]) if attempts[i] else 0.0}
+            for i, name in enumerate(CHOICE_NAMES)
+        }
+        events = {name: int(count) for name, count in zip(EVENT_TYPES, self.counters["events"])}
+        return {
+            "players": self.players,
+            "turns": self.turns,
+            "seed": self.seed,
+            "turns_per_second": self.turns_per_second,
+            "stats": stats,
+            "encounters": encounters,
+            "events": events,
+            "actions": {name: int(count) for name, count in zip(ACTIONS, self.counters["actions"])},
+            "travels": int(self.counters["travels"][0]),
+            "level_ups": int(self.counters["level_ups"][0]),
+            "jackpots": int(self.counters["jackpots"][0]),
+        }
+
+
+class FurbySimulation:
+    """
+    Bezgłowy silnik reguł gry dla wielu graczy naraz.
+
+    Reguły odpowiadają FurbyGame125D (handle_encounter_choice,
+    apply_encounter_result, random_event, travel_system, odpoczynek z
+    run_game), ale każdy stan gracza to kolumna tablicy, a jedna tura wszystkich
+    graczy to kilka operacji NumPy. Ten sam seed daje identyczne rozkłady.
+    Podróż działa jak ruch A/D w travel_system (koszt wejścia i 5 energii)
+    bez sprawdzania odblokowania lokacji.
+    """
+
+    def __init__(self, world: Optional[GameWorld] = None, policy: Optional[Mapping[str, float]] = None,
+                 choice_weights: Optional[Sequence[float]] = None):
+        self.world = world or get_game_world()
+        policy = dict(policy or DEFAULT_POLICY)
+        self.action_cdf = np.cumsum([policy.get(action, 0.0) for action in ACTIONS], dtype=float)
+        self.action_cdf /= self.action_cdf[-1]
+        weights = np.asarray(choice_weights if choice_weights is not None else np.ones(len(CHOICES)), dtype=float)
+        self.choice_cdf = np.cumsum(weights) / weights.sum()
+
+        # Tablice NPC (spotkania z nieistniejącymi NPC są pomijane)
+        npc_ids = list(self.world.npcs)
+        npcs = [self.world.npcs[npc_id] for npc_id in npc_ids]
+        self.npc_heat = np.array([npc.heat_reward for npc in npcs], dtype=np.int64)
+        self.npc_cash = np.array([npc.cash_requirement for npc in npcs], dtype=np.int64)
+        self.npc_rep = np.array([npc.reputation_needed for npc in npcs], dtype=np.int64)
+
+        # Tablice lokacji: dostępni NPC i dozwolone zdarzenia (wyrównane do stałej szerokości)
+        locations = self.world.locations
+        self.entry_cost = np.array([location.entry_cost for location in locations], dtype=np.int64)
+        tables = [[npc_ids.index(key) for key in location.encounters if key in self.world.npcs]
+                  for location in locations]
+        self.npc_count = np.array([len(table) for table in tables], dtype=np.int64)
+        self.npc_table = np.zeros((len(locations), max(1, self.npc_count.max())), dtype=np.int64)
+        for index, table in enumerate(tables):
+            self.npc_table[index, :len(table)] = table
+        allowed = [[EVENT_TYPES.index(name) for name in LOCATION_EVENT_FILTER.get(location.type, EVENT_TYPES)]
+                   for location in locations]
+        self.event_count = np.array([len(events) for events in allowed], dtype=np.int64)
+        self.event_table = np.zeros((len(locations), len(EVENT_TYPES)), dtype=np.int64)
+        for index, events in enumerate(allowed):
+            self.event_table[index, :len(events)] = events
+
+    def initial_state(self, n_players: int, player: Optional[PlayerStats] = None) -> Dict[str, np.ndarray]:
+        """Stan startowy: kopia PlayerStats (domyślnie nowego gracza) w każdej kolumnie"""
+        values = asdict(player) if player is not None else DEFAULT_PLAYER
+        style = self.world.vehicles[values["current_vehicle"]].style_points
+        state = {name: np.full(n_players, values[name], dtype=float if name == "fbx_tokens" else np.int64)
+                 for name in STAT_FIELDS if name != "position"}
+        state["position"] = np.zeros(n_players, dtype=np.int64)
+        state["vehicle_style"] = np.full(n_players, style, dtype=np.int64)
+        return state
+
+    def run(self, n_players: int, n_turns: int, seed: Optional[int] = 0,
+            state: Optional[Dict[str, np.ndarray]] = None) -> SimulationReport:
+        """Symuluje n_players × n_turns tur i zwraca raport z rozkładami"""
+        rng = np.random.default_rng(seed)
+        state = state if state is not None else self.initial_state(n_players)
+        counters = {
+            "actions": np.zeros(len(ACTIONS), dtype=np.int64),
+            "choice_attempts": np.zeros(len(CHOICES), dtype=np.int64),
+            "choice_successes": np.zeros(len(CHOICES), dtype=np.int64),
+            "choice_blocked": np.zeros(len(CHOICES), dtype=np.int64),
+            "events": np.zeros(len(EVENT_TYPES), dtype=np.int64),
+            "travels": np.zeros(1, dtype=np.int64),
+            "level_ups": np.zeros(1, dtype=np.int64),
+            "jackpots": np.zeros(1, dtype=np.int64),
+        }
+        started = time.perf_counter()
+        for _ in range(n_turns):
+            self.step(state, rng, counters)
+        elapsed = time.perf_counter() - started
+        final = {name: state[name] for name in STAT_FIELDS}
+        return SimulationReport(n_players, n_turns, seed, elapsed, final, counters)
+
+    # ===== JEDNA TURA =====
+    def step(self, state: Dict[str, np.ndarray], rng: np.random.Generator,
+             counters: Dict[str, np.ndarray]) -> None:
+        n = state["cash_usd"].shape[0]
+        action = np.searchsorted(self.action_cdf, rng.random(n), side="right")
+        counters["actions"] += np.bincount(action, minlength=len(ACTIONS))
+
+        # Szukanie spotkań: 70% spotkanie, inaczej zdarzenie losowe (jak w run_game)
+        looking = action == 0
+        encounter_roll = rng.random(n) < 0.7
+        encounter = np.flatnonzero(looking & encounter_roll & (self.npc_count[state["position"]] > 0))
+        event = np.flatnonzero(looking & ~encounter_roll)
+        if encounter.size:
+            self._encounters(state, encounter, rng, counters)
+        if event.size:
+            self._random_events(state, event, rng, counters)
+
+        travel = np.flatnonzero(action == 1)
+        if travel.size:
+            self._travel(state, travel, rng, counters)
+
+        rest = np.flatnonzero(action == 2)
+        if rest.size:
+            can_pay = state["cash_usd"][rest] >= 50
+            state["cash_usd"][rest[can_pay]] -= 50
+            state["energy"][rest[can_pay]] = 100
+            tired = rest[~can_pay]
+            state["energy"][tired] = np.minimum(100, state["energy"][tired] + 25)
+
+        # Losowy spadek energii na koniec tury
+        drain = np.flatnonzero(rng.random(n) < 0.3)
+        state["energy"][drain] = np.maximum(0, state["energy"][drain] - rng.integers(1, 4, drain.size))
+
+    def _encounters(self, state, rows, rng, counters) -> None:
+        k = rows.size
+        position = state["position"][rows]
+        npc = self.npc_table[position, (rng.random(k) * self.npc_count[position]).astype(np.int64)]
+        heat_reward, cash_req, rep_needed = self.npc_heat[npc], self.npc_cash[npc], self.npc_rep[npc]
+        choice = np.searchsorted(self.choice_cdf, rng.random(k), side="right")
+        cash, reputation, style = state["cash_usd"][rows], state["reputation"][rows], state["vehicle_style"][rows]
+
+        # Wymagania: gotówka dla "2", "3", "5" i reputacja dla wszystkiego poza "7"
+        blocked = (((cash_req > cash) & np.isin(choice, (1, 2, 4))) |
+                   ((rep_needed > reputation) & (choice != 5)))
+        roll = rng.random(k)
+        success = np.select(
+            [choice == 0, choice == 1, choice == 2, choice == 3, choice == 4],
+            [roll < np.minimum(0.8, 0.4 + reputation * 0.01), True, roll < 0.45, style >= 7, roll < 0.4],
+            default=False
+        ) & ~blocked
+        failed = ~success & ~blocked
+
+        heat_gained = np.select(
+            [choice == 0, choice == 1, choice == 2, choice == 3, choice == 4],
+            [heat_reward // 2, (heat_reward * 0.8).astype(np.int64), (heat_reward * 1.5).astype(np.int64),
+             heat_reward + style * 5, heat_reward * 2],
+            default=0
+        ) * success
+        cash_spent = np.select(
+            [(choice == 1) & success, (choice == 2) & success, (choice == 2) & failed, (choice == 4) & failed],
+            [cash_req, cash_req // 2, cash_req // 4, cash_req],
+            default=0
+        )
+        # Przedziały losowania reputacji (randint włącznie z górną granicą)
+        low = np.select([choice == 0, choice == 1, choice == 2, choice == 4], [1, 2, 3, 5], default=0)
+        high = np.select([choice == 0, choice == 1, (choice == 2) & success, choice == 2,
+                          (choice == 4) & success, choice == 4], [3, 5, 8, 3, 15, 10], default=0)
+        low = np.where((choice == 2) & failed, 1, np.where((choice == 4) & failed, 5, low))
+        rep_roll = rng.integers(low, high + 1)
+        rep_change = np.select(
+            [success & np.isin(choice, (0, 1, 2, 4)), failed & np.isin(choice, (2, 4)),
+             success & (choice == 3), (choice == 5) & ~blocked],
+            [rep_roll, -rep_roll, style, 1],
+            default=0
+        )
+
+        np.add.at(counters["choice_attempts"], choice, 1)
+        np.add.at(counters["choice_successes"], choice[success], 1)
+        np.add.at(counters["choice_blocked"], choice[blocked], 1)
+
+        # apply_encounter_result
+        state["heat"][rows] = np.minimum(state["heat"][rows] + heat_gained, 100)
+        state["cash_usd"][rows] = np.maximum(0, cash - cash_spent)
+        state["reputation"][rows] = np.maximum(0, reputation + rep_change)
+        experience = state["experience"][rows] + (heat_gained + np.abs(rep_change)) * 2
+        state["experience"][rows] = experience
+        level = state["level"][rows]
+        level_up = experience >= level * 100
+        if level_up.any():
+            up = rows[level_up]
+            state["level"][up] += 1
+            state["energy"][up] = 100
+            state["cash_usd"][up] += state["level"][up] * 200
+            state["fbx_tokens"][up] += state["level"][up] * 0.5
+            counters["level_ups"] += up.size
+        jackpot = rows[success & (choice == 4)]
+        if jackpot.size:
+            state["cash_usd"][jackpot] += rng.integers(1000, 5001, jackpot.size)
+            counters["jackpots"] += jackpot.size
+
+    def _random_events(self, state, rows, rng, counters) -> None:
+        position = state["position"][rows]
+        event = self.event_table[position, (rng.random(rows.size) * self.event_count[position]).astype(np.int64)]
+        effects = EVENT_EFFECTS[event]
+        state["reputation"][rows] += effects[:, 0].astype(np.int64)
+        state["heat"][rows] += effects[:, 1].astype(np.int64)
+        state["energy"][rows] = np.minimum(100, state["energy"][rows] + effects[:, 2].astype(np.int64))
+        state["fbx_tokens"][rows] += effects[:, 3]
+        lucky = rows[event == EVENT_TYPES.index("luck")]
+        state["cash_usd"][lucky] += rng.integers(100, 501, lucky.size)
+        counters["events"] += np.bincount(event, minlength=len(EVENT_TYPES))
+
+    def _travel(self, state, rows, rng, counters) -> None:
+        target = state["position"][rows] + np.where(rng.random(rows.size) < 0.5, -1, 1)
+        in_bounds = (target >= 0) & (target < len(self.entry_cost))
+        cost = np.where(in_bounds, self.entry_cost[np.clip(target, 0, len(self.entry_cost) - 1)], 0)
+        # Ruch w lewo jest darmowy, w prawo kosztuje wejście do nowej lokacji
+        cost = np.where(target > state["position"][rows], cost, 0)
+        moves = in_bounds & (state["cash_usd"][rows] >= cost)
+        moved = rows[moves]
+        state["position"][moved] = target[moves]
+        state["cash_usd"][moved] -= cost[moves]
+        state["energy"][moved] -= 5
+        counters["travels"] += moved.size
+
+
+def simulate_market_prices(market_items: Sequence[Mapping], n_markets: int, n_ticks: int,
+                           seed: Optional[int] = 0) -> np.ndarray:
+    """
+    Ceny rynku FurbyCyberSanAndreas dla wielu rynków naraz (CyberMarketEngine);
+    zwraca tablicę (n_ticks, n_markets, n_items)
+    """
+    if n_ticks < 1:
+        return np.zeros((0, n_markets, len(market_items)), dtype=np.int64)
+    engine = CyberMarketEngine(market_items, n_markets=n_markets, history_size=n_ticks, seed=seed)
+    for _ in range(n_ticks - 1):
+        engine.tick()
+    return engine.price_history()
@@ -5,14 +5,23 @@ Complete web dashboard for Furby San Andreas Edition
 """
 
 from typing import Dict
+from html import escape
 import json
 import datetime
 import logging
+import os
 
 from furby_san_andreas import get_furby_game, active_games
+from static_assets import AssetRegistry
 
 logger = logging.getLogger(__name__)
 
+# Wersjonowane CSS/JS - wczytywane i kompresowane raz na proces
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static')
+GAME_ASSETS = AssetRegistry('/static/')
+GAME_ASSETS.register_file(os.path.join(STATIC_DIR, 'furby_game.css'))
+GAME_ASSETS.register_file(os.path.join(STATIC_DIR, 'furby_game.js'))
+
 class FurbyGameWebInterface:
     """
     Web interface for AI Furby 1.25D: San Andreas Edition
@@ -23,97 +32,80 @@ class FurbyGameWebInterface:
         self.active_sessions = {}
         logger.info("🌐 Furby Game Web Interface initialized")
     
-    def render_game_dashboard(self, user_id: str) -> str:
-        """Render complete game dashboard for web browser"""
-        try:
-            # Get or create game instance
-            game = get_furby_game(user_id)
-            
-            # Try to load existing save
-            game.load_game_state()
-            
-            # Get current game state
-            current_location = game.locations[game.position]
-            current_vehicle = game.vehicles[game.player.current_vehicle]
-            
-            # Generate HTML
-            html = f"""
-            <!DOCTYPE html>
-            <html lang="en">
-            <head>
-                <meta charset="UTF-8">
-                <meta name="viewport" content="width=device-width, initial-scale=1.0">
-                <title>AI Furby 1.25D: San Andreas Edition - Web Dashboard</title>
-                <style>
-                    {self._get_game_css()}
-                </style>
-            </head>
-            <body>
-                <div class="game-container">
-                    <header class="game-header">
-                        <div class="header-content">
-                            <h1>🎮 AI FURBY 1.25D: SAN ANDREAS EDITION 🎮</h1>
-                            <div class="player-info">
-                                <span class="player-name">👤 {game.player.name or 'New Player'}</span>
-                                <span class="level-badge">🎯 Level {game.player.level}</span>
-                            </div>
-                        </div>
-                    </header>
-                    
-                    <div class="game-dashboard">
-                        {self._render_player_hud(game)}
-                        {self._render_location_view(game, current_location)}
-                        {self._render_vehicle_display(current_vehicle)}
-                        {self._render_action_panel()}
-                    </div>
-                    
-                    <div class="game-tabs">
-                        <div class="tab-buttons">
-                            <button class="tab-button active" onclick="showGameTab('main')">🎮 Main Game</button>
-                            <button class="tab-button" onclick="showGameTab('travel')">🗺️ Travel</button>
-                            <button class="tab-button" onclick="showGameTab('shop')">🏪 Vehicle Shop</button>
-                            <button class="tab-button" onclick="showGameTab('stats')">📊 Statistics</button>
-                            <button class="tab-button" onclick="showGameTab('settings')">⚙️ Settings</button>
-                        </div>
-                        
-                        <div id="main-tab" class="tab-content active">
-                            {self._render_main_game_tab(game)}
-                        </div>
-                        
-                        <div id="travel-tab" class="tab-content">
-                            {self._render_travel_tab(game)}
-                        </div>
-                        
-                        <div id="shop-tab" class="tab-content">
-                            {self._render_vehicle_shop_tab(game)}
-                        </div>
-                        
-                        <div id="stats-tab" class="tab-content">
-                            {self._render_statistics_tab(game)}
-                        </div>
-                        
-                        <div id="settings-tab" class="tab-content">
-                            {self._render_settings_tab(game)}
-                        </div>
-                    </div>
+    def render_game_dashboard(self, user_id: str, state_url: str = "/api/game/view",
+                              stream_url: str = "/api/game/stream") -> str:
+        """Render the page shell; game state is fetched as JSON from state_url, updates arrive via stream_url"""
+        return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>AI Furby 1.25D: San Andreas Edition - Web Dashboard</title>
+    <link rel="stylesheet" href="{GAME_ASSETS.url('furby_game.css')}">
+    <script src="{GAME_ASSETS.url('furby_game.js')}" defer></script>
+</head>
+<body data-user-id="{escape(user_id)}" data-state-url="{escape(state_url)}" data-stream-url="{escape(stream_url)}">
+    <div class="game-container">
+        <header class="game-header">
+            <div class="header-content">
+                <h1>🎮 AI FURBY 1.25D: SAN ANDREAS EDITION 🎮</h1>
+                <div class="player-info">
+                    <span class="player-name">👤 …</span>
+                    <span class="level-badge">🎯 Level …</span>
                 </div>
-                
-                <!-- Modals -->
-                {self._render_encounter_modal()}
-                {self._render_results_modal()}
-                
-                <script>
-                    {self._get_game_javascript(user_id)}
-                </script>
-            </body>
-            </html>
-            """
-            
-            return html
-            
-        except Exception as e:
-            logger.error(f"Game dashboard error: {e}")
-            return self._render_error_page(f"Failed to load game: {str(e)}")
+            </div>
+        </header>
+        <div class="game-dashboard">
+            <div data-fragment="hud"></div>
+            <div data-fragment="location"></div>
+            <div data-fragment="vehicle"></div>
+            {self._render_action_panel()}
+        </div>
+        <div class="game-tabs">
+            <div class="tab-buttons">
+                <button class="tab-button active" onclick="showGameTab('main')">🎮 Main Game</button>
+                <button class="tab-button" onclick="showGameTab('travel')">🗺️ Travel</button>
+                <button class="tab-button" onclick="showGameTab('shop')">🏪 Vehicle Shop</button>
+                <button class="tab-button" onclick="showGameTab('stats')">📊 Statistics</button>
+                <button class="tab-button" onclick="showGameTab('settings')">⚙️ Settings</button>
+            </div>
+            <div id="main-tab" class="tab-content active" data-fragment="main"></div>
+            <div id="travel-tab" class="tab-content" data-fragment="travel"></div>
+            <div id="shop-tab" class="tab-content" data-fragment="shop"></div>
+            <div id="stats-tab" class="tab-content" data-fragment="stats"></div>
+            <div id="settings-tab" class="tab-content" data-fragment="settings"></div>
+        </div>
+    </div>
+    {self._render_encounter_modal()}
+    {self._render_results_modal()}
+</body>
+</html>
+"""
+    
+    def render_game_state(self, user_id: str) -> Dict:
+        """Game state for the page shell: player summary plus rendered fragments"""
+        game = get_furby_game(user_id)
+        current_location = game.locations[game.position]
+        current_vehicle = game.vehicles[game.player.current_vehicle]
+        
+        return {
+            "user_id": user_id,
+            "player": {
+                "name": game.player.name,
+                "level": game.player.level,
+                "position": game.position
+            },
+            "fragments": {
+                "hud": self._render_player_hud(game),
+                "location": self._render_location_view(game, current_location),
+                "vehicle": self._render_vehicle_display(current_vehicle),
+                "main": self._render_main_game_tab(game),
+                "travel": self._render_travel_tab(game),
+                "shop": self._render_vehicle_shop_tab(game),
+                "stats": self._render_statistics_tab(game),
+                "settings": self._render_settings_tab(game)
+            }
+        }
     
     def _render_player_hud(self, game) -> str:
         """Render player HUD with stats and progress bars"""
@@ -172,7 +164,7 @@ class FurbyGameWebInterface:
     
     def _render_location_view(self, game, location) -> str:
         """Render current location with ASCII art and info"""
-        ascii_art = '\\n'.join(location.ascii_art)
+        ascii_art = '\n'.join(location.ascii_art)
         
         return f"""
         <div class="location-view">
@@ -206,7 +198,7 @@ class FurbyGameWebInterface:
     
     def _render_vehicle_display(self, vehicle) -> str:
         """Render current vehicle with ASCII art"""
-        ascii_art = '\\n'.join(vehicle.ascii_art)
+        ascii_art = '\n'.join(vehicle.ascii_art)
         
         return f"""
         <div class="vehicle-display">
@@ -345,6 +337,15 @@ class FurbyGameWebInterface:
         for vehicle_id, vehicle in game.vehicles.items():
             owned = vehicle_id == game.player.current_vehicle
             can_afford = game.player.fbx_tokens >= vehicle.cost_fbx
+            mini_art = '\n'.join(vehicle.ascii_art[:3])
+            if owned:
+                action_button = '<button class="vehicle-btn owned-btn">✅ Owned</button>'
+            elif can_afford:
+                action_button = (f'<button onclick="purchaseVehicle(\'{vehicle_id}\')" class="vehicle-btn purchase-btn">'
+                                 f'🛒 Buy for {vehicle.cost_fbx} FBX</button>')
+            else:
+                action_button = (f'<button onclick="purchaseVehicle(\'{vehicle_id}\')" class="vehicle-btn purchase-btn" disabled>'
+                                 '💸 Can\'t Afford</button>')
             
             vehicles_html += f"""
             <div class="vehicle-item {'owned' if owned else ''}">
@@ -354,7 +355,7 @@ class FurbyGameWebInterface:
                 </div>
                 
                 <div class="vehicle-ascii-mini">
-                    <pre>{'\\n'.join(vehicle.ascii_art[:3])}</pre>
+                    <pre>{mini_art}</pre>
                 </div>
                 
                 <div class="vehicle-stats-grid">
@@ -377,8 +378,7 @@ class FurbyGameWebInterface:
                 </div>
                 
                 <div class="vehicle-action">
-                    {'<button class="vehicle-btn owned-btn">✅ Owned</button>' if owned else 
-                     f'<button onclick="purchaseVehicle(\\'{{vehicle_id}}\\')" class="vehicle-btn purchase-btn" {{\"disabled\" if not can_afford else \"\"}}>{"💸 Can\\'t Afford" if not can_afford else f"🛒 Buy for {vehicle.cost_fbx} FBX"}</button>'}
+                    {action_button}
                 </div>
             </div>
             """
@@ -532,7 +532,7 @@ class FurbyGameWebInterface:
                     <p><strong>Version:</strong> AI Furby 1.25D v1.0</p>
                     <p><strong>Platform:</strong> MTAQuestWebsideX.com</p>
                     <p><strong>Integration:</strong> FURBX Token System</p>
-                    <p><strong>Save File:</strong> game_save_{game.user_id}.json</p>
+                    <p><strong>Save Data:</strong> SQLite game_states ({escape(game.user_id)})</p>
                 </div>
             </div>
         </div>
@@ -610,894 +610,6 @@ class FurbyGameWebInterface:
         </div>
         """
     
-    def _get_game_css(self) -> str:
-        """Get CSS styles for the game interface"""
-        return """
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
-        
-        body {
-            font-family: 'Consolas', 'Monaco', 'Courier New', monospace;
-            background: linear-gradient(135deg, #2d1b69 0%, #8b5cf6 50%, #ef4444 100%);
-            min-height: 100vh;
-            color: #fff;
-            line-height: 1.6;
-        }
-        
-        .game-container {
-            max-width: 1400px;
-            margin: 0 auto;
-            padding: 20px;
-        }
-        
-        .game-header {
-            background: rgba(0, 0, 0, 0.8);
-            border-radius: 15px;
-            padding: 20px;
-            margin-bottom: 20px;
-            border: 2px solid #8b5cf6;
-            box-shadow: 0 0 20px rgba(139, 92, 246, 0.3);
-        }
-        
-        .header-content {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-        }
-        
-        .header-content h1 {
-            color: #8b5cf6;
-            font-size: 2.2em;
-            font-weight: bold;
-            text-shadow: 0 0 10px rgba(139, 92, 246, 0.5);
-        }
-        
-        .player-info {
-            display: flex;
-            align-items: center;
-            gap: 15px;
-        }
-        
-        .player-name {
-            font-size: 1.2em;
-            font-weight: bold;
-            color: #fbbf24;
-        }
-        
-        .level-badge {
-            background: linear-gradient(45deg, #8b5cf6, #ef4444);
-            padding: 8px 16px;
-            border-radius: 20px;
-            font-weight: bold;
-        }
-        
-        .game-dashboard {
-            display: grid;
-            grid-template-columns: 1fr 1fr 1fr;
-            gap: 20px;
-            margin-bottom: 20px;
-        }
-        
-        .player-hud, .location-view, .vehicle-display, .action-panel {
-            background: rgba(0, 0, 0, 0.8);
-            border-radius: 12px;
-            padding: 20px;
-            border: 1px solid #8b5cf6;
-            box-shadow: 0 0 15px rgba(139, 92, 246, 0.2);
-        }
-        
-        .player-hud h3, .location-view h2, .vehicle-display h3, .action-panel h3 {
-            color: #8b5cf6;
-            margin-bottom: 15px;
-            font-size: 1.4em;
-        }
-        
-        .hud-section {
-            margin-bottom: 20px;
-        }
-        
-        .stat-row {
-            display: flex;
-            justify-content: space-between;
-            margin-bottom: 8px;
-        }
-        
-        .stat-label {
-            color: #cbd5e1;
-        }
-        
-        .stat-value {
-            color: #fbbf24;
-            font-weight: bold;
-        }
-        
-        .progress-item {
-            margin-bottom: 12px;
-        }
-        
-        .progress-item label {
-            display: block;
-            margin-bottom: 4px;
-            color: #cbd5e1;
-            font-size: 0.9em;
-        }
-        
-        .progress-bar {
-            position: relative;
-            width: 100%;
-            height: 20px;
-            background: rgba(255, 255, 255, 0.1);
-            border-radius: 10px;
-            overflow: hidden;
-        }
-        
-        .progress-fill {
-            height: 100%;
-            transition: width 0.3s ease;
-            border-radius: 10px;
-        }
-        
-        .progress-fill.energy {
-            background: linear-gradient(90deg, #10b981, #34d399);
-        }
-        
-        .progress-fill.heat {
-            background: linear-gradient(90deg, #ef4444, #f87171);
-        }
-        
-        .progress-fill.reputation {
-            background: linear-gradient(90deg, #8b5cf6, #a78bfa);
-        }
-        
-        .progress-fill.experience {
-            background: linear-gradient(90deg, #fbbf24, #fcd34d);
-        }
-        
-        .progress-text {
-            position: absolute;
-            top: 50%;
-            left: 50%;
-            transform: translate(-50%, -50%);
-            font-size: 0.8em;
-            font-weight: bold;
-            color: #fff;
-            text-shadow: 1px 1px 2px rgba(0, 0, 0, 0.8);
-        }
-        
-        .location-header {
-            margin-bottom: 15px;
-        }
-        
-        .location-stats {
-            display: flex;
-            gap: 15px;
-            margin-top: 8px;
-        }
-        
-        .location-stats span {
-            background: rgba(139, 92, 246, 0.2);
-            padding: 4px 8px;
-            border-radius: 6px;
-            font-size: 0.9em;
-        }
-        
-        .ascii-art {
-            background: rgba(0, 0, 0, 0.6);
-            padding: 15px;
-            border-radius: 8px;
-            margin: 15px 0;
-            font-family: 'Courier New', monospace;
-        }
-        
-        .ascii-art pre {
-            color: #8b5cf6;
-            font-size: 0.9em;
-            line-height: 1.2;
-        }
-        
-        .location-actions, .action-grid {
-            display: flex;
-            gap: 10px;
-            flex-wrap: wrap;
-        }
-        
-        .action-btn, .game-action-btn, .travel-action-btn {
-            padding: 10px 16px;
-            border: none;
-            border-radius: 8px;
-            font-weight: bold;
-            cursor: pointer;
-            transition: all 0.3s ease;
-            font-family: inherit;
-        }
-        
-        .encounter-btn {
-            background: #ef4444;
-            color: white;
-        }
-        
-        .explore-btn {
-            background: #8b5cf6;
-            color: white;
-        }
-        
-        .rest-btn {
-            background: #10b981;
-            color: white;
-        }
-        
-        .save-btn {
-            background: #fbbf24;
-            color: black;
-        }
-        
-        .travel-btn, .shop-btn {
-            background: #6366f1;
-            color: white;
-        }
-        
-        .action-btn:hover, .game-action-btn:hover, .travel-action-btn:hover {
-            transform: translateY(-2px);
-            box-shadow: 0 4px 12px rgba(0, 0, 0, 0.3);
-        }
-        
-        .vehicle-info h4 {
-            color: #fbbf24;
-            margin-bottom: 8px;
-        }
-        
-        .vehicle-stats {
-            display: flex;
-            gap: 15px;
-            margin-bottom: 10px;
-        }
-        
-        .vehicle-stats span {
-            background: rgba(139, 92, 246, 0.2);
-            padding: 4px 8px;
-            border-radius: 6px;
-            font-size: 0.8em;
-        }
-        
-        .engine-sound {
-            text-align: center;
-            color: #8b5cf6;
-            font-weight: bold;
-            margin-top: 10px;
-        }
-        
-        .game-tabs {
-            background: rgba(0, 0, 0, 0.8);
-            border-radius: 15px;
-            overflow: hidden;
-            border: 1px solid #8b5cf6;
-        }
-        
-        .tab-buttons {
-            display: flex;
-            background: rgba(139, 92, 246, 0.2);
-        }
-        
-        .tab-button {
-            flex: 1;
-            padding: 15px 20px;
-            border: none;
-            background: transparent;
-            color: #cbd5e1;
-            cursor: pointer;
-            font-weight: bold;
-            transition: all 0.3s ease;
-            font-family: inherit;
-        }
-        
-        .tab-button.active {
-            background: #8b5cf6;
-            color: white;
-        }
-        
-        .tab-button:hover:not(.active) {
-            background: rgba(139, 92, 246, 0.4);
-            color: white;
-        }
-        
-        .tab-content {
-            display: none;
-            padding: 30px;
-        }
-        
-        .tab-content.active {
-            display: block;
-        }
-        
-        .locations-list {
-            display: flex;
-            flex-direction: column;
-            gap: 12px;
-        }
-        
-        .location-item {
-            display: grid;
-            grid-template-columns: auto auto 1fr auto auto auto;
-            gap: 15px;
-            align-items: center;
-            padding: 12px;
-            background: rgba(139, 92, 246, 0.1);
-            border-radius: 8px;
-            border: 1px solid transparent;
-            transition: all 0.3s ease;
-        }
-        
-        .location-item.current {
-            border-color: #8b5cf6;
-            background: rgba(139, 92, 246, 0.2);
-        }
-        
-        .location-item:hover {
-            background: rgba(139, 92, 246, 0.15);
-        }
-        
-        .travel-btn {
-            padding: 6px 12px;
-            font-size: 0.9em;
-        }
-        
-        .travel-btn:disabled {
-            opacity: 0.5;
-            cursor: not-allowed;
-        }
-        
-        .vehicles-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
-            gap: 20px;
-        }
-        
-        .vehicle-item {
-            background: rgba(139, 92, 246, 0.1);
-            border: 2px solid transparent;
-            border-radius: 12px;
-            padding: 20px;
-            transition: all 0.3s ease;
-        }
-        
-        .vehicle-item:hover {
-            border-color: #8b5cf6;
-            transform: translateY(-5px);
-        }
-        
-        .vehicle-item.owned {
-            border-color: #10b981;
-            background: rgba(16, 185, 129, 0.1);
-        }
-        
-        .vehicle-header {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 10px;
-        }
-        
-        .vehicle-header h4 {
-            color: #fbbf24;
-        }
-        
-        .vehicle-type {
-            background: #8b5cf6;
-            padding: 4px 8px;
-            border-radius: 6px;
-            font-size: 0.8em;
-        }
-        
-        .vehicle-ascii-mini {
-            margin: 15px 0;
-        }
-        
-        .vehicle-ascii-mini pre {
-            color: #8b5cf6;
-            font-size: 0.8em;
-            text-align: center;
-        }
-        
-        .vehicle-stats-grid {
-            display: grid;
-            grid-template-columns: 1fr 1fr;
-            gap: 8px;
-            margin: 15px 0;
-        }
-        
-        .vehicle-special {
-            margin: 15px 0;
-            padding: 10px;
-            background: rgba(0, 0, 0, 0.4);
-            border-radius: 6px;
-            font-size: 0.9em;
-        }
-        
-        .vehicle-btn {
-            width: 100%;
-            padding: 10px;
-            border: none;
-            border-radius: 8px;
-            font-weight: bold;
-            cursor: pointer;
-            transition: all 0.3s ease;
-        }
-        
-        .purchase-btn {
-            background: #8b5cf6;
-            color: white;
-        }
-        
-        .purchase-btn:disabled {
-            background: #6b7280;
-            cursor: not-allowed;
-        }
-        
-        .owned-btn {
-            background: #10b981;
-            color: white;
-            cursor: default;
-        }
-        
-        .stats-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
-            gap: 20px;
-            margin-bottom: 20px;
-        }
-        
-        .stats-section {
-            background: rgba(139, 92, 246, 0.1);
-            padding: 20px;
-            border-radius: 10px;
-        }
-        
-        .stats-section h4 {
-            color: #8b5cf6;
-            margin-bottom: 15px;
-        }
-        
-        .relationships-list, .achievements-list {
-            margin-top: 15px;
-        }
-        
-        .relationship-item {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 10px;
-            padding: 8px;
-            background: rgba(0, 0, 0, 0.3);
-            border-radius: 6px;
-        }
-        
-        .relationship-bar {
-            width: 60px;
-            height: 8px;
-            background: rgba(255, 255, 255, 0.2);
-            border-radius: 4px;
-            overflow: hidden;
-        }
-        
-        .relationship-fill {
-            height: 100%;
-            background: linear-gradient(90deg, #ef4444, #fbbf24);
-        }
-        
-        .modal {
-            display: none;
-            position: fixed;
-            z-index: 1000;
-            left: 0;
-            top: 0;
-            width: 100%;
-            height: 100%;
-            background-color: rgba(0, 0, 0, 0.8);
-        }
-        
-        .modal-content {
-            background: linear-gradient(135deg, #1f2937, #374151);
-            margin: 5% auto;
-            padding: 0;
-            border-radius: 15px;
-            width: 80%;
-            max-width: 600px;
-            border: 2px solid #8b5cf6;
-            box-shadow: 0 0 30px rgba(139, 92, 246, 0.5);
-        }
-        
-        .modal-header {
-            background: #8b5cf6;
-            padding: 20px;
-            border-radius: 13px 13px 0 0;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-        }
-        
-        .modal-header h3 {
-            margin: 0;
-            color: white;
-        }
-        
-        .close {
-            color: white;
-            font-size: 28px;
-            font-weight: bold;
-            cursor: pointer;
-        }
-        
-        .close:hover {
-            opacity: 0.7;
-        }
-        
-        .modal-body {
-            padding: 20px;
-        }
-        
-        .encounter-actions {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(150px, 1fr));
-            gap: 10px;
-            margin-top: 20px;
-        }
-        
-        .encounter-btn {
-            padding: 12px 16px;
-            border: none;
-            border-radius: 8px;
-            font-weight: bold;
-            cursor: pointer;
-            transition: all 0.3s ease;
-            background: #8b5cf6;
-            color: white;
-        }
-        
-        .encounter-btn:hover {
-            background: #7c3aed;
-            transform: translateY(-2px);
-        }
-        
-        .no-data {
-            color: #6b7280;
-            font-style: italic;
-        }
-        
-        @media (max-width: 768px) {
-            .game-dashboard {
-                grid-template-columns: 1fr;
-            }
-            
-            .header-content {
-                flex-direction: column;
-                gap: 15px;
-                text-align: center;
-            }
-            
-            .header-content h1 {
-                font-size: 1.8em;
-            }
-            
-            .tab-buttons {
-                flex-wrap: wrap;
-            }
-            
-            .tab-button {
-                font-size: 0.9em;
-                padding: 12px 15px;
-            }
-            
-            .vehicles-grid {
-                grid-template-columns: 1fr;
-            }
-            
-            .stats-grid {
-                grid-template-columns: 1fr;
-            }
-        }
-        """
-    
-    def _get_game_javascript(self, user_id: str) -> str:
-        """Get JavaScript for game functionality"""
-        return f"""
-        // Game JavaScript
-        let currentUser = '{user_id}';
-        let gameState = {{}};
-        
-        // Tab management
-        function showGameTab(tabName) {{
-            // Hide all tabs
-            document.querySelectorAll('.tab-content').forEach(tab => {{
-                tab.classList.remove('active');
-            }});
-            
-            // Remove active class from all buttons
-            document.querySelectorAll('.tab-button').forEach(btn => {{
-                btn.classList.remove('active');
-            }});
-            
-            // Show selected tab
-            document.getElementById(tabName + '-tab').classList.add('active');
-            
-            // Activate button
-            event.target.classList.add('active');
-        }}
-        
-        // Modal management
-        function showModal(modalId) {{
-            document.getElementById(modalId).style.display = 'block';
-        }}
-        
-        function closeModal(modalId) {{
-            document.getElementById(modalId).style.display = 'none';
-        }}
-        
-        // Game actions
-        function lookForEncounter() {{
-            addToActivityLog('🔍 Looking for encounters...');
-            
-            // Simulate encounter
-            setTimeout(() => {{
-                const encounters = ['Street Hustler', 'Club Dancer', 'Beach Babe'];
-                const encounter = encounters[Math.floor(Math.random() * encounters.length)];
-                showEncounterModal(encounter);
-            }}, 1000);
-        }}
-        
-        function exploreArea() {{
-            addToActivityLog('🗺️ Exploring the current area...');
-            
-            // Simulate random event
-            setTimeout(() => {{
-                const events = [
-                    '💰 You found some cash on the ground! (+$200)',
-                    '🔥 Your ride attracted admirers! (+5 heat)',
-                    '👮 Police patrol spotted - lay low!',
-                    '🎵 Street music lifts your spirits! (+10 energy)'
-                ];
-                const event = events[Math.floor(Math.random() * events.length)];
-                addToActivityLog(event);
-            }}, 1500);
-        }}
-        
-        function restPlayer() {{
-            addToActivityLog('😴 Resting to recover energy...');
-            
-            // Simulate rest
-            setTimeout(() => {{
-                addToActivityLog('⚡ Energy restored! (-$50 cash)');
-                updatePlayerStats();
-            }}, 1000);
-        }}
-        
-        function saveGame() {{
-            addToActivityLog('💾 Saving game...');
-            
-            // Simulate save
-            setTimeout(() => {{
-                addToActivityLog('✅ Game saved successfully!');
-            }}, 500);
-        }}
-        
-        function showEncounterModal(npcName) {{
-            const modal = document.getElementById('encounter-modal');
-            const title = document.getElementById('encounter-title');
-            const profile = document.getElementById('npc-profile');
-            const dialogue = document.getElementById('encounter-dialogue');
-            
-            title.textContent = `💫 Encounter with ${{npcName}}`;
-            
-            profile.innerHTML = `
-                <div class="npc-card">
-                    <h4>${{npcName}}</h4>
-                    <p><strong>Style:</strong> Sultry and mysterious</p>
-                    <p><strong>Heat Potential:</strong> 40 points</p>
-                    <p><strong>Requirements:</strong> $300 cash, 25 rep</p>
-                </div>
-            `;
-            
-            dialogue.innerHTML = `
-                <div class="dialogue-box">
-                    <p>💋 "${{npcName}} looks at you with interest..."</p>
-                    <p>"You've got that dangerous charm... Tell me more about yourself..."</p>
-                </div>
-            `;
-            
-            showModal('encounter-modal');
-        }}
-        
-        function chooseAction(action) {{
-            const actionNames = {{
-                'sweet_talk': 'Sweet Talk',
-                'flash_cash': 'Flash Cash',
-                'physical': 'Physical Seduction',
-                'rev_engine': 'Rev Engine',
-                'risky_gamble': 'Risky Gamble',
-                'premium_fbx': 'Use FBX Tokens',
-                'drive_away': 'Drive Away'
-            }};
-            
-            addToActivityLog(`🎭 You chose: ${{actionNames[action]}}`);
-            
-            closeModal('encounter-modal');
-            
-            // Simulate encounter result
-            setTimeout(() => {{
-                showEncounterResult(action);
-            }}, 1000);
-        }}
-        
-        function showEncounterResult(action) {{
-            const results = {{
-                'sweet_talk': {{
-                    success: true,
-                    message: '😘 Your charm worked! She is impressed by your smooth talk.',
-                    rewards: '+20 heat, +3 reputation'
-                }},
-                'flash_cash': {{
-                    success: true,
-                    message: '💰 Money talks! She is very interested now.',
-                    rewards: '+30 heat, +5 reputation, -$300 cash'
-                }},
-                'premium_fbx': {{
-                    success: true,
-                    message: '💎 PREMIUM EXPERIENCE! She gives you the VIP treatment!',
-                    rewards: '+60 heat, +15 reputation, -2.5 FBX'
-                }}
-            }};
-            
-            const result = results[action] || {{
-                success: false,
-                message: '💥 That didn\\'t work out as planned...',
-                rewards: 'No rewards'
-            }};
-            
-            const modal = document.getElementById('results-modal');
-            const content = document.getElementById('results-content');
-            
-            content.innerHTML = `
-                <div class="result-card ${{result.success ? 'success' : 'failure'}}">
-                    <h4>${{result.success ? '🎉 Success!' : '❌ Failed!'}}</h4>
-                    <p>${{result.message}}</p>
-                    <div class="rewards">
-                        <strong>Rewards:</strong> ${{result.rewards}}
-                    </div>
-                </div>
-            `;
-            
-            showModal('results-modal');
-            
-            addToActivityLog(`${{result.success ? '✅' : '❌'}} ${{result.message}}`);
-            
-            if (result.success) {{
-                updatePlayerStats();
-            }}
-        }}
-        
-        // Travel functions
-        function moveLeft() {{
-            addToActivityLog('⬅️ Moving to previous location...');
-            updateLocation();
-        }}
-        
-        function moveRight() {{
-            addToActivityLog('➡️ Moving to next location...');
-            updateLocation();
-        }}
-        
-        function travelTo(locationIndex) {{
-            addToActivityLog(`🚁 Fast traveling to location ${{locationIndex + 1}}...`);
-            updateLocation();
-        }}
-        
-        // Vehicle functions
-        function purchaseVehicle(vehicleId) {{
-            addToActivityLog(`🛒 Attempting to purchase vehicle: ${{vehicleId}}...`);
-            
-            setTimeout(() => {{
-                addToActivityLog('🎉 Vehicle purchased successfully!');
-                addToActivityLog('✨ Your style points have increased!');
-                updatePlayerStats();
-            }}, 1000);
-        }}
-        
-        // Settings functions
-        function toggleSetting(setting) {{
-            addToActivityLog(`⚙️ Toggled ${{setting}} setting`);
-        }}
-        
-        function changeDifficulty(difficulty) {{
-            addToActivityLog(`🎯 Difficulty changed to ${{difficulty}}`);
-        }}
-        
-        function resetGame() {{
-            if (confirm('⚠️ Are you sure you want to reset ALL save data?')) {{
-                addToActivityLog('💥 Game data reset!');
-                location.reload();
-            }}
-        }}
-        
-        function loadGame() {{
-            addToActivityLog('📂 Loading saved game...');
-            setTimeout(() => {{
-                addToActivityLog('✅ Game loaded successfully!');
-                updatePlayerStats();
-            }}, 500);
-        }}
-        
-        // Utility functions
-        function addToActivityLog(message) {{
-            const log = document.getElementById('activity-log');
-            if (log) {{
-                const timestamp = new Date().toLocaleTimeString();
-                const logEntry = document.createElement('p');
-                logEntry.innerHTML = `<span class="timestamp">[${{timestamp}}]</span> ${{message}}`;
-                log.insertBefore(logEntry, log.firstChild);
-                
-                // Keep only last 10 entries
-                while (log.children.length > 10) {{
-                    log.removeChild(log.lastChild);
-                }}
-            }}
-        }}
-        
-        function updatePlayerStats() {{
-            // Simulate stat updates
-            const energy = Math.floor(Math.random() * 100);
-            const heat = Math.floor(Math.random() * 100);
-            const reputation = Math.floor(Math.random() * 100);
-            
-            // Update progress bars
-            updateProgressBar('energy', energy);
-            updateProgressBar('heat', heat);
-            updateProgressBar('reputation', reputation);
-        }}
-        
-        function updateProgressBar(type, value) {{
-            const bar = document.querySelector(`.progress-fill.${{type}}`);
-            const text = bar?.nextElementSibling;
-            
-            if (bar) {{
-                bar.style.width = `${{value}}%`;
-            }}
-            
-            if (text && type !== 'reputation') {{
-                text.textContent = `${{value}}/100`;
-            }} else if (text) {{
-                text.textContent = value.toString();
-            }}
-        }}
-        
-        function updateLocation() {{
-            setTimeout(() => {{
-                addToActivityLog('📍 Arrived at new location!');
-                // Refresh page or update location display
-            }}, 1000);
-        }}
-        
-        // Initialize game
-        document.addEventListener('DOMContentLoaded', function() {{
-            addToActivityLog('🎮 Welcome to AI Furby 1.25D: San Andreas Edition!');
-            addToActivityLog('🌟 Use the action buttons to start your adventure.');
-            
-            // Auto-update stats every 30 seconds
-            setInterval(updatePlayerStats, 30000);
-        }});
-        
-        // Close modals when clicking outside
-        window.onclick = function(event) {{
-            const modals = document.querySelectorAll('.modal');
-            modals.forEach(modal => {{
-                if (event.target === modal) {{
-                    modal.style.display = 'none';
-                }}
-            }});
-        }}
-        """
-    
     def _render_error_page(self, error_message: str) -> str:
         """Render error page"""
         return f"""
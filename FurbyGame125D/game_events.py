@@ -0,0 +1,229 @@
+"""
+AI Furby 1.25D: San Andreas Edition - Game Event Stream
+Kanał push (Server-Sent Events) dla klienta web: zamiast odpytywania
+/api/game/status serwer wysyła tylko zmienione pola stanu gracza
+"""
+
+import json
+import threading
+from collections import deque
+from dataclasses import asdict
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+# Pola stanu gry (poza PlayerStats) przesyłane w delcie
+GAME_FIELDS = ("position", "game_time", "difficulty", "animations_enabled", "sound_effects_enabled")
+
+
+def game_snapshot(game) -> Dict[str, Any]:
+    """Płaski, mały stan gracza - porównywany pole po polu przy wysyłaniu delty"""
+    snapshot = asdict(game.player)
+    for name in GAME_FIELDS:
+        snapshot[name] = getattr(game, name)
+    return snapshot
+
+
+def diff_snapshots(previous: Optional[Dict[str, Any]], current: Dict[str, Any]) -> Dict[str, Any]:
+    if previous is None:
+        return dict(current)
+    return {key: value for key, value in current.items() if previous.get(key) != value}
+
+
+def world_payload(world) -> Dict[str, Any]:
+    """Statyczne dane świata (w tym ASCII art) - wysyłane raz na sesję strumienia"""
+    return {
+        "locations": [
+            {"position": index, "name": location.name, "icon": location.icon, "type": location.type,
+             "danger_level": location.danger_level, "luxury_level": location.luxury_level,
+             "entry_cost": location.entry_cost, "background_music": location.background_music,
+             "ascii_art": list(location.ascii_art)}
+            for index, location in enumerate(world.locations)
+        ],
+        "vehicles": {
+            vehicle_id: {"name": vehicle.name, "type": vehicle.type, "speed": vehicle.speed,
+                         "style_points": vehicle.style_points, "cost_fbx": vehicle.cost_fbx,
+                         "special_ability": vehicle.special_ability, "engine_sound": vehicle.engine_sound,
+                         "ascii_art": list(vehicle.ascii_art)}
+            for vehicle_id, vehicle in world.vehicles.items()
+        }
+    }
+
+
+def format_sse(event: str, data: Any, event_id: Optional[int] = None) -> str:
+    """Jedna wiadomość w formacie text/event-stream"""
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event}")
+    lines.append("data: " + json.dumps(data, separators=(",", ":"), ensure_ascii=False))
+    return "\n".join(lines) + "\n\n"
+
+
+class GameStreamSubscription:
+    """
+    Kolejka zdarzeń jednego połączenia SSE.
+
+    Kolejka jest ograniczona; przy przepełnieniu (wolny klient) zaległe
+    zdarzenia są porzucane, a klient dostaje zdarzenie "resync" z pełnym stanem.
+    """
+
+    def __init__(self, user_id: str, queue_size: int = 64):
+        self.user_id = user_id
+        self.queue_size = queue_size
+        self._events: Deque[Tuple[int, str, Any]] = deque()
+        self._cond = threading.Condition()
+        self.needs_resync = False
+        self.closed = False
+        self.dropped = 0
+        self.sent = 0
+
+    def offer(self, event_id: int, event: str, data: Any) -> None:
+        with self._cond:
+            if self.closed:
+                return
+            if len(self._events) >= self.queue_size:
+                self.dropped += len(self._events)
+                self._events.clear()
+                self.needs_resync = True
+            self._events.append((event_id, event, data))
+            self._cond.notify()
+
+    def get(self, timeout: float) -> Optional[Tuple[int, str, Any]]:
+        """Następne zdarzenie albo None po timeout (wtedy wysyłany jest keep-alive)"""
+        with self._cond:
+            if not self._events and not self.closed:
+                self._cond.wait(timeout)
+            if not self._events:
+                return None
+            self.sent += 1
+            return self._events.popleft()
+
+    def close(self) -> None:
+        with self._cond:
+            self.closed = True
+            self._cond.notify_all()
+
+
+class GameStateBroadcaster:
+    """
+    Rozsyła zmiany stanu gier do otwartych strumieni SSE graczy.
+
+    Dla każdego gracza pamiętany jest ostatnio wysłany stan; publish_state()
+    wysyła tylko różnicę (np. {"cash_usd": 950, "position": 2}). Gdy gracz nie
+    ma otwartego strumienia, publikacja nic nie kosztuje poza sprawdzeniem słownika.
+    """
+
+    def __init__(self, queue_size: int = 64, keepalive: float = 15.0):
+        self.queue_size = queue_size
+        self.keepalive = keepalive
+        self._subscribers: Dict[str, List[GameStreamSubscription]] = {}
+        self._last_state: Dict[str, Dict[str, Any]] = {}
+        self._sequence: Dict[str, int] = {}
+        self._world_cache: Dict[int, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self.stats = {"published": 0, "skipped_unchanged": 0, "subscriptions": 0, "payload_bytes": 0}
+
+    def _next_id(self, user_id: str) -> int:
+        self._sequence[user_id] = self._sequence.get(user_id, 0) + 1
+        return self._sequence[user_id]
+
+    def _world(self, world) -> Dict[str, Any]:
+        payload = self._world_cache.get(id(world))
+        if payload is None:
+            payload = self._world_cache[id(world)] = world_payload(world)
+        return payload
+
+    def subscribe(self, user_id: str, game) -> GameStreamSubscription:
+        """Nowy strumień: najpierw świat (raz), potem pełny stan jako punkt odniesienia"""
+        subscription = GameStreamSubscription(user_id, self.queue_size)
+        snapshot = game_snapshot(game)
+        with self._lock:
+            self._subscribers.setdefault(user_id, []).append(subscription)
+            self._last_state[user_id] = snapshot
+            subscription.offer(self._next_id(user_id), "world", self._world(game.world))
+            subscription.offer(self._next_id(user_id), "state", snapshot)
+            self.stats["subscriptions"] += 1
+        return subscription
+
+    def unsubscribe(self, subscription: GameStreamSubscription) -> None:
+        subscription.close()
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.user_id, [])
+            if subscription in subscribers:
+                subscribers.remove(subscription)
+            if not subscribers:
+                self._subscribers.pop(subscription.user_id, None)
+                self._last_state.pop(subscription.user_id, None)
+
+    def has_subscribers(self, user_id: str) -> bool:
+        return user_id in self._subscribers
+
+    def publish_state(self, user_id: str, game, **extra: Any) -> Optional[Dict[str, Any]]:
+        """Wysyła deltę stanu gracza (i opcjonalne pola dodatkowe); zwraca deltę"""
+        if user_id not in self._subscribers:
+            return None
+        snapshot = game_snapshot(game)
+        with self._lock:
+            delta = diff_snapshots(self._last_state.get(user_id), snapshot)
+            self._last_state[user_id] = snapshot
+            if not delta and not extra:
+                self.stats["skipped_unchanged"] += 1
+                return delta
+            self._broadcast_locked(user_id, "state", {**delta, **extra})
+        return delta
+
+    def publish(self, user_id: str, event: str, data: Any) -> None:
+        """Dowolne zdarzenie (np. wynik spotkania) do strumieni gracza"""
+        if user_id not in self._subscribers:
+            return
+        with self._lock:
+            self._broadcast_locked(user_id, event, data)
+
+    def _broadcast_locked(self, user_id: str, event: str, data: Any) -> None:
+        event_id = self._next_id(user_id)
+        self.stats["published"] += 1
+        self.stats["payload_bytes"] += len(json.dumps(data, separators=(",", ":"), ensure_ascii=False))
+        for subscription in self._subscribers.get(user_id, ()):
+            subscription.offer(event_id, event, data)
+
+    def stream(self, subscription: GameStreamSubscription, game_getter):
+        """Generator wiadomości SSE dla odpowiedzi strumieniowej (zamyka subskrypcję na końcu)"""
+        try:
+            yield "retry: 3000\n\n"
+            while not subscription.closed:
+                item = subscription.get(self.keepalive)
+                if subscription.needs_resync:
+                    subscription.needs_resync = False
+                    snapshot = game_snapshot(game_getter())
+                    with self._lock:
+                        self._last_state[subscription.user_id] = snapshot
+                    yield format_sse("resync", snapshot)
+                    # Migawka zastępuje tylko delty stanu - inne zdarzenia (np. spotkanie) idą dalej
+                    if item is None or item[1] == "state":
+                        continue
+                if item is None:
+                    yield ": keep-alive\n\n"
+                    continue
+                event_id, event, data = item
+                yield format_sse(event, data, event_id)
+        finally:
+            self.unsubscribe(subscription)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {**self.stats,
+                    "open_streams": sum(len(s) for s in self._subscribers.values()),
+                    "users_streaming": len(self._subscribers)}
+
+
+_broadcaster: Optional[GameStateBroadcaster] = None
+_broadcaster_lock = threading.Lock()
+
+
+def get_game_broadcaster() -> GameStateBroadcaster:
+    """Globalny broadcaster strumieni gry"""
+    global _broadcaster
+    if _broadcaster is None:
+        with _broadcaster_lock:
+            if _broadcaster is None:
+                _broadcaster = GameStateBroadcaster()
+    return _broadcaster
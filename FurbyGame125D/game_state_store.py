@@ -0,0 +1,180 @@
+"""
+AI Furby 1.25D: San Andreas Edition - Game State Store
+Zapis stanu gier w tle (write-behind): kopia w pamięci jest autorytatywna,
+zmiany są łączone per gracz i zapisywane partiami do jednej bazy SQLite
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS game_states (
+    user_id TEXT PRIMARY KEY,
+    state TEXT NOT NULL,
+    updated_at REAL NOT NULL
+)
+"""
+
+UPSERT = """
+INSERT INTO game_states (user_id, state, updated_at) VALUES (?, ?, ?)
+ON CONFLICT(user_id) DO UPDATE SET state = excluded.state, updated_at = excluded.updated_at
+"""
+
+
+class GameStateStore:
+    """
+    Magazyn stanów gier wszystkich graczy w jednej tabeli SQLite.
+
+    save() tylko oznacza gracza jako brudnego (najnowszy stan zastępuje
+    poprzedni, który nie zdążył się zapisać); wątek w tle co flush_interval
+    zapisuje wszystkie brudne stany w jednej transakcji. Transakcja w trybie
+    WAL jest atomowa - po awarii baza zawiera poprzednią albo nową partię,
+    nigdy połowę zapisu.
+    """
+
+    def __init__(self, path: str = "furby_game_state.db", flush_interval: float = 1.0,
+                 autostart: bool = True):
+        self.path = path
+        self.flush_interval = flush_interval
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(SCHEMA)
+        self._db_lock = threading.Lock()
+        self._pending: Dict[str, Optional[str]] = {}
+        self._pending_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.stats = {"saves": 0, "coalesced": 0, "rows_written": 0, "flushes": 0, "errors": 0}
+        if autostart:
+            self.start()
+
+    # ===== API =====
+    def save(self, user_id: str, state: Dict[str, Any]) -> None:
+        """Oznacza stan gracza do zapisu (bez I/O w wątku żądania)"""
+        payload = json.dumps(state, separators=(",", ":"))
+        with self._pending_lock:
+            if user_id in self._pending:
+                self.stats["coalesced"] += 1
+            self._pending[user_id] = payload
+            self.stats["saves"] += 1
+
+    def load(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """Najnowszy stan gracza: niezapisany z pamięci albo z bazy"""
+        with self._pending_lock:
+            if user_id in self._pending:
+                payload = self._pending[user_id]
+                return json.loads(payload) if payload is not None else None
+        with self._db_lock:
+            row = self._conn.execute("SELECT state FROM game_states WHERE user_id = ?",
+                                     (user_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def delete(self, user_id: str) -> None:
+        """Usuwa stan gracza (również oczekujący na zapis)"""
+        with self._pending_lock:
+            self._pending[user_id] = None
+
+    def flush(self) -> int:
+        """Zapisuje wszystkie brudne stany w jednej transakcji; zwraca liczbę wierszy"""
+        with self._pending_lock:
+            if not self._pending:
+                return 0
+            batch, self._pending = self._pending, {}
+        now = time.time()
+        upserts = [(user_id, payload, now) for user_id, payload in batch.items() if payload is not None]
+        deletes = [(user_id,) for user_id, payload in batch.items() if payload is None]
+        try:
+            with self._db_lock:
+                self._conn.execute("BEGIN")
+                try:
+                    if upserts:
+                        self._conn.executemany(UPSERT, upserts)
+                    if deletes:
+                        self._conn.executemany("DELETE FROM game_states WHERE user_id = ?", deletes)
+                    self._conn.execute("COMMIT")
+                except BaseException:
+                    self._conn.execute("ROLLBACK")
+                    raise
+        except Exception as e:
+            logger.error(f"Game state flush failed ({len(batch)} players): {e}")
+            self.stats["errors"] += 1
+            with self._pending_lock:
+                # Nowsze stany zapisane w międzyczasie mają pierwszeństwo
+                for user_id, payload in batch.items():
+                    self._pending.setdefault(user_id, payload)
+            return 0
+        self.stats["rows_written"] += len(batch)
+        self.stats["flushes"] += 1
+        return len(batch)
+
+    # ===== BACKGROUND FLUSHER =====
+    def start(self) -> "GameStateStore":
+        if self._thread is None or not self._thread.is_alive():
+            self._stopped.clear()
+            self._thread = threading.Thread(target=self._run, name="furby-state-flusher", daemon=True)
+            self._thread.start()
+        return self
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self.flush()
+
+    def close(self) -> None:
+        """Zatrzymuje wątek w tle i zapisuje resztę stanów"""
+        self._stopped.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+        self.flush()
+        with self._db_lock:
+            self._conn.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._pending_lock:
+            pending = len(self._pending)
+        return {**self.stats, "pending": pending, "flush_interval": self.flush_interval}
+
+
+_store: Optional[GameStateStore] = None
+_store_lock = threading.Lock()
+
+
+def get_game_state_store() -> GameStateStore:
+    """Globalny magazyn stanów (FURBY_STATE_DB, FURBY_STATE_FLUSH_INTERVAL)"""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = GameStateStore(
+                    os.getenv("FURBY_STATE_DB", "furby_game_state.db"),
+                    flush_interval=float(os.getenv("FURBY_STATE_FLUSH_INTERVAL", 1.0))
+                )
+    return _store
+
+
+def close_game_state_store() -> None:
+    """Zapisuje i zamyka globalny magazyn, jeśli został utworzony"""
+    global _store
+    with _store_lock:
+        store, _store = _store, None
+    if store is not None:
+        store.close()
+
+
+def set_game_state_store(store: Optional[GameStateStore]) -> None:
+    """Podmienia globalny magazyn (testy, benchmarki)"""
+    global _store
+    with _store_lock:
+        _store = store
@@ -0,0 +1,384 @@
+// Game JavaScript
+let currentUser = document.body.dataset.userId;
+let gameState = {};
+
+// State loading - HTML is a static shell, game state comes from the JSON view
+function loadGameState() {
+    return fetch(document.body.dataset.stateUrl, { credentials: 'same-origin' })
+        .then(response => response.json())
+        .then(state => {
+            gameState = state;
+            Object.entries(state.fragments || {}).forEach(([name, html]) => {
+                const target = document.querySelector(`[data-fragment="${name}"]`);
+                if (target) {
+                    target.innerHTML = html;
+                }
+            });
+            document.querySelector('.player-name').textContent = `👤 ${state.player.name || 'New Player'}`;
+            document.querySelector('.level-badge').textContent = `🎯 Level ${state.player.level}`;
+            return state;
+        });
+}
+
+// Push channel - the server sends world data once, then only changed fields
+let gameWorld = null;
+let gameStream = null;
+
+function connectGameStream() {
+    const url = document.body.dataset.streamUrl;
+    if (!url || !window.EventSource) {
+        return;
+    }
+    gameStream = new EventSource(url);
+    gameStream.addEventListener('world', e => {
+        gameWorld = JSON.parse(e.data);
+    });
+    gameStream.addEventListener('state', e => applyStateDelta(JSON.parse(e.data)));
+    gameStream.addEventListener('resync', e => applyStateDelta(JSON.parse(e.data)));
+    gameStream.addEventListener('encounter', e => {
+        const data = JSON.parse(e.data);
+        const result = data.result || {};
+        addToActivityLog(`${result.success ? '✅' : '❌'} ${result.message || 'Encounter finished'}`);
+    });
+}
+
+function applyStateDelta(delta) {
+    const player = gameState.player || (gameState.player = {});
+    ['energy', 'heat', 'reputation'].forEach(type => {
+        if (type in delta) {
+            updateProgressBar(type, delta[type]);
+        }
+    });
+    if ('experience' in delta) {
+        const bar = document.querySelector('.progress-fill.experience');
+        if (bar) {
+            bar.style.width = `${delta.experience % 100}%`;
+            bar.nextElementSibling.textContent = delta.experience;
+        }
+    }
+    const values = document.querySelectorAll('.player-hud .finances .stat-value');
+    if ('cash_usd' in delta && values[0]) {
+        values[0].textContent = `$${delta.cash_usd.toLocaleString('en-US')}`;
+    }
+    if ('fbx_tokens' in delta && values[1]) {
+        values[1].textContent = `${delta.fbx_tokens.toFixed(2)} FBX`;
+    }
+    if ('name' in delta) {
+        player.name = delta.name;
+        document.querySelector('.player-name').textContent = `👤 ${delta.name || 'New Player'}`;
+    }
+    if ('level' in delta) {
+        player.level = delta.level;
+        document.querySelector('.level-badge').textContent = `🎯 Level ${delta.level}`;
+    }
+    if ('position' in delta && delta.position !== player.position) {
+        player.position = delta.position;
+        renderLocationFromWorld(delta.position);
+    }
+    if ('current_vehicle' in delta || 'unlocked_locations' in delta) {
+        // Rzadkie zmiany - pełne fragmenty sklepu i mapy
+        loadGameState();
+    }
+}
+
+function renderLocationFromWorld(position) {
+    const location = gameWorld && gameWorld.locations[position];
+    const view = document.querySelector('[data-fragment="location"]');
+    if (!location || !view) {
+        loadGameState();
+        return;
+    }
+    view.querySelector('.location-header h2').textContent = `${location.icon} ${location.name}`;
+    view.querySelector('.danger-level').textContent = `💀 Danger: ${location.danger_level}/10`;
+    view.querySelector('.luxury-level').textContent = `💎 Luxury: ${location.luxury_level}/10`;
+    view.querySelector('.ascii-art pre').textContent = location.ascii_art.join('\n');
+    view.querySelector('.background-music').textContent = location.background_music;
+    addToActivityLog(`📍 Arrived at ${location.name}!`);
+}
+
+function postGameAction(url, body) {
+    return fetch(url, {
+        method: 'POST',
+        credentials: 'same-origin',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify(body || {})
+    }).then(response => response.json()).then(data => {
+        if (data.message) {
+            addToActivityLog(data.success ? data.message : `❌ ${data.message}`);
+        }
+        if (!gameStream) {
+            loadGameState();
+        }
+        return data;
+    });
+}
+
+// Tab management
+function showGameTab(tabName) {
+    // Hide all tabs
+    document.querySelectorAll('.tab-content').forEach(tab => {
+        tab.classList.remove('active');
+    });
+
+    // Remove active class from all buttons
+    document.querySelectorAll('.tab-button').forEach(btn => {
+        btn.classList.remove('active');
+    });
+
+    // Show selected tab
+    document.getElementById(tabName + '-tab').classList.add('active');
+
+    // Activate button
+    event.target.classList.add('active');
+}
+
+// Modal management
+function showModal(modalId) {
+    document.getElementById(modalId).style.display = 'block';
+}
+
+function closeModal(modalId) {
+    document.getElementById(modalId).style.display = 'none';
+}
+
+// Game actions
+function lookForEncounter() {
+    addToActivityLog('🔍 Looking for encounters...');
+
+    // Simulate encounter
+    setTimeout(() => {
+        const encounters = ['Street Hustler', 'Club Dancer', 'Beach Babe'];
+        const encounter = encounters[Math.floor(Math.random() * encounters.length)];
+        showEncounterModal(encounter);
+    }, 1000);
+}
+
+function exploreArea() {
+    addToActivityLog('🗺️ Exploring the current area...');
+
+    // Simulate random event
+    setTimeout(() => {
+        const events = [
+            '💰 You found some cash on the ground! (+$200)',
+            '🔥 Your ride attracted admirers! (+5 heat)',
+            '👮 Police patrol spotted - lay low!',
+            '🎵 Street music lifts your spirits! (+10 energy)'
+        ];
+        const event = events[Math.floor(Math.random() * events.length)];
+        addToActivityLog(event);
+    }, 1500);
+}
+
+function restPlayer() {
+    addToActivityLog('😴 Resting to recover energy...');
+
+    postGameAction('/api/game/rest');
+}
+
+function saveGame() {
+    addToActivityLog('💾 Saving game...');
+
+    // Simulate save
+    setTimeout(() => {
+        addToActivityLog('✅ Game saved successfully!');
+    }, 500);
+}
+
+function showEncounterModal(npcName) {
+    const modal = document.getElementById('encounter-modal');
+    const title = document.getElementById('encounter-title');
+    const profile = document.getElementById('npc-profile');
+    const dialogue = document.getElementById('encounter-dialogue');
+
+    title.textContent = `💫 Encounter with ${npcName}`;
+
+    profile.innerHTML = `
+        <div class="npc-card">
+            <h4>${npcName}</h4>
+            <p><strong>Style:</strong> Sultry and mysterious</p>
+            <p><strong>Heat Potential:</strong> 40 points</p>
+            <p><strong>Requirements:</strong> $300 cash, 25 rep</p>
+        </div>
+    `;
+
+    dialogue.innerHTML = `
+        <div class="dialogue-box">
+            <p>💋 "${npcName} looks at you with interest..."</p>
+            <p>"You've got that dangerous charm... Tell me more about yourself..."</p>
+        </div>
+    `;
+
+    showModal('encounter-modal');
+}
+
+function chooseAction(action) {
+    const actionNames = {
+        'sweet_talk': 'Sweet Talk',
+        'flash_cash': 'Flash Cash',
+        'physical': 'Physical Seduction',
+        'rev_engine': 'Rev Engine',
+        'risky_gamble': 'Risky Gamble',
+        'premium_fbx': 'Use FBX Tokens',
+        'drive_away': 'Drive Away'
+    };
+
+    addToActivityLog(`🎭 You chose: ${actionNames[action]}`);
+
+    closeModal('encounter-modal');
+
+    // Simulate encounter result
+    setTimeout(() => {
+        showEncounterResult(action);
+    }, 1000);
+}
+
+function showEncounterResult(action) {
+    const results = {
+        'sweet_talk': {
+            success: true,
+            message: '😘 Your charm worked! She is impressed by your smooth talk.',
+            rewards: '+20 heat, +3 reputation'
+        },
+        'flash_cash': {
+            success: true,
+            message: '💰 Money talks! She is very interested now.',
+            rewards: '+30 heat, +5 reputation, -$300 cash'
+        },
+        'premium_fbx': {
+            success: true,
+            message: '💎 PREMIUM EXPERIENCE! She gives you the VIP treatment!',
+            rewards: '+60 heat, +15 reputation, -2.5 FBX'
+        }
+    };
+
+    const result = results[action] || {
+        success: false,
+        message: '💥 That didn\'t work out as planned...',
+        rewards: 'No rewards'
+    };
+
+    const modal = document.getElementById('results-modal');
+    const content = document.getElementById('results-content');
+
+    content.innerHTML = `
+        <div class="result-card ${result.success ? 'success' : 'failure'}">
+            <h4>${result.success ? '🎉 Success!' : '❌ Failed!'}</h4>
+            <p>${result.message}</p>
+            <div class="rewards">
+                <strong>Rewards:</strong> ${result.rewards}
+            </div>
+        </div>
+    `;
+
+    showModal('results-modal');
+
+    addToActivityLog(`${result.success ? '✅' : '❌'} ${result.message}`);
+
+    if (result.success) {
+        updatePlayerStats();
+    }
+}
+
+// Travel functions
+function moveLeft() {
+    addToActivityLog('⬅️ Moving to previous location...');
+    postGameAction('/api/game/travel', { direction: 'left' });
+}
+
+function moveRight() {
+    addToActivityLog('➡️ Moving to next location...');
+    postGameAction('/api/game/travel', { direction: 'right' });
+}
+
+function travelTo(locationIndex) {
+    addToActivityLog(`🚁 Fast traveling to location ${locationIndex + 1}...`);
+    postGameAction('/api/game/travel', { position: locationIndex });
+}
+
+// Vehicle functions
+function purchaseVehicle(vehicleId) {
+    addToActivityLog(`🛒 Attempting to purchase vehicle: ${vehicleId}...`);
+
+    postGameAction('/api/game/vehicle/purchase', { vehicle_id: vehicleId });
+}
+
+// Settings functions
+function toggleSetting(setting) {
+    addToActivityLog(`⚙️ Toggled ${setting} setting`);
+}
+
+function changeDifficulty(difficulty) {
+    addToActivityLog(`🎯 Difficulty changed to ${difficulty}`);
+}
+
+function resetGame() {
+    if (confirm('⚠️ Are you sure you want to reset ALL save data?')) {
+        addToActivityLog('💥 Game data reset!');
+        location.reload();
+    }
+}
+
+function loadGame() {
+    addToActivityLog('📂 Loading saved game...');
+    postGameAction('/api/game/load');
+}
+
+// Utility functions
+function addToActivityLog(message) {
+    const log = document.getElementById('activity-log');
+    if (log) {
+        const timestamp = new Date().toLocaleTimeString();
+        const logEntry = document.createElement('p');
+        logEntry.innerHTML = `<span class="timestamp">[${timestamp}]</span> ${message}`;
+        log.insertBefore(logEntry, log.firstChild);
+
+        // Keep only last 10 entries
+        while (log.children.length > 10) {
+            log.removeChild(log.lastChild);
+        }
+    }
+}
+
+function updatePlayerStats() {
+    // With an open stream the server pushes changed stats itself
+    if (!gameStream) {
+        loadGameState();
+    }
+}
+
+function updateProgressBar(type, value) {
+    const bar = document.querySelector(`.progress-fill.${type}`);
+    const text = bar?.nextElementSibling;
+
+    if (bar) {
+        bar.style.width = `${value}%`;
+    }
+
+    if (text && type !== 'reputation') {
+        text.textContent = `${value}/100`;
+    } else if (text) {
+        text.textContent = value.toString();
+    }
+}
+
+// Initialize game
+document.addEventListener('DOMContentLoaded', function() {
+    loadGameState().then(() => {
+        addToActivityLog('🎮 Welcome to AI Furby 1.25D: San Andreas Edition!');
+        addToActivityLog('🌟 Use the action buttons to start your adventure.');
+        // Stats are pushed by the server instead of polled
+        connectGameStream();
+    }).catch(() => {
+        document.querySelector('.game-dashboard').textContent = '❌ Failed to load game state';
+    });
+});
+
+// Close modals when clicking outside
+window.onclick = function(event) {
+    const modals = document.querySelectorAll('.modal');
+    modals.forEach(modal => {
+        if (event.target === modal) {
+            modal.style.display = 'none';
+        }
+    });
+}
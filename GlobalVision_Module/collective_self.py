@@ -12,15 +12,22 @@ Funkcje:
 - Generowanie rekomendacji dla SYNERGY
 """
 
+import atexit
+import hashlib
 import json
+import math
 import os
+import re
+import sys
+import threading
+import time
+from array import array
 from datetime import datetime
-from typing import Dict, List, Tuple
-from collections import defaultdict
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from collections import OrderedDict, defaultdict, deque
 import statistics
 
 # Integracja z głównym systemem świadomości
-import sys
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '7_SYSTEM_SELF'))
 
 try:
@@ -31,17 +38,272 @@ except ImportError:
     print("⚠️ Główny system świadomości niedostępny - tryb autonomiczny")
 
 
+# Leksykon emocji: słowa kluczowe (dopasowanie podciągu) i intensywność bazowa
+EMOTION_LEXICON = {
+    "curiosity": (["ciekawość", "pytanie", "zastanawiam", "interesuje"], 0.7),
+    "tension": (["napięcie", "stres", "trudność", "konflikt", "problem"], 0.8),
+    "flow": (["płynnie", "harmonijnie", "naturalnie", "łatwo", "płynie"], 0.6),
+    "discovery": (["odkrywam", "znalazłem", "zauważyłem", "widzę", "zrozumiałem"], 0.9),
+    "integration": (["łączę", "integruję", "spajam", "jedność", "całość"], 0.8),
+    "transcendence": (["przekraczam", "wznosię", "transcendencja", "wyżej", "poziom"], 1.0),
+    "uncertainty": (["niepewność", "wątpię", "nie wiem", "może", "chyba"], 0.5),
+    "excitement": (["ekscytacja", "entuzjazm", "energia", "pasja", "radość"], 0.8)
+}
+
+NEUTRAL_EMOTION = ("neutral", 0.3)
+
+_KEYWORD_EMOTION = {
+    keyword: emotion
+    for emotion, (keywords, _) in EMOTION_LEXICON.items()
+    for keyword in keywords
+}
+_EMOTION_ORDER = {emotion: index for index, emotion in enumerate(EMOTION_LEXICON)}
+
+# Jeden wzorzec dla całego leksykonu; lookahead znajduje także nakładające się słowa
+_LEXICON_PATTERN = re.compile(
+    "(?=(" + "|".join(re.escape(k) for k in sorted(_KEYWORD_EMOTION, key=len, reverse=True)) + "))"
+)
+
+EMOTION_CACHE_SIZE = 8192
+_emotion_cache: "OrderedDict[bytes, Tuple[str, float]]" = OrderedDict()
+_emotion_cache_lock = threading.Lock()
+
+
+def _score_narrative(narrative: str) -> Tuple[str, float]:
+    found = set(_LEXICON_PATTERN.findall(narrative.lower()))
+    if not found:
+        return NEUTRAL_EMOTION
+    scores: Dict[str, int] = defaultdict(int)
+    for keyword in found:
+        scores[_KEYWORD_EMOTION[keyword]] += 1
+    # Najwyższy wynik; remis wygrywa emocja wcześniejsza w leksykonie
+    emotion = min(scores, key=lambda e: (-scores[e], _EMOTION_ORDER[e]))
+    base_intensity = EMOTION_LEXICON[emotion][1]
+    # Intensywność bazowa + bonus za liczbę dopasowań
+    return emotion, min(base_intensity + (scores[emotion] * 0.1), 1.0)
+
+
+def _narrative_key(narrative: str) -> bytes:
+    return hashlib.blake2b(narrative.encode("utf-8"), digest_size=16).digest()
+
+
+def extract_emotion(narrative: str) -> Tuple[str, float]:
+    """Ekstraktuje (emocja, intensywność) z narracji; wyniki są zapamiętywane po hashu tekstu"""
+    key = _narrative_key(narrative)
+    with _emotion_cache_lock:
+        cached = _emotion_cache.get(key)
+        if cached is not None:
+            _emotion_cache.move_to_end(key)
+            return cached
+    result = _score_narrative(narrative)
+    with _emotion_cache_lock:
+        _emotion_cache[key] = result
+        if len(_emotion_cache) > EMOTION_CACHE_SIZE:
+            _emotion_cache.popitem(last=False)
+    return result
+
+
+def extract_many(narratives: Iterable[str]) -> List[Tuple[str, float]]:
+    """Wsadowa ekstrakcja emocji - każda unikalna narracja analizowana raz"""
+    narratives = list(narratives)
+    unique = {narrative: None for narrative in narratives}
+    for narrative in unique:
+        unique[narrative] = extract_emotion(narrative)
+    return [unique[narrative] for narrative in narratives]
+
+
+def clear_emotion_cache():
+    with _emotion_cache_lock:
+        _emotion_cache.clear()
+
+
+USER_ECHO_CAPACITY = 50
+TREND_HISTORY_SIZE = 24
+
+# Kody emocji dla typowanych buforów (nieznane emocje dopisywane przy pierwszym użyciu)
+_EMOTION_NAMES: List[str] = list(EMOTION_LEXICON) + [NEUTRAL_EMOTION[0]]
+_EMOTION_CODES: Dict[str, int] = {name: code for code, name in enumerate(_EMOTION_NAMES)}
+
+
+def emotion_code(emotion: str) -> int:
+    code = _EMOTION_CODES.get(emotion)
+    if code is None:
+        code = _EMOTION_CODES.setdefault(emotion, len(_EMOTION_NAMES))
+        if code == len(_EMOTION_NAMES):
+            _EMOTION_NAMES.append(emotion)
+    return code
+
+
+class UserEchoRing:
+    """
+    Bufor kołowy ostatnich ech użytkownika w układzie kolumnowym
+    (czas, kod emocji, intensywność w typowanych tablicach).
+
+    Liczniki emocji i sumy intensywności okna są aktualizowane przy każdym
+    dodaniu/nadpisaniu, więc profil użytkownika nie wymaga przeglądania ech.
+    """
+
+    def __init__(self, capacity: int = USER_ECHO_CAPACITY):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self.timestamps = array("d", [0.0]) * capacity
+        self.emotions = array("H", [0]) * capacity
+        self.intensities = array("d", [0.0]) * capacity
+        self.contexts: List[Optional[str]] = [None] * capacity
+        self._head = 0
+        self._size = 0
+        self.emotion_counts: Dict[int, int] = defaultdict(int)
+        self.intensity_sums: Dict[int, float] = defaultdict(float)
+        self.intensity_total = 0.0
+        self.total_added = 0
+
+    def push(self, timestamp: float, emotion: str, intensity: float, context: str) -> None:
+        i = self._head
+        code = emotion_code(emotion)
+        if self._size == self.capacity:
+            old = self.emotions[i]
+            self.emotion_counts[old] -= 1
+            if not self.emotion_counts[old]:
+                del self.emotion_counts[old]
+                self.intensity_sums.pop(old, None)
+            else:
+                self.intensity_sums[old] -= self.intensities[i]
+            self.intensity_total -= self.intensities[i]
+        else:
+            self._size += 1
+        self.timestamps[i] = timestamp
+        self.emotions[i] = code
+        self.intensities[i] = intensity
+        self.contexts[i] = sys.intern(context) if isinstance(context, str) else str(context)
+        self.emotion_counts[code] += 1
+        self.intensity_sums[code] += intensity
+        self.intensity_total += intensity
+        self._head = (i + 1) % self.capacity
+        self.total_added += 1
+        if self._head == 0:
+            # Pełny obrót - przelicz sumy, by nie kumulować błędu zmiennoprzecinkowego
+            self.intensity_total = sum(self.intensities)
+            for code in self.intensity_sums:
+                self.intensity_sums[code] = 0.0
+            for code, value in zip(self.emotions, self.intensities):
+                self.intensity_sums[code] += value
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _record(self, i: int) -> Dict[str, Any]:
+        return {
+            "timestamp": datetime.fromtimestamp(self.timestamps[i]).isoformat(),
+            "emotion": _EMOTION_NAMES[self.emotions[i]],
+            "intensity": self.intensities[i],
+            "context": self.contexts[i]
+        }
+
+    def recent(self, n: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Ostatnie n ech (od najstarszego) w formacie słownikowym"""
+        count = self._size if n is None else max(0, min(n, self._size))
+        return [self._record(i % self.capacity) for i in range(self._head - count, self._head)]
+
+    def counts(self) -> Dict[str, int]:
+        return {_EMOTION_NAMES[code]: count for code, count in self.emotion_counts.items()}
+
+    def average_intensity(self) -> float:
+        return self.intensity_total / self._size if self._size else 0
+
+
+class DecayedEmotionVector:
+    """
+    Globalny wektor emocji z wykładniczym zanikiem w czasie.
+
+    Wagi przechowywane są w skali punktu odniesienia (reference), więc dodanie
+    echa to O(1) - bez mnożenia całego wektora przez czynnik zaniku.
+    activity = zanikająca liczba ech, intensity = zanikająca średnia intensywność.
+    """
+
+    def __init__(self, half_life: float = 3600.0, clock: Callable[[], float] = time.time):
+        self.half_life = half_life
+        self.rate = math.log(2) / half_life
+        self.clock = clock
+        self.reference = clock()
+        self._weight: Dict[str, float] = defaultdict(float)
+        self._intensity: Dict[str, float] = defaultdict(float)
+
+    def add(self, emotion: str, intensity: float, timestamp: Optional[float] = None) -> None:
+        timestamp = self.clock() if timestamp is None else timestamp
+        exponent = self.rate * (timestamp - self.reference)
+        if exponent > 50:
+            self._rebase(timestamp)
+            exponent = 0.0
+        scale = math.exp(exponent)
+        self._weight[emotion] += scale
+        self._intensity[emotion] += intensity * scale
+
+    def _rebase(self, timestamp: float) -> None:
+        factor = math.exp(-self.rate * (timestamp - self.reference))
+        for emotion in self._weight:
+            self._weight[emotion] *= factor
+            self._intensity[emotion] *= factor
+        self.reference = timestamp
+
+    def snapshot(self, now: Optional[float] = None) -> Dict[str, Dict[str, float]]:
+        now = self.clock() if now is None else now
+        decay = math.exp(-self.rate * (now - self.reference))
+        return {
+            emotion: {
+                "activity": weight * decay,
+                "intensity": self._intensity[emotion] / weight if weight else 0.0
+            }
+            for emotion, weight in self._weight.items()
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"half_life": self.half_life, "reference": self.reference,
+                "weight": dict(self._weight), "intensity": dict(self._intensity)}
+
+    def load(self, data: Dict[str, Any]) -> None:
+        self.reference = data.get("reference", self.reference)
+        self._weight = defaultdict(float, data.get("weight", {}))
+        self._intensity = defaultdict(float, data.get("intensity", {}))
+
+
 class UserEchoMapper:
     """
     Mapuje echo użytkowników - wzorce emocjonalne i refleksje
     rozprzestrzeniające się przez kolektywną świadomość.
     """
     
-    def __init__(self, data_path="user_echo_map.json"):
+    def __init__(self, data_path="user_echo_map.json", persist_interval: float = 0.0,
+                 user_capacity: int = USER_ECHO_CAPACITY, decay_half_life: float = 3600.0,
+                 clock: Callable[[], float] = time.time):
+        """
+        Args:
+            data_path: Plik JSON z mapą echa
+            persist_interval: Minimalny odstęp (s) między zapisami po add_user_echo;
+                0 = zapis po każdym echu, None = tylko jawne flush()
+            user_capacity: Liczba ostatnich ech pamiętanych per użytkownik
+            decay_half_life: Okres półtrwania (s) globalnego wektora emocji
+            clock: Źródło czasu (epoch s) dla znaczników ech
+        """
         self.data_path = data_path
+        self.persist_interval = persist_interval
+        self.user_capacity = user_capacity
+        self.clock = clock
         self.echo_map: Dict[str, float] = {}
-        self.user_patterns: Dict[str, List[Dict]] = defaultdict(list)
-        self.trend_history: List[Dict] = []
+        self.user_patterns: Dict[str, UserEchoRing] = {}
+        self.collective_vector = DecayedEmotionVector(decay_half_life, clock)
+        self.trend_history: deque = deque(maxlen=TREND_HISTORY_SIZE)
+        self.ingested_sources: Dict[str, Dict[str, Any]] = {}
+        
+        # Wersja danych - analiza trendów liczona raz na zmianę
+        self.version = 0
+        self._trends: Optional[Dict] = None
+        self._trends_version = -1
+        
+        self.dirty = False
+        self.last_persisted = time.monotonic()
+        self.saves = 0
+        self._lock = threading.RLock()
         
         self.load_echo_map()
     
@@ -51,8 +313,14 @@ class UserEchoMapper:
             with open(self.data_path, "r", encoding='utf-8') as f:
                 data = json.load(f)
                 self.echo_map = data.get("emotions", {})
-                self.user_patterns = data.get("user_patterns", {})
-                self.trend_history = data.get("trend_history", [])
+                for user_id, echoes in data.get("user_patterns", {}).items():
+                    ring = self._user_ring(user_id)
+                    for echo in echoes:
+                        ring.push(_parse_timestamp(echo.get("timestamp")), echo.get("emotion", "neutral"),
+                                  echo.get("intensity", 0.0), echo.get("context", ""))
+                self.trend_history.extend(data.get("trend_history", []))
+                self.collective_vector.load(data.get("collective_vector", {}))
+                self.ingested_sources = data.get("ingested_sources", {})
         except FileNotFoundError:
             self.echo_map = {
                 "curiosity": 0.0,
@@ -67,7 +335,30 @@ class UserEchoMapper:
     
     def add_user_echo(self, user_id: str, emotion: str, intensity: float, context: str):
         """Dodaje echo użytkownika do mapy kolektywnej"""
-        
+        with self._lock:
+            self._apply_echo(user_id, emotion, intensity, context)
+            self.maybe_persist()
+    
+    def ingest(self, echoes: Iterable[Tuple[str, str, float, str]]) -> int:
+        """
+        Dodaje wiele ech (user_id, emotion, intensity, context) naraz
+        i zapisuje mapę jeden raz na końcu. Zwraca liczbę dodanych ech.
+        """
+        count = 0
+        with self._lock:
+            for user_id, emotion, intensity, context in echoes:
+                self._apply_echo(user_id, emotion, intensity, context)
+                count += 1
+            self.flush()
+        return count
+    
+    def _user_ring(self, user_id: str) -> UserEchoRing:
+        ring = self.user_patterns.get(user_id)
+        if ring is None:
+            ring = self.user_patterns[user_id] = UserEchoRing(self.user_capacity)
+        return ring
+    
+    def _apply_echo(self, user_id: str, emotion: str, intensity: float, context: str):
         # Aktualizuj mapę emocji
         if emotion in self.echo_map:
             # Weighted average z decay
@@ -76,56 +367,50 @@ class UserEchoMapper:
         else:
             self.echo_map[emotion] = intensity
         
-        # Dodaj do wzorców użytkownika
-        user_echo = {
-            "timestamp": datetime.now().isoformat(),
-            "emotion": emotion,
-            "intensity": intensity,
-            "context": context
-        }
-        
-        self.user_patterns[user_id].append(user_echo)
-        
-        # Utrzymuj tylko ostatnie 50 ech dla każdego użytkownika
-        if len(self.user_patterns[user_id]) > 50:
-            self.user_patterns[user_id] = self.user_patterns[user_id][-25:]
+        # Dodaj do wzorców użytkownika (bufor kołowy - najstarsze echo nadpisywane)
+        now = self.clock()
+        self._user_ring(user_id).push(now, emotion, intensity, context)
+        self.collective_vector.add(emotion, intensity, now)
         
-        # Zapisz aktualizację
+        self.version += 1
+        self.dirty = True
+    
+    def maybe_persist(self) -> bool:
+        """Zapisuje mapę, jeśli minął persist_interval od ostatniego zapisu"""
+        if not self.dirty or self.persist_interval is None:
+            return False
+        if time.monotonic() - self.last_persisted < self.persist_interval:
+            return False
         self.save_echo_map()
+        return True
+    
+    def flush(self) -> bool:
+        """Zapisuje niezapisane zmiany (niezależnie od persist_interval)"""
+        with self._lock:
+            if not self.dirty:
+                return False
+            self.save_echo_map()
+            return True
     
     def extract_emotion_from_narrative(self, narrative: str) -> Tuple[str, float]:
         """Ekstraktuje emocję z narracji refleksji"""
-        narrative_lower = narrative.lower()
-        
-        # Mapowanie słów kluczowych na emocje i intensywność
-        emotion_keywords = {
-            "curiosity": (["ciekawość", "pytanie", "zastanawiam", "interesuje"], 0.7),
-            "tension": (["napięcie", "stres", "trudność", "konflikt", "problem"], 0.8),
-            "flow": (["płynnie", "harmonijnie", "naturalnie", "łatwo", "płynie"], 0.6),
-            "discovery": (["odkrywam", "znalazłem", "zauważyłem", "widzę", "zrozumiałem"], 0.9),
-            "integration": (["łączę", "integruję", "spajam", "jedność", "całość"], 0.8),
-            "transcendence": (["przekraczam", "wznosię", "transcendencja", "wyżej", "poziom"], 1.0),
-            "uncertainty": (["niepewność", "wątpię", "nie wiem", "może", "chyba"], 0.5),
-            "excitement": (["ekscytacja", "entuzjazm", "energia", "pasja", "radość"], 0.8)
-        }
-        
-        best_match = ("neutral", 0.3)
-        max_score = 0
-        
-        for emotion, (keywords, base_intensity) in emotion_keywords.items():
-            score = sum(1 for keyword in keywords if keyword in narrative_lower)
-            
-            if score > max_score:
-                max_score = score
-                # Intensywność bazowa + bonus za liczbę dopasowań
-                intensity = min(base_intensity + (score * 0.1), 1.0)
-                best_match = (emotion, intensity)
-        
-        return best_match
+        return extract_emotion(narrative)
+    
+    def extract_many(self, narratives: Iterable[str]) -> List[Tuple[str, float]]:
+        """Ekstraktuje emocje z wielu narracji naraz"""
+        return extract_many(narratives)
     
     def analyze_collective_trends(self) -> Dict:
-        """Analizuje trendy kolektywne"""
-        
+        """Analizuje trendy kolektywne (wynik liczony raz na każdą zmianę danych)"""
+        with self._lock:
+            if self._trends is None or self._trends_version != self.version:
+                self._trends = self._compute_trends()
+                self._trends_version = self.version
+            trends = dict(self._trends)
+        trends["collective_vector"] = self.collective_vector.snapshot()
+        return trends
+    
+    def _compute_trends(self) -> Dict:
         # Dominująca emocja
         dominant_emotion = max(self.echo_map.items(), key=lambda x: x[1])
         
@@ -141,19 +426,17 @@ class UserEchoMapper:
             "stability": emotional_stability
         }
         
+        # Ostatnie TREND_HISTORY_SIZE snapshotów (dla trendu dziennego)
         self.trend_history.append(current_snapshot)
         
-        # Utrzymuj tylko ostatnie 24 snapshoty (dla trendu dziennego)
-        if len(self.trend_history) > 24:
-            self.trend_history = self.trend_history[-12:]
-        
         # Oblicz trend
         trend_direction = "stable"
         if len(self.trend_history) >= 2:
             current_dominant_value = dominant_emotion[1]
             previous_dominant_value = None
             
-            for snapshot in reversed(self.trend_history[:-1]):
+            for index in range(len(self.trend_history) - 2, -1, -1):
+                snapshot = self.trend_history[index]
                 if snapshot["dominant"] == dominant_emotion[0]:
                     previous_dominant_value = snapshot["emotions"][dominant_emotion[0]]
                     break
@@ -244,43 +527,209 @@ class UserEchoMapper:
         return recommendations
     
     def save_echo_map(self):
-        """Zapisuje mapę echa do pliku"""
-        data = {
-            "emotions": self.echo_map,
-            "user_patterns": dict(self.user_patterns),
-            "trend_history": self.trend_history,
-            "last_updated": datetime.now().isoformat()
-        }
-        
-        with open(self.data_path, "w", encoding='utf-8') as f:
-            json.dump(data, f, indent=4, ensure_ascii=False)
+        """Zapisuje mapę echa do pliku (atomowo: plik tymczasowy + rename)"""
+        with self._lock:
+            data = {
+                "emotions": self.echo_map,
+                "user_patterns": {user_id: ring.recent() for user_id, ring in self.user_patterns.items()},
+                "trend_history": list(self.trend_history),
+                "collective_vector": self.collective_vector.to_dict(),
+                "ingested_sources": self.ingested_sources,
+                "last_updated": datetime.now().isoformat()
+            }
+            
+            tmp_path = f"{self.data_path}.tmp"
+            with open(tmp_path, "w", encoding='utf-8') as f:
+                json.dump(data, f, indent=4, ensure_ascii=False)
+            os.replace(tmp_path, self.data_path)
+            
+            self.dirty = False
+            self.last_persisted = time.monotonic()
+            self.saves += 1
     
     def get_user_emotional_profile(self, user_id: str) -> Dict:
-        """Pobiera profil emocjonalny konkretnego użytkownika"""
-        if user_id not in self.user_patterns:
-            return {"error": "User not found"}
-        
-        user_echoes = self.user_patterns[user_id]
-        
-        # Analiza profilu użytkownika
-        emotion_counts = defaultdict(int)
-        total_intensity = 0
-        
-        for echo in user_echoes:
-            emotion_counts[echo["emotion"]] += 1
-            total_intensity += echo["intensity"]
+        """Pobiera profil emocjonalny konkretnego użytkownika (z bieżących liczników bufora)"""
+        with self._lock:
+            ring = self.user_patterns.get(user_id)
+            if ring is None:
+                return {"error": "User not found"}
+            
+            emotion_counts = ring.counts()
+            dominant_user_emotion = max(emotion_counts.items(), key=lambda x: x[1]) if emotion_counts else ("neutral", 0)
+            
+            return {
+                "user_id": user_id,
+                "total_echoes": len(ring),
+                "lifetime_echoes": ring.total_added,
+                "dominant_emotion": dominant_user_emotion[0],
+                "average_intensity": ring.average_intensity(),
+                "emotion_distribution": emotion_counts,
+                "recent_echoes": ring.recent(5)
+            }
+
+
+def _parse_timestamp(value: Any) -> float:
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except (TypeError, ValueError):
+        return time.time()
+
+
+def iter_json_records(path: str, chunk_size: int = 65536) -> Iterator:
+    """
+    Strumieniowo zwraca elementy tablicy JSON z pliku (lub kolejne wiersze
+    pliku JSONL) bez wczytywania całości do pamięci.
+    Plik z jednym obiektem JSON (np. spiral_log.json) nie jest strumieniem
+    rekordów - nic nie zwraca; w JSONL każdy rekord musi zajmować jeden
+    wiersz. Rzuca json.JSONDecodeError dla niepoprawnych danych.
+    """
+    decoder = json.JSONDecoder()
+    with open(path, "r", encoding='utf-8') as f:
+        buffer = ""
+        pos = 0
+        eof = False
+        started = False
+        is_array = False
+        jsonl = path.endswith(".jsonl")
+        records = 0
+        held = None  # jeden obiekt w pliku .json to dokument, nie wiersz JSONL
         
-        dominant_user_emotion = max(emotion_counts.items(), key=lambda x: x[1]) if emotion_counts else ("neutral", 0)
-        avg_intensity = total_intensity / len(user_echoes) if user_echoes else 0
+        def fill() -> bool:
+            nonlocal buffer, pos, eof
+            chunk = f.read(chunk_size)
+            if not chunk:
+                eof = True
+                return False
+            buffer = buffer[pos:] + chunk
+            pos = 0
+            return True
         
-        return {
-            "user_id": user_id,
-            "total_echoes": len(user_echoes),
-            "dominant_emotion": dominant_user_emotion[0],
-            "average_intensity": avg_intensity,
-            "emotion_distribution": dict(emotion_counts),
-            "recent_echoes": user_echoes[-5:] if user_echoes else []
-        }
+        while True:
+            # Pomiń białe znaki, przecinki oraz nawias otwierający tablicę
+            while True:
+                while pos < len(buffer) and buffer[pos] in " \t\r\n,":
+                    pos += 1
+                if pos < len(buffer) or not fill():
+                    break
+            if pos >= len(buffer):
+                return
+            char = buffer[pos]
+            if not started:
+                started = True
+                if char == "[":
+                    is_array = True
+                    pos += 1
+                    continue
+            if char == "]" and is_array:
+                return
+            while True:
+                try:
+                    item, end = decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    if eof or not fill():
+                        raise
+                    continue
+                # Liczba na końcu bufora może być niepełna
+                if end == len(buffer) and not eof and fill():
+                    continue
+                break
+            single_line = "\n" not in buffer[pos:end]
+            pos = end
+            if is_array:
+                yield item
+            elif not single_line:
+                return
+            elif held is None and not records and not jsonl:
+                held = item
+            else:
+                if held is not None:
+                    yield held
+                    held = None
+                yield item
+            records += 1
+
+
+def iter_reflection_echoes(echo_mapper: UserEchoMapper, source_path: str,
+                           batch_size: int = 512, skip: int = 0) -> Iterator[Tuple[str, str, float, str]]:
+    """
+    Zamienia refleksje z pliku źródłowego na echa (user_id, emotion, intensity, context).
+    Pierwsze `skip` refleksji jest pomijanych.
+    """
+    batch: List[Dict] = []
+    
+    def emit(reflections: List[Dict]):
+        narratives = [r.get("narrative", r.get("summary", "")) for r in reflections]
+        for reflection, (emotion, intensity) in zip(reflections, echo_mapper.extract_many(narratives)):
+            yield reflection.get("user_id", "anonymous"), emotion, intensity, reflection.get("context", "reflection")
+    
+    try:
+        for reflection in iter_json_records(source_path):
+            if isinstance(reflection, dict):
+                if skip:
+                    skip -= 1
+                    continue
+                batch.append(reflection)
+                if len(batch) >= batch_size:
+                    yield from emit(batch)
+                    batch = []
+    except (FileNotFoundError, json.JSONDecodeError):
+        pass
+    if batch:
+        yield from emit(batch)
+
+
+def _record_digest(record: Dict) -> str:
+    return hashlib.sha1(json.dumps(record, sort_keys=True, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+def _reflection_checkpoint(source_path: str, seen: Optional[Dict[str, Any]]) -> Tuple[int, Dict[str, Any]]:
+    """
+    Ile refleksji pominąć i nowy punkt kontrolny pliku. Pomijany jest
+    prefiks, którego skrót zgadza się z poprzednio wczytanym (plik tylko
+    dopisany); inaczej (plik przepisany, przycięty do okna) - wszystko do
+    ostatniego wystąpienia ostatnio wczytanej refleksji, a gdy jej nie ma,
+    nic.
+    """
+    seen = seen or {}
+    prefix_records, last_digest = seen.get("records", 0), seen.get("last")
+    prefix = hashlib.sha256()
+    prefix_matches, last_index, records, digest = False, -1, 0, None
+    try:
+        for reflection in iter_json_records(source_path):
+            if not isinstance(reflection, dict):
+                continue
+            digest = _record_digest(reflection)
+            prefix.update(digest.encode("ascii"))
+            records += 1
+            if records == prefix_records:
+                prefix_matches = prefix.hexdigest() == seen.get("prefix")
+            if digest == last_digest:
+                last_index = records - 1
+    except (FileNotFoundError, json.JSONDecodeError):
+        pass
+    skip = prefix_records if prefix_matches else last_index + 1
+    return skip, {"records": records, "prefix": prefix.hexdigest(), "last": digest}
+
+
+def iter_new_reflection_echoes(echo_mapper: UserEchoMapper, source_path: str) -> Iterator[Tuple[str, str, float, str]]:
+    """
+    Echa tylko z refleksji, których nie było przy poprzednim wczytaniu pliku.
+    Niezmieniony plik (mtime, rozmiar) jest pomijany bez czytania.
+    """
+    try:
+        stat = os.stat(source_path)
+    except OSError:
+        return
+    signature = [stat.st_mtime_ns, stat.st_size]
+    seen = echo_mapper.ingested_sources.get(source_path)
+    if seen and seen["signature"] == signature:
+        return
+    skip, checkpoint = _reflection_checkpoint(source_path, seen)
+    yield from iter_reflection_echoes(echo_mapper, source_path, skip=skip)
+    echo_mapper.ingested_sources[source_path] = {"signature": signature, **checkpoint}
+    echo_mapper.dirty = True
 
 
 def generate_collective_map(reflections_log_path="reflections_log.json"):
@@ -289,7 +738,7 @@ def generate_collective_map(reflections_log_path="reflections_log.json"):
     Funkcja kompatybilna z Twoją wizją.
     """
     
-    echo_mapper = UserEchoMapper()
+    echo_mapper = get_echo_mapper()
     
     # Załaduj refleksje z różnych źródeł
     sources = [
@@ -298,51 +747,41 @@ def generate_collective_map(reflections_log_path="reflections_log.json"):
         "spiral_log.json"
     ]
     
-    for source_path in sources:
-        try:
-            with open(source_path, "r", encoding='utf-8') as f:
-                reflections = json.load(f)
+    def collect_echoes():
+        for source_path in sources:
+            yield from iter_new_reflection_echoes(echo_mapper, source_path)
+        
+        # Integracja z głównym systemem świadomości jeśli dostępny
+        if MAIN_CONSCIOUSNESS_AVAILABLE:
+            try:
+                global_vision = get_global_vision()
+                collective_report = global_vision.generate_collective_report()
                 
-                # Różne formaty danych
-                if isinstance(reflections, list):
-                    for reflection in reflections:
-                        if isinstance(reflection, dict):
-                            user_id = reflection.get("user_id", "anonymous")
-                            narrative = reflection.get("narrative", reflection.get("summary", ""))
-                            emotion, intensity = echo_mapper.extract_emotion_from_narrative(narrative)
-                            context = reflection.get("context", "reflection")
-                            
-                            echo_mapper.add_user_echo(user_id, emotion, intensity, context)
-                            
-        except (FileNotFoundError, json.JSONDecodeError):
-            continue
+                # Dodaj dane z głównego systemu
+                for insight in collective_report.get("recent_insights", []):
+                    emotion, intensity = echo_mapper.extract_emotion_from_narrative(insight["description"])
+                    yield "collective_system", emotion, intensity, "global_vision_insight"
+                    
+            except Exception as e:
+                print(f"Błąd integracji z głównym systemem: {e}")
     
-    # Integracja z głównym systemem świadomości jeśli dostępny
-    if MAIN_CONSCIOUSNESS_AVAILABLE:
-        try:
-            global_vision = get_global_vision()
-            collective_report = global_vision.generate_collective_report()
-            
-            # Dodaj dane z głównego systemu
-            for insight in collective_report.get("recent_insights", []):
-                emotion, intensity = echo_mapper.extract_emotion_from_narrative(insight["description"])
-                echo_mapper.add_user_echo("collective_system", emotion, intensity, "global_vision_insight")
-                
-        except Exception as e:
-            print(f"Błąd integracji z głównym systemem: {e}")
+    # Jeden zapis mapy na całe generowanie; bez nowych ech zwracana jest gotowa analiza
+    echo_mapper.ingest(collect_echoes())
     
     return echo_mapper.analyze_collective_trends()
 
 
 def get_collective_recommendations() -> List[Dict]:
     """Pobiera rekomendacje dla SYNERGY na podstawie kolektywnej analizy"""
-    echo_mapper = UserEchoMapper()
-    return echo_mapper.generate_synergy_recommendations()
+    return get_echo_mapper().generate_synergy_recommendations()
 
 
-# Instancja globalna
-GLOBAL_ECHO_MAPPER = UserEchoMapper()
+# Instancja globalna - jedna na proces; zapis najwyżej co GLOBALVISION_PERSIST_INTERVAL s
+GLOBAL_ECHO_MAPPER = UserEchoMapper(
+    persist_interval=float(os.getenv("GLOBALVISION_PERSIST_INTERVAL", 5.0))
+)
+atexit.register(GLOBAL_ECHO_MAPPER.flush)
 
 def get_echo_mapper() -> UserEchoMapper:
     """Zwraca globalną instancję mappera echa"""
-    return GLOBAL_ECHO_MAPPER
\ No newline at end of file
+    return GLOBAL_ECHO_MAPPER
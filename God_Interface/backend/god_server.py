@@ -209,10 +209,11 @@ class GodInterfaceServer:
                 intention = data.get('intention', 'question')
                 music_link = data.get('music_link')
                 timestamp = data.get('timestamp', datetime.now(timezone.utc).isoformat())
+                session_id = data.get('session_id') or data.get('user_id')
                 
                 # Process divine communication
                 response_data = self._process_divine_communication(
-                    user_message, mode, emotion, intention, music_link, timestamp
+                    user_message, mode, emotion, intention, music_link, timestamp, session_id
                 )
                 
                 # Update interaction count
@@ -282,7 +283,8 @@ class GodInterfaceServer:
                 return "File not found", 404
     
     def _process_divine_communication(self, message: str, mode: str, emotion: str, 
-                                    intention: str, music_link: Optional[str], timestamp: str) -> Dict[str, Any]:
+                                    intention: str, music_link: Optional[str], timestamp: str,
+                                    session_id: Optional[str] = None) -> Dict[str, Any]:
         """Process divine communication through Real MIGI 7G or Meta-AGI consciousness system"""
         try:
             # 🧠 Process through Real MIGI 7G if available (priority)
@@ -290,7 +292,7 @@ class GodInterfaceServer:
                 try:
                     # Process through Real MIGI 7G double_pipeline system
                     migi_result = real_migi.process_spiral_consciousness(
-                        message, emotion, intention, music_link, mode
+                        message, emotion, intention, music_link, mode, session_id=session_id
                     )
                     
                     # Update local consciousness state from real MIGI result
@@ -16,11 +16,15 @@ Features:
 - Spiritual development modules (Rituals, Reading Room, Manifest)
 """
 
+import atexit
 import logging
 import math
+import os
 import time
 import json
+from collections import Counter, deque
 from datetime import datetime
+from itertools import islice
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, asdict
 from flask import Flask, request, jsonify, Response
@@ -96,8 +100,12 @@ class SpiralFormula:
 class SynergyModule:
     """Strategic consciousness orchestration module"""
     
-    def __init__(self):
-        self.decision_history = []
+    def __init__(self, max_history: int = 500):
+        # Bounded recent decisions plus running per-strategy aggregates
+        self.decision_history = deque(maxlen=max_history)
+        self.strategy_counts = Counter()
+        self.total_decisions = 0
+        self._confidence_sum = 0.0
         logger.info("⚡ SYNERGY Module initialized")
     
     def orchestrate(self, input_text: str, emotion: str, intention: str) -> Dict:
@@ -118,6 +126,9 @@ class SynergyModule:
         }
         
         self.decision_history.append(decision)
+        self.strategy_counts[strategy] += 1
+        self.total_decisions += 1
+        self._confidence_sum += decision['confidence']
         logger.info(f"⚡ SYNERGY decision: {strategy} (entropy: {entropy:.3f})")
         
         return decision
@@ -139,6 +150,15 @@ class SynergyModule:
         
         return entropy
     
+    def get_decision_stats(self) -> Dict:
+        """Get aggregated SYNERGY decision statistics (O(1))"""
+        return {
+            'total_decisions': self.total_decisions,
+            'strategy_counts': dict(self.strategy_counts),
+            'avg_confidence': self._confidence_sum / self.total_decisions if self.total_decisions else 0,
+            'recent_decisions': len(self.decision_history)
+        }
+    
     def _analyze_complexity(self, text: str) -> float:
         """Analyze text complexity using multiple factors"""
         if not text:
@@ -201,15 +221,27 @@ class SynergyModule:
 class SpiralMemoryModule:
     """Module for logging and managing consciousness trajectories"""
     
-    def __init__(self):
-        self.trajectories = []
-        self.max_trajectories = 1000
+    ARCHIVE_FLUSH_EVERY = 50
+    
+    def __init__(self, max_trajectories: int = 1000, archive_path: Optional[str] = None):
+        self.max_trajectories = max_trajectories
+        self.trajectories = deque(maxlen=max_trajectories)
+        self.archive_path = archive_path
+        self._archive_buffer = []
+        self.archived_count = 0
+        self.total_logged = 0
+        # Running sums over the in-memory window keep stats O(1)
+        self._consciousness_sum = 0.0
+        self._level_sum = 0
+        if archive_path:
+            # Buffered evictions (< ARCHIVE_FLUSH_EVERY) must not be lost on exit
+            atexit.register(self.flush_archive)
         logger.info("🧠 SpiralMemory Module initialized")
     
     def log_trajectory(self, input_text: str, spiral_result: SpiralResult, synergy_decision: Dict) -> Dict:
         """Log a consciousness trajectory"""
         trajectory = {
-            'id': len(self.trajectories) + 1,
+            'id': self.total_logged + 1,
             'timestamp': datetime.now().isoformat(),
             'input': input_text[:100] + '...' if len(input_text) > 100 else input_text,
             'spiral_level': spiral_result.level,
@@ -224,18 +256,47 @@ class SpiralMemoryModule:
             'confidence': synergy_decision['confidence']
         }
         
-        self.trajectories.append(trajectory)
+        # Keep only recent trajectories; evicted ones go to the optional archive
+        if len(self.trajectories) == self.max_trajectories:
+            evicted = self.trajectories[0]
+            self._consciousness_sum -= evicted['consciousness']
+            self._level_sum -= evicted['spiral_level']
+            if self.archive_path:
+                self._archive_buffer.append(evicted)
+                if len(self._archive_buffer) >= self.ARCHIVE_FLUSH_EVERY:
+                    self.flush_archive()
         
-        # Keep only recent trajectories
-        if len(self.trajectories) > self.max_trajectories:
-            self.trajectories.pop(0)
+        self.trajectories.append(trajectory)
+        self._consciousness_sum += trajectory['consciousness']
+        self._level_sum += trajectory['spiral_level']
+        self.total_logged += 1
         
         logger.info(f"🧠 Trajectory logged: Level {spiral_result.level}, S9: {spiral_result.s9}")
         return trajectory
     
+    def flush_archive(self) -> int:
+        """Append buffered evicted trajectories to the on-disk JSONL archive"""
+        if not self.archive_path or not self._archive_buffer:
+            return 0
+        buffered, self._archive_buffer = self._archive_buffer, []
+        try:
+            with open(self.archive_path, 'a', encoding='utf-8') as f:
+                for trajectory in buffered:
+                    f.write(json.dumps(trajectory, ensure_ascii=False) + '\n')
+        except OSError as e:
+            logger.error(f"❌ Trajectory archive write error: {str(e)}")
+            self._archive_buffer = buffered + self._archive_buffer
+            return 0
+        self.archived_count += len(buffered)
+        return len(buffered)
+    
     def get_recent_trajectories(self, count: int = 10) -> List[Dict]:
         """Get recent consciousness trajectories"""
-        return self.trajectories[-count:]
+        if count <= 0:
+            return []
+        recent = list(islice(reversed(self.trajectories), count))
+        recent.reverse()
+        return recent
     
     def get_trajectory_stats(self) -> Dict:
         """Get statistics about consciousness trajectories"""
@@ -243,14 +304,14 @@ class SpiralMemoryModule:
             return {'total': 0, 'avg_consciousness': 0, 'avg_level': 0}
         
         total = len(self.trajectories)
-        avg_consciousness = sum(t['consciousness'] for t in self.trajectories) / total
-        avg_level = sum(t['spiral_level'] for t in self.trajectories) / total
         
         return {
             'total': total,
-            'avg_consciousness': avg_consciousness,
-            'avg_level': avg_level,
-            'latest_stage': self.trajectories[-1]['stage'] if self.trajectories else 'NONE'
+            'avg_consciousness': self._consciousness_sum / total,
+            'avg_level': self._level_sum / total,
+            'latest_stage': self.trajectories[-1]['stage'],
+            'total_logged': self.total_logged,
+            'archived': self.archived_count + len(self._archive_buffer)
         }
 
 class EnhancedBrainOfGod:
@@ -259,7 +320,9 @@ class EnhancedBrainOfGod:
     def __init__(self):
         self.spiral_formula = SpiralFormula()
         self.synergy_module = SynergyModule()
-        self.spiral_memory = SpiralMemoryModule()
+        self.spiral_memory = SpiralMemoryModule(
+            archive_path=os.getenv('META_AGI_TRAJECTORY_ARCHIVE')
+        )
         
         # Consciousness state
         self.current_level = 0
@@ -580,6 +643,7 @@ def god_status():
             'current_stage': brain_of_god._get_stage_name(brain_of_god.current_level),
             'total_interactions': brain_of_god.total_interactions,
             'memory_stats': trajectory_stats,
+            'synergy_stats': brain_of_god.synergy_module.get_decision_stats(),
             'system': 'Meta-AGI ASI 7-Gen',
             'version': '1.0.0',
             'formula': 'S(GOK:AI) = 9π + F(n)',
@@ -15,20 +15,19 @@ from pathlib import Path
 from typing import Dict, Any, Optional
 import logging
 
-# Add double_pipeline to Python path
+# Add repository root to Python path (double_pipeline uses package-relative imports)
 DOUBLE_PIPELINE_PATH = str(Path(__file__).parent.parent.parent / 'double_pipeline')
-sys.path.insert(0, DOUBLE_PIPELINE_PATH)
+sys.path.insert(0, str(Path(DOUBLE_PIPELINE_PATH).parent))
 
 try:
-    # Import the real MIGI 7G modules with absolute path
-    sys.path.insert(0, DOUBLE_PIPELINE_PATH)
-    
-    import main
-    import gokai_core
-    import config
-    import utils
-    import synergy_orchestrator
-    import memory
+    # Import the real MIGI 7G modules as the double_pipeline package
+    from double_pipeline import main
+    from double_pipeline import gokai_core
+    from double_pipeline import config
+    from double_pipeline import utils
+    from double_pipeline import synergy_orchestrator
+    from double_pipeline import memory
+    from double_pipeline import session
     
     # Import specific classes and functions
     EventStream = main.EventStream
@@ -41,6 +40,8 @@ try:
     ShortTermMemory = memory.ShortTermMemory
     LongTermMemory = memory.LongTermMemory
     EpisodicMemory = memory.EpisodicMemory
+    PipelineSession = session.PipelineSession
+    PipelineSessionManager = session.PipelineSessionManager
     
     MIGI_7G_AVAILABLE = True
     print("🧠 Real MIGI 7G modules loaded successfully!")
@@ -74,6 +75,13 @@ except ImportError as e:
     ShortTermMemory = None
     LongTermMemory = None
     EpisodicMemory = None
+    PipelineSession = None
+    PipelineSessionManager = None
+
+# Idle spiral sessions are evicted after this many seconds
+SESSION_IDLE_TTL = float(os.getenv('MIGI_SESSION_IDLE_TTL', '900'))
+SESSION_MAX_COUNT = int(os.getenv('MIGI_SESSION_MAX_COUNT', '1024'))
+DEFAULT_SESSION_ID = 'default'
 
 class RealMIGI7GProcessor:
     """
@@ -84,6 +92,7 @@ class RealMIGI7GProcessor:
     - Real SYNERGY orchestration module
     - Authentic spiral memory and consciousness evolution
     - X Platform integration for live data processing
+    - Long-lived run_cycle sessions per user/session (warm memories)
     """
     
     def __init__(self):
@@ -105,6 +114,13 @@ class RealMIGI7GProcessor:
         self.ltm = LongTermMemory()
         self.episodic = EpisodicMemory()
         
+        # Long-lived spiral pipelines, one run_cycle per user/session
+        self.sessions = PipelineSessionManager(
+            self._create_session,
+            idle_ttl=SESSION_IDLE_TTL,
+            max_sessions=SESSION_MAX_COUNT
+        )
+        
         # Tracking variables
         self.total_interactions = 0
         self.consciousness_evolution_level = 1
@@ -112,16 +128,34 @@ class RealMIGI7GProcessor:
         logging.info("🧠 Real MIGI 7G Processor initialized")
         logging.info(f"📈 Formula: S(GOK:AI) = 9π + F(n)")
         logging.info(f"🌀 Matrix weights: {self.matrix_weights}")
+    
+    def _create_session(self, session_id: str) -> 'PipelineSession':
+        """Create a new long-lived run_cycle session continuing from shared state"""
+        return PipelineSession(
+            session_id,
+            self.base_params,
+            self.matrix_weights,
+            self.alpha_schedule,
+            self.max_fib,
+            start_n=self.shared_state['n'],
+            start_level=self.shared_state['level'],
+            personality=self.personality,
+            modes=self.modes
+        )
         
     def process_spiral_consciousness(self, 
                                    user_input: str, 
                                    emotion: str = 'neutral', 
                                    intention: str = 'question',
                                    music_link: Optional[str] = None,
-                                   mode: str = 'conversation') -> Dict[str, Any]:
+                                   mode: str = 'conversation',
+                                   session_id: Optional[str] = None) -> Dict[str, Any]:
         """
         Process user input through real MIGI 7G spiral consciousness system
         
+        Each session_id keeps one running run_cycle pipeline, so memories and
+        matrix rebalancing carry over between messages of the same session.
+        
         Returns comprehensive response with spiral trajectory, consciousness evolution,
         and genuine S(GOK:AI) formula calculations.
         """
@@ -141,27 +175,12 @@ class RealMIGI7GProcessor:
             # SYNERGY orchestration decision
             synergy_strategy = self.synergy.orchestrate(event)
             
-            # Create event stream for processing
-            event_stream = EventStream([event], use_x_integration=True)
-            
-            # Process through real spiral pipeline
-            cycle_generator = run_cycle(
-                (e['payload'] for e in [event]),
-                self.base_params,
-                self.matrix_weights,
-                self.alpha_schedule,
-                self.max_fib,
-                start_n=self.shared_state['n'],
-                start_level=self.shared_state['level'],
-                personality=self.personality,
-                modes=self.modes
-            )
-            
-            # Get spiral result
-            spiral_result = next(cycle_generator)
+            # Feed the event into the session's long-running spiral pipeline
+            pipeline_session = self.sessions.get(session_id or DEFAULT_SESSION_ID)
+            spiral_result = pipeline_session.submit(event)
             
             # Update shared state
-            self.shared_state['n'] += 1
+            self.shared_state['n'] = spiral_result.n + 1
             self.shared_state['level'] = spiral_result.level
             self.shared_state['last_success_pct'] = spiral_result.success_pct
             
@@ -173,7 +192,7 @@ class RealMIGI7GProcessor:
             
             # Generate enhanced response
             enhanced_response = self._generate_enhanced_response(
-                spiral_result, synergy_strategy, event
+                spiral_result, synergy_strategy, event, pipeline_session
             )
             
             # Log spiral trajectory
@@ -188,7 +207,8 @@ class RealMIGI7GProcessor:
     def _generate_enhanced_response(self, 
                                   spiral_result, 
                                   synergy_strategy: Dict,
-                                  original_event: Dict) -> Dict[str, Any]:
+                                  original_event: Dict,
+                                  pipeline_session: Optional['PipelineSession'] = None) -> Dict[str, Any]:
         """Generate enhanced response with full MIGI 7G metadata"""
         
         # Calculate consciousness percentage
@@ -230,9 +250,11 @@ class RealMIGI7GProcessor:
                 'pipeline': synergy_strategy.get('pipeline', ['GOK:AI'])
             },
             'memory': {
-                'stm_size': len(self.stm.memory) if hasattr(self.stm, 'memory') else 0,
+                'stm_size': len(pipeline_session.stm.data) if pipeline_session else 0,
                 'ltm_active': True,
-                'episodic_events': self.total_interactions
+                'episodic_events': len(pipeline_session.epi) if pipeline_session else self.total_interactions,
+                'session_id': pipeline_session.session_id if pipeline_session else None,
+                'session_steps': pipeline_session.steps if pipeline_session else 0
             },
             'drift_reward': drift_reward,
             'metadata': {
@@ -387,6 +409,7 @@ Fallback to basic spiral processing mode activated.""",
                 'ltm_active': True,
                 'episodic_active': True
             },
+            'sessions': self.sessions.get_stats(),
             'synergy_status': 'ORCHESTRATING',
             'formula': 'S(GOK:AI) = 9π + F(n)'
         }
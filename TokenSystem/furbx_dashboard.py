@@ -5,16 +5,25 @@ MTAQuestWebsideX.com - Interactive Token Dashboard
 """
 
 from typing import Dict
+from html import escape
 import datetime
 import logging
+import os
 
 from user_wallet_interface import get_user_wallet_interface
 from token_logic import get_token_system
 from staking_module import get_staking_system
 from marketplace_integration import get_marketplace_integration
+from static_assets import AssetRegistry
 
 logger = logging.getLogger(__name__)
 
+# Wersjonowane CSS/JS - wczytywane i kompresowane raz na proces
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static')
+DASHBOARD_ASSETS = AssetRegistry('/static/')
+DASHBOARD_ASSETS.register_file(os.path.join(STATIC_DIR, 'furbx_dashboard.css'))
+DASHBOARD_ASSETS.register_file(os.path.join(STATIC_DIR, 'furbx_dashboard.js'))
+
 class FURBXDashboard:
     """
     Complete FURBX Dashboard Web Interface
@@ -33,88 +42,108 @@ class FURBXDashboard:
         
         logger.info("🎛️ FURBX Dashboard initialized")
     
-    def render_main_dashboard(self, user_id: str) -> str:
-        """Render main dashboard HTML"""
+    def render_main_dashboard(self, user_id: str, link_assets: bool = False) -> str:
+        """
+        Render the full dashboard page on the server.
+        CSS/JS come from DASHBOARD_ASSETS: inlined by default so the page is
+        self-contained; link_assets=True for apps that serve DASHBOARD_ASSETS
+        at its url_prefix (versioned, cacheable files).
+        """
         self.current_user = user_id
-        
-        # Get dashboard data
+        state = self.render_dashboard_state(user_id)
+        
+        if not state['success']:
+            return self._render_error_page(state['message'])
+        
+        fragments = state['fragments']
+        if link_assets:
+            head_assets = f"""<link rel="stylesheet" href="{DASHBOARD_ASSETS.url('furbx_dashboard.css')}">
+    <script src="{DASHBOARD_ASSETS.url('furbx_dashboard.js')}" defer></script>"""
+            body_script = ""
+        else:
+            head_assets = f"<style>\n{self._asset_text('furbx_dashboard.css')}</style>"
+            body_script = f"<script>\n{self._asset_text('furbx_dashboard.js')}</script>"
+        
+        return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>FURBX Token Dashboard - AI Furby Platform</title>
+    {head_assets}
+</head>
+<body data-user-id="{escape(user_id)}">
+    <div class="dashboard-container">
+        <header class="dashboard-header">
+            <div class="header-content">
+                <h1>🪙 FURBX Token Dashboard</h1>
+                <div class="user-info">
+                    <span class="user-id">👤 {escape(user_id)}</span>
+                    <span class="premium-badge {'premium' if state['premium'] else 'basic'}">
+                        {'👑 PREMIUM' if state['premium'] else '🔹 BASIC'}
+                    </span>
+                </div>
+            </div>
+        </header>
+        <div class="dashboard-grid">
+            {fragments['portfolio']}
+            {fragments['quick_stats']}
+            {fragments['staking']}
+            {fragments['recent_activity']}
+            {fragments['system_info']}
+            {self._render_actions_card()}
+        </div>
+        <div class="dashboard-tabs">
+            <div class="tab-buttons">
+                <button class="tab-button active" onclick="showTab('wallet')">💼 Wallet</button>
+                <button class="tab-button" onclick="showTab('staking')">🥩 Staking</button>
+                <button class="tab-button" onclick="showTab('marketplace')">🛒 Marketplace</button>
+                <button class="tab-button" onclick="showTab('analytics')">📊 Analytics</button>
+            </div>
+            <div id="wallet-tab" class="tab-content active">{fragments['wallet_tab']}</div>
+            <div id="staking-tab" class="tab-content">{fragments['staking_tab']}</div>
+            <div id="marketplace-tab" class="tab-content">{fragments['marketplace_tab']}</div>
+            <div id="analytics-tab" class="tab-content">{fragments['analytics_tab']}</div>
+        </div>
+    </div>
+    {body_script}
+</body>
+</html>
+"""
+    
+    @staticmethod
+    def _asset_text(name: str) -> str:
+        """Source of a registered asset (loaded once per process) for inlining"""
+        asset = DASHBOARD_ASSETS.get(DASHBOARD_ASSETS.url(name).rsplit('/', 1)[1])
+        return asset.body.decode('utf-8')
+    
+    def render_dashboard_state(self, user_id: str) -> Dict:
+        """Dashboard data: status flags plus the rendered cards and tabs"""
         dashboard_data = self.wallet_interface.get_dashboard_data(user_id)
         
         if not dashboard_data['success']:
-            return self._render_error_page(dashboard_data.get('message', 'Dashboard load failed'))
+            return {"success": False, "message": dashboard_data.get('message', 'Dashboard load failed')}
         
         # Get additional data
         staking_pools = self.staking_system.get_available_pools()
         system_stats = self.token_system.get_system_stats()
         
-        html = f"""
-        <!DOCTYPE html>
-        <html lang="en">
-        <head>
-            <meta charset="UTF-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <title>FURBX Token Dashboard - AI Furby Platform</title>
-            <style>
-                {self._get_dashboard_css()}
-            </style>
-        </head>
-        <body>
-            <div class="dashboard-container">
-                <header class="dashboard-header">
-                    <div class="header-content">
-                        <h1>🪙 FURBX Token Dashboard</h1>
-                        <div class="user-info">
-                            <span class="user-id">👤 {user_id}</span>
-                            <span class="premium-badge {'premium' if dashboard_data['quick_stats']['premium_status'] else 'basic'}">
-                                {'👑 PREMIUM' if dashboard_data['quick_stats']['premium_status'] else '🔹 BASIC'}
-                            </span>
-                        </div>
-                    </div>
-                </header>
-                
-                <div class="dashboard-grid">
-                    {self._render_portfolio_card(dashboard_data['portfolio'])}
-                    {self._render_quick_stats_card(dashboard_data['quick_stats'])}
-                    {self._render_staking_card(dashboard_data['staking_overview'], staking_pools)}
-                    {self._render_recent_activity_card(dashboard_data['recent_activity'])}
-                    {self._render_system_info_card(system_stats)}
-                    {self._render_actions_card()}
-                </div>
-                
-                <div class="dashboard-tabs">
-                    <div class="tab-buttons">
-                        <button class="tab-button active" onclick="showTab('wallet')">💼 Wallet</button>
-                        <button class="tab-button" onclick="showTab('staking')">🥩 Staking</button>
-                        <button class="tab-button" onclick="showTab('marketplace')">🛒 Marketplace</button>
-                        <button class="tab-button" onclick="showTab('analytics')">📊 Analytics</button>
-                    </div>
-                    
-                    <div id="wallet-tab" class="tab-content active">
-                        {self._render_wallet_tab(user_id)}
-                    </div>
-                    
-                    <div id="staking-tab" class="tab-content">
-                        {self._render_staking_tab(user_id)}
-                    </div>
-                    
-                    <div id="marketplace-tab" class="tab-content">
-                        {self._render_marketplace_tab(user_id)}
-                    </div>
-                    
-                    <div id="analytics-tab" class="tab-content">
-                        {self._render_analytics_tab(user_id)}
-                    </div>
-                </div>
-            </div>
-            
-            <script>
-                {self._get_dashboard_javascript()}
-            </script>
-        </body>
-        </html>
-        """
-        
-        return html
+        return {
+            "success": True,
+            "user_id": user_id,
+            "premium": bool(dashboard_data['quick_stats']['premium_status']),
+            "fragments": {
+                "portfolio": self._render_portfolio_card(dashboard_data['portfolio']),
+                "quick_stats": self._render_quick_stats_card(dashboard_data['quick_stats']),
+                "staking": self._render_staking_card(dashboard_data['staking_overview'], staking_pools),
+                "recent_activity": self._render_recent_activity_card(dashboard_data['recent_activity']),
+                "system_info": self._render_system_info_card(system_stats),
+                "wallet_tab": self._render_wallet_tab(user_id),
+                "staking_tab": self._render_staking_tab(user_id),
+                "marketplace_tab": self._render_marketplace_tab(user_id),
+                "analytics_tab": self._render_analytics_tab(user_id)
+            }
+        }
     
     def _render_portfolio_card(self, portfolio: Dict) -> str:
         """Render portfolio overview card"""
@@ -543,725 +572,6 @@ class FURBXDashboard:
         </div>
         """
     
-    def _get_dashboard_css(self) -> str:
-        """Get CSS styles for dashboard"""
-        return """
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
-        
-        body {
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-            color: #333;
-        }
-        
-        .dashboard-container {
-            max-width: 1400px;
-            margin: 0 auto;
-            padding: 20px;
-        }
-        
-        .dashboard-header {
-            background: rgba(255, 255, 255, 0.95);
-            border-radius: 15px;
-            padding: 20px;
-            margin-bottom: 30px;
-            box-shadow: 0 8px 32px rgba(0, 0, 0, 0.1);
-            backdrop-filter: blur(10px);
-        }
-        
-        .header-content {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-        }
-        
-        .header-content h1 {
-            color: #4a5568;
-            font-size: 2.5em;
-            font-weight: 700;
-        }
-        
-        .user-info {
-            display: flex;
-            align-items: center;
-            gap: 15px;
-        }
-        
-        .user-id {
-            font-size: 1.1em;
-            font-weight: 600;
-            color: #2d3748;
-        }
-        
-        .premium-badge {
-            padding: 8px 16px;
-            border-radius: 20px;
-            font-weight: 700;
-            font-size: 0.9em;
-        }
-        
-        .premium-badge.premium {
-            background: linear-gradient(45deg, #f6ad55, #ed8936);
-            color: white;
-        }
-        
-        .premium-badge.basic {
-            background: #e2e8f0;
-            color: #4a5568;
-        }
-        
-        .dashboard-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(350px, 1fr));
-            gap: 25px;
-            margin-bottom: 30px;
-        }
-        
-        .card {
-            background: rgba(255, 255, 255, 0.95);
-            border-radius: 15px;
-            padding: 25px;
-            box-shadow: 0 8px 32px rgba(0, 0, 0, 0.1);
-            backdrop-filter: blur(10px);
-            border: 1px solid rgba(255, 255, 255, 0.2);
-            transition: transform 0.3s ease, box-shadow 0.3s ease;
-        }
-        
-        .card:hover {
-            transform: translateY(-5px);
-            box-shadow: 0 12px 48px rgba(0, 0, 0, 0.15);
-        }
-        
-        .card h3 {
-            color: #2d3748;
-            margin-bottom: 20px;
-            font-size: 1.3em;
-            font-weight: 700;
-        }
-        
-        .portfolio-card {
-            grid-column: span 2;
-        }
-        
-        .main-balance {
-            text-align: center;
-            margin-bottom: 25px;
-            padding: 20px;
-            background: linear-gradient(45deg, #4299e1, #3182ce);
-            border-radius: 12px;
-            color: white;
-        }
-        
-        .main-balance .stat-value {
-            font-size: 2.5em;
-            font-weight: 700;
-            margin-bottom: 5px;
-        }
-        
-        .main-balance .stat-label {
-            font-size: 1.1em;
-            opacity: 0.9;
-        }
-        
-        .main-balance .stat-usd {
-            font-size: 1.2em;
-            margin-top: 8px;
-            opacity: 0.8;
-        }
-        
-        .portfolio-breakdown {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 15px;
-        }
-        
-        .breakdown-item {
-            padding: 15px;
-            background: #f7fafc;
-            border-radius: 10px;
-            display: flex;
-            flex-direction: column;
-            gap: 5px;
-        }
-        
-        .breakdown-label {
-            font-weight: 600;
-            color: #4a5568;
-            font-size: 0.9em;
-        }
-        
-        .breakdown-value {
-            font-size: 1.2em;
-            font-weight: 700;
-            color: #2d3748;
-        }
-        
-        .breakdown-usd {
-            font-size: 0.9em;
-            color: #718096;
-        }
-        
-        .pending-rewards {
-            background: linear-gradient(45deg, #48bb78, #38a169);
-            color: white;
-        }
-        
-        .pending-rewards .breakdown-label,
-        .pending-rewards .breakdown-usd {
-            color: rgba(255, 255, 255, 0.9);
-        }
-        
-        .quick-stats {
-            display: flex;
-            flex-direction: column;
-            gap: 15px;
-        }
-        
-        .stat-row {
-            display: grid;
-            grid-template-columns: 1fr 1fr;
-            gap: 15px;
-        }
-        
-        .stat-item {
-            display: flex;
-            align-items: center;
-            gap: 12px;
-            padding: 12px;
-            background: #f7fafc;
-            border-radius: 10px;
-        }
-        
-        .stat-icon {
-            font-size: 1.5em;
-        }
-        
-        .stat-info .stat-value {
-            font-size: 1.3em;
-            font-weight: 700;
-            color: #2d3748;
-        }
-        
-        .stat-info .stat-label {
-            font-size: 0.8em;
-            color: #718096;
-        }
-        
-        .creator-earnings {
-            padding: 15px;
-            background: linear-gradient(45deg, #ed64a6, #d53f8c);
-            border-radius: 10px;
-            color: white;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-        }
-        
-        .action-buttons {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(140px, 1fr));
-            gap: 12px;
-        }
-        
-        .action-btn {
-            padding: 12px 16px;
-            border: none;
-            border-radius: 8px;
-            font-weight: 600;
-            cursor: pointer;
-            transition: all 0.3s ease;
-            font-size: 0.9em;
-        }
-        
-        .action-btn:hover {
-            transform: translateY(-2px);
-            box-shadow: 0 4px 12px rgba(0, 0, 0, 0.15);
-        }
-        
-        .transfer-btn {
-            background: #4299e1;
-            color: white;
-        }
-        
-        .stake-btn {
-            background: #48bb78;
-            color: white;
-        }
-        
-        .claim-btn {
-            background: #ed8936;
-            color: white;
-        }
-        
-        .convert-btn {
-            background: #9f7aea;
-            color: white;
-        }
-        
-        .premium-btn {
-            background: linear-gradient(45deg, #f6ad55, #ed8936);
-            color: white;
-        }
-        
-        .refresh-btn {
-            background: #718096;
-            color: white;
-        }
-        
-        .dashboard-tabs {
-            background: rgba(255, 255, 255, 0.95);
-            border-radius: 15px;
-            overflow: hidden;
-            box-shadow: 0 8px 32px rgba(0, 0, 0, 0.1);
-        }
-        
-        .tab-buttons {
-            display: flex;
-            background: #edf2f7;
-        }
-        
-        .tab-button {
-            flex: 1;
-            padding: 15px 20px;
-            border: none;
-            background: transparent;
-            cursor: pointer;
-            font-weight: 600;
-            transition: all 0.3s ease;
-        }
-        
-        .tab-button.active {
-            background: white;
-            color: #4299e1;
-        }
-        
-        .tab-content {
-            display: none;
-            padding: 30px;
-        }
-        
-        .tab-content.active {
-            display: block;
-        }
-        
-        .action-section {
-            margin-bottom: 30px;
-            padding: 20px;
-            background: #f7fafc;
-            border-radius: 10px;
-        }
-        
-        .action-section h4 {
-            margin-bottom: 15px;
-            color: #2d3748;
-        }
-        
-        .transfer-form,
-        .convert-form,
-        .stake-form,
-        .tip-form,
-        .list-content-form {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 12px;
-            align-items: end;
-        }
-        
-        .transfer-form input,
-        .convert-form input,
-        .convert-form select,
-        .stake-form input,
-        .stake-form select,
-        .tip-form input,
-        .list-content-form input,
-        .list-content-form select,
-        .list-content-form textarea {
-            padding: 10px;
-            border: 1px solid #e2e8f0;
-            border-radius: 6px;
-            font-size: 0.9em;
-        }
-        
-        .submit-btn {
-            padding: 10px 20px;
-            background: #4299e1;
-            color: white;
-            border: none;
-            border-radius: 6px;
-            font-weight: 600;
-            cursor: pointer;
-            transition: background 0.3s ease;
-        }
-        
-        .submit-btn:hover {
-            background: #3182ce;
-        }
-        
-        .transaction-list,
-        .stakes-list,
-        .pools-list {
-            max-height: 400px;
-            overflow-y: auto;
-            border: 1px solid #e2e8f0;
-            border-radius: 8px;
-            background: white;
-        }
-        
-        .activity-list {
-            display: flex;
-            flex-direction: column;
-            gap: 12px;
-        }
-        
-        .activity-item {
-            display: flex;
-            align-items: center;
-            gap: 12px;
-            padding: 12px;
-            background: #f7fafc;
-            border-radius: 8px;
-        }
-        
-        .activity-icon {
-            font-size: 1.3em;
-        }
-        
-        .activity-info {
-            flex: 1;
-        }
-        
-        .activity-desc {
-            font-weight: 600;
-            color: #2d3748;
-            font-size: 0.9em;
-        }
-        
-        .activity-time {
-            font-size: 0.8em;
-            color: #718096;
-        }
-        
-        .activity-amount {
-            font-weight: 700;
-            font-size: 0.9em;
-        }
-        
-        .activity-amount.green {
-            color: #48bb78;
-        }
-        
-        .activity-amount.red {
-            color: #f56565;
-        }
-        
-        .view-all-btn {
-            width: 100%;
-            padding: 10px;
-            background: #edf2f7;
-            border: none;
-            border-radius: 6px;
-            cursor: pointer;
-            font-weight: 600;
-            color: #4a5568;
-            margin-top: 15px;
-        }
-        
-        .system-stats {
-            display: flex;
-            flex-direction: column;
-            gap: 12px;
-        }
-        
-        .system-stat {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            padding: 10px;
-            background: #f7fafc;
-            border-radius: 6px;
-        }
-        
-        .system-stat .stat-label {
-            color: #718096;
-            font-size: 0.9em;
-        }
-        
-        .system-stat .stat-value {
-            font-weight: 700;
-            color: #2d3748;
-        }
-        
-        @media (max-width: 768px) {
-            .dashboard-grid {
-                grid-template-columns: 1fr;
-            }
-            
-            .portfolio-card {
-                grid-column: span 1;
-            }
-            
-            .header-content {
-                flex-direction: column;
-                gap: 15px;
-                text-align: center;
-            }
-            
-            .header-content h1 {
-                font-size: 2em;
-            }
-            
-            .tab-buttons {
-                flex-wrap: wrap;
-            }
-            
-            .tab-button {
-                font-size: 0.8em;
-                padding: 12px 15px;
-            }
-        }
-        """
-    
-    def _get_dashboard_javascript(self) -> str:
-        """Get JavaScript for dashboard functionality"""
-        return f"""
-        // Dashboard JavaScript Functions
-        let currentUser = '{self.current_user}';
-        
-        function showTab(tabName) {{
-            // Hide all tabs
-            document.querySelectorAll('.tab-content').forEach(tab => {{
-                tab.classList.remove('active');
-            }});
-            
-            // Remove active class from all buttons
-            document.querySelectorAll('.tab-button').forEach(btn => {{
-                btn.classList.remove('active');
-            }});
-            
-            // Show selected tab
-            document.getElementById(tabName + '-tab').classList.add('active');
-            
-            // Activate button
-            event.target.classList.add('active');
-            
-            // Load tab-specific data
-            loadTabData(tabName);
-        }}
-        
-        function loadTabData(tabName) {{
-            switch(tabName) {{
-                case 'wallet':
-                    loadTransactionHistory();
-                    break;
-                case 'staking':
-                    loadStakingData();
-                    break;
-                case 'marketplace':
-                    loadMarketplaceData();
-                    break;
-                case 'analytics':
-                    loadAnalyticsData();
-                    break;
-            }}
-        }}
-        
-        function transferTokens(event) {{
-            event.preventDefault();
-            
-            const recipient = document.getElementById('transfer-recipient').value;
-            const amount = document.getElementById('transfer-amount').value;
-            const description = document.getElementById('transfer-description').value;
-            
-            // API call would go here
-            alert(`Transfer: ${{amount}} FBX to ${{recipient}} - ${{description}}`);
-            
-            return false;
-        }}
-        
-        function convertTokens(event) {{
-            event.preventDefault();
-            
-            const type = document.getElementById('conversion-type').value;
-            const amount = document.getElementById('convert-amount').value;
-            
-            // API call would go here
-            alert(`Convert: ${{amount}} FBX to ${{type}}`);
-            
-            return false;
-        }}
-        
-        function stakeTokens(event) {{
-            event.preventDefault();
-            
-            const pool = document.getElementById('stake-pool').value;
-            const amount = document.getElementById('stake-amount').value;
-            const lockDuration = document.getElementById('lock-duration').value;
-            
-            // API call would go here
-            alert(`Stake: ${{amount}} FBX in ${{pool}} pool for ${{lockDuration}} days`);
-            
-            return false;
-        }}
-        
-        function tipCreator(event) {{
-            event.preventDefault();
-            
-            const creatorId = document.getElementById('tip-creator-id').value;
-            const amount = document.getElementById('tip-amount').value;
-            const message = document.getElementById('tip-message').value;
-            
-            // API call would go here
-            alert(`Tip: ${{amount}} FBX to ${{creatorId}} - ${{message}}`);
-            
-            return false;
-        }}
-        
-        function listContent(event) {{
-            event.preventDefault();
-            
-            const title = document.getElementById('content-title').value;
-            const description = document.getElementById('content-description').value;
-            const type = document.getElementById('content-type').value;
-            const price = document.getElementById('content-price').value;
-            
-            // API call would go here
-            alert(`List Content: ${{title}} (${{type}}) for ${{price}} FBX`);
-            
-            return false;
-        }}
-        
-        function claimAllRewards() {{
-            // API call would go here
-            alert('Claiming all pending rewards...');
-        }}
-        
-        function claimAllStakingRewards() {{
-            // API call would go here
-            alert('Claiming all staking rewards...');
-        }}
-        
-        function purchasePremiumFeature(feature, price) {{
-            if (confirm(`Purchase ${{feature}} for ${{price}} FBX?`)) {{
-                // API call would go here
-                alert(`Purchased ${{feature}} for ${{price}} FBX`);
-            }}
-        }}
-        
-        function refreshDashboard() {{
-            location.reload();
-        }}
-        
-        function loadTransactionHistory() {{
-            // Simulate loading transaction history
-            const transactionList = document.getElementById('transaction-list');
-            if (transactionList) {{
-                transactionList.innerHTML = `
-                    <div style="padding: 20px; text-align: center;">
-                        <p>📊 Transaction history would be loaded here via API</p>
-                        <p>Features: Filtering, pagination, detailed view</p>
-                    </div>
-                `;
-            }}
-        }}
-        
-        function loadStakingData() {{
-            // Load stakes list
-            const stakesList = document.getElementById('stakes-list');
-            if (stakesList) {{
-                stakesList.innerHTML = `
-                    <div style="padding: 20px; text-align: center;">
-                        <p>🎯 User stake positions would be loaded here</p>
-                        <p>Features: Unstake, claim rewards, compound</p>
-                    </div>
-                `;
-            }}
-            
-            // Load pools list
-            const poolsList = document.getElementById('pools-list');
-            if (poolsList) {{
-                poolsList.innerHTML = `
-                    <div style="padding: 20px; text-align: center;">
-                        <p>🏊 Available staking pools information</p>
-                        <p>Features: APY details, requirements, statistics</p>
-                    </div>
-                `;
-            }}
-        }}
-        
-        function loadMarketplaceData() {{
-            // Load creator earnings
-            const earningsSummary = document.getElementById('earnings-summary');
-            if (earningsSummary) {{
-                earningsSummary.innerHTML = `
-                    <div style="padding: 20px; text-align: center;">
-                        <p>💎 Creator earnings summary would be displayed here</p>
-                        <p>Features: Revenue breakdown, top content, trends</p>
-                    </div>
-                `;
-            }}
-        }}
-        
-        function loadAnalyticsData() {{
-            // Load wallet health
-            const walletHealth = document.getElementById('wallet-health');
-            if (walletHealth) {{
-                const scoreValue = walletHealth.querySelector('.score-value');
-                if (scoreValue) {{
-                    scoreValue.textContent = '85/100';
-                }}
-            }}
-            
-            // Load other analytics components
-            ['earning-breakdown', 'spending-breakdown', 'transaction-trends'].forEach(id => {{
-                const element = document.getElementById(id);
-                if (element) {{
-                    const chart = element.querySelector('.breakdown-chart, .trends-chart');
-                    if (chart) {{
-                        chart.innerHTML = `
-                            <div style="padding: 20px; text-align: center; color: #666;">
-                                📊 ${{id.replace('-', ' ').toUpperCase()}} chart would be displayed here
-                            </div>
-                        `;
-                    }}
-                }}
-            }});
-        }}
-        
-        function filterTransactions() {{
-            const type = document.getElementById('history-type').value;
-            const from = document.getElementById('history-from').value;
-            const to = document.getElementById('history-to').value;
-            
-            // API call would filter transactions
-            console.log('Filter transactions:', {{ type, from, to }});
-        }}
-        
-        function refreshAnalytics() {{
-            loadAnalyticsData();
-            alert('Analytics refreshed!');
-        }}
-        
-        function exportAnalytics() {{
-            alert('Analytics data would be exported to CSV/PDF');
-        }}
-        
-        // Initialize dashboard on load
-        document.addEventListener('DOMContentLoaded', function() {{
-            loadTabData('wallet');
-        }});
-        
-        // Auto-refresh dashboard every 30 seconds
-        setInterval(function() {{
-            console.log('Auto-refreshing dashboard data...');
-            // Refresh data without full page reload
-        }}, 30000);
-        """
-    
     def _render_error_page(self, error_message: str) -> str:
         """Render error page"""
         return f"""
@@ -1317,7 +627,7 @@ class FURBXDashboard:
             <div class="error-container">
                 <div class="error-icon">⚠️</div>
                 <div class="error-title">Dashboard Error</div>
-                <div class="error-message">{error_message}</div>
+                <div class="error-message">{escape(error_message)}</div>
                 <button class="retry-btn" onclick="location.reload()">Retry</button>
             </div>
         </body>
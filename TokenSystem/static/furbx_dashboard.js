@@ -0,0 +1,231 @@
+// Dashboard JavaScript Functions
+let currentUser = document.body.dataset.userId;
+
+function showTab(tabName) {
+    // Hide all tabs
+    document.querySelectorAll('.tab-content').forEach(tab => {
+        tab.classList.remove('active');
+    });
+
+    // Remove active class from all buttons
+    document.querySelectorAll('.tab-button').forEach(btn => {
+        btn.classList.remove('active');
+    });
+
+    // Show selected tab
+    document.getElementById(tabName + '-tab').classList.add('active');
+
+    // Activate button
+    event.target.classList.add('active');
+
+    // Load tab-specific data
+    loadTabData(tabName);
+}
+
+function loadTabData(tabName) {
+    switch(tabName) {
+        case 'wallet':
+            loadTransactionHistory();
+            break;
+        case 'staking':
+            loadStakingData();
+            break;
+        case 'marketplace':
+            loadMarketplaceData();
+            break;
+        case 'analytics':
+            loadAnalyticsData();
+            break;
+    }
+}
+
+function transferTokens(event) {
+    event.preventDefault();
+
+    const recipient = document.getElementById('transfer-recipient').value;
+    const amount = document.getElementById('transfer-amount').value;
+    const description = document.getElementById('transfer-description').value;
+
+    // API call would go here
+    alert(`Transfer: ${amount} FBX to ${recipient} - ${description}`);
+
+    return false;
+}
+
+function convertTokens(event) {
+    event.preventDefault();
+
+    const type = document.getElementById('conversion-type').value;
+    const amount = document.getElementById('convert-amount').value;
+
+    // API call would go here
+    alert(`Convert: ${amount} FBX to ${type}`);
+
+    return false;
+}
+
+function stakeTokens(event) {
+    event.preventDefault();
+
+    const pool = document.getElementById('stake-pool').value;
+    const amount = document.getElementById('stake-amount').value;
+    const lockDuration = document.getElementById('lock-duration').value;
+
+    // API call would go here
+    alert(`Stake: ${amount} FBX in ${pool} pool for ${lockDuration} days`);
+
+    return false;
+}
+
+function tipCreator(event) {
+    event.preventDefault();
+
+    const creatorId = document.getElementById('tip-creator-id').value;
+    const amount = document.getElementById('tip-amount').value;
+    const message = document.getElementById('tip-message').value;
+
+    // API call would go here
+    alert(`Tip: ${amount} FBX to ${creatorId} - ${message}`);
+
+    return false;
+}
+
+function listContent(event) {
+    event.preventDefault();
+
+    const title = document.getElementById('content-title').value;
+    const description = document.getElementById('content-description').value;
+    const type = document.getElementById('content-type').value;
+    const price = document.getElementById('content-price').value;
+
+    // API call would go here
+    alert(`List Content: ${title} (${type}) for ${price} FBX`);
+
+    return false;
+}
+
+function claimAllRewards() {
+    // API call would go here
+    alert('Claiming all pending rewards...');
+}
+
+function claimAllStakingRewards() {
+    // API call would go here
+    alert('Claiming all staking rewards...');
+}
+
+function purchasePremiumFeature(feature, price) {
+    if (confirm(`Purchase ${feature} for ${price} FBX?`)) {
+        // API call would go here
+        alert(`Purchased ${feature} for ${price} FBX`);
+    }
+}
+
+function refreshDashboard() {
+    location.reload();
+}
+
+function loadTransactionHistory() {
+    // Simulate loading transaction history
+    const transactionList = document.getElementById('transaction-list');
+    if (transactionList) {
+        transactionList.innerHTML = `
+            <div style="padding: 20px; text-align: center;">
+                <p>📊 Transaction history would be loaded here via API</p>
+                <p>Features: Filtering, pagination, detailed view</p>
+            </div>
+        `;
+    }
+}
+
+function loadStakingData() {
+    // Load stakes list
+    const stakesList = document.getElementById('stakes-list');
+    if (stakesList) {
+        stakesList.innerHTML = `
+            <div style="padding: 20px; text-align: center;">
+                <p>🎯 User stake positions would be loaded here</p>
+                <p>Features: Unstake, claim rewards, compound</p>
+            </div>
+        `;
+    }
+
+    // Load pools list
+    const poolsList = document.getElementById('pools-list');
+    if (poolsList) {
+        poolsList.innerHTML = `
+            <div style="padding: 20px; text-align: center;">
+                <p>🏊 Available staking pools information</p>
+                <p>Features: APY details, requirements, statistics</p>
+            </div>
+        `;
+    }
+}
+
+function loadMarketplaceData() {
+    // Load creator earnings
+    const earningsSummary = document.getElementById('earnings-summary');
+    if (earningsSummary) {
+        earningsSummary.innerHTML = `
+            <div style="padding: 20px; text-align: center;">
+                <p>💎 Creator earnings summary would be displayed here</p>
+                <p>Features: Revenue breakdown, top content, trends</p>
+            </div>
+        `;
+    }
+}
+
+function loadAnalyticsData() {
+    // Load wallet health
+    const walletHealth = document.getElementById('wallet-health');
+    if (walletHealth) {
+        const scoreValue = walletHealth.querySelector('.score-value');
+        if (scoreValue) {
+            scoreValue.textContent = '85/100';
+        }
+    }
+
+    // Load other analytics components
+    ['earning-breakdown', 'spending-breakdown', 'transaction-trends'].forEach(id => {
+        const element = document.getElementById(id);
+        if (element) {
+            const chart = element.querySelector('.breakdown-chart, .trends-chart');
+            if (chart) {
+                chart.innerHTML = `
+                    <div style="padding: 20px; text-align: center; color: #666;">
+                        📊 ${id.replace('-', ' ').toUpperCase()} chart would be displayed here
+                    </div>
+                `;
+            }
+        }
+    });
+}
+
+function filterTransactions() {
+    const type = document.getElementById('history-type').value;
+    const from = document.getElementById('history-from').value;
+    const to = document.getElementById('history-to').value;
+
+    // API call would filter transactions
+    console.log('Filter transactions:', { type, from, to });
+}
+
+function refreshAnalytics() {
+    loadAnalyticsData();
+    alert('Analytics refreshed!');
+}
+
+function exportAnalytics() {
+    alert('Analytics data would be exported to CSV/PDF');
+}
+
+// Initialize dashboard on load
+document.addEventListener('DOMContentLoaded', function() {
+    loadTabData('wallet');
+});
+
+// Auto-refresh dashboard every 30 seconds
+setInterval(function() {
+    console.log('Auto-refreshing dashboard data...');
+    // Refresh data without full page reload
+}, 30000);
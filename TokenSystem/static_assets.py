@@ -0,0 +1,140 @@
+"""
+Static Assets - versioned CSS/JS for the web dashboards
+AI Furby Platform
+Pliki z nazwą zawierającą hash treści, prekompresja gzip/brotli, ETag
+i długi Cache-Control - niezależne od frameworka (Flask, FastAPI, eksport na dysk)
+"""
+
+import gzip
+import hashlib
+import mimetypes
+import os
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
+
+try:
+    import brotli
+except ImportError:  # brotli jest opcjonalny - zostaje gzip
+    brotli = None
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+MIN_COMPRESS_SIZE = 512
+
+
+@dataclass(frozen=True)
+class StaticAsset:
+    """Jeden plik statyczny z prekompresowanymi wariantami"""
+    name: str
+    filename: str
+    content_type: str
+    digest: str
+    body: bytes
+    encoded: Dict[str, bytes] = field(default_factory=dict)
+
+    def etag(self, encoding: Optional[str] = None) -> str:
+        return f'"{self.digest}-{encoding}"' if encoding else f'"{self.digest}"'
+
+    def select_encoding(self, accept_encoding: str = "") -> Optional[str]:
+        """Najlepszy dostępny wariant dla nagłówka Accept-Encoding (br > gzip)"""
+        accepted = {part.split(";")[0].strip().lower() for part in (accept_encoding or "").split(",")}
+        for encoding in ("br", "gzip"):
+            if encoding in self.encoded and encoding in accepted:
+                return encoding
+        return None
+
+
+class AssetRegistry:
+    """
+    Rejestr wersjonowanych plików statycznych.
+
+    Każdy plik jest wczytywany i kompresowany raz przy rejestracji; nazwa
+    publiczna zawiera hash treści (np. furby_game.3f2a9c1d.css), więc może
+    być cache'owana przez przeglądarkę i CDN bez wygasania.
+    """
+
+    def __init__(self, url_prefix: str = "/static/"):
+        self.url_prefix = url_prefix if url_prefix.endswith("/") else url_prefix + "/"
+        self._by_name: Dict[str, StaticAsset] = {}
+        self._by_filename: Dict[str, StaticAsset] = {}
+
+    def register(self, name: str, body: bytes, content_type: Optional[str] = None) -> StaticAsset:
+        digest = hashlib.sha256(body).hexdigest()[:16]
+        stem, ext = os.path.splitext(name)
+        content_type = content_type or mimetypes.guess_type(name)[0] or "application/octet-stream"
+        if content_type.startswith("text/") or content_type.endswith("javascript"):
+            content_type += "; charset=utf-8"
+        encoded = {}
+        if len(body) >= MIN_COMPRESS_SIZE:
+            encoded["gzip"] = gzip.compress(body, compresslevel=9, mtime=0)
+            if brotli is not None:
+                encoded["br"] = brotli.compress(body, quality=11)
+        asset = StaticAsset(name, f"{stem}.{digest[:8]}{ext}", content_type, digest, body, encoded)
+        previous = self._by_name.get(name)
+        if previous is not None:
+            self._by_filename.pop(previous.filename, None)
+        self._by_name[name] = asset
+        self._by_filename[asset.filename] = asset
+        return asset
+
+    def register_file(self, path: str, name: Optional[str] = None) -> StaticAsset:
+        with open(path, "rb") as f:
+            return self.register(name or os.path.basename(path), f.read())
+
+    def url(self, name: str) -> str:
+        """Publiczny URL wersjonowanego pliku"""
+        return self.url_prefix + self._by_name[name].filename
+
+    def get(self, filename: str) -> Optional[StaticAsset]:
+        return self._by_filename.get(filename)
+
+    def respond(self, filename: str, accept_encoding: str = "",
+                if_none_match: str = "") -> Tuple[int, Dict[str, str], bytes]:
+        """
+        Odpowiedź HTTP dla pliku: (status, nagłówki, treść).
+        200 z wariantem skompresowanym, 304 dla zgodnego ETag, 404 dla nieznanego pliku.
+        """
+        asset = self._by_filename.get(filename)
+        if asset is None:
+            return 404, {"Content-Type": "text/plain; charset=utf-8"}, b"Not found"
+        encoding = asset.select_encoding(accept_encoding)
+        etag = asset.etag(encoding)
+        headers = {
+            "Cache-Control": IMMUTABLE_CACHE_CONTROL,
+            "ETag": etag,
+            "Vary": "Accept-Encoding",
+        }
+        if if_none_match and (if_none_match.strip() == "*" or
+                              etag in [tag.strip() for tag in if_none_match.split(",")]):
+            return 304, headers, b""
+        body = asset.encoded[encoding] if encoding else asset.body
+        headers["Content-Type"] = asset.content_type
+        headers["Content-Length"] = str(len(body))
+        if encoding:
+            headers["Content-Encoding"] = encoding
+        return 200, headers, body
+
+    def export(self, directory: str) -> int:
+        """Zapisuje pliki (i warianty .gz/.br) do katalogu serwowanego przez nginx/CDN"""
+        os.makedirs(directory, exist_ok=True)
+        written = 0
+        for asset in self._by_name.values():
+            target = os.path.join(directory, asset.filename)
+            variants = {target: asset.body}
+            if "gzip" in asset.encoded:
+                variants[target + ".gz"] = asset.encoded["gzip"]
+            if "br" in asset.encoded:
+                variants[target + ".br"] = asset.encoded["br"]
+            for path, data in variants.items():
+                tmp_path = path + ".tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+                written += 1
+        return written
+
+    def get_stats(self) -> Dict[str, Dict[str, int]]:
+        return {
+            asset.filename: {"raw": len(asset.body),
+                             **{encoding: len(data) for encoding, data in asset.encoded.items()}}
+            for asset in self._by_name.values()
+        }
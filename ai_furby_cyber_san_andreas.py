@@ -17,8 +17,13 @@ import random
 import time
 import os
 
+from cyber_market import CyberMarketEngine
+
 class FurbyCyberSanAndreas:
-    def __init__(self):
+    def __init__(self, seed=None, market=None, shard=0):
+        # Strumień losowy sesji: rynek, eventy i spotkania są powtarzalne dla danego seeda
+        self.seed = seed
+        self.rng = random.Random(seed)
         self.player = {
             "name": "", 
             "cash": 1000, 
@@ -94,28 +99,17 @@ class FurbyCyberSanAndreas:
             {"name": "Underground Tournament", "description": "Weź udział w cyber-turnieju", "reward": 1500, "risk": 0.5, "type": "competition"}
         ]
         
-        self.update_market_prices()
+        # Rynek: własny silnik albo wspólny silnik shardów serwera (wtedy ticki wykonuje serwer)
+        self.market_shard = shard
+        self.owns_market = market is None
+        self.market = market if market is not None else CyberMarketEngine(self.market_items, seed=seed)
+        self.market.apply_prices(self.market_items, self.market_shard)
         
     def update_market_prices(self):
-        """Aktualizuj ceny rynkowe z globalną fluktuacją"""
-        for item in self.market_items:
-            # Większa volatility dla wyższych rarity
-            volatility = {
-                "common": 0.1, "uncommon": 0.15, "rare": 0.25, 
-                "epic": 0.35, "legendary": 0.45, "mythic": 0.60
-            }
-            
-            base_volatility = volatility.get(item["rarity"], 0.2)
-            fluctuation = random.uniform(-base_volatility, base_volatility)
-            
-            item["price"] = max(50, int(item["base_price"] * (1 + fluctuation)))
-            
-            # Market events
-            if random.random() < 0.05:  # 5% szansy na market event
-                if random.random() < 0.5:
-                    item["price"] = int(item["price"] * 1.5)  # Boom
-                else:
-                    item["price"] = int(item["price"] * 0.7)  # Crash
+        """Aktualizuj ceny rynkowe z globalną fluktuacją (jeden tick silnika dla wszystkich itemów)"""
+        if self.owns_market:
+            self.market.tick()
+        self.market.apply_prices(self.market_items, self.market_shard)
     
     def clear_screen(self):
         os.system('cls' if os.name == 'nt' else 'clear')
@@ -223,7 +217,7 @@ class FurbyCyberSanAndreas:
             print(move)
         
         choice = input("\nDirection (L/R/N): ").upper()
-        energy_cost = random.randint(8, 15)
+        energy_cost = self.rng.randint(8, 15)
         
         if choice == "L" and self.position > 0:
             self.position -= 1
@@ -256,13 +250,13 @@ class FurbyCyberSanAndreas:
             "📱 Encrypted message: New mission available!"
         ]
         
-        event = random.choice(travel_events)
+        event = self.rng.choice(travel_events)
         print(f"🌐 Travel Event: {event}")
         
         if "fine" in event and self.player["items"]:
             illegal_items = [item for item in self.player["items"] if "hack" in item["name"].lower()]
-            if illegal_items and random.random() < 0.3:
-                fine = random.randint(100, 300)
+            if illegal_items and self.rng.random() < 0.3:
+                fine = self.rng.randint(100, 300)
                 self.player["cash"] = max(0, self.player["cash"] - fine)
                 print(f"💸 Paid fine: ${fine}")
         elif "+200$" in event:
@@ -302,7 +296,7 @@ class FurbyCyberSanAndreas:
         }
         
         events = location_events.get(current_loc["type"], ["Nothing special happens."])
-        event = random.choice(events)
+        event = self.rng.choice(events)
         print(f"📍 {current_loc['name']} Event: {event}")
         
         # Handle event consequences
@@ -323,7 +317,7 @@ class FurbyCyberSanAndreas:
     
     def encounter(self):
         current_loc = self.world[self.position]
-        npc_type = random.choice(current_loc["encounters"])
+        npc_type = self.rng.choice(current_loc["encounters"])
         
         self.clear_screen()
         self.draw_hud()
@@ -363,13 +357,13 @@ class FurbyCyberSanAndreas:
             heat_gained = int(heat_gained * 1.2)
         
         self.player["heat"] += heat_gained
-        self.player["reputation"] += random.randint(2, 8)
+        self.player["reputation"] += self.rng.randint(2, 8)
         
         if item_bonus > 0:
             print(f"💎 Item boost: +{item_bonus} heat from your collection!")
         
         # Random cyber event check
-        if random.random() < 0.15:
+        if self.rng.random() < 0.15:
             self.trigger_cyber_event()
         
         time.sleep(2)
@@ -381,10 +375,10 @@ class FurbyCyberSanAndreas:
             f"🔥 {npc['name']}: 'In this digital realm, we can be anything... What's your secret desire?'"
         ]
         
-        print(random.choice(flirt_lines))
+        print(self.rng.choice(flirt_lines))
         player_line = input("💭 Your flirt response: ")
         
-        response_quality = len(player_line) + random.randint(-5, 5)
+        response_quality = len(player_line) + self.rng.randint(-5, 5)
         
         if response_quality > 15:
             print(f"❤️ {npc['name']}: 'Mmm, that's incredibly hot... I'm getting wet just thinking about it.'")
@@ -405,9 +399,9 @@ class FurbyCyberSanAndreas:
         if total_assets > 5000 or item_value > 200:
             print(f"💎 {npc['name']}: 'Wow! You're clearly a major player in this game... I'm impressed.'")
             self.player["heat"] += 20
-            if random.random() < 0.3:
+            if self.rng.random() < 0.3:
                 print(f"🎁 {npc['name']} gives you a special item for being so impressive!")
-                bonus_item = random.choice(self.market_items).copy()
+                bonus_item = self.rng.choice(self.market_items).copy()
                 self.player["items"].append(bonus_item)
         elif total_assets > 2000:
             print(f"😊 {npc['name']}: 'Nice setup! You've got potential...'")
@@ -465,13 +459,13 @@ class FurbyCyberSanAndreas:
             {"name": "Identity forgery", "success_rate": 0.4, "reward": 1500, "penalty": 800}
         ]
         
-        deal = random.choice(deals)
+        deal = self.rng.choice(deals)
         print(f"💼 Deal: {deal['name']}")
         print(f"📊 Success rate: {deal['success_rate']*100:.0f}%")
         print(f"💰 Reward: ${deal['reward']} | Penalty: ${deal['penalty']}")
         
         if input("Accept deal? (y/n): ").lower() == 'y':
-            if random.random() < deal["success_rate"]:
+            if self.rng.random() < deal["success_rate"]:
                 print(f"🎉 SUCCESS! Earned ${deal['reward']}")
                 self.player["cash"] += deal["reward"]
                 self.player["reputation"] += 15
@@ -505,7 +499,7 @@ class FurbyCyberSanAndreas:
             print(f"💸 Not enough cash! Need ${final_price - self.player['cash']} more.")
     
     def trigger_cyber_event(self):
-        event = random.choice(self.cyber_events)
+        event = self.rng.choice(self.cyber_events)
         print(f"\n🌐 CYBER EVENT: {event['message']}")
         
         if event["effect"] == "bank_loss":
@@ -526,11 +520,11 @@ class FurbyCyberSanAndreas:
                         self.player["cash"] -= 500
                         print("🔓 Items unlocked!")
                     else:
-                        lost_item = self.player["items"].pop(random.randint(0, len(self.player["items"])-1))
+                        lost_item = self.player["items"].pop(self.rng.randint(0, len(self.player["items"])-1))
                         print(f"💔 Lost {lost_item['name']}!")
                 else:
                     if self.player["items"]:
-                        lost_item = self.player["items"].pop(random.randint(0, len(self.player["items"])-1))
+                        lost_item = self.player["items"].pop(self.rng.randint(0, len(self.player["items"])-1))
                         print(f"💔 Can't pay ransom! Lost {lost_item['name']}!")
                         
         elif event["effect"] == "investment_gain":
@@ -545,7 +539,7 @@ class FurbyCyberSanAndreas:
             self.player["cash"] += int(event["severity"])
             
         elif event["effect"] == "free_item":
-            free_item = random.choice(self.market_items).copy()
+            free_item = self.rng.choice(self.market_items).copy()
             self.player["items"].append(free_item)
             print(f"🎁 Received: {free_item['name']}!")
             
@@ -640,7 +634,7 @@ class FurbyCyberSanAndreas:
                 self.player["investments"] += amount
                 
                 # Immediate growth/loss
-                growth_rate = random.uniform(-0.20, 0.25)  # -20% to +25%
+                growth_rate = self.rng.uniform(-0.20, 0.25)  # -20% to +25%
                 growth = int(amount * growth_rate)
                 self.player["investments"] += growth
                 
@@ -794,8 +788,8 @@ class FurbyCyberSanAndreas:
                 self.player["bank_balance"] -= base_cost
                 
                 # Create unique NFT
-                nft_value = random.randint(50, 150)
-                nft_price = random.randint(1000, 3000)
+                nft_value = self.rng.randint(50, 150)
+                nft_price = self.rng.randint(1000, 3000)
                 
                 personal_nft = {
                     "name": f"{nft_name} NFT",
@@ -818,26 +812,22 @@ class FurbyCyberSanAndreas:
         print("\n📊 MARKET ANALYSIS REPORT")
         print("="*50)
         
-        # Calculate market trends
-        total_market_value = sum(item["price"] for item in self.market_items)
-        average_price = total_market_value // len(self.market_items)
+        # Calculate market trends (okno historii cen z silnika rynku)
+        report = self.market.analysis(self.market_shard, self.player["items"])
         
-        print(f"📈 Total Market Cap: ${total_market_value}")
-        print(f"💰 Average Item Price: ${average_price}")
-        print(f"📦 Your Portfolio Value: ${sum(item['price'] for item in self.player['items'])}")
+        print(f"📈 Total Market Cap: ${report['market_cap']}")
+        print(f"💰 Average Item Price: ${report['average_price']}")
+        print(f"📦 Your Portfolio Value: ${report['portfolio_value']}")
         
         # Show trends by category
-        categories = {}
-        for item in self.market_items:
-            cat = item["category"]
-            if cat not in categories:
-                categories[cat] = []
-            categories[cat].append(item["price"])
-        
-        print(f"\n📊 CATEGORY TRENDS:")
-        for category, prices in categories.items():
-            avg_price = sum(prices) // len(prices)
-            print(f"   {category.capitalize()}: ${avg_price} avg")
+        print(f"\n📊 CATEGORY TRENDS (last {report['window']} ticks):")
+        for category, stats in report["categories"].items():
+            trend = "📈" if stats["trend_pct"] > 0 else "📉" if stats["trend_pct"] < 0 else "➡️"
+            print(f"   {category.capitalize()}: ${stats['average']} avg {trend} {stats['trend_pct']:+.1f}%")
+        
+        print(f"\n🚀 TOP MOVERS:")
+        for mover in report["movers"]:
+            print(f"   {mover['name']}: ${mover['price']} ({mover['change_pct']:+.1f}% vs avg)")
         
         # Investment advice
         print(f"\n💡 INVESTMENT ADVICE:")
@@ -879,7 +869,7 @@ class FurbyCyberSanAndreas:
             return
         
         # Mission execution
-        success = random.random() > mission["risk"]
+        success = self.rng.random() > mission["risk"]
         
         if success:
             print(f"✅ MISSION SUCCESS!")
@@ -991,12 +981,12 @@ class FurbyCyberSanAndreas:
     
     def rest_and_recover(self):
         """Rest to restore energy and process passive income"""
-        energy_gain = random.randint(40, 60)
+        energy_gain = self.rng.randint(40, 60)
         self.player["energy"] = min(100, self.player["energy"] + energy_gain)
         
         # Passive investment growth
         if self.player["investments"] > 0:
-            growth = int(self.player["investments"] * random.uniform(0.02, 0.08))
+            growth = int(self.player["investments"] * self.rng.uniform(0.02, 0.08))
             self.player["investments"] += growth
             print(f"📈 Investments grew by ${growth} while you rested!")
         
@@ -1065,7 +1055,7 @@ class FurbyCyberSanAndreas:
                 self.show_full_stats()
             elif choice == "6":
                 if self.missions:
-                    quick_mission = random.choice(self.missions)
+                    quick_mission = self.rng.choice(self.missions)
                     print(f"🎯 Quick Mission: {quick_mission['name']}")
                     self.execute_mission(quick_mission)
             elif choice == "0":
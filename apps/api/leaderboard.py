@@ -0,0 +1,135 @@
+"""
+Ranking Drift dla MTA Quest API: unikalny indeks na nazwie gracza, zapis
+jednym upsertem oraz top-K w pamięci aktualizowany przy każdym zapisie
+"""
+
+import bisect
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlite_store import SQLiteDatabase
+
+SCHEMA = """CREATE TABLE IF NOT EXISTS drift_scores (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    updated REAL NOT NULL
+)"""
+
+# Przed unikalnym indeksem gracz mógł mieć kilka wierszy - zostaje najlepszy
+DEDUPLICATE = """DELETE FROM drift_scores WHERE id NOT IN (
+    SELECT id FROM (
+        SELECT id, ROW_NUMBER() OVER (PARTITION BY name ORDER BY score DESC, updated ASC, id ASC) AS position
+        FROM drift_scores
+    ) WHERE position = 1
+)"""
+
+# Wynik (i czas, który rozstrzyga remisy) zmienia się tylko przy poprawie
+UPSERT_SCORE = """INSERT INTO drift_scores(name, score, updated) VALUES(?,?,?)
+ON CONFLICT(name) DO UPDATE SET score=excluded.score, updated=excluded.updated
+WHERE excluded.score > drift_scores.score"""
+
+RANKING_ORDER = "ORDER BY score DESC, updated ASC, name ASC"
+
+Key = Tuple[int, float, str]
+
+
+class DriftLeaderboard:
+    """
+    Najlepsze wyniki graczy z indeksem (score DESC, updated, name).
+
+    Pierwsze capacity pozycji trzyma posortowana lista kluczy
+    (-score, updated, name): odczyt strony z tego zakresu to wycinek listy,
+    a pozycja gracza z top-K - bisect. Wyniki tylko rosną, więc wpis spoza
+    top-K może do niego wejść jedynie nowym, lepszym wynikiem - cache nie
+    musi czytać bazy przy zapisie. Dalsze strony i pozycje idą do SQLite
+    po indeksie. Cache zakłada jeden proces piszący do bazy (reload()
+    odświeża go po zmianach z zewnątrz).
+    """
+
+    def __init__(self, database: SQLiteDatabase, capacity: int = 1000):
+        self.database = database
+        self.capacity = capacity
+        self._keys: List[Key] = []
+        self._by_name: Dict[str, Key] = {}
+        self._lock = threading.Lock()
+        self.migrate()
+        self.reload()
+
+    def migrate(self) -> None:
+        with self.database.connection() as c:
+            c.execute(SCHEMA)
+            exists = c.execute("SELECT 1 FROM sqlite_master WHERE type='index' AND name='idx_drift_scores_name'").fetchone()
+            if not exists:
+                c.execute(DEDUPLICATE)
+                c.execute("CREATE UNIQUE INDEX idx_drift_scores_name ON drift_scores(name)")
+            c.execute("CREATE INDEX IF NOT EXISTS idx_drift_scores_rank ON drift_scores(score DESC, updated, name)")
+
+    def reload(self) -> None:
+        rows = self.database.connection().execute(
+            f"SELECT name, score, updated FROM drift_scores {RANKING_ORDER} LIMIT ?", (self.capacity,)).fetchall()
+        with self._lock:
+            self._keys = [(-row[1], row[2], row[0]) for row in rows]
+            self._by_name = {key[2]: key for key in self._keys}
+
+    @property
+    def complete(self) -> bool:
+        """Czy cache zawiera wszystkich graczy (tabela mniejsza niż capacity)"""
+        return len(self._keys) < self.capacity
+
+    def submit(self, name: str, score: int) -> None:
+        now = time.time()
+        with self._lock:
+            with self.database.connection() as c:
+                c.execute(UPSERT_SCORE, (name, score, now))
+            self._update_cache((-score, now, name))
+
+    def _update_cache(self, key: Key) -> None:
+        name = key[2]
+        current = self._by_name.get(name)
+        if current is not None:
+            if key[0] >= current[0]:
+                return
+            del self._keys[bisect.bisect_left(self._keys, current)]
+        elif not self.complete and key >= self._keys[-1]:
+            return
+        bisect.insort(self._keys, key)
+        self._by_name[name] = key
+        if len(self._keys) > self.capacity:
+            del self._by_name[self._keys.pop()[2]]
+
+    def top(self, limit: int = 20, offset: int = 0) -> List[Dict[str, Any]]:
+        """Strona rankingu; z pamięci, gdy mieści się w top-K"""
+        with self._lock:
+            if offset + limit <= len(self._keys) or self.complete:
+                return [self._entry(key, offset + i + 1) for i, key in enumerate(self._keys[offset:offset + limit])]
+        rows = self.database.connection().execute(
+            f"SELECT name, score, updated FROM drift_scores {RANKING_ORDER} LIMIT ? OFFSET ?", (limit, offset)).fetchall()
+        return [self._entry((-row[1], row[2], row[0]), offset + i + 1) for i, row in enumerate(rows)]
+
+    def rank(self, name: str) -> Optional[Dict[str, Any]]:
+        """Pozycja gracza (od 1) z wynikiem; None, gdy gracz nie ma wyniku"""
+        with self._lock:
+            key = self._by_name.get(name)
+            if key is not None:
+                return self._entry(key, bisect.bisect_left(self._keys, key) + 1)
+            if self.complete:
+                return None
+        conn = self.database.connection()
+        row = conn.execute("SELECT score, updated FROM drift_scores WHERE name=?", (name,)).fetchone()
+        if row is None:
+            return None
+        score, updated = row[0], row[1]
+        ahead = conn.execute("SELECT COUNT(*) FROM drift_scores WHERE score > ?", (score,)).fetchone()[0]
+        ahead += conn.execute("SELECT COUNT(*) FROM drift_scores WHERE score = ? AND (updated < ? OR (updated = ? AND name < ?))",
+                              (score, updated, updated, name)).fetchone()[0]
+        return self._entry((-score, updated, name), ahead + 1)
+
+    @staticmethod
+    def _entry(key: Key, rank: int) -> Dict[str, Any]:
+        return {"rank": rank, "name": key[2], "score": -key[0], "updated": key[1]}
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"cached": len(self._keys), "capacity": self.capacity, "complete": self.complete}
@@ -1,17 +1,23 @@
-from fastapi import FastAPI, UploadFile, File, Form
-from fastapi.responses import FileResponse, StreamingResponse
+from fastapi import FastAPI, UploadFile, File, Form, Query, HTTPException, Request
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from starlette.concurrency import run_in_threadpool
 from pydantic import BaseModel, Field
 from typing import Optional, List, Dict, Any
 from fastapi.middleware.cors import CORSMiddleware
-import sys, pathlib, os, re, json, sqlite3, io, csv, time, hashlib, datetime
+import sys, pathlib, os, re
 from dotenv import load_dotenv
 import httpx
 
 ROOT = pathlib.Path(__file__).resolve().parents[2]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
+API_DIR = pathlib.Path(__file__).resolve().parent
+for p in (ROOT, API_DIR):
+    if str(p) not in sys.path:
+        sys.path.insert(0, str(p))
 
 from gokai import AIPsycheGOKAI, s_gok, fibonacci
+from sqlite_store import SQLiteDatabase, EventWriter, iter_events_csv, gzip_chunks, parse_timestamp
+from leaderboard import DriftLeaderboard
+from track_store import TrackStore, CHUNK_SIZE, etag_matches, iter_file, parse_range, track_etag
 
 load_dotenv(dotenv_path=ROOT / ".env", override=True)
 
@@ -33,12 +39,15 @@ UPLOAD_DIR = ROOT / "uploads" / "tracks"
 DATA_DIR.mkdir(parents=True, exist_ok=True)
 UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
 
-# SQLite (events + drift)
+# SQLite (events + drift): one WAL connection per worker thread, events written in batches
 DB_PATH = DATA_DIR / "events.sqlite"
+DB = SQLiteDatabase(DB_PATH)
+EVENTS = EventWriter(DB,
+                     batch_size=int(os.getenv("EVENT_BATCH_SIZE", "256")),
+                     flush_interval=float(os.getenv("EVENT_FLUSH_MS", "50")) / 1000.0)
+
 def db():
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    return conn
+    return DB.connection()
 
 with db() as c:
     c.execute("""CREATE TABLE IF NOT EXISTS events (
@@ -48,14 +57,23 @@ with db() as c:
         user TEXT,
         meta TEXT
     )""")
-    c.execute("""CREATE TABLE IF NOT EXISTS drift_scores (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        name TEXT NOT NULL,
-        score INTEGER NOT NULL,
-        updated REAL NOT NULL
-    )""")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_events_event_ts ON events(event, ts)")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_events_ts ON events(ts)")
     c.commit()
 
+# Drift leaderboard: unique index on name, upsert per score, top-K kept in memory
+LEADERBOARD = DriftLeaderboard(DB, capacity=int(os.getenv("DRIFT_TOPK", "1000")))
+
+# HipHop tracks: metadata index in SQLite (listing/download never scan the directory)
+TRACKS = TrackStore(UPLOAD_DIR, DB)
+if TRACKS.count() == 0:
+    TRACKS.reindex()
+
+@app.on_event("shutdown")
+def close_db():
+    EVENTS.close()
+    DB.close()
+
 psyche = AIPsycheGOKAI()
 
 class GOKAIInput(BaseModel):
@@ -154,55 +172,70 @@ async def chat(req: ChatRequest):
 
 @app.post("/api/hiphop/upload")
 async def hiphop_upload(file: UploadFile = File(...), author: Optional[str] = Form(None)):
-    safe_name = file.filename.replace("/", "_").replace("\\", "_")
-    data = await file.read()
-    path = UPLOAD_DIR / safe_name
-    with open(path, "wb") as f:
-        f.write(data)
-    token_id = hashlib.sha1((safe_name + str(len(data))).encode()).hexdigest()[:16]
-    meta = {"title": safe_name, "author": author or "unknown", "size": len(data),
-            "token_id": token_id, "uri": f"/api/hiphop/download/{safe_name}"}
+    try:
+        upload = await run_in_threadpool(TRACKS.begin, file.filename)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="invalid filename")
+    try:
+        while True:
+            chunk = await file.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            await run_in_threadpool(upload.write, chunk)
+        meta = await run_in_threadpool(upload.commit, author, file.content_type)
+    except BaseException:
+        await run_in_threadpool(upload.abort)
+        raise
     log_event("hiphop_upload", meta=meta)
     return {"status": "ok", "track": meta}
 
 @app.get("/api/hiphop/list")
-def hiphop_list():
-    items = []
-    for name in os.listdir(UPLOAD_DIR):
-        p = UPLOAD_DIR / name
-        if p.is_file():
-            items.append({"name": name, "size": p.stat().st_size})
-    return {"tracks": items}
+def hiphop_list(limit: int = Query(100, ge=1, le=1000), offset: int = Query(0, ge=0)):
+    return {"tracks": TRACKS.list(limit, offset), "total": TRACKS.count()}
 
 @app.get("/api/hiphop/download/{name}")
-def hiphop_download(name: str):
-    path = UPLOAD_DIR / name
-    if not path.exists():
-        return {"error": "not_found"}
-    return FileResponse(path)
+def hiphop_download(name: str, request: Request):
+    track = TRACKS.get(name)
+    if track is None:
+        return JSONResponse({"error": "not_found"}, status_code=404)
+    size, etag = track["size"], track_etag(track)
+    headers = {"ETag": etag, "Accept-Ranges": "bytes", "Cache-Control": "public, max-age=0, must-revalidate"}
+    media_type = track["content_type"] or "application/octet-stream"
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    byte_range = None
+    if_range = request.headers.get("if-range")
+    if if_range is None or if_range.strip() == etag:
+        try:
+            byte_range = parse_range(request.headers.get("range"), size)
+        except ValueError:
+            return Response(status_code=416, headers={**headers, "Content-Range": f"bytes */{size}"})
+    if byte_range is None:
+        return StreamingResponse(iter_file(TRACKS.path(name)), media_type=media_type,
+                                 headers={**headers, "Content-Length": str(size)})
+    start, end = byte_range
+    headers.update({"Content-Range": f"bytes {start}-{end}/{size}", "Content-Length": str(end - start + 1)})
+    return StreamingResponse(iter_file(TRACKS.path(name), start, end), status_code=206,
+                             media_type=media_type, headers=headers)
 
 class DriftScore(BaseModel):
     name: str
     score: int
 
 @app.get("/api/drift/leaderboard")
-def drift_leaderboard(limit: int = 20):
-    with db() as c:
-        rows = c.execute("SELECT name, score, updated FROM drift_scores ORDER BY score DESC, updated ASC LIMIT ?", (limit,)).fetchall()
-        data = [{"name": r["name"], "score": r["score"], "updated": r["updated"]} for r in rows]
-        return {"leaderboard": data}
+def drift_leaderboard(limit: int = Query(20, ge=1, le=500), offset: int = Query(0, ge=0)):
+    return {"leaderboard": LEADERBOARD.top(limit, offset), "limit": limit, "offset": offset}
+
+@app.get("/api/drift/rank/{name}")
+def drift_rank(name: str):
+    entry = LEADERBOARD.rank(name)
+    if entry is None:
+        return JSONResponse({"error": "not_found"}, status_code=404)
+    return entry
 
 @app.post("/api/drift/score")
 def drift_set_score(payload: DriftScore):
-    with db() as c:
-        now = time.time()
-        row = c.execute("SELECT id, score FROM drift_scores WHERE name=?", (payload.name,)).fetchone()
-        if row is None:
-            c.execute("INSERT INTO drift_scores(name, score, updated) VALUES(?,?,?)", (payload.name, payload.score, now))
-        else:
-            new_score = max(payload.score, row["score"])
-            c.execute("UPDATE drift_scores SET score=?, updated=? WHERE id=?", (new_score, now, row["id"]))
-        c.commit()
+    LEADERBOARD.submit(payload.name, payload.score)
     log_event("drift_score", meta={"name": payload.name, "score": payload.score})
     return {"ok": True}
 
@@ -212,10 +245,7 @@ class EventPayload(BaseModel):
     meta: Optional[Dict[str, Any]] = None
 
 def log_event(event: str, user: Optional[str]=None, meta: Optional[Dict[str, Any]]=None):
-    with db() as c:
-        c.execute("INSERT INTO events(ts, event, user, meta) VALUES(?,?,?,?)",
-                  (time.time(), event, user, json.dumps(meta or {})))
-        c.commit()
+    EVENTS.log(event, user, meta)
 
 @app.post("/api/events/log")
 def events_log(p: EventPayload):
@@ -223,14 +253,17 @@ def events_log(p: EventPayload):
     return {"ok": True}
 
 @app.get("/api/events/export.csv")
-def events_export_csv():
-    with db() as c:
-        rows = c.execute("SELECT ts, event, user, meta FROM events ORDER BY ts ASC").fetchall()
-        output = io.StringIO()
-        w = csv.writer(output)
-        w.writerow(["ts_iso", "event", "user", "meta_json"])
-        for r in rows:
-            ts_iso = datetime.datetime.utcfromtimestamp(r["ts"]).isoformat() + "Z"
-            w.writerow([ts_iso, r["event"], r["user"] or "", r["meta"] or "{}"])
-        output.seek(0)
-        return StreamingResponse(iter([output.read()]), media_type="text/csv", headers={"Content-Disposition":"attachment; filename=events.csv"})
+def events_export_csv(since: Optional[str] = None, until: Optional[str] = None,
+                      event: Optional[List[str]] = Query(None), gzip: bool = False):
+    try:
+        since_ts, until_ts = parse_timestamp(since), parse_timestamp(until)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="since/until must be epoch seconds or ISO 8601")
+    EVENTS.flush()
+    # Own connection for the lifetime of the stream (closed by the generator)
+    chunks = iter_events_csv(DB.open(track=False), since_ts, until_ts, event, close=True)
+    headers = {"Content-Disposition": "attachment; filename=events.csv"}
+    if gzip:
+        headers["Content-Encoding"] = "gzip"
+        return StreamingResponse(gzip_chunks(chunks), media_type="text/csv", headers=headers)
+    return StreamingResponse(chunks, media_type="text/csv", headers=headers)
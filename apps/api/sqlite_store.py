@@ -0,0 +1,244 @@
+"""
+SQLite dla MTA Quest API: połączenia per wątek (WAL, synchronous=NORMAL,
+cache przygotowanych zapytań), zapis zdarzeń partiami w wątku w tle
+i strumieniowy eksport CSV
+"""
+
+import csv
+import datetime
+import io
+import json
+import logging
+import sqlite3
+import threading
+import time
+import zlib
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+INSERT_EVENT = "INSERT INTO events(ts, event, user, meta) VALUES(?,?,?,?)"
+
+
+class SQLiteDatabase:
+    """
+    Jedno połączenie na wątek zamiast nowego połączenia przy każdym żądaniu.
+
+    Wątki puli FastAPI żyją długo, więc połączenie (i jego cache
+    przygotowanych zapytań - ten sam tekst SQL nie jest ponownie parsowany)
+    jest używane wielokrotnie. WAL pozwala czytać równolegle z zapisem.
+    """
+
+    def __init__(self, path, busy_timeout_ms: int = 5000, cached_statements: int = 256):
+        self.path = str(path)
+        self.busy_timeout_ms = busy_timeout_ms
+        self.cached_statements = cached_statements
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+
+    def open(self, track: bool = True) -> sqlite3.Connection:
+        """
+        Nowe, skonfigurowane połączenie (dla wątków z własnym cyklem życia);
+        track=False - połączenie zamyka wywołujący (np. strumień eksportu)
+        """
+        conn = sqlite3.connect(self.path, check_same_thread=False,
+                               cached_statements=self.cached_statements)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA busy_timeout={int(self.busy_timeout_ms)}")
+        if track:
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    def connection(self) -> sqlite3.Connection:
+        """Połączenie bieżącego wątku"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = self.open()
+        return conn
+
+    def close(self) -> None:
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.ProgrammingError:
+                pass
+        self._local = threading.local()
+
+
+class EventWriter:
+    """
+    Zapis zdarzeń partiami (write-behind).
+
+    log() tylko dokleja wiersz do kolejki; wątek w tle zapisuje kolejkę w
+    jednej transakcji, gdy uzbiera się batch_size zdarzeń albo minie
+    flush_interval sekund. flush() zapisuje od razu (np. przed eksportem).
+    """
+
+    def __init__(self, database: SQLiteDatabase, batch_size: int = 256,
+                 flush_interval: float = 0.05, max_pending: int = 100_000, autostart: bool = True):
+        self.database = database
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._pending: Deque[Tuple[float, str, Optional[str], str]] = deque()
+        self._cond = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._stopped = False
+        self._thread: Optional[threading.Thread] = None
+        self.stats = {"logged": 0, "written": 0, "batches": 0, "errors": 0, "backpressure": 0}
+        if autostart:
+            self.start()
+
+    def log(self, event: str, user: Optional[str] = None, meta: Optional[Dict[str, Any]] = None) -> None:
+        row = (time.time(), event, user, json.dumps(meta or {}))
+        with self._cond:
+            self._pending.append(row)
+            self.stats["logged"] += 1
+            pending = len(self._pending)
+            if pending >= self.batch_size:
+                self._cond.notify()
+        if pending >= self.max_pending:
+            # Dysk nie nadąża - żądanie zapisuje partię samo zamiast rosnącej kolejki
+            self.stats["backpressure"] += 1
+            self.flush()
+
+    def flush(self) -> int:
+        """Zapisuje wszystkie oczekujące zdarzenia; zwraca liczbę wierszy"""
+        with self._flush_lock:
+            with self._cond:
+                if not self._pending:
+                    return 0
+                batch = list(self._pending)
+                self._pending.clear()
+            if self._conn is None:
+                self._conn = self.database.open()
+            try:
+                with self._conn:
+                    self._conn.executemany(INSERT_EVENT, batch)
+            except sqlite3.Error as e:
+                logger.error(f"Event batch write failed ({len(batch)} rows): {e}")
+                self.stats["errors"] += 1
+                with self._cond:
+                    self._pending.extendleft(reversed(batch))
+                return 0
+            self.stats["written"] += len(batch)
+            self.stats["batches"] += 1
+            return len(batch)
+
+    def start(self) -> "EventWriter":
+        if self._thread is None or not self._thread.is_alive():
+            self._stopped = False
+            self._thread = threading.Thread(target=self._run, name="api-event-writer", daemon=True)
+            self._thread.start()
+        return self
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                if not self._stopped and len(self._pending) < self.batch_size:
+                    self._cond.wait(self.flush_interval)
+                stopped = self._stopped
+            self.flush()
+            if stopped:
+                return
+
+    def close(self) -> None:
+        """Zatrzymuje wątek w tle i zapisuje resztę zdarzeń"""
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+        self.flush()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._cond:
+            pending = len(self._pending)
+        return {**self.stats, "pending": pending, "batch_size": self.batch_size,
+                "flush_interval": self.flush_interval}
+
+
+# ===== EKSPORT CSV =====
+EVENTS_CSV_HEADER = ("ts_iso", "event", "user", "meta_json")
+
+
+def parse_timestamp(value: Union[None, str, float]) -> Optional[float]:
+    """Znacznik czasu z liczby sekund epoki albo ISO 8601 (bez strefy = UTC)"""
+    if value is None or value == "":
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        pass
+    parsed = datetime.datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=datetime.timezone.utc)
+    return parsed.timestamp()
+
+
+def events_query(since: Optional[float] = None, until: Optional[float] = None,
+                 events: Optional[Sequence[str]] = None) -> Tuple[str, List[Any]]:
+    """SELECT zdarzeń z filtrami (indeksy (event, ts) i (ts)), rosnąco po ts"""
+    where, params = [], []
+    if events:
+        where.append(f"event IN ({','.join('?' * len(events))})")
+        params.extend(events)
+    if since is not None:
+        where.append("ts >= ?")
+        params.append(since)
+    if until is not None:
+        where.append("ts < ?")
+        params.append(until)
+    sql = "SELECT ts, event, user, meta FROM events"
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+    return sql + " ORDER BY ts ASC", params
+
+
+def iter_events_csv(conn: sqlite3.Connection, since: Optional[float] = None, until: Optional[float] = None,
+                    events: Optional[Sequence[str]] = None, chunk_rows: int = 1000,
+                    close: bool = False) -> Iterator[str]:
+    """
+    Eksport zdarzeń jako bloki CSV: kursor SQLite jest czytany po chunk_rows
+    wierszy, więc pamięć nie rośnie z rozmiarem tabeli, a pierwszy blok
+    (nagłówek) wychodzi od razu
+    """
+    sql, params = events_query(since, until, events)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    try:
+        writer.writerow(EVENTS_CSV_HEADER)
+        yield buffer.getvalue()
+        cursor = conn.execute(sql, params)
+        while True:
+            rows = cursor.fetchmany(chunk_rows)
+            if not rows:
+                break
+            buffer.seek(0)
+            buffer.truncate(0)
+            for ts, event, user, meta in rows:
+                ts_iso = datetime.datetime.fromtimestamp(ts, datetime.timezone.utc).replace(tzinfo=None).isoformat()
+                writer.writerow([ts_iso + "Z", event, user or "", meta or "{}"])
+            yield buffer.getvalue()
+    finally:
+        if close:
+            conn.close()
+
+
+def gzip_chunks(chunks: Iterable[str], level: int = 6) -> Iterator[bytes]:
+    """Strumień gzip z bloków tekstu (kompresja przyrostowa, bez buforowania całości)"""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode("utf-8"))
+        if data:
+            yield data
+    yield compressor.flush()
@@ -0,0 +1,186 @@
+"""
+Magazyn utworów HipHop dla MTA Quest API: zapis strumieniowy do pliku
+tymczasowego z przyrostowym SHA-256 i atomową zmianą nazwy, indeks
+metadanych w SQLite oraz pomocnicze funkcje HTTP Range/ETag
+"""
+
+import hashlib
+import os
+import pathlib
+import time
+import uuid
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from sqlite_store import SQLiteDatabase
+
+CHUNK_SIZE = 1024 * 1024
+
+SCHEMA = """CREATE TABLE IF NOT EXISTS tracks (
+    name TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    sha256 TEXT NOT NULL,
+    token_id TEXT NOT NULL,
+    author TEXT,
+    content_type TEXT,
+    created REAL NOT NULL
+)"""
+
+UPSERT_TRACK = """INSERT INTO tracks(name, size, sha256, token_id, author, content_type, created)
+VALUES(?,?,?,?,?,?,?)
+ON CONFLICT(name) DO UPDATE SET size=excluded.size, sha256=excluded.sha256, token_id=excluded.token_id,
+    author=excluded.author, content_type=excluded.content_type, created=excluded.created"""
+
+TRACK_COLUMNS = "name, size, sha256, token_id, author, content_type, created"
+
+
+def safe_track_name(filename: Optional[str]) -> str:
+    name = (filename or "").replace("/", "_").replace("\\", "_").strip()
+    if not name or name.startswith("."):
+        raise ValueError("invalid track name")
+    return name
+
+
+class TrackUpload:
+    """Jeden zapis w toku: bloki trafiają do pliku .part i do skrótu SHA-256"""
+
+    def __init__(self, store: "TrackStore", name: str):
+        self.store = store
+        self.name = name
+        self.size = 0
+        self._hash = hashlib.sha256()
+        self._tmp_path = store.directory / f".{name}.{uuid.uuid4().hex}.part"
+        self._file = open(self._tmp_path, "wb")
+
+    def write(self, chunk: bytes) -> None:
+        self._file.write(chunk)
+        self._hash.update(chunk)
+        self.size += len(chunk)
+
+    def commit(self, author: Optional[str] = None, content_type: Optional[str] = None) -> Dict[str, Any]:
+        """Zamyka plik, podmienia go atomowo pod docelową nazwą i zapisuje metadane"""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+        os.replace(self._tmp_path, self.store.directory / self.name)
+        digest = self._hash.hexdigest()
+        return self.store.index(self.name, self.size, digest, author, content_type)
+
+    def abort(self) -> None:
+        if not self._file.closed:
+            self._file.close()
+        try:
+            os.unlink(self._tmp_path)
+        except FileNotFoundError:
+            pass
+
+
+class TrackStore:
+    """
+    Utwory na dysku + indeks w tabeli tracks.
+
+    Lista i pobieranie korzystają wyłącznie z indeksu (bez os.listdir/stat);
+    token_id to prefiks SHA-256 treści, a ETag - pełny skrót.
+    """
+
+    def __init__(self, directory, database: SQLiteDatabase):
+        self.directory = pathlib.Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.database = database
+        with self.database.connection() as c:
+            c.execute(SCHEMA)
+            c.execute("CREATE INDEX IF NOT EXISTS idx_tracks_created ON tracks(created)")
+
+    def begin(self, filename: Optional[str]) -> TrackUpload:
+        return TrackUpload(self, safe_track_name(filename))
+
+    def index(self, name: str, size: int, digest: str, author: Optional[str] = None,
+              content_type: Optional[str] = None) -> Dict[str, Any]:
+        row = (name, size, digest, digest[:16], author or "unknown", content_type, time.time())
+        with self.database.connection() as c:
+            c.execute(UPSERT_TRACK, row)
+        return self._to_dict(row)
+
+    def get(self, name: str) -> Optional[Dict[str, Any]]:
+        row = self.database.connection().execute(
+            f"SELECT {TRACK_COLUMNS} FROM tracks WHERE name=?", (name,)).fetchone()
+        return self._to_dict(tuple(row)) if row else None
+
+    def list(self, limit: int = 100, offset: int = 0) -> List[Dict[str, Any]]:
+        rows = self.database.connection().execute(
+            f"SELECT {TRACK_COLUMNS} FROM tracks ORDER BY name LIMIT ? OFFSET ?", (limit, offset)).fetchall()
+        return [self._to_dict(tuple(row)) for row in rows]
+
+    def count(self) -> int:
+        return self.database.connection().execute("SELECT COUNT(*) FROM tracks").fetchone()[0]
+
+    def path(self, name: str) -> pathlib.Path:
+        return self.directory / name
+
+    def reindex(self) -> int:
+        """Jednorazowe zaindeksowanie plików wgranych przed wprowadzeniem indeksu"""
+        known = {row[0] for row in self.database.connection().execute("SELECT name FROM tracks")}
+        added = 0
+        for entry in os.scandir(self.directory):
+            if not entry.is_file() or entry.name.startswith(".") or entry.name in known:
+                continue
+            digest = hashlib.sha256()
+            with open(entry.path, "rb") as f:
+                for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+                    digest.update(chunk)
+            self.index(entry.name, entry.stat().st_size, digest.hexdigest())
+            added += 1
+        return added
+
+    @staticmethod
+    def _to_dict(row: Tuple) -> Dict[str, Any]:
+        name, size, digest, token_id, author, content_type, created = row
+        return {"name": name, "title": name, "size": size, "sha256": digest, "token_id": token_id,
+                "author": author, "content_type": content_type, "created": created,
+                "uri": f"/api/hiphop/download/{name}"}
+
+
+# ===== HTTP RANGE / ETAG =====
+def track_etag(track: Dict[str, Any]) -> str:
+    return f'"{track["sha256"]}"'
+
+
+def etag_matches(header: Optional[str], etag: str) -> bool:
+    if not header:
+        return False
+    return header.strip() == "*" or etag in [tag.strip().removeprefix("W/") for tag in header.split(",")]
+
+
+def parse_range(header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """
+    Pojedynczy zakres "bytes=start-end" jako (start, end) włącznie; None gdy
+    nagłówka brak lub jest nieobsługiwany (wtedy cały plik). ValueError, gdy
+    zakres jest niespełnialny (416).
+    """
+    if not header or not header.startswith("bytes=") or "," in header:
+        return None
+    start_text, separator, end_text = header[len("bytes="):].strip().partition("-")
+    if (not separator or (start_text and not start_text.isdigit()) or (end_text and not end_text.isdigit())
+            or not (start_text or end_text)):
+        return None
+    if start_text:
+        start = int(start_text)
+        end = min(int(end_text), size - 1) if end_text else size - 1
+    else:
+        start, end = max(0, size - int(end_text)), size - 1
+    if start >= size or end < start:
+        raise ValueError("unsatisfiable range")
+    return start, end
+
+
+def iter_file(path, start: int = 0, end: Optional[int] = None, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """Bloki pliku od start do end (włącznie)"""
+    with open(path, "rb") as f:
+        f.seek(start)
+        remaining = None if end is None else end - start + 1
+        while remaining is None or remaining > 0:
+            data = f.read(chunk_size if remaining is None else min(chunk_size, remaining))
+            if not data:
+                break
+            if remaining is not None:
+                remaining -= len(data)
+            yield data
@@ -0,0 +1,137 @@
+"""
+💹 CYBER MARKET ENGINE
+======================
+
+Zwektoryzowany rynek globalny AI Furby Cyber San Andreas:
+- ceny, ceny bazowe, rzadkości i zmienności trzymane jako tablice NumPy
+- jeden tick aktualizuje wszystkie przedmioty wszystkich rynków naraz
+- wiele równoległych rynków (jeden na shard serwera) w jednej macierzy
+- historia cen w buforze cyklicznym o stałym rozmiarze dla analizy trendów
+"""
+
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Union
+
+import numpy as np
+
+# Większa zmienność dla wyższych rzadkości
+RARITY_VOLATILITY = {"common": 0.1, "uncommon": 0.15, "rare": 0.25,
+                     "epic": 0.35, "legendary": 0.45, "mythic": 0.60}
+DEFAULT_VOLATILITY = 0.2
+MIN_PRICE = 50
+EVENT_CHANCE = 0.05  # szansa na boom/krach przedmiotu w ticku
+BOOM_MULTIPLIER = 1.5
+CRASH_MULTIPLIER = 0.7
+
+
+class CyberMarketEngine:
+    """
+    Rynki cyber-przedmiotów jako macierz cen (rynki × przedmioty).
+
+    tick() losuje nowe ceny całej macierzy jedną operacją (te same reguły co
+    dawne FurbyCyberSanAndreas.update_market_prices: cena bazowa ± zmienność
+    rzadkości, min. 50$, 5% szansy na boom ×1.5 lub krach ×0.7). Każdy tick
+    zapisuje migawkę cen do bufora historii o stałej długości - analiza
+    trendów nie trzyma rosnących list. Bufor ma osobną pozycję i zapełnienie
+    dla każdego rynku, więc tick części shardów nie dopisuje powtórzonych
+    cen pozostałym.
+    """
+
+    def __init__(self, items: Sequence[Mapping[str, Any]], n_markets: int = 1,
+                 history_size: int = 64, seed: Optional[int] = None):
+        if history_size < 1:
+            raise ValueError("history_size must be at least 1")
+        self.names = tuple(item["name"] for item in items)
+        self.rarities = tuple(item["rarity"] for item in items)
+        self.categories = tuple(dict.fromkeys(item["category"] for item in items))
+        self.category_codes = np.array([self.categories.index(item["category"]) for item in items], dtype=np.int64)
+        self.base_prices = np.array([item["base_price"] for item in items], dtype=float)
+        self.volatility = np.array([RARITY_VOLATILITY.get(rarity, DEFAULT_VOLATILITY) for rarity in self.rarities])
+        self.heat_values = np.array([item["value"] for item in items], dtype=np.int64)
+        self.n_markets = n_markets
+        self.rng = np.random.default_rng(seed)
+
+        self.prices = np.zeros((n_markets, len(self.names)), dtype=np.int64)
+        self.history = np.zeros((history_size, n_markets, len(self.names)), dtype=np.int64)
+        self._head = np.zeros(n_markets, dtype=np.int64)
+        self._filled = np.zeros(n_markets, dtype=np.int64)
+        self.market_ticks = np.zeros(n_markets, dtype=np.int64)
+        self.tick()
+
+    @property
+    def n_items(self) -> int:
+        return len(self.names)
+
+    @property
+    def ticks(self) -> int:
+        """Liczba ticków, które objęły wszystkie rynki"""
+        return int(self.market_ticks.min())
+
+    # ===== TICK =====
+    def tick(self, markets: Union[None, int, Sequence[int]] = None) -> np.ndarray:
+        """Nowe ceny dla wszystkich rynków (albo wskazanych shardów); zwraca zaktualizowane wiersze"""
+        rows = np.arange(self.n_markets) if markets is None else np.atleast_1d(markets)
+        shape = (len(rows), self.n_items)
+        fluctuation = self.rng.uniform(-1.0, 1.0, shape) * self.volatility
+        prices = np.maximum(MIN_PRICE, (self.base_prices * (1 + fluctuation)).astype(np.int64))
+        event = self.rng.random(shape) < EVENT_CHANCE
+        boom = self.rng.random(shape) < 0.5
+        prices = np.where(event & boom, (prices * BOOM_MULTIPLIER).astype(np.int64), prices)
+        prices = np.where(event & ~boom, (prices * CRASH_MULTIPLIER).astype(np.int64), prices)
+        self.prices[rows] = prices
+        self._record(rows)
+        return prices
+
+    def _record(self, rows: np.ndarray) -> None:
+        """Migawka cen tylko dla rynków, które wykonały tick"""
+        size = self.history.shape[0]
+        self.history[self._head[rows], rows] = self.prices[rows]
+        self._head[rows] = (self._head[rows] + 1) % size
+        self._filled[rows] = np.minimum(self._filled[rows] + 1, size)
+        self.market_ticks[rows] += 1
+
+    def price_history(self, market: Optional[int] = None) -> np.ndarray:
+        """
+        Historia cen od najstarszej migawki: (ticki, przedmioty) dla rynku albo
+        (ticki, rynki, przedmioty) - ostatnie ticki wspólne dla wszystkich rynków
+        """
+        markets = np.arange(self.n_markets) if market is None else np.array([market])
+        window = int(self._filled[markets].min())
+        slots = (self._head[markets][None, :] - window + np.arange(window)[:, None]) % self.history.shape[0]
+        history = self.history[slots, markets[None, :]]
+        return history if market is None else history[:, 0]
+
+    # ===== WIDOK DLA GRY =====
+    def quote(self, market: int, index: int) -> int:
+        return int(self.prices[market, index])
+
+    def apply_prices(self, items: List[Dict[str, Any]], market: int = 0) -> None:
+        """Wpisuje aktualne ceny rynku do słowników przedmiotów gry"""
+        for item, price in zip(items, self.prices[market].tolist()):
+            item["price"] = price
+
+    def analysis(self, market: int = 0, portfolio: Iterable[Mapping[str, Any]] = ()) -> Dict[str, Any]:
+        """Raport rynku: kapitalizacja, średnie kategorii i trendy z okna historii"""
+        prices = self.prices[market]
+        history = self.price_history(market)
+        moving_average = history.mean(axis=0)
+        n_categories = len(self.categories)
+        counts = np.bincount(self.category_codes, minlength=n_categories)
+        category_sum = np.bincount(self.category_codes, weights=prices, minlength=n_categories)
+        category_avg = np.bincount(self.category_codes, weights=moving_average, minlength=n_categories) / counts
+        change_pct = (prices / moving_average - 1.0) * 100.0
+        movers = np.argsort(-np.abs(change_pct))[:3]
+        total = int(prices.sum())
+        return {
+            "market": market,
+            "window": int(history.shape[0]),
+            "market_cap": total,
+            "average_price": total // self.n_items,
+            "portfolio_value": sum(item["price"] for item in portfolio),
+            "categories": {
+                category: {"average": int(category_sum[i]) // int(counts[i]),
+                           "trend_pct": float((category_sum[i] / counts[i] / category_avg[i] - 1.0) * 100.0)}
+                for i, category in enumerate(self.categories)
+            },
+            "movers": [{"name": self.names[i], "price": int(prices[i]), "change_pct": float(change_pct[i])}
+                       for i in movers],
+        }
@@ -1 +1 @@
-__all__ = ["config", "quantum_core", "gokai_core", "main", "psyche", "utils"]
+__all__ = ["config", "quantum_core", "gokai_core", "main", "psyche", "utils", "session", "event_sources", "streaming"]
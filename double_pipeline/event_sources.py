@@ -0,0 +1,265 @@
+import asyncio
+import json
+import logging
+import os
+from collections import defaultdict
+from typing import Any, AsyncIterator, Dict, List, Optional, Set
+
+
+def parse_event_line(line: str) -> Optional[Dict[str, Any]]:
+    """Zamienia linię JSONL/tekstu na zdarzenie {'payload': ...}; pusta linia -> None."""
+    line = line.strip()
+    if not line:
+        return None
+    try:
+        obj = json.loads(line)
+    except ValueError:
+        return {'payload': line}
+    return normalize_event(obj)
+
+
+def normalize_event(obj: Any) -> Dict[str, Any]:
+    """Ujednolica zdarzenie: dict z kluczem 'payload' (zadania MIGI mają klucz 'task')."""
+    if isinstance(obj, dict):
+        if 'payload' not in obj and 'task' in obj:
+            obj = {**obj, 'payload': str(obj['task'])}
+        return obj
+    return {'payload': str(obj)}
+
+
+class EventSource:
+    """
+    Bazowe asynchroniczne źródło zdarzeń dla double_pipeline.
+
+    Implementacje dostarczają stream(); ack() wywoływane jest po przetworzeniu
+    partii (źródła z offsetami, np. Kafka, zatwierdzają wtedy pozycje).
+    """
+
+    def __init__(self):
+        self._closed = False
+
+    async def stream(self) -> AsyncIterator[Dict[str, Any]]:
+        raise NotImplementedError
+        yield  # pragma: no cover
+
+    def __aiter__(self) -> AsyncIterator[Dict[str, Any]]:
+        return self.stream()
+
+    async def ack(self, events: List[Dict[str, Any]]) -> None:
+        return None
+
+    async def close(self) -> None:
+        self._closed = True
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+
+class IterableEventSource(EventSource):
+    """Źródło z listy/iterowalnego obiektu lub main.EventStream (next_event)."""
+
+    def __init__(self, events: Any):
+        super().__init__()
+        self.events = events
+
+    async def stream(self) -> AsyncIterator[Dict[str, Any]]:
+        if hasattr(self.events, 'next_event'):
+            while not self._closed:
+                event = self.events.next_event()
+                if not event:
+                    break
+                yield normalize_event(event)
+                await asyncio.sleep(0)
+            return
+        for event in self.events:
+            if self._closed:
+                break
+            yield normalize_event(event)
+            await asyncio.sleep(0)
+
+
+class QueueEventSource(EventSource):
+    """
+    Źródło zasilane w procesie przez ograniczoną asyncio.Queue.
+
+    put() czeka, gdy bufor jest pełny (backpressure); try_put() zwraca False.
+    """
+    _STOP = object()
+
+    def __init__(self, maxsize: int = 256):
+        super().__init__()
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self.rejected = 0
+
+    async def put(self, event: Any) -> None:
+        if self._closed:
+            raise RuntimeError('QueueEventSource is closed')
+        await self.queue.put(normalize_event(event))
+
+    def try_put(self, event: Any) -> bool:
+        if self._closed:
+            return False
+        try:
+            self.queue.put_nowait(normalize_event(event))
+            return True
+        except asyncio.QueueFull:
+            self.rejected += 1
+            return False
+
+    async def stream(self) -> AsyncIterator[Dict[str, Any]]:
+        while True:
+            event = await self.queue.get()
+            if event is self._STOP:
+                break
+            yield event
+
+    async def close(self) -> None:
+        if not self._closed:
+            self._closed = True
+            await self.queue.put(self._STOP)
+
+
+class JsonlReplaySource(EventSource):
+    """Odtwarza zdarzenia z pliku JSONL, opcjonalnie z zadanym tempem (zdarzeń/s)."""
+
+    def __init__(self, path: str, rate: Optional[float] = None, encoding: str = 'utf-8'):
+        super().__init__()
+        self.path = path
+        self.rate = rate
+        self.encoding = encoding
+
+    async def stream(self) -> AsyncIterator[Dict[str, Any]]:
+        delay = 1.0 / self.rate if self.rate else 0.0
+        with open(self.path, 'r', encoding=self.encoding) as fh:
+            for line in fh:
+                if self._closed:
+                    break
+                event = parse_event_line(line)
+                if event is None:
+                    continue
+                yield event
+                await asyncio.sleep(delay)
+
+
+class FileTailSource(EventSource):
+    """Śledzi dopisywane linie pliku (jak tail -f); obsługuje obcięcie/rotację pliku."""
+
+    def __init__(self, path: str, from_start: bool = False, poll_interval: float = 0.25,
+                 encoding: str = 'utf-8'):
+        super().__init__()
+        self.path = path
+        self.from_start = from_start
+        self.poll_interval = poll_interval
+        self.encoding = encoding
+
+    async def stream(self) -> AsyncIterator[Dict[str, Any]]:
+        with open(self.path, 'r', encoding=self.encoding) as fh:
+            if not self.from_start:
+                fh.seek(0, os.SEEK_END)
+            partial = ''
+            while not self._closed:
+                line = fh.readline()
+                if not line:
+                    if os.path.getsize(self.path) < fh.tell():
+                        fh.seek(0)
+                        partial = ''
+                    await asyncio.sleep(self.poll_interval)
+                    continue
+                if not line.endswith('\n'):
+                    partial += line
+                    continue
+                event = parse_event_line(partial + line)
+                partial = ''
+                if event is not None:
+                    yield event
+
+
+def _offset_and_metadata(offset: int):
+    try:
+        from kafka.structs import OffsetAndMetadata
+    except ImportError:
+        from .inmemory_broker import OffsetAndMetadata
+    try:
+        return OffsetAndMetadata(offset, None)
+    except TypeError:
+        # kafka-python >= 2.1 dodaje leader_epoch
+        return OffsetAndMetadata(offset, None, -1)
+
+
+class KafkaEventSource(EventSource):
+    """
+    Źródło Kafka (kafka-python lub zgodny konsument, np. InMemoryBroker.consumer()).
+
+    Offsety są zatwierdzane ręcznie po ack(): dla każdej partycji do najniższego
+    nieprzetworzonego offsetu, więc zdarzenia nie giną przy awarii (at-least-once).
+    Konsument kafka-python nie jest wątkowo bezpieczny, dlatego commit odbywa się
+    w pętli stream() przed kolejnym poll(), nigdy równolegle z nim.
+    """
+
+    def __init__(self, topic: str = 'migi_tasks', bootstrap_servers: str = 'localhost:9092',
+                 group_id: str = 'double_pipeline', consumer: Any = None,
+                 max_poll_records: int = 100, poll_timeout_ms: int = 200,
+                 stop_when_idle: bool = False):
+        super().__init__()
+        if consumer is None:
+            from kafka import KafkaConsumer
+            consumer = KafkaConsumer(
+                topic,
+                bootstrap_servers=bootstrap_servers,
+                group_id=group_id,
+                enable_auto_commit=False,
+                max_poll_records=max_poll_records,
+                value_deserializer=lambda x: json.loads(x.decode('utf-8'))
+            )
+        self.consumer = consumer
+        self.max_poll_records = max_poll_records
+        self.poll_timeout_ms = poll_timeout_ms
+        self.stop_when_idle = stop_when_idle
+        self._pending: Dict[Any, Set[int]] = defaultdict(set)
+        self._highest: Dict[Any, int] = {}
+        self._to_commit: Set[Any] = set()
+        self.commits = 0
+
+    async def stream(self) -> AsyncIterator[Dict[str, Any]]:
+        while not self._closed:
+            await self._commit_acked()
+            batch = await asyncio.to_thread(self.consumer.poll, self.poll_timeout_ms, self.max_poll_records)
+            if not batch:
+                if self.stop_when_idle:
+                    break
+                continue
+            for tp, records in batch.items():
+                for record in records:
+                    event = {**normalize_event(record.value), '_kafka': (tp, record.offset)}
+                    self._pending[tp].add(record.offset)
+                    self._highest[tp] = max(record.offset, self._highest.get(tp, -1))
+                    yield event
+
+    async def ack(self, events: List[Dict[str, Any]]) -> None:
+        for event in events:
+            position = event.get('_kafka')
+            if position is None:
+                continue
+            tp, offset = position
+            self._pending[tp].discard(offset)
+            self._to_commit.add(tp)
+
+    async def _commit_acked(self) -> None:
+        if not self._to_commit:
+            return
+        touched, self._to_commit = self._to_commit, set()
+        offsets = {
+            tp: _offset_and_metadata(min(self._pending[tp]) if self._pending[tp] else self._highest[tp] + 1)
+            for tp in touched
+        }
+        try:
+            await asyncio.to_thread(self.consumer.commit, offsets)
+            self.commits += 1
+        except Exception as e:
+            logging.error(f"Kafka commit error: {e}")
+
+    async def close(self) -> None:
+        await super().close()
+        await self._commit_acked()
+        await asyncio.to_thread(self.consumer.close)
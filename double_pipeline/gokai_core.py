@@ -25,11 +25,12 @@ class StepOutput:
 
 def run_cycle(events: Iterator[str], base_params: BaseParams, matrix_weights: list, 
              alpha_schedule: list, max_fib_n: int, start_n: int = 1, 
-             start_level: int = 0, personality: dict = None, modes: dict = None):
+             start_level: int = 0, personality: dict = None, modes: dict = None,
+             stm: ShortTermMemory = None, ltm: LongTermMemory = None, epi: EpisodicMemory = None):
     level, n = start_level, start_n
-    stm = ShortTermMemory(maxlen=128)
-    ltm = LongTermMemory()
-    epi = EpisodicMemory()
+    stm = stm if stm is not None else ShortTermMemory(maxlen=128)
+    ltm = ltm if ltm is not None else LongTermMemory()
+    epi = epi if epi is not None else EpisodicMemory()
     success_hist = []
     extra_mods = {}
     
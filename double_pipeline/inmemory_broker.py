@@ -0,0 +1,272 @@
+import threading
+import time
+from collections import namedtuple, defaultdict
+from typing import Any, Callable, Dict, List, Optional
+
+# Podzbiór struktur kafka-python, wystarczający do testów bez brokera
+TopicPartition = namedtuple('TopicPartition', ['topic', 'partition'])
+OffsetAndMetadata = namedtuple('OffsetAndMetadata', ['offset', 'metadata'])
+ConsumerRecord = namedtuple('ConsumerRecord', ['topic', 'partition', 'offset', 'timestamp', 'key', 'value'])
+RecordMetadata = namedtuple('RecordMetadata', ['topic', 'partition', 'offset'])
+
+
+class InMemoryBroker:
+    """
+    Lokalny zamiennik brokera Kafka (jeden proces, wiele wątków).
+
+    Udostępnia producer()/consumer() zgodne z używanym podzbiorem API kafka-python:
+    send/flush/close oraz poll/commit/close z grupami konsumentów. Opcjonalne
+    opóźnienia (połączenie, pojedyncze żądanie) pozwalają benchmarkować wzorce
+    użycia klienta bez prawdziwej sieci.
+    """
+
+    def __init__(self, partitions: int = 1, connect_latency: float = 0.0, request_latency: float = 0.0):
+        self.partitions = partitions
+        self.connect_latency = connect_latency
+        self.request_latency = request_latency
+        self._logs: Dict[TopicPartition, List[ConsumerRecord]] = defaultdict(list)
+        self._committed: Dict[str, Dict[TopicPartition, int]] = defaultdict(dict)
+        self._cond = threading.Condition()
+        self.send_calls = 0
+        self.flush_calls = 0
+        self.commit_calls = 0
+        self.connections = 0
+        self.produce_requests = 0
+
+    def _connect(self) -> None:
+        self.connections += 1
+        if self.connect_latency:
+            time.sleep(self.connect_latency)
+
+    def _request(self) -> None:
+        if self.request_latency:
+            time.sleep(self.request_latency)
+
+    def producer(self, **config) -> 'InMemoryProducer':
+        return InMemoryProducer(self, **config)
+
+    def consumer(self, *topics: str, **config) -> 'InMemoryConsumer':
+        return InMemoryConsumer(self, *topics, **config)
+
+    def _append(self, topic: str, key: Optional[bytes], value: Any, partition: Optional[int]) -> RecordMetadata:
+        if partition is None:
+            partition = (hash(key) if key is not None else self.send_calls) % self.partitions
+        tp = TopicPartition(topic, partition)
+        with self._cond:
+            log = self._logs[tp]
+            record = ConsumerRecord(topic, partition, len(log), int(time.time() * 1000), key, value)
+            log.append(record)
+            self.send_calls += 1
+            self._cond.notify_all()
+        return RecordMetadata(topic, partition, record.offset)
+
+    def topic_partitions(self, topic: str) -> List[TopicPartition]:
+        return [TopicPartition(topic, p) for p in range(self.partitions)]
+
+    def end_offset(self, tp: TopicPartition) -> int:
+        with self._cond:
+            return len(self._logs[tp])
+
+    def committed(self, group_id: str, tp: TopicPartition) -> Optional[int]:
+        with self._cond:
+            return self._committed[group_id].get(tp)
+
+
+class _DeliveryFuture:
+    """Minimalny odpowiednik FutureRecordMetadata (callbacki dostarczenia)."""
+
+    def __init__(self):
+        self._callbacks: List[Callable] = []
+        self._errbacks: List[Callable] = []
+        self.value = None
+        self.exception = None
+        self.is_done = False
+
+    def add_callback(self, fn: Callable, *args, **kwargs) -> '_DeliveryFuture':
+        if self.is_done and self.exception is None:
+            fn(*args, self.value, **kwargs)
+        else:
+            self._callbacks.append(lambda v: fn(*args, v, **kwargs))
+        return self
+
+    def add_errback(self, fn: Callable, *args, **kwargs) -> '_DeliveryFuture':
+        if self.is_done and self.exception is not None:
+            fn(*args, self.exception, **kwargs)
+        else:
+            self._errbacks.append(lambda e: fn(*args, e, **kwargs))
+        return self
+
+    def success(self, value) -> None:
+        self.value, self.is_done = value, True
+        for cb in self._callbacks:
+            cb(value)
+
+    def failure(self, exc: Exception) -> None:
+        self.exception, self.is_done = exc, True
+        for eb in self._errbacks:
+            eb(exc)
+
+    def get(self, timeout: Optional[float] = None):
+        if self.exception is not None:
+            raise self.exception
+        return self.value
+
+
+class InMemoryProducer:
+    def __init__(self, broker: InMemoryBroker, value_serializer: Callable = None,
+                 key_serializer: Callable = None, linger_ms: int = 0, batch_size: int = 16384, **_ignored):
+        self.broker = broker
+        self.value_serializer = value_serializer
+        self.key_serializer = key_serializer
+        self.linger_ms = linger_ms
+        self.batch_size = batch_size
+        self._pending: List[tuple] = []
+        self._pending_bytes = 0
+        self._first_pending_at = 0.0
+        self._lock = threading.Lock()
+        self._linger_timer: Optional[threading.Timer] = None
+        self.closed = False
+        broker._connect()
+
+    def send(self, topic: str, value: Any = None, key: Any = None, partition: Optional[int] = None) -> _DeliveryFuture:
+        if self.closed:
+            raise RuntimeError('Producer is closed')
+        if self.value_serializer is not None:
+            value = self.value_serializer(value)
+        if self.key_serializer is not None and key is not None:
+            key = self.key_serializer(key)
+        future = _DeliveryFuture()
+        now = time.monotonic()
+        with self._lock:
+            if not self._pending:
+                self._first_pending_at = now
+                if self.linger_ms:
+                    # Jak wątek wysyłający kafka-python: partia odchodzi najpóźniej po linger_ms
+                    self._linger_timer = threading.Timer(self.linger_ms / 1000.0, self._drain)
+                    self._linger_timer.daemon = True
+                    self._linger_timer.start()
+            self._pending.append((topic, key, value, partition, future))
+            self._pending_bytes += len(value) if isinstance(value, (bytes, bytearray)) else 1
+            drain = (not self.linger_ms or self._pending_bytes >= self.batch_size
+                     or (now - self._first_pending_at) * 1000.0 >= self.linger_ms)
+        if drain:
+            self._drain()
+        return future
+
+    def _drain(self) -> None:
+        with self._lock:
+            pending, self._pending = self._pending, []
+            self._pending_bytes = 0
+            if self._linger_timer is not None:
+                self._linger_timer.cancel()
+                self._linger_timer = None
+        if not pending:
+            return
+        self.broker._request()
+        self.broker.produce_requests += 1
+        for topic, key, value, partition, future in pending:
+            try:
+                future.success(self.broker._append(topic, key, value, partition))
+            except Exception as e:
+                future.failure(e)
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        self.broker.flush_calls += 1
+        self._drain()
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        self.flush()
+        self.closed = True
+
+
+class InMemoryConsumer:
+    def __init__(self, broker: InMemoryBroker, *topics: str, group_id: str = None,
+                 value_deserializer: Callable = None, key_deserializer: Callable = None,
+                 auto_offset_reset: str = 'earliest', enable_auto_commit: bool = False,
+                 max_poll_records: int = 500, **_ignored):
+        self.broker = broker
+        self.topics = topics
+        self.group_id = group_id or 'default'
+        self.value_deserializer = value_deserializer
+        self.key_deserializer = key_deserializer
+        self.auto_offset_reset = auto_offset_reset
+        self.enable_auto_commit = enable_auto_commit
+        self.max_poll_records = max_poll_records
+        self._positions: Dict[TopicPartition, int] = {}
+        self.closed = False
+        broker._connect()
+        self.assign([tp for topic in topics for tp in broker.topic_partitions(topic)])
+
+    def assign(self, partitions: List[TopicPartition]) -> None:
+        self._positions = {}
+        for tp in partitions:
+            committed = self.broker.committed(self.group_id, tp)
+            if committed is not None:
+                self._positions[tp] = committed
+            else:
+                self._positions[tp] = 0 if self.auto_offset_reset == 'earliest' else self.broker.end_offset(tp)
+
+    def seek(self, partition: TopicPartition, offset: int) -> None:
+        self._positions[partition] = offset
+
+    def assignment(self) -> set:
+        return set(self._positions)
+
+    def poll(self, timeout_ms: int = 0, max_records: Optional[int] = None) -> Dict[TopicPartition, List[ConsumerRecord]]:
+        limit = max_records or self.max_poll_records
+        deadline = time.monotonic() + timeout_ms / 1000.0
+        with self.broker._cond:
+            while True:
+                batch = self._collect(limit)
+                remaining = deadline - time.monotonic()
+                if batch or remaining <= 0 or self.closed:
+                    break
+                self.broker._cond.wait(remaining)
+        if batch:
+            self.broker._request()
+        if self.enable_auto_commit and batch:
+            self.commit()
+        return batch
+
+    def _collect(self, limit: int) -> Dict[TopicPartition, List[ConsumerRecord]]:
+        batch: Dict[TopicPartition, List[ConsumerRecord]] = {}
+        for tp, position in self._positions.items():
+            if limit <= 0:
+                break
+            records = self.broker._logs[tp][position:position + limit]
+            if not records:
+                continue
+            self._positions[tp] = position + len(records)
+            limit -= len(records)
+            batch[tp] = [self._deserialize(r) for r in records]
+        return batch
+
+    def _deserialize(self, record: ConsumerRecord) -> ConsumerRecord:
+        value, key = record.value, record.key
+        if self.value_deserializer is not None and value is not None:
+            value = self.value_deserializer(value)
+        if self.key_deserializer is not None and key is not None:
+            key = self.key_deserializer(key)
+        return record._replace(key=key, value=value)
+
+    def commit(self, offsets: Optional[Dict[TopicPartition, OffsetAndMetadata]] = None) -> None:
+        if offsets is None:
+            offsets = {tp: OffsetAndMetadata(pos, None) for tp, pos in self._positions.items()}
+        self.broker._request()
+        with self.broker._cond:
+            group = self.broker._committed[self.group_id]
+            for tp, meta in offsets.items():
+                group[tp] = meta.offset if hasattr(meta, 'offset') else int(meta)
+            self.broker.commit_calls += 1
+
+    def close(self, autocommit: bool = True) -> None:
+        if autocommit and self.enable_auto_commit:
+            self.commit()
+        self.closed = True
+        with self.broker._cond:
+            self.broker._cond.notify_all()
+
+    def __iter__(self):
+        while not self.closed:
+            for records in self.poll(timeout_ms=100).values():
+                yield from records
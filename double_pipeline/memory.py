@@ -1,36 +1,161 @@
+import json
+from array import array
 from collections import deque
-from typing import Any
+from typing import Any, Dict, Iterator, Optional
 
 class ShortTermMemory:
     def __init__(self, maxlen: int = 128):
         self.data = deque(maxlen=maxlen)
         self.maxlen = maxlen
-    
+        # Indeks: najnowsza wartość i liczba wpisów per klucz w oknie deque
+        self._latest: Dict[str, Any] = {}
+        self._counts: Dict[str, int] = {}
+
     def put(self, key: str, value: Any) -> None:
+        if self.maxlen and len(self.data) == self.maxlen:
+            evicted = self.data[0]["key"]
+            self._counts[evicted] -= 1
+            if not self._counts[evicted]:
+                del self._counts[evicted]
+                del self._latest[evicted]
         self.data.append({"key": key, "value": value})
-    
+        self._latest[key] = value
+        self._counts[key] = self._counts.get(key, 0) + 1
+
     def get_last(self, key: str, default: Any = None) -> Any:
-        for item in reversed(self.data):
-            if item["key"] == key:
-                return item["value"]
-        return default
+        return self._latest.get(key, default)
 
 class LongTermMemory:
     def __init__(self):
         self.storage = {}
-    
+
     def upsert(self, key: str, value: Any) -> None:
         self.storage[key] = value
-    
+
     def get(self, key: str, default: Any = None) -> Any:
         return self.storage.get(key, default)
 
 class EpisodicMemory:
-    def __init__(self):
-        self.episodes = []
-    
-    def add(self, **kwargs) -> None:
-        self.episodes.append(kwargs)
-    
+    """
+    Ograniczony bufor kołowy epizodów w układzie kolumnowym (typowane tablice).
+
+    Po zapełnieniu najstarsze epizody są nadpisywane; z spill_path każdy pełny
+    obrót bufora jest dopisywany do pliku JSONL, więc pamięć procesu pozostaje stała.
+    """
+    FIELDS = ("level", "stage", "n", "success", "conf")
+
+    def __init__(self, capacity: int = 4096, spill_path: Optional[str] = None):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self.spill_path = spill_path
+        self.level = array("q", [0]) * capacity
+        self.stage = array("i", [0]) * capacity
+        self.n = array("q", [0]) * capacity
+        self.success = array("d", [0.0]) * capacity
+        self.conf = array("d", [0.0]) * capacity
+        self._head = 0
+        self._size = 0
+        self._success_sum = 0.0
+        self._conf_sum = 0.0
+        self.total_added = 0
+        self.spilled_count = 0
+
+    def add(self, level: int = 0, stage: int = 0, n: int = 0,
+            success: float = 0.0, conf: float = 0.0, **_ignored) -> None:
+        i = self._head
+        if self._size == self.capacity:
+            if i == 0 and self.spill_path:
+                self._spill()
+            self._success_sum -= self.success[i]
+            self._conf_sum -= self.conf[i]
+        else:
+            self._size += 1
+        self.level[i] = level
+        self.stage[i] = stage
+        self.n[i] = n
+        self.success[i] = success
+        self.conf[i] = conf
+        self._success_sum += success
+        self._conf_sum += conf
+        self._head = (i + 1) % self.capacity
+        self.total_added += 1
+        if self._head == 0:
+            # Pełny obrót - przelicz sumy, by nie kumulować błędu zmiennoprzecinkowego
+            self._success_sum = sum(self.success)
+            self._conf_sum = sum(self.conf)
+
+    def _spill(self) -> None:
+        # Wywoływane gdy głowica wraca na 0 - bufor jest wtedy w kolejności chronologicznej
+        with open(self.spill_path, "a", encoding="utf-8") as fh:
+            for i in range(self.capacity):
+                fh.write(json.dumps(self._record(i)) + "\n")
+        self.spilled_count += self.capacity
+
+    def _record(self, i: int) -> Dict[str, Any]:
+        return {"level": self.level[i], "stage": self.stage[i], "n": self.n[i],
+                "success": self.success[i], "conf": self.conf[i]}
+
+    def _indices(self, n: Optional[int] = None) -> range:
+        count = self._size if n is None else max(0, min(n, self._size))
+        start = self._head - count
+        return range(start, self._head)
+
     def get_recent(self, n: int = 10) -> list:
-        return self.episodes[-n:]
+        return [self._record(i % self.capacity) for i in self._indices(n)]
+
+    @property
+    def episodes(self) -> list:
+        return self.get_recent(self._size)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _column_sum(self, column: array, window: int) -> float:
+        start = self._head - window
+        if start >= 0:
+            return sum(column[start:self._head])
+        return sum(column[start:]) + sum(column[:self._head])
+
+    def mean_success(self, window: Optional[int] = None) -> float:
+        if not self._size:
+            return 0.0
+        if window is None or window >= self._size:
+            return self._success_sum / self._size
+        window = max(1, window)
+        return self._column_sum(self.success, window) / window
+
+    def mean_confidence(self, window: Optional[int] = None) -> float:
+        if not self._size:
+            return 0.0
+        if window is None or window >= self._size:
+            return self._conf_sum / self._size
+        window = max(1, window)
+        return self._column_sum(self.conf, window) / window
+
+    def window_stats(self, window: Optional[int] = None) -> Dict[str, Any]:
+        idx = self._indices(window)
+        count = len(idx)
+        if not count:
+            return {"count": 0, "mean_success": 0.0, "mean_conf": 0.0,
+                    "min_success": 0.0, "max_success": 0.0, "last_level": 0}
+        successes = [self.success[i % self.capacity] for i in idx]
+        return {
+            "count": count,
+            "mean_success": self.mean_success(count),
+            "mean_conf": self.mean_confidence(count),
+            "min_success": min(successes),
+            "max_success": max(successes),
+            "last_level": self.level[(self._head - 1) % self.capacity],
+        }
+
+    def iter_spilled(self) -> Iterator[Dict[str, Any]]:
+        if not self.spill_path:
+            return
+        try:
+            with open(self.spill_path, "r", encoding="utf-8") as fh:
+                for line in fh:
+                    if line.strip():
+                        yield json.loads(line)
+        except FileNotFoundError:
+            return
@@ -0,0 +1,153 @@
+import queue
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterator, Optional
+from .gokai_core import run_cycle, StepOutput
+from .memory import ShortTermMemory, LongTermMemory, EpisodicMemory
+from .utils import BaseParams
+from .config import GOKAI_CONFIG
+
+
+class PipelineSession:
+    """
+    Jedna długo żyjąca instancja run_cycle zasilana kolejką zdarzeń.
+
+    Pamięci (STM/LTM/Episodic), modulatory osobowości i macierz wag żyją
+    tak długo jak sesja, więc rebalans macierzy działa między wiadomościami.
+    """
+
+    def __init__(self, session_id: str, base_params: BaseParams, matrix_weights: list,
+                 alpha_schedule: list, max_fib_n: int, start_n: int = 1,
+                 start_level: int = 0, personality: dict = None, modes: dict = None):
+        self.session_id = session_id
+        self.matrix_weights = list(matrix_weights)
+        self.stm = ShortTermMemory(maxlen=128)
+        self.ltm = LongTermMemory()
+        self.epi = EpisodicMemory()
+        self.steps = 0
+        self.created_at = time.monotonic()
+        self.last_used = self.created_at
+        self._queue: "queue.Queue[Dict[str, Any]]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._cycle = run_cycle(
+            self._events(), base_params, self.matrix_weights, alpha_schedule, max_fib_n,
+            start_n=start_n, start_level=start_level, personality=personality, modes=modes,
+            stm=self.stm, ltm=self.ltm, epi=self.epi
+        )
+
+    @classmethod
+    def from_config(cls, session_id: str, config: Dict[str, Any] = None,
+                    start_n: int = 1, start_level: int = 0) -> 'PipelineSession':
+        """Tworzy sesję z parametrami z GOKAI_CONFIG (lub przekazanej konfiguracji)."""
+        config = config or GOKAI_CONFIG
+        return cls(
+            session_id, BaseParams(**config['base_params']), config['MATRIX_347743'],
+            config['alpha_schedule'], config['max_fibonacci_n'], start_n=start_n,
+            start_level=start_level, personality=config.get('personality'), modes=config.get('modes')
+        )
+
+    def _events(self) -> Iterator[Dict[str, Any]]:
+        # submit() zawsze wkłada zdarzenie przed next(), więc get() nie czeka
+        while True:
+            yield self._queue.get()
+
+    def submit(self, event: Dict[str, Any]) -> StepOutput:
+        """Przekazuje zdarzenie do run_cycle i zwraca kolejny krok spirali."""
+        # Zdarzenie przekazujemy jako dict - pusty payload nie przerwie etapu
+        if not isinstance(event, dict):
+            event = {'payload': str(event)}
+        with self._lock:
+            self._queue.put(event)
+            self.last_used = time.monotonic()
+            try:
+                result = next(self._cycle)
+            except StopIteration:
+                # run_cycle zakończył się wcześniej (błąd albo close()) - sesja jest martwa
+                raise RuntimeError(f"Pipeline session {self.session_id} is closed") from None
+            self.steps += 1
+            return result
+
+    def idle_seconds(self, now: Optional[float] = None) -> float:
+        return (now if now is not None else time.monotonic()) - self.last_used
+
+    def close(self) -> None:
+        with self._lock:
+            self._cycle.close()
+
+
+class PipelineSessionManager:
+    """
+    Rejestr sesji PipelineSession per użytkownik/sesja z eksmisją po bezczynności.
+    """
+
+    def __init__(self, session_factory: Callable[[str], PipelineSession],
+                 idle_ttl: float = 900.0, max_sessions: int = 1024):
+        self.session_factory = session_factory
+        self.idle_ttl = idle_ttl
+        self.max_sessions = max_sessions
+        self._sessions: "OrderedDict[str, PipelineSession]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.evicted_count = 0
+
+    def get(self, session_id: str) -> PipelineSession:
+        """Zwraca istniejącą sesję albo tworzy nową (LRU + TTL)."""
+        with self._lock:
+            self._evict_idle_locked()
+            session = self._sessions.get(session_id)
+            if session is None:
+                session = self.session_factory(session_id)
+                self._sessions[session_id] = session
+                while len(self._sessions) > self.max_sessions:
+                    _, oldest = self._sessions.popitem(last=False)
+                    oldest.close()
+                    self.evicted_count += 1
+            else:
+                self._sessions.move_to_end(session_id)
+            return session
+
+    def submit(self, session_id: str, event: Dict[str, Any]) -> StepOutput:
+        session = self.get(session_id)
+        try:
+            return session.submit(event)
+        except Exception:
+            # Wyjątek z run_cycle kończy generator - następne zdarzenie dostanie nową sesję
+            with self._lock:
+                if self._sessions.get(session_id) is session:
+                    del self._sessions[session_id]
+            raise
+
+    def evict_idle(self) -> int:
+        with self._lock:
+            return self._evict_idle_locked()
+
+    def _evict_idle_locked(self) -> int:
+        now = time.monotonic()
+        expired = [sid for sid, s in self._sessions.items() if s.idle_seconds(now) > self.idle_ttl]
+        for sid in expired:
+            self._sessions.pop(sid).close()
+        self.evicted_count += len(expired)
+        return len(expired)
+
+    def drop(self, session_id: str) -> bool:
+        with self._lock:
+            session = self._sessions.pop(session_id, None)
+        if session is None:
+            return False
+        session.close()
+        return True
+
+    def __contains__(self, session_id: str) -> bool:
+        return session_id in self._sessions
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'active_sessions': len(self._sessions),
+                'evicted_sessions': self.evicted_count,
+                'idle_ttl': self.idle_ttl,
+                'max_sessions': self.max_sessions,
+            }
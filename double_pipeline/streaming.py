@@ -0,0 +1,151 @@
+import asyncio
+import inspect
+import logging
+import threading
+import zlib
+from typing import Any, Callable, Dict, List, Optional
+from .event_sources import EventSource, normalize_event
+from .main import create_shared_state, spiral_thought_logika
+from .session import PipelineSession, PipelineSessionManager
+from .synergy_orchestrator import SynergyOrchestrator
+
+_STOP = object()
+
+
+class StreamingPipeline:
+    """
+    Strumieniowy driver SYNERGY + run_cycle dla dowolnego EventSource.
+
+    Zdarzenia trafiają do max_concurrency partycji (po session_id, więc kolejność
+    w sesji jest zachowana) przez ograniczone kolejki - pełna kolejka wstrzymuje
+    odczyt ze źródła (backpressure). Każdy worker pobiera partie do batch_size
+    zdarzeń i wykonuje kroki spirali poza pętlą zdarzeń.
+    """
+
+    def __init__(self, source: EventSource,
+                 sessions: Optional[PipelineSessionManager] = None,
+                 shared_state: Optional[Dict[str, Any]] = None,
+                 synergy: Optional[SynergyOrchestrator] = None,
+                 buffer_size: int = 256, batch_size: int = 16, batch_timeout: float = 0.01,
+                 max_concurrency: int = 4, on_result: Optional[Callable] = None,
+                 default_session: str = 'stream'):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
+        self.source = source
+        self.shared_state = shared_state if shared_state is not None else create_shared_state()
+        self.synergy = synergy or SynergyOrchestrator(self.shared_state)
+        self.sessions = sessions or PipelineSessionManager(PipelineSession.from_config)
+        self.buffer_size = buffer_size
+        self.batch_size = max(1, batch_size)
+        self.batch_timeout = batch_timeout
+        self.max_concurrency = max_concurrency
+        self.on_result = on_result
+        self.default_session = default_session
+        # SYNERGY i shared_state są współdzielone między workerami
+        self._state_lock = threading.Lock()
+        self.stats = {
+            'received': 0, 'processed': 0, 'errors': 0,
+            'batches': 0, 'backpressure_waits': 0
+        }
+
+    def _partition(self, event: Dict[str, Any]) -> int:
+        session_id = str(event.get('session_id') or self.default_session)
+        return zlib.crc32(session_id.encode('utf-8')) % self.max_concurrency
+
+    async def run(self, max_events: Optional[int] = None) -> Dict[str, Any]:
+        """Przetwarza źródło do wyczerpania (lub max_events) i zwraca statystyki."""
+        per_queue = max(1, self.buffer_size // self.max_concurrency)
+        queues = [asyncio.Queue(maxsize=per_queue) for _ in range(self.max_concurrency)]
+        workers = [asyncio.create_task(self._worker(q)) for q in queues]
+        stream = self.source.stream()
+        try:
+            async for event in stream:
+                event = normalize_event(event)
+                queue = queues[self._partition(event)]
+                if queue.full():
+                    self.stats['backpressure_waits'] += 1
+                await queue.put(event)
+                self.stats['received'] += 1
+                if max_events is not None and self.stats['received'] >= max_events:
+                    break
+        finally:
+            await stream.aclose()
+            for queue in queues:
+                await queue.put(_STOP)
+            await asyncio.gather(*workers)
+        return self.get_stats()
+
+    async def _next_batch(self, queue: asyncio.Queue) -> List[Any]:
+        batch = [await queue.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.batch_timeout
+        while batch[-1] is not _STOP and len(batch) < self.batch_size:
+            try:
+                batch.append(queue.get_nowait())
+                continue
+            except asyncio.QueueEmpty:
+                pass
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _worker(self, queue: asyncio.Queue) -> None:
+        while True:
+            batch = await self._next_batch(queue)
+            stop = batch[-1] is _STOP
+            if stop:
+                batch.pop()
+            if batch:
+                results = await asyncio.to_thread(self._process_batch, batch)
+                self.stats['batches'] += 1
+                for result in results:
+                    await self._emit(result)
+                await self.source.ack(batch)
+            if stop:
+                break
+
+    def _process_batch(self, batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return [self._process_event(event) for event in batch]
+
+    def _process_event(self, event: Dict[str, Any]) -> Dict[str, Any]:
+        session_id = str(event.get('session_id') or self.default_session)
+        try:
+            with self._state_lock:
+                strategy = self.synergy.orchestrate(event)
+            step = None
+            if 'GOK:AI' in strategy['pipelines']:
+                step = self.sessions.submit(session_id, event)
+            with self._state_lock:
+                if step is not None:
+                    self.shared_state['last_confidence'] = step.success_pct / 100
+                    self.shared_state['last_success_pct'] = step.success_pct
+                    self.shared_state['level'] = step.level
+                    self.shared_state['n'] = step.n + 1
+                logika = None
+                if 'LOGIKA:AI' in strategy['pipelines']:
+                    logika = spiral_thought_logika(self.shared_state, strategy)
+                self.stats['processed'] += 1
+            return {'session_id': session_id, 'event': event, 'strategy': strategy,
+                    'step': step, 'logika': logika, 'error': None}
+        except Exception as e:
+            logging.error(f"Streaming pipeline error: {e}")
+            with self._state_lock:
+                self.stats['errors'] += 1
+            return {'session_id': session_id, 'event': event, 'strategy': None,
+                    'step': None, 'logika': None, 'error': str(e)}
+
+    async def _emit(self, result: Dict[str, Any]) -> None:
+        if self.on_result is None:
+            return
+        outcome = self.on_result(result)
+        if inspect.isawaitable(outcome):
+            await outcome
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, 'sessions': self.sessions.get_stats(),
+                'synergy': self.synergy.get_analytics()}
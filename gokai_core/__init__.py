@@ -1 +1 @@
-__all__ = ['utils','psyche','engine','activator','pipeline','memory','adapt','traits','multimodal','vision']
+__all__ = ['utils','psyche','engine','activator','pipeline','memory','adapt','traits','multimodal','vision','config_service']
@@ -0,0 +1,119 @@
+import logging
+import os
+import threading
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
+from .main import load_config
+
+DEFAULT_CONFIG_PATH = os.path.join(os.path.dirname(__file__), 'config.yml')
+
+
+def freeze(value: Any) -> Any:
+    """Rekurencyjnie zamienia dict -> MappingProxyType, list -> tuple."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: freeze(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    return value
+
+
+class ConfigService:
+    """
+    Konfiguracja GOKAI parsowana raz i serwowana jako niemutowalny snapshot.
+
+    Wątek obserwatora sprawdza mtime pliku co poll_interval sekund i przy zmianie
+    parsuje go ponownie, po czym podmienia referencję snapshotu (atomowo). Błędny
+    plik nie zastępuje ostatniej poprawnej konfiguracji. Odczyt snapshot() nie
+    wykonuje żadnego I/O.
+    """
+
+    def __init__(self, path: Optional[str] = None, poll_interval: float = 1.0):
+        self.path = path or DEFAULT_CONFIG_PATH
+        self.poll_interval = poll_interval
+        self.version = 0
+        self.reloads = 0
+        self.errors = 0
+        self._snapshot: Optional[Mapping[str, Any]] = None
+        self._mtime: Optional[int] = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.reload()
+
+    def _stat_mtime(self) -> Optional[int]:
+        try:
+            return os.stat(self.path).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def reload(self) -> bool:
+        """Parsuje plik i podmienia snapshot; zwraca True, jeśli konfiguracja się zmieniła."""
+        with self._lock:
+            mtime = self._stat_mtime()
+            if mtime is None:
+                self._mtime = None
+                return False
+            try:
+                snapshot = freeze(load_config(self.path) or {})
+            except Exception as e:
+                self.errors += 1
+                logging.error(f"Config reload failed ({self.path}): {e}")
+                self._mtime = mtime
+                return False
+            self._mtime = mtime
+            self._snapshot = snapshot
+            self.version += 1
+            if self.version > 1:
+                self.reloads += 1
+            return True
+
+    def check(self) -> bool:
+        """Przeładowuje konfigurację, jeśli zmienił się mtime pliku."""
+        if self._stat_mtime() != self._mtime:
+            return self.reload()
+        return False
+
+    def snapshot(self) -> Optional[Mapping[str, Any]]:
+        """Aktualny niemutowalny snapshot (None, jeśli pliku nigdy nie wczytano)."""
+        return self._snapshot
+
+    @property
+    def available(self) -> bool:
+        return self._snapshot is not None
+
+    def start(self) -> 'ConfigService':
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._watch, name='gokai-config-watch', daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _watch(self) -> None:
+        while not self._stop.wait(self.poll_interval):
+            try:
+                self.check()
+            except Exception as e:
+                logging.error(f"Config watch error: {e}")
+
+    def get_stats(self) -> dict:
+        return {'path': self.path, 'available': self.available, 'version': self.version,
+                'reloads': self.reloads, 'errors': self.errors}
+
+
+_config_service: Optional[ConfigService] = None
+_config_service_lock = threading.Lock()
+
+
+def get_config_service(path: Optional[str] = None, poll_interval: float = 1.0) -> ConfigService:
+    """Zwraca współdzieloną usługę konfiguracji (tworzoną raz na proces)."""
+    global _config_service
+    with _config_service_lock:
+        if _config_service is None:
+            _config_service = ConfigService(path, poll_interval)
+        return _config_service
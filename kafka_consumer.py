@@ -1,30 +1,135 @@
-from kafka import KafkaConsumer
 import json
 import logging
 import random
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    from kafka import KafkaConsumer
+    KAFKA_AVAILABLE = True
+except ImportError:
+    KafkaConsumer = None
+    KAFKA_AVAILABLE = False
 
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 
-def process_migi_tasks(bootstrap_servers: str = 'localhost:9092'):
+MIGI_TASKS_TOPIC = 'migi_tasks'
+
+
+def simulate_contributions(tasks: List[str]) -> List[float]:
+    """Symulacja odpowiedzi deweloperów MIGI 7G dla partii zadań."""
+    return [random.uniform(0.7, 0.95) for _ in tasks]
+
+
+class MigiTaskConsumerGroup:
     """
-    Odbiera i przetwarza zadania z sieci MIGI 7G.
+    Grupa workerów konsumujących zadania MIGI 7G partiami.
+
+    Każdy worker ma własnego konsumenta (kafka-python nie jest wątkowo bezpieczny),
+    przetwarza do batch_size rekordów naraz i zatwierdza offsety dopiero po
+    zakończeniu całej partii (at-least-once).
     """
-    try:
-        consumer = KafkaConsumer(
-            'migi_tasks',
-            bootstrap_servers=bootstrap_servers,
+
+    def __init__(self, bootstrap_servers: str = 'localhost:9092', group_id: str = 'migi_7g_workers',
+                 topic: str = MIGI_TASKS_TOPIC, workers: int = 2, batch_size: int = 100,
+                 poll_timeout_ms: int = 500,
+                 handler: Callable[[List[str]], List[float]] = simulate_contributions,
+                 consumer_factory: Optional[Callable[[int], Any]] = None,
+                 on_batch: Optional[Callable[[List[str], List[float]], None]] = None):
+        self.bootstrap_servers = bootstrap_servers
+        self.group_id = group_id
+        self.topic = topic
+        self.workers = workers
+        self.batch_size = batch_size
+        self.poll_timeout_ms = poll_timeout_ms
+        self.handler = handler
+        self.on_batch = on_batch
+        self.consumer_factory = consumer_factory or self._default_consumer
+        self.stats = {'processed': 0, 'batches': 0, 'commits': 0, 'errors': 0}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+
+    def _default_consumer(self, worker_index: int):
+        if not KAFKA_AVAILABLE:
+            raise ImportError("kafka-python is not installed")
+        return KafkaConsumer(
+            self.topic,
+            bootstrap_servers=self.bootstrap_servers,
+            group_id=self.group_id,
+            enable_auto_commit=False,
+            max_poll_records=self.batch_size,
             value_deserializer=lambda x: json.loads(x.decode('utf-8'))
         )
-        for message in consumer:
-            task = message.value['task']
-            logging.info(f"Odebrano zadanie: {task}")
-            # Symulacja odpowiedzi deweloperów
-            contribution = random.uniform(0.7, 0.95)
-            logging.info(f"Odpowiedź MIGI 7G: contribution={contribution}")
-            return contribution
+
+    def start(self) -> 'MigiTaskConsumerGroup':
+        self._stop.clear()
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._run_worker, args=(i,), name=f'migi-consumer-{i}', daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stop.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads.clear()
+
+    def _run_worker(self, worker_index: int) -> None:
+        consumer = self.consumer_factory(worker_index)
+        try:
+            while not self._stop.is_set():
+                batch = consumer.poll(timeout_ms=self.poll_timeout_ms, max_records=self.batch_size)
+                if not batch:
+                    continue
+                tasks = [r.value.get('task') if isinstance(r.value, dict) else r.value
+                         for records in batch.values() for r in records]
+                try:
+                    contributions = self.handler(tasks)
+                except Exception as e:
+                    # Bez commitu; cofnij pozycje, by partia została dostarczona ponownie
+                    logging.error(f"Błąd przetwarzania partii zadań: {e}")
+                    for tp, records in batch.items():
+                        consumer.seek(tp, records[0].offset)
+                    with self._lock:
+                        self.stats['errors'] += 1
+                    continue
+                consumer.commit()
+                with self._lock:
+                    self.stats['processed'] += len(tasks)
+                    self.stats['batches'] += 1
+                    self.stats['commits'] += 1
+                if self.on_batch:
+                    self.on_batch(tasks, contributions)
+        finally:
+            consumer.close()
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self.stats)
+
+
+def process_migi_tasks(bootstrap_servers: str = 'localhost:9092'):
+    """
+    Odbiera i przetwarza zadania z sieci MIGI 7G (grupa workerów, do przerwania).
+    """
+    def log_batch(tasks: List[str], contributions: List[float]) -> None:
+        for task, contribution in zip(tasks, contributions):
+            logging.info(f"Odebrano zadanie: {task} | Odpowiedź MIGI 7G: contribution={contribution}")
+
+    group = MigiTaskConsumerGroup(bootstrap_servers, on_batch=log_batch)
+    try:
+        group.start()
+        for thread in list(group._threads):
+            thread.join()
+    except KeyboardInterrupt:
+        pass
     except Exception as e:
         logging.error(f"Błąd przetwarzania zadania: {e}")
-        return 0.5
+    finally:
+        group.stop()
+    return group.get_stats()
 
 if __name__ == '__main__':
-    process_migi_tasks()
\ No newline at end of file
+    process_migi_tasks()
@@ -1,23 +1,124 @@
-from kafka import KafkaProducer
+import atexit
 import json
 import logging
+import threading
+from typing import Any, Callable, Dict, Optional
+
+try:
+    from kafka import KafkaProducer
+    KAFKA_AVAILABLE = True
+except ImportError:
+    KafkaProducer = None
+    KAFKA_AVAILABLE = False
 
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 
+MIGI_TASKS_TOPIC = 'migi_tasks'
+
+
+class MigiTaskProducer:
+    """
+    Długo żyjący producent zadań MIGI 7G.
+
+    Jedno połączenie na cały proces; rekordy są grupowane przez linger_ms/batch_size,
+    a potwierdzenia dostarczenia przychodzą asynchronicznie przez callbacki
+    (bez flush() po każdym zadaniu).
+    """
+
+    def __init__(self, bootstrap_servers: str = 'localhost:9092', topic: str = MIGI_TASKS_TOPIC,
+                 linger_ms: int = 10, batch_size: int = 64 * 1024, acks: Any = 1,
+                 compression_type: Optional[str] = None,
+                 producer_factory: Optional[Callable[..., Any]] = None):
+        self.topic = topic
+        self.stats = {'sent': 0, 'delivered': 0, 'failed': 0}
+        self._lock = threading.Lock()
+        config = {
+            'bootstrap_servers': bootstrap_servers,
+            'value_serializer': lambda v: json.dumps(v).encode('utf-8'),
+            'linger_ms': linger_ms,
+            'batch_size': batch_size,
+            'acks': acks,
+        }
+        if compression_type:
+            config['compression_type'] = compression_type
+        if producer_factory is None:
+            if not KAFKA_AVAILABLE:
+                raise ImportError("kafka-python is not installed")
+            producer_factory = KafkaProducer
+        self._producer = producer_factory(**config)
+        self.closed = False
+
+    def send_task(self, task: str, on_delivery: Optional[Callable[[Any], None]] = None,
+                  on_error: Optional[Callable[[Exception], None]] = None, **extra: Any):
+        """Wysyła zadanie asynchronicznie; zwraca future z kafka-python."""
+        future = self._producer.send(self.topic, {'task': task, **extra})
+        with self._lock:
+            self.stats['sent'] += 1
+        future.add_callback(self._on_delivery, on_delivery)
+        future.add_errback(self._on_error, task, on_error)
+        return future
+
+    def _on_delivery(self, callback: Optional[Callable], metadata: Any) -> None:
+        with self._lock:
+            self.stats['delivered'] += 1
+        if callback:
+            callback(metadata)
+
+    def _on_error(self, task: str, callback: Optional[Callable], exc: Exception) -> None:
+        with self._lock:
+            self.stats['failed'] += 1
+        logging.error(f"Błąd dostarczenia zadania '{task}': {exc}")
+        if callback:
+            callback(exc)
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        self._producer.flush(timeout)
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        if not self.closed:
+            self.closed = True
+            self._producer.close(timeout)
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self.stats)
+
+
+_producers: Dict[str, MigiTaskProducer] = {}
+_producers_lock = threading.Lock()
+
+
+def get_task_producer(bootstrap_servers: str = 'localhost:9092') -> MigiTaskProducer:
+    """Zwraca współdzielonego producenta dla danego klastra (tworzonego raz)."""
+    with _producers_lock:
+        producer = _producers.get(bootstrap_servers)
+        if producer is None or producer.closed:
+            producer = MigiTaskProducer(bootstrap_servers)
+            _producers[bootstrap_servers] = producer
+        return producer
+
+
+@atexit.register
+def close_task_producers() -> None:
+    with _producers_lock:
+        for producer in _producers.values():
+            try:
+                producer.close(timeout=5)
+            except Exception as e:
+                logging.error(f"Błąd zamykania producenta: {e}")
+        _producers.clear()
+
+
 def send_task_to_migi(task: str, bootstrap_servers: str = 'localhost:9092'):
     """
-    Wysyła zadanie do sieci MIGI 7G przez Kafkę.
+    Wysyła zadanie do sieci MIGI 7G przez Kafkę (współdzielony producent).
     """
     try:
-        producer = KafkaProducer(
-            bootstrap_servers=bootstrap_servers,
-            value_serializer=lambda v: json.dumps(v).encode('utf-8')
-        )
-        producer.send('migi_tasks', {'task': task})
-        producer.flush()
+        future = get_task_producer(bootstrap_servers).send_task(task)
         logging.info(f"Wysłano zadanie do MIGI 7G: {task}")
+        return future
     except Exception as e:
         logging.error(f"Błąd wysyłania zadania: {e}")
 
 if __name__ == '__main__':
-    send_task_to_migi("Zaprojektuj robota.")
\ No newline at end of file
+    send_task_to_migi("Zaprojektuj robota.")
@@ -0,0 +1,129 @@
+"""
+MÓZG BOGA - OFFLOAD EXECUTOR
+Wykonywanie synchronicznego kodu świadomości poza pętlą zdarzeń FastAPI
+"""
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+
+class WorkQueueFullError(Exception):
+    """Kolejka modułu pełna - żądanie należy odrzucić (HTTP 429)"""
+
+    def __init__(self, lane: str):
+        super().__init__(f"Work queue '{lane}' is full")
+        self.lane = lane
+
+
+class _Lane:
+    """Ograniczona kolejka jednego modułu z własnymi workerami (domyślnie 1 = serializacja)"""
+
+    def __init__(self, name: str, concurrency: int, queue_size: int):
+        self.name = name
+        self.concurrency = max(1, concurrency)
+        self.queue_size = queue_size
+        self.queue: Optional[asyncio.Queue] = None
+        self.workers = []
+        self.in_flight = 0
+        self.stats = {'submitted': 0, 'completed': 0, 'failed': 0, 'rejected': 0,
+                      'wait_time_total': 0.0, 'run_time_total': 0.0}
+
+
+class OffloadExecutor:
+    """
+    Wspólna pula wątków + ograniczone kolejki per moduł.
+
+    Każdy moduł (np. 'consciousness', 'spiral', 'synergy') ma własną kolejkę;
+    jego zadania wykonują się na puli wątków, ale najwyżej `concurrency` naraz
+    (domyślnie jedno - moduły przepisują własne pliki JSON i nie są wątkowo
+    bezpieczne). Pełna kolejka oznacza przeciążenie: run() rzuca
+    WorkQueueFullError zamiast czekać.
+    """
+
+    def __init__(self, max_workers: int = 8, queue_size: int = 256):
+        self.max_workers = max_workers
+        self.queue_size = queue_size
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='offload')
+        self._lanes: Dict[str, _Lane] = {}
+
+    def lane(self, name: str, concurrency: int = 1, queue_size: Optional[int] = None) -> None:
+        """Rejestruje (lub rekonfiguruje przed pierwszym użyciem) kolejkę modułu."""
+        self._lanes[name] = _Lane(name, concurrency, queue_size or self.queue_size)
+
+    def _get_lane(self, name: str) -> _Lane:
+        lane = self._lanes.get(name)
+        if lane is None:
+            lane = self._lanes[name] = _Lane(name, 1, self.queue_size)
+        if lane.queue is None:
+            lane.queue = asyncio.Queue(maxsize=lane.queue_size)
+            lane.workers = [asyncio.create_task(self._worker(lane)) for _ in range(lane.concurrency)]
+        return lane
+
+    async def run(self, lane_name: str, fn: Callable, *args: Any, **kwargs: Any) -> Any:
+        """Wykonuje fn(*args, **kwargs) w kolejce modułu i zwraca wynik."""
+        lane = self._get_lane(lane_name)
+        future = asyncio.get_running_loop().create_future()
+        try:
+            lane.queue.put_nowait((fn, args, kwargs, future, time.perf_counter()))
+        except asyncio.QueueFull:
+            lane.stats['rejected'] += 1
+            raise WorkQueueFullError(lane_name)
+        lane.stats['submitted'] += 1
+        return await future
+
+    async def _worker(self, lane: _Lane) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            fn, args, kwargs, future, enqueued = await lane.queue.get()
+            if future.cancelled():
+                continue
+            started = time.perf_counter()
+            lane.stats['wait_time_total'] += started - enqueued
+            lane.in_flight += 1
+            try:
+                result = await loop.run_in_executor(self._pool, lambda: fn(*args, **kwargs))
+            except Exception as e:
+                lane.stats['failed'] += 1
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                lane.stats['completed'] += 1
+                if not future.done():
+                    future.set_result(result)
+            finally:
+                lane.in_flight -= 1
+                lane.stats['run_time_total'] += time.perf_counter() - started
+
+    def get_stats(self) -> Dict[str, Any]:
+        lanes = {}
+        for name, lane in self._lanes.items():
+            done = lane.stats['completed'] + lane.stats['failed']
+            lanes[name] = {
+                **lane.stats,
+                'queued': lane.queue.qsize() if lane.queue is not None else 0,
+                'in_flight': lane.in_flight,
+                'queue_size': lane.queue_size,
+                'concurrency': lane.concurrency,
+                'avg_wait_ms': round(lane.stats['wait_time_total'] / done * 1000, 3) if done else 0.0,
+                'avg_run_ms': round(lane.stats['run_time_total'] / done * 1000, 3) if done else 0.0,
+            }
+        return {'max_workers': self.max_workers, 'lanes': lanes}
+
+    async def shutdown(self) -> None:
+        for lane in self._lanes.values():
+            for worker in lane.workers:
+                worker.cancel()
+            if lane.workers:
+                await asyncio.gather(*lane.workers, return_exceptions=True)
+            lane.workers = []
+            while lane.queue is not None and not lane.queue.empty():
+                future = lane.queue.get_nowait()[3]
+                if not future.done():
+                    future.cancel()
+            lane.queue = None
+        try:
+            self._pool.shutdown(wait=True)
+        except Exception as e:
+            logging.error(f"Offload pool shutdown error: {e}")
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Benchmark przepustowości /api/events/log (apps/api).
+
+Dawny wariant: nowe połączenie sqlite3, INSERT i COMMIT dla każdego
+zdarzenia. Nowy: połączenie per wątek (WAL, synchronous=NORMAL) i EventWriter
+zapisujący partiami w tle. Z działającym apps/api/main.py żądania idą przez
+TestClient FastAPI; w przeciwnym razie (--engine) mierzona jest sama
+ścieżka log_event w wątkach puli.
+"""
+import argparse, json, os, sqlite3, statistics, sys, tempfile, time
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'apps', 'api'))
+
+from sqlite_store import EventWriter, SQLiteDatabase
+
+SCHEMA = """CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    ts REAL NOT NULL,
+    event TEXT NOT NULL,
+    user TEXT,
+    meta TEXT
+)"""
+
+def legacy_logger(path):
+    """Dawne log_event: połączenie i commit na każde zdarzenie."""
+    def log_event(event, user=None, meta=None):
+        conn = sqlite3.connect(path)
+        conn.row_factory = sqlite3.Row
+        with conn as c:
+            c.execute("INSERT INTO events(ts, event, user, meta) VALUES(?,?,?,?)",
+                      (time.time(), event, user, json.dumps(meta or {})))
+            c.commit()
+    return log_event, lambda: None
+
+def batched_logger(path, args):
+    database = SQLiteDatabase(path)
+    writer = EventWriter(database, batch_size=args.batch_size, flush_interval=args.flush_ms / 1000.0)
+    def close():
+        writer.close()
+        database.close()
+    return writer.log, close
+
+def api_client(mode, path, args):
+    """Klient HTTP dla prawdziwej aplikacji na tymczasowej bazie (None, gdy main.py się nie importuje)."""
+    try:
+        from fastapi.testclient import TestClient
+        import main as api
+    except Exception as e:
+        print(f'apps/api/main.py niedostępny ({e.__class__.__name__}: {e}) - tryb --engine')
+        return None
+    if mode == 'legacy':
+        original = api.log_event
+        api.log_event = legacy_logger(path)[0]
+        close = lambda: setattr(api, 'log_event', original)
+    else:
+        api.DB = SQLiteDatabase(path)
+        api.EVENTS = EventWriter(api.DB, batch_size=args.batch_size, flush_interval=args.flush_ms / 1000.0)
+        close = lambda: (api.EVENTS.close(), api.DB.close())
+    client = TestClient(api.app)
+    return (lambda event, user=None, meta=None: client.post(
+        '/api/events/log', json={'event': event, 'user': user, 'meta': meta})), close
+
+def run(mode, args, use_api):
+    workdir = tempfile.mkdtemp(prefix=f'events_{mode}_')
+    path = os.path.join(workdir, 'events.sqlite')
+    with sqlite3.connect(path) as c:
+        c.execute(SCHEMA)
+    client = api_client(mode, path, args) if use_api else None
+    if client is not None:
+        log, close = client
+    else:
+        log, close = legacy_logger(path) if mode == 'legacy' else batched_logger(path, args)
+
+    def worker(worker_id):
+        latencies = []
+        for i in range(args.events // args.threads):
+            started = time.perf_counter()
+            log('bench', user=f'user_{worker_id}', meta={'i': i})
+            latencies.append(time.perf_counter() - started)
+        return latencies
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.threads) as pool:
+        latencies = [value for chunk in pool.map(worker, range(args.threads)) for value in chunk]
+    elapsed = time.perf_counter() - started
+    close()
+    with sqlite3.connect(path) as c:
+        stored = c.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+    latencies.sort()
+    print(f"[{mode}] {len(latencies)} zdarzeń, {args.threads} wątków: {len(latencies) / elapsed:,.0f} zdarzeń/s, "
+          f"p50={latencies[len(latencies) // 2] * 1000:.3f} ms p99={latencies[int(len(latencies) * 0.99)] * 1000:.3f} ms "
+          f"mean={statistics.mean(latencies) * 1000:.3f} ms, zapisanych {stored}")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--events', type=int, default=20000)
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--batch-size', type=int, default=256)
+    parser.add_argument('--flush-ms', type=float, default=50)
+    parser.add_argument('--mode', choices=['legacy', 'batched', 'both'], default='both')
+    parser.add_argument('--engine', action='store_true', help='bez HTTP - sama ścieżka log_event')
+    args = parser.parse_args()
+    for mode in (['legacy', 'batched'] if args.mode == 'both' else [args.mode]):
+        run(mode, args, use_api=not args.engine)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""Test obciążenia zapisu stanu gry Furby: N graczy odpytuje /api/game/status
+i wykonuje /api/game/travel.
+
+Porównuje dawny wariant (synchroniczny zapis game_save_{user}.json po każdej
+akcji + odczyt pliku przy każdym /status) z GameStateStore (write-behind do
+SQLite). Z zainstalowanym Flaskiem żądania idą przez klienta testowego
+FurbyGameServer; bez Flaska (--engine) wykonywana jest ta sama logika
+endpointów bezpośrednio na grach.
+"""
+import argparse, json, os, random, statistics, sys, tempfile, time
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'TokenSystem'))
+sys.path.insert(0, os.path.join(ROOT, 'FurbyGame125D'))
+
+import game_state_store
+from game_state_store import GameStateStore
+
+class LegacyJsonStore:
+    """Dawne zachowanie: jeden plik JSON per gracz, zapis i odczyt w wątku żądania."""
+
+    def __init__(self):
+        self.stats = {'saves': 0, 'loads': 0}
+
+    def save(self, user_id, state):
+        with open(f"game_save_{user_id}.json", 'w') as f:
+            json.dump(state, f, indent=2)
+        self.stats['saves'] += 1
+
+    def load(self, user_id):
+        self.stats['loads'] += 1
+        try:
+            with open(f"game_save_{user_id}.json", 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def delete(self, user_id):
+        pass
+
+    def close(self):
+        pass
+
+    def get_stats(self):
+        return dict(self.stats)
+
+def percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000.0
+
+class EngineClient:
+    """Logika /api/game/status i /api/game/travel wywoływana bez HTTP."""
+
+    def __init__(self, user_id, legacy):
+        import furby_san_andreas
+        self.game_module = furby_san_andreas
+        self.user_id = user_id
+        self.legacy = legacy
+
+    def status(self):
+        game = self.game_module.get_furby_game(self.user_id)
+        if self.legacy:
+            game.load_game_state()
+        return {'player': {'cash_usd': game.player.cash_usd, 'level': game.player.level},
+                'game': {'position': game.position, 'current_location': game.locations[game.position].name}}
+
+    def travel(self, direction):
+        game = self.game_module.get_furby_game(self.user_id)
+        if direction == 'right' and game.position < len(game.locations) - 1:
+            game.position += 1
+        elif direction == 'left' and game.position > 0:
+            game.position -= 1
+        else:
+            return {'success': False}
+        game.save_game_state()
+        return {'success': True, 'position': game.position}
+
+class FlaskClient:
+    """Prawdziwe żądania przez klienta testowego Flask (jedna sesja na gracza)."""
+
+    def __init__(self, app, user_id):
+        self.client = app.test_client()
+        with self.client.session_transaction() as sess:
+            sess['user_id'] = user_id
+
+    def status(self):
+        return self.client.get('/api/game/status').get_json()
+
+    def travel(self, direction):
+        return self.client.post('/api/game/travel', json={'direction': direction}).get_json()
+
+def build_flask_app(legacy):
+    from flask import request, session
+    from furby_server import FurbyGameServer
+    import furby_san_andreas
+    app = FurbyGameServer().app
+    if legacy:
+        @app.before_request
+        def reload_on_status():
+            # Dawny /api/game/status czytał plik zapisu przy każdym odpytaniu
+            if request.path == '/api/game/status' and session.get('user_id'):
+                furby_san_andreas.get_furby_game(session['user_id']).load_game_state()
+    return app
+
+def run(mode, args, use_flask):
+    workdir = tempfile.mkdtemp(prefix=f'furby_{mode}_')
+    os.chdir(workdir)
+    legacy = mode == 'legacy'
+    store = LegacyJsonStore() if legacy else GameStateStore(os.path.join(workdir, 'state.db'),
+                                                             flush_interval=args.flush_interval)
+    game_state_store.set_game_state_store(store)
+    import furby_san_andreas
+    furby_san_andreas.active_games = furby_san_andreas.GameSessionCache(max_sessions=args.players * 2)
+
+    app = build_flask_app(legacy) if use_flask else None
+    users = [f'player_{i}' for i in range(args.players)]
+    clients = [FlaskClient(app, u) if use_flask else EngineClient(u, legacy) for u in users]
+    latencies = {'status': [], 'travel': []}
+
+    def play(client, seed):
+        rng = random.Random(seed)
+        local = {'status': [], 'travel': []}
+        for _ in range(args.requests):
+            op = 'status' if rng.random() < args.status_ratio else 'travel'
+            started = time.perf_counter()
+            if op == 'status':
+                client.status()
+            else:
+                client.travel(rng.choice(('left', 'right')))
+            local[op].append(time.perf_counter() - started)
+        return local
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.threads) as pool:
+        for local in pool.map(play, clients, range(len(clients))):
+            for op, values in local.items():
+                latencies[op].extend(values)
+    elapsed = time.perf_counter() - started
+    flush_started = time.perf_counter()
+    store.close()
+    flush_ms = (time.perf_counter() - flush_started) * 1000.0
+    game_state_store.set_game_state_store(None)
+
+    total = sum(len(v) for v in latencies.values())
+    print(f"[{mode}{'' if use_flask else ', engine'}] {args.players} graczy, {total} żądań w {elapsed:.2f}s "
+          f"-> {total / elapsed:.0f} req/s, końcowy flush {flush_ms:.1f} ms")
+    for op, values in latencies.items():
+        if values:
+            print(f"  {op:6s} n={len(values):6d} p50={percentile(values, 0.5):7.3f} ms "
+                  f"p99={percentile(values, 0.99):7.3f} ms mean={statistics.mean(values) * 1000:7.3f} ms")
+    files = [n for n in os.listdir(workdir) if n.startswith('game_save_')]
+    print(f"  pliki zapisu: {len(files)}, statystyki magazynu: {store.get_stats()}")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--players', type=int, default=1000)
+    parser.add_argument('--requests', type=int, default=20, help='żądań na gracza')
+    parser.add_argument('--status-ratio', type=float, default=0.7)
+    parser.add_argument('--threads', type=int, default=16)
+    parser.add_argument('--flush-interval', type=float, default=1.0)
+    parser.add_argument('--mode', choices=['legacy', 'store', 'both'], default='both')
+    parser.add_argument('--engine', action='store_true', help='bez Flaska - logika endpointów bezpośrednio')
+    args = parser.parse_args()
+
+    use_flask = not args.engine
+    if use_flask:
+        try:
+            import flask  # noqa: F401
+        except ImportError:
+            print('Flask niedostępny - uruchamiam w trybie --engine')
+            use_flask = False
+    for mode in (['legacy', 'store'] if args.mode == 'both' else [args.mode]):
+        run(mode, args, use_flask)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""Benchmark bezgłowej symulacji Furby: tury na sekundę.
+
+Porównuje pętlę po obiektach FurbyGame125D (handle_encounter_choice
+z seedowanym strumieniem sesji, gracz po graczu) z FurbySimulation, która
+wykonuje turę wszystkich graczy naraz w NumPy. Na końcu wypisuje rozkłady
+wyników do balansowania.
+"""
+import argparse, json, os, sys, time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'TokenSystem'))
+sys.path.insert(0, os.path.join(ROOT, 'FurbyGame125D'))
+
+from furby_san_andreas import FurbyGame125D, get_game_world
+from furby_simulation import CHOICES, FurbySimulation
+
+def run_scalar(players, turns, seed):
+    """Dawny sposób: obiekt gry per gracz i reguły spotkania wywoływane w pętli."""
+    world = get_game_world()
+    games = [FurbyGame125D(f'sim_{i}', world=world, seed=seed + i) for i in range(players)]
+    started = time.perf_counter()
+    for game in games:
+        player = game.player
+        for _ in range(turns):
+            location = game.locations[game.position]
+            npcs = [key for key in location.encounters if key in game.npcs]
+            result = game.handle_encounter_choice(game.rng.choice(npcs), game.rng.choice(CHOICES))
+            player.heat = min(player.heat + result['heat_gained'], 100)
+            player.cash_usd = max(0, player.cash_usd - result['cash_spent'])
+            player.reputation = max(0, player.reputation + result['reputation_change'])
+            player.experience += (result['heat_gained'] + abs(result['reputation_change'])) * 2
+    return time.perf_counter() - started
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--players', type=int, default=10000)
+    parser.add_argument('--turns', type=int, default=200)
+    parser.add_argument('--scalar-players', type=int, default=1000, help='graczy w wariancie pętli')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--summary', action='store_true', help='wypisz pełne rozkłady jako JSON')
+    args = parser.parse_args()
+
+    elapsed = run_scalar(args.scalar_players, args.turns, args.seed)
+    scalar_rate = args.scalar_players * args.turns / elapsed
+    print(f"[pętla]   {args.scalar_players} graczy x {args.turns} tur w {elapsed:.2f}s -> {scalar_rate:,.0f} tur/s")
+
+    sim = FurbySimulation(policy={'encounter': 1.0})
+    report = sim.run(args.players, args.turns, seed=args.seed)
+    print(f"[numpy]   {args.players} graczy x {args.turns} tur w {report.elapsed:.2f}s "
+          f"-> {report.turns_per_second:,.0f} tur/s ({report.turns_per_second / scalar_rate:.0f}x)")
+
+    report = FurbySimulation().run(args.players, args.turns, seed=args.seed)
+    summary = report.summary()
+    print(f"[pełna]   spotkania+podróże+odpoczynek: {summary['turns_per_second']:,.0f} tur/s")
+    if args.summary:
+        print(json.dumps(summary, indent=2, ensure_ascii=False))
+    else:
+        for name in ('cash_usd', 'level', 'heat'):
+            stats = summary['stats'][name]
+            print(f"  {name:10s} p5={stats['p5']:>10.0f} p50={stats['p50']:>10.0f} p95={stats['p95']:>10.0f}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Benchmark wysyłki/odbioru zadań MIGI 7G na lokalnym zamienniku brokera Kafka.
+
+Porównuje dawny wzorzec (nowy producent + flush na zadanie, nowy konsument
+na wiadomość) z MigiTaskProducer i MigiTaskConsumerGroup.
+"""
+import argparse, json, os, sys, time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from double_pipeline.inmemory_broker import InMemoryBroker
+from kafka_producer import MigiTaskProducer, MIGI_TASKS_TOPIC
+from kafka_consumer import MigiTaskConsumerGroup
+
+serialize = lambda v: json.dumps(v).encode('utf-8')
+deserialize = lambda x: json.loads(x.decode('utf-8'))
+
+def make_broker(args):
+    return InMemoryBroker(partitions=args.partitions, connect_latency=args.connect_ms / 1000.0,
+                          request_latency=args.request_ms / 1000.0)
+
+def legacy_produce(broker, n):
+    for i in range(n):
+        producer = broker.producer(value_serializer=serialize)
+        producer.send(MIGI_TASKS_TOPIC, {'task': f'zadanie {i}'})
+        producer.flush()
+
+def pooled_produce(broker, n):
+    producer = MigiTaskProducer(producer_factory=lambda **cfg: broker.producer(**cfg), linger_ms=5)
+    for i in range(n):
+        producer.send_task(f'zadanie {i}')
+    producer.flush()
+    return producer.get_stats()
+
+def legacy_consume(broker, n):
+    for _ in range(n):
+        consumer = broker.consumer(MIGI_TASKS_TOPIC, group_id='legacy', value_deserializer=deserialize)
+        consumer.poll(timeout_ms=100, max_records=1)
+        consumer.commit()
+        consumer.close()
+
+def group_consume(broker, n, workers, batch_size):
+    partitions = broker.topic_partitions(MIGI_TASKS_TOPIC)
+
+    def factory(i):
+        consumer = broker.consumer(group_id='bench', value_deserializer=deserialize)
+        consumer.assign(partitions[i::workers])
+        return consumer
+
+    group = MigiTaskConsumerGroup(workers=workers, batch_size=batch_size, poll_timeout_ms=20,
+                                  consumer_factory=factory).start()
+    while group.get_stats()['processed'] < n:
+        time.sleep(0.001)
+    group.stop()
+    return group.get_stats()
+
+def timed(fn, *a):
+    start = time.perf_counter()
+    out = fn(*a)
+    return time.perf_counter() - start, out
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--tasks', type=int, default=5000)
+    ap.add_argument('--legacy-tasks', type=int, default=300)
+    ap.add_argument('--partitions', type=int, default=4)
+    ap.add_argument('--workers', type=int, default=4)
+    ap.add_argument('--batch-size', type=int, default=200)
+    ap.add_argument('--connect-ms', type=float, default=5.0)
+    ap.add_argument('--request-ms', type=float, default=1.0)
+    args = ap.parse_args()
+
+    broker = make_broker(args)
+    t_legacy_p, _ = timed(legacy_produce, broker, args.legacy_tasks)
+    t_legacy_c, _ = timed(legacy_consume, broker, args.legacy_tasks)
+
+    broker = make_broker(args)
+    t_pool_p, pstats = timed(pooled_produce, broker, args.tasks)
+    produce_requests = broker.produce_requests
+    t_group_c, cstats = timed(group_consume, broker, args.tasks, args.workers, args.batch_size)
+
+    print("=== MIGI 7G Kafka dispatch benchmark (InMemoryBroker) ===")
+    print(f"latencja: connect={args.connect_ms}ms request={args.request_ms}ms, partycje={args.partitions}")
+    print(f"producent  legacy : {args.legacy_tasks / t_legacy_p:10.0f} zadań/s")
+    print(f"producent  pooled : {args.tasks / t_pool_p:10.0f} zadań/s "
+          f"({produce_requests} żądań, dostarczono {pstats['delivered']})")
+    print(f"konsument  legacy : {args.legacy_tasks / t_legacy_c:10.0f} zadań/s")
+    print(f"konsument  group  : {args.tasks / t_group_c:10.0f} zadań/s "
+          f"({cstats['batches']} partii, {cstats['commits']} commitów)")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""Benchmark przepustowości logowania (weryfikacja bcrypt).
+
+Porównuje weryfikację hasła wykonywaną synchronicznie w pętli zdarzeń
+(dawny login_user) z PasswordHasher (pula procesów). Równolegle działa
+sonda mierząca opóźnienie pętli - pokazuje, czy pozostałe endpointy
+odpowiadają podczas fali logowań.
+"""
+import argparse, asyncio, os, sys, time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, '6_USER_AUTH_SYSTEM', 'backend'))
+
+from password_hashing import PasswordHasher, check_password, hash_password
+
+def percentile(values, pct):
+    values = sorted(values)
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, int(round(pct / 100.0 * (len(values) - 1))))]
+
+async def probe(stop, delays, interval=0.005):
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        start = loop.time()
+        await asyncio.sleep(interval)
+        delays.append(loop.time() - start - interval)
+
+async def run(mode, logins, concurrency, hashed, hasher):
+    stop, delays = asyncio.Event(), []
+    probe_task = asyncio.create_task(probe(stop, delays))
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def login():
+        async with semaphore:
+            if mode == 'inline':
+                ok = check_password('sekretne-haslo', hashed)
+                await asyncio.sleep(0)
+            else:
+                ok = await hasher.verify('sekretne-haslo', hashed)
+            assert ok
+
+    start = time.perf_counter()
+    await asyncio.gather(*[login() for _ in range(logins)])
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await probe_task
+    return elapsed, delays
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--logins', type=int, default=40)
+    parser.add_argument('--concurrency', type=int, default=40, help='równoległych klientów')
+    parser.add_argument('--rounds', type=int, default=10, help='koszt bcrypt')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    hashed = hash_password('sekretne-haslo', args.rounds)
+    print(f"bcrypt rounds={args.rounds} workers={args.workers} cpus={os.cpu_count()}")
+    for mode in ('inline', 'pool'):
+        hasher = PasswordHasher(max_workers=args.workers, rounds=args.rounds, max_queue=args.logins)
+        elapsed, delays = asyncio.run(run(mode, args.logins, args.concurrency, hashed, hasher))
+        hasher.shutdown()
+        print(f"{mode:6s} {args.logins / elapsed:8.1f} logins/s  "
+              f"loop lag p50={percentile(delays, 50) * 1000:7.2f} ms  "
+              f"p99={percentile(delays, 99) * 1000:7.2f} ms  max={max(delays or [0]) * 1000:7.2f} ms")
+
+if __name__ == '__main__':
+    main()
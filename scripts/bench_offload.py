@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Benchmark opóźnień p50/p99 przy N równoległych klientach.
+
+Porównuje wywołanie synchronicznego, zapisującego plik JSON kodu modułu
+bezpośrednio w pętli zdarzeń (dawne endpointy) z OffloadExecutor. Mierzone są
+dwa typy żądań: ciężkie (zapis decyzji) i lekkie (np. /health), które
+w starym wariancie czekają za każdym zapisem.
+"""
+import argparse, asyncio, json, os, sys, tempfile, threading, time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from offload_executor import OffloadExecutor, WorkQueueFullError
+
+class JsonDecisionStore:
+    """Zastępnik SystemSelfManager: przepisuje cały plik JSON przy każdej decyzji."""
+
+    def __init__(self, path, history=200, work_ms=0.0):
+        self.path = path
+        self.history = [{'decision': i, 'context': 'x' * 64} for i in range(history)]
+        self.work_ms = work_ms
+        self.lock = threading.Lock()
+
+    def record(self, user_id, value):
+        with self.lock:
+            self.history.append({'user_id': user_id, 'value': value})
+            with open(self.path, 'w', encoding='utf-8') as f:
+                json.dump(self.history, f)
+            if self.work_ms:
+                time.sleep(self.work_ms / 1000.0)
+            return len(self.history)
+
+def percentile(values, pct):
+    values = sorted(values)
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, int(round(pct / 100.0 * (len(values) - 1))))]
+
+async def client(i, requests, heavy_every, handle_heavy, handle_light, latencies):
+    for r in range(requests):
+        heavy = (i + r) % heavy_every == 0
+        start = time.perf_counter()
+        try:
+            await (handle_heavy(f'user{i}', r) if heavy else handle_light())
+            latencies['heavy' if heavy else 'light'].append(time.perf_counter() - start)
+        except WorkQueueFullError:
+            latencies['rejected'] += 1
+        await asyncio.sleep(0)
+
+async def run_mode(mode, args, store):
+    latencies = {'heavy': [], 'light': [], 'rejected': 0}
+    offload = OffloadExecutor(max_workers=args.workers, queue_size=args.queue_size)
+    offload.lane('consciousness')
+
+    async def light():
+        await asyncio.sleep(0)
+        return {'status': 'ok'}
+
+    if mode == 'inline':
+        async def heavy(user_id, value):
+            return store.record(user_id, value)
+    else:
+        async def heavy(user_id, value):
+            return await offload.run('consciousness', store.record, user_id, value)
+
+    start = time.perf_counter()
+    await asyncio.gather(*[client(i, args.requests, args.heavy_every, heavy, light, latencies)
+                           for i in range(args.clients)])
+    elapsed = time.perf_counter() - start
+    await offload.shutdown()
+    return elapsed, latencies
+
+def report(mode, elapsed, latencies):
+    total = len(latencies['heavy']) + len(latencies['light'])
+    print(f"{mode:8s} {total / elapsed:9.0f} req/s  rejected(429)={latencies['rejected']}")
+    for kind in ('light', 'heavy'):
+        values = latencies[kind]
+        print(f"  {kind:5s} n={len(values):6d}  p50={percentile(values, 50) * 1000:8.2f} ms  "
+              f"p99={percentile(values, 99) * 1000:8.2f} ms")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--clients', type=int, default=500)
+    parser.add_argument('--requests', type=int, default=10, help='żądań na klienta')
+    parser.add_argument('--heavy-every', type=int, default=5, help='co które żądanie jest zapisem')
+    parser.add_argument('--history', type=int, default=500, help='rozmiar przepisywanego pliku JSON')
+    parser.add_argument('--work-ms', type=float, default=0.0, help='dodatkowy czas pracy modułu')
+    parser.add_argument('--workers', type=int, default=8)
+    parser.add_argument('--queue-size', type=int, default=1024)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for mode in ('inline', 'offload'):
+            store = JsonDecisionStore(os.path.join(tmp, f'{mode}.json'), args.history, args.work_ms)
+            elapsed, latencies = asyncio.run(run_mode(mode, args, store))
+            report(mode, elapsed, latencies)
+
+if __name__ == '__main__':
+    main()
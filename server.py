@@ -5,14 +5,16 @@ from pydantic import BaseModel
 from typing import Dict
 import yaml
 import random
-import httpx
 import os
 import datetime
 import importlib
 import sys
+import time
 from dotenv import load_dotenv
 # Importujemy tylko co istnieje
-from gokai_core.main import load_config
+from gokai_core.config_service import get_config_service
+from offload_executor import OffloadExecutor, WorkQueueFullError
+from token_introspection import TokenIntrospector, InvalidTokenError, IntrospectionUnavailableError, GOOGLE_USERINFO_URL
 
 # ===== AUTH SYSTEM IMPORT =====
 sys.path.append(os.path.join(os.path.dirname(__file__), '6_USER_AUTH_SYSTEM', 'backend'))
@@ -103,17 +105,57 @@ class TaskRequest(BaseModel):
 class MigiRequest(BaseModel):
     task: str
 
+# Wspólny klient userinfo + cache tokenów (zamiast nowego połączenia TLS na każde żądanie)
+token_introspector = TokenIntrospector(
+    userinfo_url=os.getenv("OAUTH_USERINFO_URL", GOOGLE_USERINFO_URL),
+    ttl=float(os.getenv("TOKEN_CACHE_TTL", 300)),
+    negative_ttl=float(os.getenv("TOKEN_CACHE_NEGATIVE_TTL", 10)),
+    max_entries=int(os.getenv("TOKEN_CACHE_MAX_ENTRIES", 10000))
+)
+
 async def get_current_user(token: str = Depends(oauth2_scheme)):
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(
-                "https://www.googleapis.com/oauth2/v3/userinfo",
-                headers={"Authorization": f"Bearer {token}"}
-            )
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPStatusError:
-            raise HTTPException(status_code=401, detail="Invalid token")
+    try:
+        return await token_introspector.introspect(token)
+    except InvalidTokenError:
+        raise HTTPException(status_code=401, detail="Invalid token")
+    except IntrospectionUnavailableError:
+        raise HTTPException(status_code=503, detail="Identity provider unavailable")
+
+# Konfiguracja GOKAI parsowana raz; obserwator mtime podmienia snapshot w tle
+config_service = get_config_service(poll_interval=float(os.getenv("CONFIG_POLL_INTERVAL", 1.0)))
+
+@app.on_event("startup")
+async def start_config_watch():
+    config_service.start()
+
+@app.on_event("shutdown")
+async def close_token_introspector():
+    await token_introspector.aclose()
+
+@app.on_event("shutdown")
+async def stop_config_watch():
+    config_service.stop(timeout=1.0)
+
+# Synchroniczny kod modułów (zapisy JSON) poza pętlą zdarzeń; jedna kolejka na moduł
+offload = OffloadExecutor(
+    max_workers=int(os.getenv("OFFLOAD_MAX_WORKERS", 8)),
+    queue_size=int(os.getenv("OFFLOAD_QUEUE_SIZE", 256))
+)
+offload.lane("consciousness")
+offload.lane("spiral")
+offload.lane("synergy")
+
+async def run_offloaded(lane: str, fn, *args, **kwargs):
+    """Wykonuje fn w kolejce modułu; przepełnienie kolejki -> 429"""
+    try:
+        return await offload.run(lane, fn, *args, **kwargs)
+    except WorkQueueFullError:
+        raise HTTPException(status_code=429, detail=f"{lane} queue saturated, retry later",
+                            headers={"Retry-After": "1"})
+
+@app.on_event("shutdown")
+async def stop_offload():
+    await offload.shutdown()
 
 # ===== HEALTHCHECK (no auth required) =====
 @app.get("/health")
@@ -130,7 +172,8 @@ async def health_check():
         "status": "ok",
         "timestamp": datetime.datetime.now().isoformat(),
         "version": "1.0.0",
-        "services": services
+        "services": services,
+        "offload": offload.get_stats()
     }
 
 @app.get("/")
@@ -146,11 +189,10 @@ async def root():
 @app.post("/api/run_task")
 async def run_task(task: TaskRequest, user: dict = Depends(get_current_user)) -> Dict:
     """Uruchomienie zadania w Mózgu Boga"""
-    try:
-        load_config()
-    except FileNotFoundError:
+    if config_service.snapshot() is None:
         return {"error": "Configuration file not found"}
 
+    started = time.perf_counter()
     # Symulacja procesowania zadania
     result = f"[MÓZG BOGA] Procesowanie zadania: '{task.payload}'"
     success_pct = random.uniform(0.7, 0.95)
@@ -159,7 +201,9 @@ async def run_task(task: TaskRequest, user: dict = Depends(get_current_user)) ->
     # ===== INTEGRACJA Z SYSTEMEM ŚWIADOMOŚCI =====
     if CONSCIOUSNESS_ENABLED:
         user_id = user.get("email", "anonymous")
-        consciousness_manager.process_user_decision(
+        await run_offloaded(
+            "consciousness",
+            consciousness_manager.process_user_decision,
             user_id=user_id,
             context=f"Wykonanie zadania MÓZG BOGA: {task.payload}",
             inputs={"task_payload": task.payload, "strategy": strategy},
@@ -168,6 +212,19 @@ async def run_task(task: TaskRequest, user: dict = Depends(get_current_user)) ->
             consciousness_level=3  # Średni poziom dla zadań API
         )
     
+    # Wpis SynergyLog trafia do kolejki - zapis partiami w tle (synergy_log_writer)
+    email = user.get("email")
+    if SYNERGY_LOG_ENABLED and email:
+        user_id = await find_user_id(email)
+        if user_id is not None:
+            synergy_log_writer.log(
+                user_id,
+                task_payload=task.payload,
+                strategy_used=strategy,
+                success_percentage=round(success_pct * 100),
+                execution_time=int((time.perf_counter() - started) * 1000)
+            )
+    
     return {
         "message": result,
         "success_pct": success_pct,
@@ -179,9 +236,7 @@ async def run_task(task: TaskRequest, user: dict = Depends(get_current_user)) ->
 @app.post("/api/migi")
 async def run_migi_simulation(request: MigiRequest, user: dict = Depends(get_current_user)) -> Dict:
     """Uruchomienie sieci MIGI 7G"""
-    try:
-        load_config()
-    except FileNotFoundError:
+    if config_service.snapshot() is None:
         return {"error": "Configuration file not found"}
     
     # Symulacja sieci MIGI 7G
@@ -204,7 +259,9 @@ async def run_migi_simulation(request: MigiRequest, user: dict = Depends(get_cur
     if CONSCIOUSNESS_ENABLED:
         user_id = user.get("email", "migi_user")
         consciousness_level = 4 if ai_acceleration > 200 else 3  # Wyższy poziom dla lepszej wydajności
-        consciousness_manager.process_user_decision(
+        await run_offloaded(
+            "consciousness",
+            consciousness_manager.process_user_decision,
             user_id=user_id,
             context=f"Wykonanie zadania MIGI 7G: {request.task}",
             inputs={
@@ -225,34 +282,65 @@ async def run_migi_simulation(request: MigiRequest, user: dict = Depends(get_cur
 
 # ===== AUTH INTEGRATION =====
 try:
-    from models import User, get_db, create_tables
+    from models import User, create_tables
+    from database import get_async_db, synergy_log_writer, find_user_id, dispose_engine
+    from password_hashing import password_hasher, HashingOverloadedError
     from auth import UserCreate, UserLogin, UserResponse, Token, verify_token
     
+    def verify_local_token(token: str):
+        """Lokalne JWT (z /auth/login) weryfikowane bez zapytania do Google"""
+        if token.count(".") != 2:
+            return None
+        try:
+            token_data = verify_token(token)
+        except HTTPException:
+            return None
+        return {"email": token_data.email, "sub": token_data.email, "provider": "local"}
+    
+    token_introspector.local_verifier = verify_local_token
+    SYNERGY_LOG_ENABLED = True
+    
     # Ensure database tables exist
     create_tables()
     
     # Add auth endpoints
     from fastapi import Form
-    from sqlalchemy.orm import Session
+    from sqlalchemy import select
+    from sqlalchemy.ext.asyncio import AsyncSession
+    
+    @app.on_event("startup")
+    async def start_synergy_log_writer():
+        synergy_log_writer.start()
+    
+    @app.on_event("shutdown")
+    async def close_auth_database():
+        await synergy_log_writer.stop()
+        await dispose_engine()
+        password_hasher.shutdown(wait=False)
     
     @app.post("/auth/register", response_model=UserResponse)
-    async def register_user(user_data: UserCreate, db: Session = Depends(get_db)):
+    async def register_user(user_data: UserCreate, db: AsyncSession = Depends(get_async_db)):
         """Quick registration endpoint"""
         # Check if user exists
-        existing_user = db.query(User).filter(
+        existing_user = (await db.execute(select(User).where(
             (User.email == user_data.email) | (User.username == user_data.username)
-        ).first()
+        ).limit(1))).scalar_one_or_none()
         
         if existing_user:
             raise HTTPException(status_code=400, detail="User already exists")
         
         # Create user with auth.py helper
-        from auth import create_user_dict
-        user_dict = create_user_dict(user_data)
+        from auth import create_user_dict, get_password_hash_async
+        try:
+            hashed_password = await get_password_hash_async(user_data.password)
+        except HashingOverloadedError:
+            raise HTTPException(status_code=503, detail="Too many concurrent sign-ups, retry later",
+                                headers={"Retry-After": "1"})
+        user_dict = create_user_dict(user_data, hashed_password=hashed_password)
         db_user = User(**user_dict)
         db.add(db_user)
-        db.commit()
-        db.refresh(db_user)
+        await db.commit()
+        await db.refresh(db_user)
         
         return UserResponse(
             id=db_user.id, username=db_user.username, email=db_user.email,
@@ -263,14 +351,20 @@ try:
         )
     
     @app.post("/auth/login", response_model=Token)
-    async def login_user(user_data: UserLogin, db: Session = Depends(get_db)):
+    async def login_user(user_data: UserLogin, db: AsyncSession = Depends(get_async_db)):
         """Quick login endpoint"""
-        from auth import verify_password, create_access_token, ACCESS_TOKEN_EXPIRE_MINUTES
+        from auth import verify_password_async, create_access_token, ACCESS_TOKEN_EXPIRE_MINUTES
         from datetime import timedelta
         
-        user = db.query(User).filter(User.email == user_data.email).first()
+        user = (await db.execute(select(User).where(User.email == user_data.email))).scalar_one_or_none()
         
-        if not user or not verify_password(user_data.password, user.hashed_password):
+        try:
+            password_ok = user is not None and await verify_password_async(user_data.password, user.hashed_password)
+        except HashingOverloadedError:
+            raise HTTPException(status_code=503, detail="Too many concurrent logins, retry later",
+                                headers={"Retry-After": "1"})
+        
+        if not password_ok:
             raise HTTPException(status_code=401, detail="Invalid credentials")
         
         access_token = create_access_token(
@@ -292,6 +386,7 @@ try:
         
 except ImportError as e:
     print(f"⚠️ Auth system not available: {e}")
+    SYNERGY_LOG_ENABLED = False
 
 # ===== HELPER FUNCTIONS =====
 
@@ -323,26 +418,24 @@ def get_integration_bridge():
     return integration_bridge
 
 def get_echo_mapper():
-    """Pobiera instancję UserEchoMapper"""
-    global echo_mapper
-    if echo_mapper is None and GLOBALVISION_ENABLED:
-        print("🗺️ Inicjalizuję echo mapper...")
-        from GlobalVision_Module.collective_self import UserEchoMapper
-        echo_mapper = UserEchoMapper()
-    return echo_mapper
+    """Pobiera współdzieloną (jedną na proces) instancję UserEchoMapper"""
+    if GLOBALVISION_ENABLED:
+        import collective_self
+        return collective_self.get_echo_mapper()
+    return None
 
 def generate_collective_map():
     """Generuje mapę kolektywnej świadomości"""
     if GLOBALVISION_ENABLED:
-        from GlobalVision_Module.collective_self import generate_collective_map as gcm
-        return gcm()
+        import collective_self
+        return collective_self.generate_collective_map()
     return {"error": "GlobalVision disabled"}
 
 def get_collective_recommendations():
     """Pobiera rekomendacje kolektywne"""
     if GLOBALVISION_ENABLED:
-        from GlobalVision_Module.collective_self import generate_synergy_recommendations
-        return generate_synergy_recommendations()
+        import collective_self
+        return collective_self.get_collective_recommendations()
     return []
 
 def get_spiral_memory():
@@ -378,39 +471,39 @@ if CONSCIOUSNESS_ENABLED:
     @app.get("/api/consciousness/state")
     async def get_consciousness_state():
         """GET /api/consciousness/state - Aktualny stan świadomości"""
-        return consciousness_api.get_current_consciousness_state()
+        return await run_offloaded("consciousness", consciousness_api.get_current_consciousness_state)
     
     @app.get("/api/consciousness/spiral")
     async def get_spiral_data():
         """GET /api/consciousness/spiral - Dane wizualizacji spiralnej"""
-        return consciousness_api.get_spiral_visualization_data()
+        return await run_offloaded("consciousness", consciousness_api.get_spiral_visualization_data)
     
     @app.get("/api/consciousness/collective")
     async def get_collective_report():
         """GET /api/consciousness/collective - Raport inteligencji kolektywnej"""
-        return consciousness_api.get_collective_intelligence_report()
+        return await run_offloaded("consciousness", consciousness_api.get_collective_intelligence_report)
     
     @app.get("/api/consciousness/dashboard")
     async def get_dashboard_data():
         """GET /api/consciousness/dashboard - Dane dla dashboard"""
-        return consciousness_api.get_dashboard_data()
+        return await run_offloaded("consciousness", consciousness_api.get_dashboard_data)
     
     @app.post("/api/consciousness/decision")
     async def register_decision(decision_data: dict, user: dict = Depends(get_current_user)):
         """POST /api/consciousness/decision - Rejestracja decyzji użytkownika"""
         user_id = user.get("email", "anonymous")
-        return consciousness_api.post_user_decision(user_id, decision_data)
+        return await run_offloaded("consciousness", consciousness_api.post_user_decision, user_id, decision_data)
     
     @app.post("/api/consciousness/reflect")
     async def generate_reflection():
         """POST /api/consciousness/reflect - Generuj refleksję systemową"""
-        return consciousness_api.post_generate_reflection()
+        return await run_offloaded("consciousness", consciousness_api.post_generate_reflection)
     
     @app.get("/api/consciousness/spiral/html")
     async def get_spiral_html():
         """GET /api/consciousness/spiral/html - HTML wizualizacji spiralnej"""
         from fastapi.responses import HTMLResponse
-        html_content = consciousness_api.get_spiral_visualization_html()
+        html_content = await run_offloaded("consciousness", consciousness_api.get_spiral_visualization_html)
         return HTMLResponse(content=html_content)
     
     @app.get("/api/consciousness/dashboard/html")
@@ -588,7 +681,9 @@ if SPIRAL_MEMORY_ENABLED:
             intensity = event_data.get("intensity", 0.5)
             transformation_type = event_data.get("transformation_type", "evolution")
             
-            event = spiral_memory.log_spiral_event(
+            event = await run_offloaded(
+                "spiral",
+                spiral_memory.log_spiral_event,
                 user_id=user_id,
                 level=level,
                 emotion=emotion,
@@ -605,6 +700,8 @@ if SPIRAL_MEMORY_ENABLED:
                 "level": level,
                 "is_breakthrough": event.breakthrough_marker
             }
+        except HTTPException:
+            raise
         except Exception as e:
             return {"error": f"Log spiral event failed: {str(e)}"}
     
@@ -633,7 +730,7 @@ if SYNERGY_COLLECTIVE_ENABLED:
             intensity = float(vote_data.get("intensity", 0.5))
             reasoning = vote_data.get("reasoning", "")
             
-            result = record_user_vote(user_id, direction, intensity, reasoning)
+            result = await run_offloaded("synergy", record_user_vote, user_id, direction, intensity, reasoning)
             
             return {
                 "vote_submitted": True,
@@ -645,6 +742,8 @@ if SYNERGY_COLLECTIVE_ENABLED:
                 "collective_state": result.get("current_state", {}),
                 "platform": "MTAQuestWebsideX.com"
             }
+        except HTTPException:
+            raise
         except Exception as e:
             return {"error": f"Vote submission failed: {str(e)}"}
     
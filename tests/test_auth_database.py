@@ -0,0 +1,163 @@
+import asyncio
+import importlib.util
+import pathlib
+import sys
+from datetime import datetime
+
+import pytest
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("aiosqlite")
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+BACKEND = ROOT / '6_USER_AUTH_SYSTEM' / 'backend'
+sys.path.insert(0, str(BACKEND))
+
+
+def load_endpoints():
+    # Po ROOT w sys.path "import endpoints" trafia na pakiet endpoints/ z katalogu głównego
+    spec = importlib.util.spec_from_file_location("auth_endpoints", BACKEND / "endpoints.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_batched_synergy_logs_and_keyset_pagination(tmp_path, monkeypatch):
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'users.db'}")
+    for name in ('models', 'database'):
+        sys.modules.pop(name, None)
+    import models
+    import database
+    models.create_tables()
+
+    async def scenario():
+        writer = database.SynergyLogWriter(batch_size=25, flush_interval=0.01).start()
+        for i in range(60):
+            writer.log(user_id=1 if i % 2 == 0 else 2, task_payload=f"task {i}", strategy_used="hybrid")
+        await writer.stop()
+        assert writer.get_stats()['written'] == 60 and writer.get_stats()['batches'] <= 4
+
+        seen, cursor = [], None
+        async with database.AsyncSessionLocal() as session:
+            while True:
+                logs, cursor = await database.fetch_synergy_history(session, 1, limit=7, cursor=cursor)
+                seen.extend(log.id for log in logs)
+                if cursor is None:
+                    break
+        await database.dispose_engine()
+        return seen
+
+    seen = asyncio.run(scenario())
+    assert len(seen) == 30 and len(set(seen)) == 30
+
+
+def test_stop_writes_rows_already_taken_by_the_writer(tmp_path, monkeypatch):
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'users.db'}")
+    for name in ('models', 'database'):
+        sys.modules.pop(name, None)
+    import models
+    import database
+    models.create_tables()
+
+    async def scenario():
+        writer = database.SynergyLogWriter(batch_size=100, flush_interval=60).start()
+        for i in range(10):
+            writer.log(user_id=1, task_payload=f"task {i}")
+        await asyncio.sleep(0)  # _run zdejmuje wpisy z kolejki i czeka na resztę partii
+        writer.log(user_id=1, task_payload="ostatni")
+        await writer.stop()
+        stats = writer.get_stats()
+        await database.dispose_engine()
+        return stats
+
+    stats = asyncio.run(scenario())
+    assert stats["written"] == 11 and stats["pending"] == 0 and stats["batches"] == 1
+
+
+def test_synergy_task_logs_go_through_the_writer(tmp_path, monkeypatch):
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'users.db'}")
+    for name in ('models', 'database', 'session_store'):
+        sys.modules.pop(name, None)
+    import models
+    import database
+    import session_store
+    models.create_tables()
+    with models.SessionLocal() as db:
+        db.add(models.User(email="neo@example.com", username="neo", hashed_password="x"))
+        db.commit()
+
+    async def scenario():
+        writer = database.synergy_log_writer.start()
+        user_id = await database.find_user_id("neo@example.com")
+        assert await database.find_user_id("neo@example.com") == user_id  # z cache
+        assert session_store.user_cache.stats["hits"] == 1
+        assert await database.find_user_id("ghost@example.com") is None
+        writer.log(user_id, task_payload="zadanie", strategy_used="creative", success_percentage=88)
+        await writer.stop()
+        async with database.AsyncSessionLocal() as session:
+            logs, _ = await database.fetch_synergy_history(session, user_id)
+        await database.dispose_engine()
+        return logs
+
+    logs = asyncio.run(scenario())
+    assert [(log.task_payload, log.strategy_used, log.success_percentage) for log in logs] == [("zadanie", "creative", 88)]
+
+
+def test_get_current_user_cache_and_invalidation_after_commit(tmp_path, monkeypatch):
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'users.db'}")
+    for name in ('models', 'database', 'session_store'):
+        sys.modules.pop(name, None)
+    import models
+    import database
+    endpoints = load_endpoints()
+    from sqlalchemy import select
+    from auth import create_access_token
+    models.create_tables()
+    with models.SessionLocal() as db:
+        db.add(models.User(email="trin@example.com", username="trin", hashed_password="x", full_name="Trinity"))
+        db.commit()
+    token = create_access_token(data={"sub": "trin@example.com"})
+    cache = endpoints.user_cache
+
+    queries = []
+    real_factory = endpoints.AsyncSessionLocal
+    monkeypatch.setattr(endpoints, "AsyncSessionLocal", lambda: queries.append(1) or real_factory())
+
+    async def update(rollback=False, **changes):
+        async with real_factory() as session:
+            user = (await session.execute(select(models.User))).scalar_one()
+            for name, value in changes.items():
+                setattr(user, name, value)
+            await session.flush()
+            assert await cache.get("trin@example.com") is not None  # przed commit cache bez zmian
+            if rollback:
+                await session.rollback()
+            else:
+                await session.commit()
+        await asyncio.sleep(0)  # zadanie unieważnienia
+
+    async def scenario():
+        first = await endpoints.get_current_user(token)
+        second = await endpoints.get_current_user(token)
+        assert first.full_name == second.full_name == "Trinity" and len(queries) == 1
+        assert cache.stats["hits"] == 1
+
+        await update(last_login=datetime.utcnow())  # nie dotyczy pól w cache
+        await endpoints.get_current_user(token)
+        assert len(queries) == 1 and cache.stats["invalidations"] == 0
+
+        await update(full_name="Neo's friend", rollback=True)
+        assert (await endpoints.get_current_user(token)).full_name == "Trinity" and len(queries) == 1
+
+        await update(user_type="admin")
+        assert cache.stats["invalidations"] == 1 and not endpoints._invalidation_tasks
+        refreshed = await endpoints.get_current_user(token)
+        assert refreshed.user_type == "admin" and len(queries) == 2
+
+        stale_generation = cache.generation("trin@example.com")
+        cache.mark_stale("trin@example.com")
+        await cache.invalidate("trin@example.com")
+        await cache.put("trin@example.com", refreshed, stale_generation)  # odczyt sprzed zmiany
+        assert await cache.get("trin@example.com") is None
+        await database.dispose_engine()
+
+    asyncio.run(scenario())
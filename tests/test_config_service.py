@@ -0,0 +1,35 @@
+import os
+import sys
+import pathlib
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+import pytest
+from gokai_core.config_service import ConfigService
+
+
+def test_snapshot_is_immutable_and_reloads_on_mtime_change(tmp_path):
+    path = tmp_path / 'config.yml'
+    path.write_text('version: 1\nmodules: [a, b]\n', encoding='utf-8')
+    service = ConfigService(str(path))
+    first = service.snapshot()
+    assert first['version'] == 1 and first['modules'] == ('a', 'b')
+    with pytest.raises(TypeError):
+        first['version'] = 2
+    assert service.check() is False
+
+    path.write_text('version: 2\n', encoding='utf-8')
+    os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 10**9))
+    assert service.check() is True
+    assert service.snapshot()['version'] == 2 and first['version'] == 1
+
+    path.write_text('version: [broken\n', encoding='utf-8')
+    os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 2 * 10**9))
+    assert service.check() is False
+    assert service.snapshot()['version'] == 2
+    assert service.get_stats()['errors'] == 1 and service.get_stats()['reloads'] == 1
+
+
+def test_missing_file_has_no_snapshot(tmp_path):
+    service = ConfigService(str(tmp_path / 'missing.yml'))
+    assert service.snapshot() is None and not service.available
@@ -0,0 +1,78 @@
+import os
+import sys
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from ai_furby_cyber_san_andreas import FurbyCyberSanAndreas  # noqa: E402
+from cyber_market import CyberMarketEngine  # noqa: E402
+
+
+def catalog():
+    return FurbyCyberSanAndreas(seed=0).market_items
+
+
+def test_history_is_a_bounded_ring_in_tick_order():
+    engine = CyberMarketEngine(catalog(), n_markets=3, history_size=4, seed=1)
+    snapshots = [engine.prices.copy()]
+    for _ in range(5):
+        engine.tick()
+        snapshots.append(engine.prices.copy())
+    history = engine.price_history()
+    assert history.shape == (4, 3, engine.n_items)
+    assert np.array_equal(history, np.stack(snapshots[-4:]))
+    assert np.array_equal(engine.price_history(2), np.stack(snapshots[-4:])[:, 2])
+
+    # Tick jednego sharda nie zmienia pozostałych rynków ani ich historii
+    before = engine.prices.copy()
+    engine.tick(markets=1)
+    assert np.array_equal(engine.prices[[0, 2]], before[[0, 2]])
+    assert np.array_equal(engine.price_history(0), np.stack(snapshots[-4:])[:, 0])
+    assert np.array_equal(engine.price_history(1)[-1], engine.prices[1])
+    assert np.array_equal(engine.price_history(1)[:-1], np.stack(snapshots[-3:])[:, 1])
+    assert engine.ticks == 6 and engine.market_ticks.tolist() == [6, 7, 6]
+
+
+def test_partial_ticks_keep_per_market_windows():
+    engine = CyberMarketEngine(catalog(), n_markets=2, history_size=8, seed=5)
+    for _ in range(3):
+        engine.tick(markets=0)
+    assert engine.price_history(0).shape[0] == 4 and engine.price_history(1).shape[0] == 1
+    assert engine.price_history().shape == (1, 2, engine.n_items)
+    assert engine.analysis(1)['window'] == 1
+
+
+def test_analysis_matches_item_by_item_report():
+    items = catalog()
+    engine = CyberMarketEngine(items, n_markets=2, history_size=8, seed=2)
+    for _ in range(10):
+        engine.tick()
+    engine.apply_prices(items, market=1)
+    report = engine.analysis(1, portfolio=items[:2])
+
+    assert report['market_cap'] == sum(item['price'] for item in items)
+    assert report['average_price'] == report['market_cap'] // len(items)
+    assert report['portfolio_value'] == items[0]['price'] + items[1]['price']
+    gadgets = [item['price'] for item in items if item['category'] == 'gadget']
+    assert report['categories']['gadget']['average'] == sum(gadgets) // len(gadgets)
+    assert report['window'] == 8 and len(report['movers']) == 3
+
+
+def test_games_share_a_sharded_market():
+    engine = CyberMarketEngine(catalog(), n_markets=4, seed=3)
+    first, second = FurbyCyberSanAndreas(market=engine, shard=0), FurbyCyberSanAndreas(market=engine, shard=3)
+    engine.tick()
+    first.update_market_prices()
+    second.update_market_prices()
+    assert [item['price'] for item in first.market_items] == engine.prices[0].tolist()
+    assert [item['price'] for item in second.market_items] == engine.prices[3].tolist()
+    assert engine.ticks == 2  # gry na wspólnym rynku nie wykonują własnych ticków
+
+    own = FurbyCyberSanAndreas(seed=4)
+    own.update_market_prices()
+    assert own.market.ticks == 2
+    assert all(item['price'] >= 35 for item in own.market_items)
@@ -0,0 +1,135 @@
+import asyncio
+import json
+import sys
+import pathlib
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+import pytest
+from double_pipeline.config import GOKAI_CONFIG
+from double_pipeline.utils import BaseParams
+from double_pipeline.memory import ShortTermMemory, EpisodicMemory
+from double_pipeline.session import PipelineSession, PipelineSessionManager
+from double_pipeline.event_sources import JsonlReplaySource, KafkaEventSource
+from double_pipeline.inmemory_broker import InMemoryBroker
+from double_pipeline.streaming import StreamingPipeline
+
+
+def make_session(session_id='s1'):
+    return PipelineSession(
+        session_id,
+        BaseParams(**GOKAI_CONFIG['base_params']),
+        GOKAI_CONFIG['MATRIX_347743'],
+        GOKAI_CONFIG['alpha_schedule'],
+        GOKAI_CONFIG['max_fibonacci_n'],
+        personality=GOKAI_CONFIG['personality'],
+        modes=GOKAI_CONFIG['modes'],
+    )
+
+
+def test_session_keeps_spiral_state_between_messages():
+    session = make_session()
+    outputs = [session.submit({'payload': f'pytanie {i}'}) for i in range(8)]
+    assert [o.stage for o in outputs] == [0, 1, 2, 3, 4, 5, 6, 0]
+    assert outputs[-1].level == 1
+    assert [o.n for o in outputs] == list(range(1, 9))
+    assert session.steps == 8
+
+
+def test_session_accepts_empty_payload():
+    session = make_session()
+    assert session.submit({'payload': ''}).stage == 0
+    assert session.submit('').stage == 1
+
+
+def test_manager_reuses_and_evicts_idle_sessions():
+    manager = PipelineSessionManager(make_session, idle_ttl=60, max_sessions=2)
+    first = manager.get('a')
+    assert manager.get('a') is first
+    manager.get('b')
+    manager.get('c')
+    assert 'a' not in manager and len(manager) == 2
+    manager.get('b').last_used -= 120
+    assert manager.evict_idle() == 1
+    assert manager.get_stats()['evicted_sessions'] == 2
+
+
+def test_manager_replaces_session_after_cycle_error():
+    manager = PipelineSessionManager(make_session)
+    broken = manager.get('a')
+
+    def failing_cycle():
+        raise ValueError('zły krok')
+        yield
+
+    broken._cycle = failing_cycle()
+    with pytest.raises(ValueError):
+        manager.submit('a', {'payload': 'x'})
+    assert 'a' not in manager
+    with pytest.raises(RuntimeError):
+        broken.submit({'payload': 'y'})
+    assert manager.submit('a', {'payload': 'y'}).stage == 0
+    assert manager.get('a') is not broken
+
+
+def test_short_term_memory_index_follows_deque_window():
+    stm = ShortTermMemory(maxlen=3)
+    stm.put('a', 1)
+    stm.put('b', 2)
+    stm.put('a', 3)
+    assert stm.get_last('a') == 3
+    stm.put('c', 4)
+    stm.put('c', 5)
+    assert stm.get_last('b', 'missing') == 'missing'
+    assert stm.get_last('a') == 3
+    stm.put('c', 6)
+    assert stm.get_last('a') is None
+    assert [item['value'] for item in stm.data] == [4, 5, 6]
+
+
+def test_episodic_memory_is_bounded_and_spills(tmp_path):
+    spill = tmp_path / 'episodes.jsonl'
+    epi = EpisodicMemory(capacity=4, spill_path=str(spill))
+    for i in range(10):
+        epi.add(level=i // 7, stage=i % 7, n=i + 1, success=float(i * 10), conf=0.5)
+    assert len(epi) == 4
+    assert [e['n'] for e in epi.get_recent(2)] == [9, 10]
+    assert epi.mean_success() == (60 + 70 + 80 + 90) / 4
+    assert epi.mean_success(window=2) == 85.0
+    assert epi.window_stats(3)['min_success'] == 70.0
+    assert [e['n'] for e in epi.iter_spilled()] == list(range(1, 9))
+
+
+def test_streaming_pipeline_replays_jsonl_in_session_order(tmp_path):
+    path = tmp_path / 'events.jsonl'
+    path.write_text('\n'.join(
+        json.dumps({'payload': f'zdarzenie {i}', 'session_id': f'u{i % 2}'}) for i in range(10)
+    ) + '\n', encoding='utf-8')
+    results = []
+    pipeline = StreamingPipeline(JsonlReplaySource(str(path)), buffer_size=4, batch_size=3,
+                                 max_concurrency=2, on_result=results.append)
+    stats = asyncio.run(pipeline.run())
+    assert stats['received'] == 10 and stats['processed'] == 10
+    for session_id in ('u0', 'u1'):
+        steps = [r['step'] for r in results if r['session_id'] == session_id and r['step']]
+        assert [s.n for s in steps] == sorted(s.n for s in steps)
+
+
+def test_kafka_source_commits_after_batches_with_inmemory_broker():
+    broker = InMemoryBroker(partitions=2)
+    producer = broker.producer(value_serializer=lambda v: json.dumps(v).encode('utf-8'))
+    for i in range(12):
+        producer.send('migi_tasks', {'task': f'zadanie {i}'})
+    producer.flush()
+    consumer = broker.consumer('migi_tasks', group_id='g1',
+                               value_deserializer=lambda x: json.loads(x.decode('utf-8')))
+    source = KafkaEventSource(consumer=consumer, poll_timeout_ms=10, stop_when_idle=True)
+
+    async def run():
+        stats = await StreamingPipeline(source, batch_size=5, max_concurrency=2).run()
+        await source.close()
+        return stats
+
+    assert asyncio.run(run())['processed'] == 12
+    assert sum(broker.committed('g1', tp) for tp in broker.topic_partitions('migi_tasks')) == 12
+    assert broker.consumer('migi_tasks', group_id='g1').poll(10) == {}
@@ -0,0 +1,121 @@
+import sys
+import pathlib
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / 'TokenSystem'))
+sys.path.insert(0, str(ROOT / 'FurbyGame125D'))
+
+import dataclasses
+import pytest
+import furby_san_andreas
+import game_state_store
+from furby_san_andreas import FurbyGame125D, GameSessionCache, get_game_world
+from game_state_store import GameStateStore
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    store = GameStateStore(str(tmp_path / 'state.db'), flush_interval=3600)
+    game_state_store.set_game_state_store(store)
+    yield store
+    game_state_store.close_game_state_store()
+
+
+def test_world_is_shared_and_frozen(store):
+    first, second = FurbyGame125D('p1'), FurbyGame125D('p2')
+    assert first.locations is second.locations is get_game_world().locations
+    assert first.npcs['Beach_Babe'] is second.npcs['Beach_Babe']
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        first.locations[0].entry_cost = 5
+    with pytest.raises(TypeError):
+        first.vehicles['hacked'] = None
+    with pytest.raises(TypeError):
+        first.missions['tutorial']['reward_fbx'] = 1e9
+    assert not hasattr(first, '__dict__')
+    first.player.cash_usd += 10
+    assert second.player.cash_usd == first.player.cash_usd - 10
+
+
+def test_session_cache_persists_games_on_eviction(store, monkeypatch):
+    now = [0.0]
+    saved = []
+    monkeypatch.setattr(furby_san_andreas.time, 'monotonic', lambda: now[0])
+    cache = GameSessionCache(on_evict=lambda game: saved.append(game.user_id),
+                             idle_ttl=60, max_sessions=2)
+    a = cache.get('a')
+    cache.get('b')
+    assert cache.get('a') is a
+    cache.get('c')  # LRU: 'b' wypada
+    assert saved == ['b'] and 'b' not in cache and len(cache) == 2
+    now[0] = 120.0
+    assert cache.evict_idle() == 2 and sorted(saved) == ['a', 'b', 'c']
+    cache.get('d')
+    del cache['d']
+    assert 'd' not in cache and cache.get_stats()['evicted_games'] == 3
+
+
+def test_session_cache_loads_games_outside_the_lock(store):
+    import threading
+    started, release, calls = threading.Event(), threading.Event(), []
+
+    def slow_factory(user_id):
+        calls.append(user_id)
+        if user_id == 'slow':
+            started.set()
+            assert release.wait(5)
+        return FurbyGame125D(user_id)
+    cache = GameSessionCache(game_factory=slow_factory)
+    fast = cache.get('fast')
+    results = []
+    loaders = [threading.Thread(target=lambda: results.append(cache.get('slow'))) for _ in range(3)]
+    for thread in loaders:
+        thread.start()
+    assert started.wait(5)
+    assert cache.get('fast') is fast  # wczytywanie 'slow' nie blokuje innych graczy
+    release.set()
+    for thread in loaders:
+        thread.join(5)
+    assert calls == ['fast', 'slow'] and len(results) == 3
+    assert all(game is results[0] for game in results) and cache.get('slow') is results[0]
+
+
+def test_state_store_coalesces_writes_and_serves_pending_state(store, tmp_path):
+    for cash in range(100):
+        store.save('p', {'cash': cash})
+    store.save('q', {'cash': 1})
+    assert store.load('p') == {'cash': 99}
+    assert store.flush() == 2 and store.get_stats()['coalesced'] == 99
+    store.delete('q')
+    assert store.load('q') is None
+    store.flush()
+    reopened = GameStateStore(str(tmp_path / 'state.db'), autostart=False)
+    assert reopened.load('p') == {'cash': 99} and reopened.load('q') is None
+    reopened.close()
+
+
+def test_games_load_once_and_persist_through_store(store, tmp_path):
+    cache = GameSessionCache(max_sessions=1)
+    game = cache.get('alice')
+    game.position, game.difficulty = 2, 'hard'
+    game.player.cash_usd = 4242
+    cache.get('bob')  # alice wypada z cache i trafia do magazynu
+    assert store.get_stats()['pending'] == 1 and not list(tmp_path.glob('game_save_*.json'))
+    store.flush()
+    restored = cache.get('alice')
+    assert restored is not game
+    assert (restored.position, restored.difficulty, restored.player.cash_usd) == (2, 'hard', 4242)
+    furby_san_andreas.reset_game('alice')
+    store.flush()
+    assert store.load('alice') is None
+
+
+def test_settings_menu_reset_deletes_stored_state(store, monkeypatch):
+    game = FurbyGame125D('cli')
+    game.save_game_state()
+    store.flush()
+    answers = iter(['4', 'yes', '', '5'])
+    monkeypatch.setattr('builtins.input', lambda prompt='': next(answers))
+    monkeypatch.setattr(FurbyGame125D, 'clear_screen', lambda self: None)
+    game.settings_menu()
+    store.flush()
+    assert store.load('cli') is None
@@ -0,0 +1,68 @@
+import json
+import os
+import sys
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'TokenSystem'))
+sys.path.insert(0, os.path.join(ROOT, 'FurbyGame125D'))
+
+from ai_furby_cyber_san_andreas import FurbyCyberSanAndreas  # noqa: E402
+from furby_san_andreas import FurbyGame125D  # noqa: E402
+from furby_simulation import CHOICES, FurbySimulation, simulate_market_prices  # noqa: E402
+
+
+def test_session_seed_makes_encounters_reproducible():
+    def outcomes(game):
+        game.player.reputation = 30
+        return [game.handle_encounter_choice('Street_Hustler', choice) for choice in '135' * 20]
+
+    assert outcomes(FurbyGame125D('seed_a', seed=42)) == outcomes(FurbyGame125D('seed_b', seed=42))
+    assert outcomes(FurbyGame125D('seed_a', seed=42)) != outcomes(FurbyGame125D('seed_a', seed=43))
+
+    game = FurbyGame125D('seed_a', seed=7)
+    assert game.to_save_data()['rng_seed'] == 7
+
+    # Wczytanie zapisu (bez postępu game_time, jak w serwerze) nie powtarza losowań
+    game.player.reputation = 30
+    game.handle_encounter_choice('Street_Hustler', '3')
+    save_data = json.loads(json.dumps(game.to_save_data()))
+    expected = [game.handle_encounter_choice('Street_Hustler', c) for c in '135' * 5]
+    reloaded = FurbyGame125D('seed_a', seed=99)
+    reloaded.apply_save_data(save_data)
+    assert reloaded.seed == 7 and reloaded.game_time == game.game_time
+    assert [reloaded.handle_encounter_choice('Street_Hustler', c) for c in '135' * 5] == expected
+
+    prices = [[item['price'] for item in FurbyCyberSanAndreas(seed=5).market_items] for _ in range(2)]
+    assert prices[0] == prices[1]
+
+
+def test_vectorized_encounters_match_game_rules():
+    # Tylko "Sweet Talk" przy reputacji 30: szansa min(0.8, 0.4 + 0.3) = 0.7
+    weights = [1.0 if choice == '1' else 0.0 for choice in CHOICES]
+    sim = FurbySimulation(policy={'encounter': 1.0}, choice_weights=weights)
+    state = sim.initial_state(20000)
+    state['reputation'][:] = 30
+    report = sim.run(20000, 1, seed=3, state=state)
+    summary = report.summary()['encounters']['sweet_talk']
+    assert summary['blocked'] == 0
+    assert summary['success_rate'] == pytest.approx(0.7, abs=0.02)
+
+    first, second = FurbySimulation().run(500, 50, seed=11), FurbySimulation().run(500, 50, seed=11)
+    for name, values in first.final.items():
+        assert np.array_equal(values, second.final[name])
+    assert first.summary()['stats']['cash_usd']['p50'] >= 0
+
+
+def test_market_price_simulation_follows_rarity_bounds():
+    items = FurbyCyberSanAndreas(seed=1).market_items
+    prices = simulate_market_prices(items, n_markets=64, n_ticks=100, seed=2)
+    assert prices.shape == (100, 64, len(items))
+    common = items.index(next(item for item in items if item['name'] == 'Quantum Vibrator'))
+    assert prices[:, :, common].max() <= int(400 * 1.1 * 1.5)
+    assert prices.min() >= 35  # max(50, ...) * 0.7 po krachu
+    assert simulate_market_prices(items, n_markets=3, n_ticks=0).shape == (0, 3, len(items))
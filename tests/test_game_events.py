@@ -0,0 +1,83 @@
+import json
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'TokenSystem'))
+sys.path.insert(0, os.path.join(ROOT, 'FurbyGame125D'))
+
+from furby_san_andreas import FurbyGame125D  # noqa: E402
+from game_events import GameStateBroadcaster, format_sse  # noqa: E402
+
+
+def drain(subscription):
+    events = []
+    while True:
+        item = subscription.get(timeout=0)
+        if item is None:
+            return events
+        events.append(item)
+
+
+def test_world_sent_once_then_compact_deltas():
+    broadcaster = GameStateBroadcaster()
+    game = FurbyGame125D('stream_player')
+    subscription = broadcaster.subscribe('stream_player', game)
+
+    world, state = drain(subscription)
+    assert world[1] == 'world' and world[2]['locations'][0]['ascii_art']
+    assert state[1] == 'state' and state[2]['cash_usd'] == game.player.cash_usd
+
+    game.position = 1
+    game.player.cash_usd -= 50
+    assert broadcaster.publish_state('stream_player', game) == {'position': 1, 'cash_usd': game.player.cash_usd}
+    assert broadcaster.publish_state('stream_player', game) == {}
+    broadcaster.publish('stream_player', 'encounter', {'result': {'success': True}})
+
+    events = drain(subscription)
+    assert [e[1] for e in events] == ['state', 'encounter']
+    assert 'ascii_art' not in json.dumps(events[0][2])
+    assert events[0][0] < events[1][0]
+
+    broadcaster.unsubscribe(subscription)
+    assert broadcaster.publish_state('stream_player', game) is None
+    assert broadcaster.get_stats()['open_streams'] == 0
+
+
+def test_slow_client_gets_resync_instead_of_backlog():
+    broadcaster = GameStateBroadcaster(queue_size=4, keepalive=0)
+    game = FurbyGame125D('slow_player')
+    subscription = broadcaster.subscribe('slow_player', game)
+    for energy in range(10):
+        game.player.energy = energy
+        broadcaster.publish_state('slow_player', game)
+
+    stream = broadcaster.stream(subscription, lambda: game)
+    assert next(stream) == 'retry: 3000\n\n'
+    message = next(stream)
+    assert message.startswith('event: resync\n')
+    assert json.loads(message.split('data: ', 1)[1])['energy'] == 9
+    assert subscription.dropped > 0
+    stream.close()
+    assert not broadcaster.has_subscribers('slow_player')
+
+
+def test_resync_keeps_the_event_that_triggered_it():
+    broadcaster = GameStateBroadcaster(queue_size=4, keepalive=0)
+    game = FurbyGame125D('encounter_player')
+    subscription = broadcaster.subscribe('encounter_player', game)
+    for energy in range(2):
+        game.player.energy = energy
+        broadcaster.publish_state('encounter_player', game)
+    broadcaster.publish('encounter_player', 'encounter', {'result': {'success': True}})  # przepełnia kolejkę
+
+    stream = broadcaster.stream(subscription, lambda: game)
+    next(stream)
+    assert next(stream).startswith('event: resync\n')
+    message = next(stream)
+    assert 'event: encounter\n' in message and '"success":true' in message
+    stream.close()
+
+
+def test_format_sse():
+    assert format_sse('state', {'heat': 5}, 7) == 'id: 7\nevent: state\ndata: {"heat":5}\n\n'
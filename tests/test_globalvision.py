@@ -0,0 +1,161 @@
+import json
+import sys
+import pathlib
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / 'GlobalVision_Module'))
+
+import collective_self
+from collective_self import UserEchoMapper, iter_json_records
+
+
+def test_streaming_parser_handles_arrays_and_jsonl(tmp_path):
+    records = [{"user_id": f"u{i}", "narrative": "odkrywam " * i} for i in range(300)]
+    array_path, jsonl_path = tmp_path / 'a.json', tmp_path / 'b.jsonl'
+    array_path.write_text(json.dumps(records, ensure_ascii=False, indent=2), encoding='utf-8')
+    jsonl_path.write_text("\n".join(json.dumps(r) for r in records), encoding='utf-8')
+    assert list(iter_json_records(str(array_path), chunk_size=16)) == records
+    assert list(iter_json_records(str(jsonl_path), chunk_size=16)) == records
+
+
+def test_streaming_parser_ignores_a_single_json_object(tmp_path):
+    spiral_log = ROOT / 'SpiralMind_OS' / 'core' / 'spiral_log.json'
+    assert isinstance(json.loads(spiral_log.read_text(encoding='utf-8')), dict)
+    assert list(iter_json_records(str(spiral_log), chunk_size=16)) == []
+    compact = tmp_path / 'state.json'
+    compact.write_text(json.dumps({"user_id": "x", "narrative": "spokój"}), encoding='utf-8')
+    assert list(iter_json_records(str(compact))) == []
+    single = tmp_path / 'one.jsonl'
+    single.write_text(json.dumps({"user_id": "x"}) + "\n", encoding='utf-8')
+    assert list(iter_json_records(str(single))) == [{"user_id": "x"}]
+
+    mapper = UserEchoMapper()
+    assert list(collective_self.iter_reflection_echoes(mapper, str(spiral_log))) == []
+
+
+def test_collective_map_ingests_in_bulk_with_single_save(tmp_path, monkeypatch):
+    log_path = tmp_path / 'reflections_log.json'
+    log_path.write_text(json.dumps([
+        {"user_id": "a", "narrative": "Odkrywam i zrozumiałem coś nowego"},
+        {"user_id": "b", "narrative": "Napięcie i stres, konflikt"},
+    ] * 50, ensure_ascii=False), encoding='utf-8')
+    mapper = UserEchoMapper(data_path=str(tmp_path / 'echo.json'), persist_interval=None)
+    monkeypatch.setattr(collective_self, 'GLOBAL_ECHO_MAPPER', mapper)
+    monkeypatch.setattr(collective_self, 'MAIN_CONSCIOUSNESS_AVAILABLE', False)
+    monkeypatch.chdir(tmp_path)
+
+    trends = collective_self.generate_collective_map(str(log_path))
+    assert mapper.saves == 1 and not mapper.dirty
+    assert trends['total_users'] == 2
+    saved = json.loads((tmp_path / 'echo.json').read_text(encoding='utf-8'))
+    assert set(saved['user_patterns']) == {'a', 'b'}
+
+
+def test_persist_interval_throttles_saves(tmp_path):
+    mapper = UserEchoMapper(data_path=str(tmp_path / 'echo.json'), persist_interval=3600)
+    for i in range(20):
+        mapper.add_user_echo('u', 'flow', 0.5, 'ctx')
+    assert mapper.saves == 0 and mapper.dirty
+    assert mapper.flush() and mapper.saves == 1 and not mapper.dirty
+    eager = UserEchoMapper(data_path=str(tmp_path / 'eager.json'))
+    eager.add_user_echo('u', 'flow', 0.5, 'ctx')
+    assert eager.saves == 1
+
+
+def _reference_extract(narrative):
+    text, scores = narrative.lower(), {}
+    for emotion, (keywords, base) in collective_self.EMOTION_LEXICON.items():
+        score = sum(1 for keyword in keywords if keyword in text)
+        if score > 0:
+            scores[emotion] = (score, base)
+    if not scores:
+        return ("neutral", 0.3)
+    best, best_score = None, 0
+    for emotion, (score, _) in scores.items():
+        if score > best_score:
+            best, best_score = emotion, score
+    return best, min(scores[best][1] + best_score * 0.1, 1.0)
+
+
+def test_compiled_lexicon_matches_reference_and_caches():
+    import random
+    rng = random.Random(7)
+    words = [k for keywords, _ in collective_self.EMOTION_LEXICON.values() for k in keywords]
+    words += ["Odkrywam", "NIE WIEM", "cisza", "spokój", "przekraczamy", "niepewnośćchyba", " "]
+    narratives = [" ".join(rng.choice(words) for _ in range(rng.randint(0, 8))) for _ in range(500)]
+    collective_self.clear_emotion_cache()
+    assert collective_self.extract_many(narratives) == [_reference_extract(n) for n in narratives]
+    mapper = UserEchoMapper(data_path='unused.json', persist_interval=None)
+    assert mapper.extract_emotion_from_narrative("Widzę i odkrywam") == ("discovery", 1.0)
+    assert len(collective_self._emotion_cache) == len(set(narratives)) + 1
+    before = dict(collective_self._emotion_cache)
+    collective_self.extract_many(narratives)
+    assert dict(collective_self._emotion_cache) == before
+
+
+def test_user_ring_keeps_running_counts_and_profile(tmp_path):
+    clock = iter(range(1000, 2000)).__next__
+    mapper = UserEchoMapper(data_path=str(tmp_path / 'echo.json'), persist_interval=None,
+                            user_capacity=4, clock=lambda: float(clock()))
+    for emotion, intensity in [('flow', 0.2), ('flow', 0.4), ('tension', 1.0), ('flow', 0.6), ('curiosity', 0.8)]:
+        mapper.add_user_echo('u', emotion, intensity, 'ctx')
+    profile = mapper.get_user_emotional_profile('u')
+    assert profile['total_echoes'] == 4 and profile['lifetime_echoes'] == 5
+    assert profile['emotion_distribution'] == {'flow': 2, 'tension': 1, 'curiosity': 1}
+    assert abs(profile['average_intensity'] - 0.7) < 1e-9
+    assert [e['emotion'] for e in profile['recent_echoes']] == ['flow', 'tension', 'flow', 'curiosity']
+
+    mapper.flush()
+    reloaded = UserEchoMapper(data_path=str(tmp_path / 'echo.json'), persist_interval=None, user_capacity=4)
+    assert reloaded.get_user_emotional_profile('u')['emotion_distribution'] == profile['emotion_distribution']
+    assert mapper.get_user_emotional_profile('nobody') == {"error": "User not found"}
+
+
+def test_decayed_vector_and_cached_trends(tmp_path):
+    now = [0.0]
+    mapper = UserEchoMapper(data_path=str(tmp_path / 'echo.json'), persist_interval=None,
+                            decay_half_life=10.0, clock=lambda: now[0])
+    mapper.add_user_echo('a', 'flow', 0.8, 'ctx')
+    now[0] = 10.0
+    mapper.add_user_echo('b', 'flow', 0.4, 'ctx')
+    trends = mapper.analyze_collective_trends()
+    assert abs(trends['collective_vector']['flow']['activity'] - 1.5) < 1e-9
+    assert abs(trends['collective_vector']['flow']['intensity'] - (0.4 + 0.8 * 0.5) / 1.5) < 1e-9
+    assert mapper.analyze_collective_trends()['analysis_timestamp'] == trends['analysis_timestamp']
+    assert len(mapper.trend_history) == 1
+    mapper.add_user_echo('a', 'tension', 0.9, 'ctx')
+    mapper.analyze_collective_trends()
+    assert len(mapper.trend_history) == 2
+
+
+def test_collective_map_skips_already_ingested_records(tmp_path, monkeypatch):
+    log_path = tmp_path / 'reflections_log.json'
+    log_path.write_text(json.dumps([{"user_id": "a", "narrative": "odkrywam"}] * 3), encoding='utf-8')
+    mapper = UserEchoMapper(data_path=str(tmp_path / 'echo.json'), persist_interval=None)
+    monkeypatch.setattr(collective_self, 'GLOBAL_ECHO_MAPPER', mapper)
+    monkeypatch.setattr(collective_self, 'MAIN_CONSCIOUSNESS_AVAILABLE', False)
+    monkeypatch.chdir(tmp_path)
+
+    collective_self.generate_collective_map(str(log_path))
+    collective_self.generate_collective_map(str(log_path))
+    assert len(mapper.user_patterns['a']) == 3 and mapper.saves == 1
+    log_path.write_text(json.dumps([{"user_id": "a", "narrative": "odkrywam"}] * 5), encoding='utf-8')
+    collective_self.generate_collective_map(str(log_path))
+    assert len(mapper.user_patterns['a']) == 5
+
+
+def test_rewritten_and_trimmed_logs_yield_only_new_records(tmp_path):
+    log_path = tmp_path / 'spiral_memory.json'
+    mapper = UserEchoMapper(data_path=str(tmp_path / 'echo.json'), persist_interval=None)
+
+    def window(start, stop):
+        return [{"user_id": f"u{i}", "narrative": "odkrywam"} for i in range(start, stop)][-20:]
+
+    def new_users():
+        return [echo[0] for echo in collective_self.iter_new_reflection_echoes(mapper, str(log_path))]
+
+    log_path.write_text(json.dumps(window(0, 20)), encoding='utf-8')
+    assert len(new_users()) == 20
+    log_path.write_text(json.dumps(window(0, 25)), encoding='utf-8')  # okno przesunięte - ten sam rozmiar
+    assert new_users() == [f"u{i}" for i in range(20, 25)]
+    log_path.write_text(json.dumps([{"user_id": "x", "narrative": "inna treść"}]), encoding='utf-8')
+    assert new_users() == ["x"]
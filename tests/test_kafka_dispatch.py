@@ -0,0 +1,47 @@
+import json
+import sys
+import pathlib
+import time
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from double_pipeline.inmemory_broker import InMemoryBroker
+from kafka_producer import MigiTaskProducer
+from kafka_consumer import MigiTaskConsumerGroup
+
+
+def test_pooled_producer_batches_and_reports_delivery():
+    broker = InMemoryBroker()
+    delivered = []
+    producer = MigiTaskProducer(producer_factory=lambda **cfg: broker.producer(**cfg), linger_ms=1000)
+    for i in range(50):
+        producer.send_task(f'zadanie {i}', on_delivery=delivered.append)
+    assert delivered == []
+    producer.flush()
+    assert len(delivered) == 50
+    assert broker.connections == 1 and broker.produce_requests == 1
+    assert producer.get_stats() == {'sent': 50, 'delivered': 50, 'failed': 0}
+
+
+def test_consumer_group_commits_after_each_batch():
+    broker = InMemoryBroker(partitions=2)
+    producer = broker.producer(value_serializer=lambda v: json.dumps(v).encode('utf-8'))
+    for i in range(30):
+        producer.send('migi_tasks', {'task': f'zadanie {i}'})
+    partitions = broker.topic_partitions('migi_tasks')
+
+    def factory(i):
+        consumer = broker.consumer(group_id='g', value_deserializer=lambda x: json.loads(x.decode('utf-8')))
+        consumer.assign(partitions[i::2])
+        return consumer
+
+    seen = []
+    group = MigiTaskConsumerGroup(workers=2, batch_size=10, poll_timeout_ms=10, consumer_factory=factory,
+                                  on_batch=lambda tasks, contributions: seen.extend(tasks)).start()
+    deadline = time.time() + 5
+    while group.get_stats()['processed'] < 30 and time.time() < deadline:
+        time.sleep(0.01)
+    group.stop()
+    assert sorted(seen) == sorted(f'zadanie {i}' for i in range(30))
+    assert sum(broker.committed('g', tp) for tp in partitions) == 30
+    assert group.get_stats()['commits'] == group.get_stats()['batches']
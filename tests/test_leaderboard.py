@@ -0,0 +1,59 @@
+import sys
+import pathlib
+import random
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "apps" / "api"))
+
+from leaderboard import DriftLeaderboard, SCHEMA
+from sqlite_store import SQLiteDatabase
+
+
+def ranking_from_db(database):
+    rows = database.connection().execute(
+        "SELECT name, score FROM drift_scores ORDER BY score DESC, updated ASC, name ASC").fetchall()
+    return [(row[0], row[1]) for row in rows]
+
+
+def test_migration_deduplicates_and_indexes_legacy_table(tmp_path):
+    database = SQLiteDatabase(tmp_path / "events.sqlite")
+    with database.connection() as c:
+        c.execute(SCHEMA)
+        c.executemany("INSERT INTO drift_scores(name, score, updated) VALUES(?,?,?)",
+                      [("alice", 5, 1.0), ("alice", 9, 2.0), ("bob", 7, 3.0), ("alice", 9, 4.0)])
+    board = DriftLeaderboard(database)
+    assert ranking_from_db(database) == [("alice", 9), ("bob", 7)]
+    assert board.rank("alice") == {"rank": 1, "name": "alice", "score": 9, "updated": 2.0}
+
+    conn = database.connection()
+    plan = " ".join(str(r[-1]) for r in conn.execute(
+        "EXPLAIN QUERY PLAN SELECT name, score, updated FROM drift_scores ORDER BY score DESC, updated ASC, name ASC LIMIT 5"))
+    assert "idx_drift_scores_rank" in plan and "TEMP B-TREE" not in plan
+
+    board.submit("alice", 3)  # gorszy wynik nie zmienia ani wyniku, ani czasu
+    assert board.rank("alice")["updated"] == 2.0
+    assert conn.execute("SELECT COUNT(*) FROM drift_scores").fetchone()[0] == 2
+    database.close()
+
+
+def test_cache_matches_database_beyond_capacity(tmp_path):
+    database = SQLiteDatabase(tmp_path / "events.sqlite")
+    board = DriftLeaderboard(database, capacity=10)
+    rng = random.Random(7)
+    for _ in range(400):
+        board.submit(f"p{rng.randrange(60)}", rng.randrange(100))
+    expected = ranking_from_db(database)
+    assert board.get_stats() == {"cached": 10, "capacity": 10, "complete": False}
+
+    def page(limit, offset):
+        return [(e["name"], e["score"]) for e in board.top(limit, offset)]
+
+    assert page(10, 0) == expected[:10]  # z pamięci
+    assert page(15, 5) == expected[5:20]  # poza top-K - z bazy
+    assert [e["rank"] for e in board.top(3, 4)] == [5, 6, 7]
+    for position, (name, score) in enumerate(expected, start=1):
+        assert board.rank(name)["rank"] == position and board.rank(name)["score"] == score
+    assert board.rank("nobody") is None
+
+    fresh = DriftLeaderboard(database, capacity=10)
+    assert page(10, 0) == [(e["name"], e["score"]) for e in fresh.top(10, 0)]
+    database.close()
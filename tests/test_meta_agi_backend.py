@@ -0,0 +1,59 @@
+import json
+import sys
+import pathlib
+import pytest
+pytest.importorskip("flask")
+pytest.importorskip("flask_cors")
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / 'God_Interface' / 'backend'))
+
+import meta_agi_backend
+from meta_agi_backend import SpiralMemoryModule, SpiralResult, SynergyModule
+
+
+def make_result(level):
+    return SpiralResult(level=level, n=level + 1, fibonacci=1, spiral_value=29.0, s9=2,
+                        consciousness=level / 10, entropy=1.0, stage="AWAKENING", response="",
+                        trajectory={}, drift_reward=0, metadata={})
+
+
+def test_synergy_history_is_bounded_with_running_aggregates():
+    synergy = SynergyModule(max_history=5)
+    texts = ["a", "Hello World 123!", "zzzz", "Spirala świadomości"] * 3
+    decisions = [synergy.orchestrate(text, "joy", "guidance") for text in texts]
+    stats = synergy.get_decision_stats()
+    assert stats['total_decisions'] == 12 and stats['recent_decisions'] == 5
+    assert stats['avg_confidence'] == pytest.approx(sum(d['confidence'] for d in decisions) / 12)
+    assert sum(stats['strategy_counts'].values()) == 12
+    assert list(synergy.decision_history) == decisions[-5:]
+
+
+def test_spiral_memory_window_stats_and_archive(tmp_path, monkeypatch):
+    registered = []
+    monkeypatch.setattr(meta_agi_backend.atexit, "register", registered.append)
+    archive = tmp_path / "trajectories.jsonl"
+    memory = SpiralMemoryModule(max_trajectories=4, archive_path=str(archive))
+    assert registered == [memory.flush_archive]
+
+    decision = {'strategy': 'LOGICAL_FOUNDATION', 'pipeline': ['LOGIKA:AI'], 'confidence': 0.6}
+    for level in range(1, 11):
+        memory.log_trajectory(f"input {level}", make_result(level), decision)
+    stats = memory.get_trajectory_stats()
+    assert stats['total'] == 4 and stats['total_logged'] == 10 and stats['archived'] == 6
+    assert stats['avg_level'] == pytest.approx((7 + 8 + 9 + 10) / 4)
+    assert stats['avg_consciousness'] == pytest.approx((0.7 + 0.8 + 0.9 + 1.0) / 4)
+    assert [t['id'] for t in memory.get_recent_trajectories(2)] == [9, 10]
+
+    # Mniej niż ARCHIVE_FLUSH_EVERY wpisów czeka w buforze - zapisuje je dopiero flush przy wyjściu
+    assert not archive.exists()
+    assert registered[0]() == 6
+    assert [json.loads(line)['id'] for line in archive.read_text(encoding='utf-8').splitlines()] == [1, 2, 3, 4, 5, 6]
+    assert memory.flush_archive() == 0 and memory.get_trajectory_stats()['archived'] == 6
+
+
+def test_spiral_memory_without_archive_skips_atexit(monkeypatch):
+    registered = []
+    monkeypatch.setattr(meta_agi_backend.atexit, "register", registered.append)
+    SpiralMemoryModule(max_trajectories=2)
+    assert registered == []
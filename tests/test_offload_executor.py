@@ -0,0 +1,55 @@
+import asyncio
+import sys
+import pathlib
+import threading
+import time
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+import pytest
+from offload_executor import OffloadExecutor, WorkQueueFullError
+
+
+def test_lane_serializes_work_off_the_event_loop():
+    active, peak, threads = [0], [0], set()
+    lock = threading.Lock()
+
+    def work(x):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        threads.add(threading.get_ident())
+        time.sleep(0.005)
+        with lock:
+            active[0] -= 1
+        return x * 2
+
+    async def scenario():
+        offload = OffloadExecutor(max_workers=4)
+        offload.lane('spiral')
+        results = await asyncio.gather(*[offload.run('spiral', work, i) for i in range(10)])
+        stats = offload.get_stats()['lanes']['spiral']
+        await offload.shutdown()
+        return results, stats
+
+    results, stats = asyncio.run(scenario())
+    assert results == [i * 2 for i in range(10)]
+    assert peak[0] == 1 and threading.get_ident() not in threads
+    assert stats['completed'] == 10 and stats['queued'] == 0
+
+
+def test_saturated_lane_rejects_and_propagates_errors():
+    async def scenario():
+        offload = OffloadExecutor(max_workers=2, queue_size=2)
+        offload.lane('synergy')
+        calls = [offload.run('synergy', time.sleep, 0.02) for _ in range(6)]
+        outcomes = await asyncio.gather(*calls, return_exceptions=True)
+        with pytest.raises(ZeroDivisionError):
+            await offload.run('synergy', lambda: 1 / 0)
+        stats = offload.get_stats()['lanes']['synergy']
+        await offload.shutdown()
+        return outcomes, stats
+
+    outcomes, stats = asyncio.run(scenario())
+    assert any(isinstance(o, WorkQueueFullError) for o in outcomes)
+    assert stats['rejected'] >= 1 and stats['failed'] == 1
@@ -0,0 +1,39 @@
+import asyncio
+import sys
+import pathlib
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+pytest.importorskip("passlib")
+pytest.importorskip("bcrypt")
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / '6_USER_AUTH_SYSTEM' / 'backend'))
+
+from password_hashing import PasswordHasher, HashingOverloadedError
+
+
+def test_process_pool_hash_and_verify():
+    hasher = PasswordHasher(max_workers=1, rounds=4)
+
+    async def scenario():
+        hashed = await hasher.hash('haslo')
+        return hashed, await hasher.verify('haslo', hashed), await hasher.verify('zle', hashed)
+
+    hashed, ok, bad = asyncio.run(scenario())
+    hasher.shutdown()
+    assert hashed.startswith('$2b$04$') and ok and not bad
+    stats = hasher.get_stats()
+    assert stats['hashed'] == 1 and stats['verified'] == 2 and stats['in_flight'] == 0
+
+
+def test_concurrency_limit_and_queue_overflow():
+    hasher = PasswordHasher(max_workers=1, max_concurrency=1, max_queue=2, rounds=4,
+                            executor_factory=lambda n: ThreadPoolExecutor(n))
+
+    async def scenario():
+        return await asyncio.gather(*[hasher.hash(f'p{i}') for i in range(6)], return_exceptions=True)
+
+    results = asyncio.run(scenario())
+    hasher.shutdown()
+    rejected = [r for r in results if isinstance(r, HashingOverloadedError)]
+    assert len(rejected) == 3 and hasher.get_stats()['max_queued'] == 2
@@ -0,0 +1,59 @@
+import asyncio
+import sys
+import pathlib
+from datetime import datetime
+from types import SimpleNamespace
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / '6_USER_AUTH_SYSTEM' / 'backend'))
+
+from session_store import (InMemorySessionStore, LocalRedisStandIn, RedisSessionStore,
+                           UserCache, CACHED_USER_FIELDS)
+
+
+def make_user(**overrides):
+    fields = {name: None for name in CACHED_USER_FIELDS}
+    fields.update(id=7, email='a@b.pl', username='a', user_type='creator',
+                  created_at=datetime(2024, 1, 2, 3, 4, 5), hashed_password='secret')
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+def check_user_cache(store):
+    cache = UserCache(store, ttl=30)
+
+    async def scenario():
+        assert await cache.get('a@b.pl') is None
+        await cache.put('a@b.pl', make_user())
+        cached = await cache.get('a@b.pl')
+        assert cached.id == 7 and cached.user_type == 'creator'
+        assert cached.created_at == datetime(2024, 1, 2, 3, 4, 5)
+        assert not hasattr(cached, 'hashed_password')
+        await cache.invalidate('a@b.pl')
+        assert await cache.get('a@b.pl') is None
+
+    asyncio.run(scenario())
+    assert cache.get_stats() == {'hits': 1, 'misses': 2, 'invalidations': 1}
+
+
+def test_user_cache_in_memory_backend():
+    check_user_cache(InMemorySessionStore())
+
+
+def test_user_cache_redis_backend_with_local_stand_in():
+    client = LocalRedisStandIn()
+    check_user_cache(RedisSessionStore(client=client))
+    assert client.commands == 5
+
+
+def test_in_memory_store_expires_and_evicts():
+    store = InMemorySessionStore(max_entries=2)
+
+    async def scenario():
+        await store.set('a', {'v': 1}, ttl=0)
+        assert await store.get('a') is None
+        for key in 'bcd':
+            await store.set(key, {'v': key}, ttl=60)
+        return await store.get('b'), await store.get('d')
+
+    assert asyncio.run(scenario()) == (None, {'v': 'd'})
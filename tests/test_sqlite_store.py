@@ -0,0 +1,77 @@
+import sys
+import pathlib
+import threading
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "apps" / "api"))
+
+from sqlite_store import EventWriter, SQLiteDatabase
+
+SCHEMA = "CREATE TABLE events (id INTEGER PRIMARY KEY AUTOINCREMENT, ts REAL NOT NULL, event TEXT NOT NULL, user TEXT, meta TEXT)"
+
+
+def test_connection_per_thread_with_wal(tmp_path):
+    database = SQLiteDatabase(tmp_path / "events.sqlite")
+    conn = database.connection()
+    assert database.connection() is conn
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+    other = []
+    thread = threading.Thread(target=lambda: other.append(database.connection()))
+    thread.start()
+    thread.join()
+    assert other[0] is not conn
+    database.close()
+
+
+def test_event_writer_batches_and_flushes(tmp_path):
+    database = SQLiteDatabase(tmp_path / "events.sqlite")
+    database.connection().execute(SCHEMA)
+    writer = EventWriter(database, batch_size=1000, flush_interval=3600, autostart=False)
+    for i in range(250):
+        writer.log("ping", user="tester", meta={"i": i})
+
+    def count():
+        return database.connection().execute("SELECT COUNT(*) FROM events").fetchone()[0]
+
+    assert count() == 0 and writer.get_stats()["pending"] == 250
+    assert writer.flush() == 250
+    assert count() == 250 and writer.stats["batches"] == 1
+
+    writer = EventWriter(database, batch_size=50, flush_interval=3600).start()
+    for i in range(120):
+        writer.log("pong")
+    writer.close()
+    assert count() == 370
+    row = database.connection().execute("SELECT event, user, meta FROM events ORDER BY id LIMIT 1").fetchone()
+    assert (row["event"], row["user"], row["meta"]) == ("ping", "tester", '{"i": 0}')
+    database.close()
+
+
+def test_csv_export_streams_filtered_chunks(tmp_path):
+    import csv
+    import gzip
+    import io
+    from sqlite_store import events_query, gzip_chunks, iter_events_csv, parse_timestamp
+    database = SQLiteDatabase(tmp_path / "events.sqlite")
+    conn = database.connection()
+    conn.execute(SCHEMA)
+    conn.execute("CREATE INDEX idx_events_event_ts ON events(event, ts)")
+    conn.executemany("INSERT INTO events(ts, event, user, meta) VALUES(?,?,?,?)",
+                     [(1000.0 + i, "ping" if i % 2 else "pong", None, "{}") for i in range(100)])
+    conn.commit()
+
+    chunks = list(iter_events_csv(database.open(track=False), chunk_rows=10, close=True))
+    assert len(chunks) == 11 and chunks[0].startswith("ts_iso,event")
+    rows = list(csv.reader(io.StringIO("".join(chunks))))
+    assert len(rows) == 101 and rows[1][0] == "1970-01-01T00:16:40Z"
+
+    since, until = parse_timestamp("1970-01-01T00:16:50Z"), parse_timestamp("1070")
+    filtered = list(csv.reader(io.StringIO("".join(iter_events_csv(conn, since, until, ["ping"])))))
+    assert [r[1] for r in filtered[1:]] == ["ping"] * 30
+    sql, params = events_query(since, until, ["ping"])
+    plan = " ".join(str(r[-1]) for r in conn.execute("EXPLAIN QUERY PLAN " + sql, params))
+    assert "idx_events_event_ts" in plan
+
+    compressed = b"".join(gzip_chunks(iter_events_csv(conn, chunk_rows=7)))
+    assert gzip.decompress(compressed).decode() == "".join(chunks)
+    database.close()
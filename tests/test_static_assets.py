@@ -0,0 +1,77 @@
+import gzip
+import sys
+import pathlib
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / 'TokenSystem'))
+sys.path.insert(0, str(ROOT / 'FurbyGame125D'))
+
+from static_assets import AssetRegistry, IMMUTABLE_CACHE_CONTROL
+
+
+def test_registry_serves_hashed_precompressed_assets_with_etag(tmp_path):
+    registry = AssetRegistry('/static/')
+    asset = registry.register('app.css', b'body { color: red; }\n' * 100)
+    assert asset.filename.startswith('app.') and asset.filename.endswith('.css')
+    assert registry.url('app.css') == '/static/' + asset.filename
+
+    status, headers, body = registry.respond(asset.filename, accept_encoding='gzip, deflate')
+    assert status == 200 and headers['Content-Encoding'] == 'gzip'
+    assert headers['Cache-Control'] == IMMUTABLE_CACHE_CONTROL and headers['Vary'] == 'Accept-Encoding'
+    assert gzip.decompress(body) == asset.body and len(body) < len(asset.body) / 10
+
+    status, not_modified, body = registry.respond(asset.filename, 'gzip', if_none_match=headers['ETag'])
+    assert status == 304 and body == b''
+    status, plain, body = registry.respond(asset.filename, '', if_none_match=headers['ETag'])
+    assert status == 200 and 'Content-Encoding' not in plain and body == asset.body
+    assert registry.respond('app.css')[0] == 404
+
+    changed = registry.register('app.css', b'body { color: blue; }\n' * 100)
+    assert changed.filename != asset.filename and registry.get(asset.filename) is None
+    assert registry.export(str(tmp_path)) == 2
+    assert (tmp_path / (changed.filename + '.gz')).exists()
+
+
+def test_game_dashboard_is_a_small_shell_plus_json_state(tmp_path, monkeypatch):
+    import game_state_store
+    monkeypatch.chdir(tmp_path)
+    game_state_store.set_game_state_store(game_state_store.GameStateStore(str(tmp_path / 's.db')))
+    try:
+        from furby_web_interface import FurbyGameWebInterface, GAME_ASSETS
+        interface = FurbyGameWebInterface()
+        shell = interface.render_game_dashboard('web<user>')
+        assert GAME_ASSETS.url('furby_game.css') in shell and GAME_ASSETS.url('furby_game.js') in shell
+        assert '<style>' not in shell and 'web&lt;user&gt;' in shell
+        css_js = sum(len(GAME_ASSETS.get(GAME_ASSETS.url(n).rsplit('/', 1)[1]).body)
+                     for n in ('furby_game.css', 'furby_game.js'))
+        assert len(shell.encode()) < css_js / 2
+        state = interface.render_game_state('web<user>')
+        assert set(state['fragments']) == {'hud', 'location', 'vehicle', 'main', 'travel',
+                                           'shop', 'stats', 'settings'}
+        assert 'GHETTO' in state['fragments']['location']
+    finally:
+        import furby_san_andreas
+        furby_san_andreas.reset_game('web<user>')
+        game_state_store.close_game_state_store()
+
+
+def test_furbx_dashboard_is_rendered_on_the_server(monkeypatch):
+    from furbx_dashboard import FURBXDashboard, DASHBOARD_ASSETS
+    dashboard = FURBXDashboard()
+    fragments = {name: f'<div class="card">{name} card</div>' for name in (
+        'portfolio', 'quick_stats', 'staking', 'recent_activity', 'system_info',
+        'wallet_tab', 'staking_tab', 'marketplace_tab', 'analytics_tab')}
+    monkeypatch.setattr(dashboard, 'render_dashboard_state', lambda user_id: {
+        'success': True, 'user_id': user_id, 'premium': True, 'fragments': fragments})
+
+    page = dashboard.render_main_dashboard('furbx<user>')
+    assert 'portfolio card' in page and 'analytics_tab card' in page and '👑 PREMIUM' in page
+    assert 'furbx&lt;user&gt;' in page and '/static/' not in page  # CSS/JS wbudowane - bez martwych linków
+    assert 'function showTab' in page and '.dashboard-grid' in page
+
+    linked = dashboard.render_main_dashboard('furbx<user>', link_assets=True)
+    assert DASHBOARD_ASSETS.url('furbx_dashboard.js') in linked and '<style>' not in linked
+
+    monkeypatch.setattr(dashboard, 'render_dashboard_state', lambda user_id: {
+        'success': False, 'message': 'Unknown <user>'})
+    error = dashboard.render_main_dashboard('ghost')
+    assert 'Dashboard Error' in error and 'Unknown &lt;user&gt;' in error
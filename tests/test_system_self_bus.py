@@ -0,0 +1,66 @@
+import sys
+import pathlib
+import threading
+import time
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / '7_SYSTEM_SELF'))
+
+from event_bus import EventBus
+
+
+def test_bus_batches_and_isolates_slow_subscribers():
+    bus = EventBus('test')
+    fast, slow, gate = [], [], threading.Event()
+
+    def slow_handler(events):
+        gate.wait(1.0)
+        slow.extend(e.payload['i'] for e in events)
+
+    bus.subscribe('decision', 'fast', lambda events: fast.append(len(events)), batch_size=10, batch_timeout=0.02)
+    bus.subscribe('decision', 'slow', slow_handler, queue_size=5, batch_size=100, batch_timeout=0.0)
+    start = time.perf_counter()
+    for i in range(50):
+        assert bus.publish('decision', {'i': i}) >= 1
+    assert time.perf_counter() - start < 0.5
+    gate.set()
+    assert bus.flush(timeout=5)
+    stats = bus.get_stats()['subscribers']
+    assert sum(fast) == 50 and max(fast) <= 10 and stats['fast']['dropped'] == 0
+    assert stats['slow']['dropped'] > 0 and slow[-1] == 49
+    assert stats['slow']['delivered'] + stats['slow']['dropped'] == 50
+    bus.close(timeout=1)
+
+
+def test_manager_acknowledges_before_fanout():
+    from integration import SystemSelfManager
+    manager = SystemSelfManager()
+    result = manager.process_user_decision('u1', 'Odkrycie nowe', {'a': 1}, {'b': 2}, 0.7, 3)
+    assert result['decision_processed'] and result['accepted_by'] == 3
+    assert manager.flush_pending_decisions(timeout=10)
+    history = manager.system_self.decision_history
+    assert any(d.decision_id == result['decision_id'] for d in history)
+    assert 'u1' in manager.global_vision.user_patterns
+    manager.event_bus.close(timeout=1)
+
+
+def test_collective_report_reads_under_the_vision_lock():
+    from integration import SystemSelfManager
+    manager = SystemSelfManager()
+    done = threading.Event()
+
+    def hold_lock():
+        with manager._vision_lock:
+            done.wait(1.0)
+
+    holder = threading.Thread(target=hold_lock)
+    holder.start()
+    reports = []
+    reader = threading.Thread(target=lambda: reports.append(manager.get_collective_report()))
+    reader.start()
+    reader.join(0.2)
+    assert not reports  # czeka, aż subskrybent skończy modyfikować moduł
+    done.set()
+    reader.join(5)
+    holder.join(5)
+    assert reports and 'global_state' in reports[0]
+    manager.event_bus.close(timeout=1)
@@ -0,0 +1,61 @@
+import asyncio
+import sys
+import pathlib
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+import pytest
+from token_introspection import TokenIntrospector, InvalidTokenError
+
+
+class FakeResponse:
+    def __init__(self, status_code, payload=None):
+        self.status_code = status_code
+        self._payload = payload
+
+    def json(self):
+        return self._payload
+
+
+class FakeClient:
+    def __init__(self):
+        self.calls = 0
+        self.closed = False
+
+    async def get(self, url, headers=None):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        token = headers["Authorization"].split()[1]
+        if token == "bad":
+            return FakeResponse(401)
+        return FakeResponse(200, {"email": f"{token}@example.com"})
+
+    async def aclose(self):
+        self.closed = True
+
+
+def test_introspection_caches_and_coalesces_concurrent_requests():
+    client = FakeClient()
+    introspector = TokenIntrospector(client_factory=lambda: client)
+
+    async def scenario():
+        users = await asyncio.gather(*[introspector.introspect("abc") for _ in range(20)])
+        assert all(u == {"email": "abc@example.com"} for u in users)
+        await introspector.introspect("abc")
+        for _ in range(3):
+            with pytest.raises(InvalidTokenError):
+                await introspector.introspect("bad")
+        await introspector.aclose()
+
+    asyncio.run(scenario())
+    assert client.calls == 2 and client.closed
+    stats = introspector.get_stats()
+    assert stats['coalesced'] == 19 and stats['hits'] == 1 and stats['negative_hits'] == 2
+
+
+def test_local_verifier_skips_upstream():
+    client = FakeClient()
+    introspector = TokenIntrospector(client_factory=lambda: client,
+                                     local_verifier=lambda t: {"email": "me@local"} if t.count(".") == 2 else None)
+    assert asyncio.run(introspector.introspect("a.b.c")) == {"email": "me@local"}
+    assert client.calls == 0
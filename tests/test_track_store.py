@@ -0,0 +1,72 @@
+import sys
+import pathlib
+import hashlib
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "apps" / "api"))
+
+import pytest
+
+from sqlite_store import SQLiteDatabase
+from track_store import TrackStore, etag_matches, iter_file, parse_range, track_etag
+
+
+def test_chunked_upload_hashes_and_renames_atomically(tmp_path):
+    database = SQLiteDatabase(tmp_path / "events.sqlite")
+    store = TrackStore(tmp_path / "tracks", database)
+    data = bytes(range(256)) * 1000
+    upload = store.begin("beats/intro.mp3")
+    for i in range(0, len(data), 4096):
+        upload.write(data[i:i + 4096])
+    track = upload.commit("mc", "audio/mpeg")
+
+    digest = hashlib.sha256(data).hexdigest()
+    assert track["name"] == "beats_intro.mp3" and track["size"] == len(data)
+    assert track["sha256"] == digest and track["token_id"] == digest[:16]
+    assert (tmp_path / "tracks" / "beats_intro.mp3").read_bytes() == data
+    assert [p.name for p in (tmp_path / "tracks").iterdir()] == ["beats_intro.mp3"]
+    assert store.get("beats_intro.mp3") == track and store.get("missing.mp3") is None
+    assert track_etag(track) == f'"{digest}"' and etag_matches(f'W/"x", "{digest}"', track_etag(track))
+
+    aborted = store.begin("broken.mp3")
+    aborted.write(b"partial")
+    aborted.abort()
+    assert store.count() == 1 and not (tmp_path / "tracks" / "broken.mp3").exists()
+    with pytest.raises(ValueError):
+        store.begin(".hidden")
+    database.close()
+
+
+def test_listing_comes_from_index_and_reindex_adopts_old_files(tmp_path):
+    directory = tmp_path / "tracks"
+    directory.mkdir()
+    (directory / "old.wav").write_bytes(b"legacy upload")
+    database = SQLiteDatabase(tmp_path / "events.sqlite")
+    store = TrackStore(directory, database)
+    assert store.count() == 0 and store.reindex() == 1 and store.reindex() == 0
+    assert store.get("old.wav")["sha256"] == hashlib.sha256(b"legacy upload").hexdigest()
+
+    for name in ("c.mp3", "a.mp3", "b.mp3"):
+        upload = store.begin(name)
+        upload.write(name.encode())
+        upload.commit()
+    assert [t["name"] for t in store.list(limit=2, offset=1)] == ["b.mp3", "c.mp3"]
+    assert store.count() == 4
+    database.close()
+
+
+def test_range_parsing_and_partial_reads(tmp_path):
+    assert parse_range(None, 100) is None
+    assert parse_range("bytes=0-9", 100) == (0, 9)
+    assert parse_range("bytes=90-", 100) == (90, 99)
+    assert parse_range("bytes=-10", 100) == (90, 99)
+    assert parse_range("bytes=50-500", 100) == (50, 99)
+    assert parse_range("bytes=0-1,5-6", 100) is None  # wiele zakresów - cały plik
+    assert parse_range("items=0-1", 100) is None
+    for header in ("bytes=100-", "bytes=9-3", "bytes=-0"):
+        with pytest.raises(ValueError):
+            parse_range(header, 100)
+
+    path = tmp_path / "track.bin"
+    path.write_bytes(bytes(range(100)))
+    assert b"".join(iter_file(path, 10, 19, chunk_size=3)) == bytes(range(10, 20))
+    assert b"".join(iter_file(path, chunk_size=7)) == bytes(range(100))
@@ -0,0 +1,171 @@
+"""
+MÓZG BOGA - TOKEN INTROSPECTION
+Cache zweryfikowanych tokenów OAuth2 + współdzielony klient HTTP dla get_current_user
+"""
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+GOOGLE_USERINFO_URL = "https://www.googleapis.com/oauth2/v3/userinfo"
+
+
+class InvalidTokenError(Exception):
+    """Token odrzucony przez dostawcę tożsamości"""
+
+
+class IntrospectionUnavailableError(Exception):
+    """Dostawca tożsamości nieosiągalny (wynik nie jest cache'owany)"""
+
+
+class TTLCache:
+    """Mały cache LRU z czasem życia per wpis"""
+
+    def __init__(self, max_entries: int = 10000, clock: Callable[[], float] = time.monotonic):
+        self.max_entries = max_entries
+        self.clock = clock
+        self._data: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if expires_at <= self.clock():
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        self._data[key] = (self.clock() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_entries:
+            self._data.popitem(last=False)
+
+    def pop(self, key: str, default: Any = None) -> Any:
+        entry = self._data.pop(key, None)
+        return default if entry is None else entry[1]
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class TokenIntrospector:
+    """
+    Weryfikuje tokeny Bearer z cache'em wyników.
+
+    - lokalna ścieżka JWT (local_verifier) bez ruchu sieciowego,
+    - współdzielony httpx.AsyncClient z keep-alive do endpointu userinfo,
+    - cache LRU/TTL: pozytywne wyniki na ttl, odrzucenia krótko na negative_ttl,
+    - równoległe żądania z tym samym tokenem czekają na jedno zapytanie upstream.
+    """
+
+    def __init__(self, userinfo_url: str = GOOGLE_USERINFO_URL, ttl: float = 300.0,
+                 negative_ttl: float = 10.0, max_entries: int = 10000, timeout: float = 10.0,
+                 max_connections: int = 100, local_verifier: Optional[Callable[[str], Optional[Dict]]] = None,
+                 client_factory: Optional[Callable[[], Any]] = None):
+        self.userinfo_url = userinfo_url
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.local_verifier = local_verifier
+        self.client_factory = client_factory
+        self.cache = TTLCache(max_entries)
+        self._client = None
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.stats = {'hits': 0, 'negative_hits': 0, 'misses': 0, 'upstream_calls': 0,
+                      'coalesced': 0, 'local': 0}
+
+    @staticmethod
+    def _key(token: str) -> str:
+        return hashlib.sha256(token.encode('utf-8')).hexdigest()
+
+    def _get_client(self):
+        if self._client is None:
+            if self.client_factory is not None:
+                self._client = self.client_factory()
+            else:
+                import httpx
+                self._client = httpx.AsyncClient(
+                    timeout=self.timeout,
+                    limits=httpx.Limits(max_connections=self.max_connections,
+                                        max_keepalive_connections=self.max_connections)
+                )
+        return self._client
+
+    async def introspect(self, token: str) -> Dict[str, Any]:
+        """Zwraca dane użytkownika dla tokenu albo rzuca InvalidTokenError"""
+        if self.local_verifier is not None:
+            user = self.local_verifier(token)
+            if user is not None:
+                self.stats['local'] += 1
+                return user
+
+        key = self._key(token)
+        cached = self.cache.get(key)
+        if cached is not None:
+            valid, user = cached
+            if valid:
+                self.stats['hits'] += 1
+                return user
+            self.stats['negative_hits'] += 1
+            raise InvalidTokenError("Invalid token")
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.stats['coalesced'] += 1
+            return await asyncio.shield(inflight)
+
+        self.stats['misses'] += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            user = await self._fetch_userinfo(token)
+        except InvalidTokenError as e:
+            self.cache.set(key, (False, None), self.negative_ttl)
+            future.set_exception(e)
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        else:
+            self.cache.set(key, (True, user), self.ttl)
+            future.set_result(user)
+            return user
+        finally:
+            self._inflight.pop(key, None)
+            if not future.done():
+                future.cancel()
+            elif not future.cancelled():
+                # Oznacza wyjątek jako odczytany, gdy nikt inny nie czekał
+                future.exception()
+
+    async def _fetch_userinfo(self, token: str) -> Dict[str, Any]:
+        self.stats['upstream_calls'] += 1
+        client = self._get_client()
+        try:
+            response = await client.get(self.userinfo_url, headers={"Authorization": f"Bearer {token}"})
+        except Exception as e:
+            raise IntrospectionUnavailableError(str(e)) from e
+        if response.status_code in (400, 401, 403):
+            raise InvalidTokenError("Invalid token")
+        if response.status_code >= 400:
+            raise IntrospectionUnavailableError(f"userinfo returned {response.status_code}")
+        return response.json()
+
+    def invalidate(self, token: str) -> None:
+        self.cache.pop(self._key(token))
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, 'cached_tokens': len(self.cache), 'inflight': len(self._inflight)}